@@ -0,0 +1,48 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Benchmarks of the client's hot paths.
+
+Run them all with ``make benchmark`` or ``python -m benchmarks``; see
+:mod:`benchmarks.__main__`. Every result is a dict with at least a
+``benchmark`` and a ``case`` key, and one of the metrics listed in
+:data:`METRICS`.
+"""
+
+import time
+
+#: The metrics results are compared on, and whether higher is better.
+METRICS = {
+    'ops_per_second': True,
+    'best_ms': False,
+    'seconds': False,
+}
+
+
+def measure(func, seconds):
+    """Call func repeatedly for about ``seconds`` and return calls per
+    second.
+
+    """
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        func()
+        count += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            return count / (now - start)
+
+
+async def measure_async(func, seconds):
+    """Like :func:`measure`, for a coroutine function."""
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        await func()
+        count += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            return count / (now - start)
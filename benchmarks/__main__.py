@@ -0,0 +1,98 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Run all the benchmarks and write their results as one JSON document.
+
+Usage::
+
+    python -m benchmarks --output benchmark-$(git rev-parse --short HEAD).json
+    python -m benchmarks --quick --only apply_delta rpc_throughput
+    python -m benchmarks --compare benchmark-1a2b3c4.json --max-regression 10
+
+The document records the commit and interpreter the results were measured
+with, so that files from different commits can be compared with
+:mod:`benchmarks.compare`.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import subprocess
+import sys
+
+from benchmarks import compare, hot_paths, import_time, json_codec, rpc_throughput
+
+SUITES = sorted(list(hot_paths.BENCHMARKS) + ['json_codec', 'rpc_throughput', 'import_time'])
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, check=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    if args.quick:
+        args.applications, args.units = 20, 10
+        args.files, args.seconds = 100, 0.2
+    selected = args.only or SUITES
+    results = hot_paths.run(args, [name for name in selected if name in hot_paths.BENCHMARKS])
+    if 'json_codec' in selected:
+        results.extend(json_codec.run(args))
+    if 'rpc_throughput' in selected:
+        results.extend(asyncio.run(rpc_throughput.main(rpc_throughput.parse_args(
+            ['--requests', '500' if args.quick else '2000']))))
+    if 'import_time' in selected:
+        # The generated definitions are measured on their own too, so that
+        # --compare catches them growing even when the rest got faster.
+        for module in ('juju.client.client', 'juju.client._definitions'):
+            results.append(import_time.measure(
+                module, 2 if args.quick else 5, top=5))
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    hot_paths.add_arguments(parser)
+    parser.add_argument('--quick', action='store_true',
+                        help='measure small models, briefly, e.g. to check the suite runs')
+    parser.add_argument('--only', nargs='+', choices=SUITES)
+    parser.add_argument('--output', default=None,
+                        help='file to write the results to, instead of stdout')
+    parser.add_argument('--compare', metavar='BASELINE', default=None,
+                        help='results file to compare the new results with')
+    parser.add_argument('--max-regression', type=float, default=None,
+                        help='with --compare, fail if a metric got worse by more '
+                             'than this many percent')
+    return parser.parse_args(argv)
+
+
+def main(args):
+    document = {
+        'commit': _commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'quick': args.quick,
+        'results': run(args),
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+    else:
+        print(json.dumps(document, indent=2))
+    if args.compare:
+        # Keep stdout for the document when it is not written to a file.
+        return compare.report(
+            compare.compare(compare.load(args.compare), document['results']),
+            args.max_regression, file=sys.stderr if not args.output else None)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(parse_args()))
@@ -0,0 +1,88 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Compare two benchmark result files written by ``python -m benchmarks``.
+
+Usage::
+
+    python -m benchmarks.compare benchmark-1a2b3c4.json benchmark-5d6e7f8.json
+    python -m benchmarks.compare --max-regression 10 old.json new.json
+
+Results are matched on their ``benchmark`` and ``case``, and every metric of
+:data:`benchmarks.METRICS` they both have is printed as a JSON line with its
+relative change, positive being an improvement. With ``--max-regression``
+the exit status is non-zero when any metric got worse by more than that many
+percent.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks import METRICS
+
+
+def _key(result):
+    return result['benchmark'], result['case']
+
+
+def compare(baseline, current):
+    """Return a dict per metric of the results of ``current`` that are also
+    in ``baseline``; both are lists of result dicts.
+
+    """
+    before = {_key(result): result for result in baseline}
+    changes = []
+    for result in current:
+        old = before.get(_key(result))
+        if old is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in result or metric not in old or not old[metric]:
+                continue
+            change = (result[metric] - old[metric]) / old[metric] * 100
+            changes.append({
+                'benchmark': result['benchmark'],
+                'case': result['case'],
+                'metric': metric,
+                'baseline': old[metric],
+                'current': result[metric],
+                'change_percent': round(change if higher_is_better else -change, 1),
+            })
+    return changes
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--max-regression', type=float, default=None,
+                        help='fail if a metric got worse by more than this many percent')
+    return parser.parse_args(argv)
+
+
+def report(changes, max_regression=None, file=None):
+    """Print ``changes`` as JSON lines and return the exit status: 1 if a
+    metric regressed by more than ``max_regression`` percent, else 0.
+
+    """
+    failed = False
+    for change in changes:
+        print(json.dumps(change), file=file)
+        if max_regression is not None and change['change_percent'] < -max_regression:
+            failed = True
+    return 1 if failed else 0
+
+
+def main(args):
+    return report(compare(load(args.baseline), load(args.current)),
+                  args.max_regression)
+
+
+if __name__ == '__main__':
+    sys.exit(main(parse_args()))
@@ -0,0 +1,289 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Microbenchmarks of the client's hot paths, against synthetic models
+served by :class:`tests.fake_controller.FakeController`.
+
+Usage::
+
+    python -m benchmarks.hot_paths --applications 100 --units 50 --seconds 1
+    python -m benchmarks.hot_paths --only apply_delta entity_access
+
+Each benchmark returns a list of result dicts; see :data:`BENCHMARKS`.
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import tempfile
+import time
+
+from benchmarks import measure, measure_async
+from juju import jasyncio
+from juju.bundle import ChangeSet
+from juju.client import client
+from juju.delta import get_entity_delta
+from juju.model import CharmArchiveGenerator, Model, ModelState
+from tests.fake_controller import FakeController, SyntheticModel
+
+
+def _result(benchmark, case, rate, **extra):
+    return dict({'benchmark': benchmark, 'case': case,
+                 'ops_per_second': round(rate, 1)}, **extra)
+
+
+def _deltas(raw):
+    return [get_entity_delta(client.Delta(deltas=d)) for d in raw]
+
+
+class _Connected:
+    """Connects a Model to a fake controller serving an empty model, for the
+    benchmarks that need a Model but no particular state in it.
+
+    """
+    async def __aenter__(self):
+        self.controller = FakeController()
+        await self.controller.start()
+        self.model = Model()
+        await self.model.connect(**self.controller.connect_params())
+        return self.model
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.model.disconnect()
+        await self.controller.stop()
+
+
+def from_json(args):
+    """Decoding of large replies into the generated types: validated,
+    through the trusted path replies take, and lazily.
+
+    """
+    synthetic = SyntheticModel(applications=args.applications, units=args.units)
+    status = synthetic.full_status()
+    info = synthetic.model_info()
+    info['machines'] = [
+        {'id': m['id'], 'instance-id': m['instance-id'], 'display-name': '',
+         'status': 'started', 'message': '', 'has-vote': False,
+         'wants-vote': False, 'hardware': {'arch': 'amd64', 'cores': 2,
+                                           'mem': 4096, 'root-disk': 20480}}
+        for m in synthetic.machines.values()]
+    units = len(synthetic.units)
+    app = next(iter(synthetic.applications))
+    return [
+        _result('from_json', 'FullStatus', measure(
+            lambda: client.FullStatus.from_json(status), args.seconds),
+            units=units),
+        _result('from_json', 'FullStatus from_wire', measure(
+            lambda: client.FullStatus.from_wire(status), args.seconds),
+            units=units),
+        _result('from_json', 'FullStatus from_wire_lazy, one application read', measure(
+            lambda: client.FullStatus.from_wire_lazy(status).applications[app].status,
+            args.seconds), units=units),
+        _result('from_json', 'ModelInfo', measure(
+            lambda: client.ModelInfo.from_json(info), args.seconds),
+            machines=units),
+        _result('from_json', 'ModelInfo from_wire', measure(
+            lambda: client.ModelInfo.from_wire(info), args.seconds),
+            machines=units),
+    ]
+
+
+async def apply_delta(args):
+    """ModelState.apply_delta, first for a whole model then for changes to
+    it.
+
+    """
+    synthetic = SyntheticModel(applications=args.applications, units=args.units)
+    initial = _deltas(synthetic.snapshot())
+    changes = _deltas(
+        ['unit', 'change', dict(data, **{'workload-status': dict(
+            data['workload-status'], message='step {}'.format(i))})]
+        for i, data in enumerate(synthetic.units.values()))
+    async with _Connected() as model:
+        def populate():
+            state = ModelState(model)
+            for delta in initial:
+                state.apply_delta(delta)
+            return state
+
+        rate = measure(populate, args.seconds)
+        state = populate()
+
+        def change():
+            for delta in changes:
+                state.apply_delta(delta)
+
+        change_rate = measure(change, args.seconds)
+    return [
+        _result('apply_delta', 'initial', rate * len(initial), deltas=len(initial)),
+        _result('apply_delta', 'change', change_rate * len(changes), deltas=len(changes)),
+    ]
+
+
+async def entity_access(args):
+    """The entity collections of a large model."""
+    synthetic = SyntheticModel(applications=args.applications, units=args.units)
+    async with _Connected() as model:
+        for delta in _deltas(synthetic.snapshot()):
+            model.state.apply_delta(delta)
+        apps = list(model.applications.values())
+        machine = next(iter(model.machines.values()))
+        cases = {
+            'Model.units': lambda: model.units,
+            'Model.applications': lambda: model.applications,
+            'Application.units': lambda: [app.units for app in apps],
+            'Machine.units': lambda: machine.units,
+        }
+        return [_result('entity_access', case, measure(func, args.seconds),
+                        units=len(synthetic.units))
+                for case, func in cases.items()]
+
+
+async def observers(args):
+    """Matching and dispatching of deltas to many observers."""
+    synthetic = SyntheticModel(applications=args.applications, units=args.units)
+    deltas = _deltas(['unit', 'change', data] for data in synthetic.units.values())
+    calls = 0
+
+    async def callback(delta, old, new, model):
+        nonlocal calls
+        calls += 1
+
+    async with _Connected() as model:
+        # An observer per application, and a few broad ones.
+        for app in synthetic.applications:
+            model.add_observer(callback, 'unit', 'change',
+                               entity_id=r'{}/\d+'.format(app))
+        for name in list(synthetic.units)[::args.units]:
+            model.add_observer(callback, 'unit', entity_id=name)
+        model.add_observer(callback, 'unit')
+        model.add_observer(callback, 'application')
+
+        dispatcher = model._observer_dispatcher
+
+        async def notify():
+            for delta in deltas:
+                await model._notify_observers(delta, None, None)
+            while dispatcher._workers:
+                await jasyncio.gather(*dispatcher._workers)
+
+        await notify()
+        per_delta = calls / len(deltas)
+        rate = await measure_async(notify, args.seconds)
+    return [_result('observers', 'unit changes', rate * len(deltas),
+                    observers=len(model._observers),
+                    callbacks_per_delta=round(per_delta, 2))]
+
+
+def changeset_sorted(args):
+    """Topological sorting of the changes of a large bundle."""
+    changes = []
+    for i in range(args.applications):
+        changes.append(client.BundleChange(id_='addCharm-{}'.format(i), requires=[]))
+        changes.append(client.BundleChange(id_='deploy-{}'.format(i),
+                                           requires=['addCharm-{}'.format(i)]))
+        for u in range(args.units):
+            machine = 'addMachines-{}-{}'.format(i, u)
+            changes.append(client.BundleChange(id_=machine, requires=[]))
+            changes.append(client.BundleChange(
+                id_='addUnit-{}-{}'.format(i, u),
+                requires=['deploy-{}'.format(i), machine]))
+        if i:
+            changes.append(client.BundleChange(
+                id_='addRelation-{}'.format(i),
+                requires=['deploy-{}'.format(i - 1), 'deploy-{}'.format(i)]))
+    changeset = ChangeSet(changes)
+    return [_result('changeset_sorted', 'bundle', measure(changeset.sorted, args.seconds),
+                    changes=len(changes))]
+
+
+def make_archive(args):
+    """Zipping of a local charm directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        charm = os.path.join(tmp, 'charm')
+        for d in ('src', 'lib/charms/lib', 'build', '.git'):
+            os.makedirs(os.path.join(charm, d))
+        with open(os.path.join(charm, 'metadata.yaml'), 'w') as f:
+            f.write('name: bench\nsummary: bench\ndescription: bench\n')
+        size = 0
+        for i in range(args.files):
+            directory = ('src', 'lib/charms/lib', 'build', '.git')[i % 4]
+            content = ('# line {} of a python module\n'.format(i) * 128).encode()
+            with open(os.path.join(charm, directory, 'f{}.py'.format(i)), 'wb') as f:
+                f.write(content)
+            if directory in ('src', 'lib/charms/lib'):
+                size += len(content)
+        generator = CharmArchiveGenerator(charm)
+        archive = os.path.join(tmp, 'charm.zip')
+        rate = measure(lambda: generator.make_archive(archive), args.seconds)
+    return [_result('make_archive', '{} files'.format(args.files), rate,
+                    mb_per_second=round(rate * size / 2**20, 1))]
+
+
+async def model_connect(args):
+    """Model.connect and wait_for_idle against a large fake model."""
+    synthetic = SyntheticModel(applications=args.applications, units=args.units)
+    async with FakeController(synthetic) as controller:
+        model = Model()
+        start = time.perf_counter()
+        await model.connect(**controller.connect_params())
+        connected = time.perf_counter() - start
+        try:
+            start = time.perf_counter()
+            await model.wait_for_idle(idle_period=0, check_freq=0)
+            idle = time.perf_counter() - start
+        finally:
+            await model.disconnect()
+    return [
+        _result('model_connect', 'connect', 1 / connected,
+                seconds=round(connected, 4), units=len(synthetic.units)),
+        _result('model_connect', 'wait_for_idle', 1 / idle,
+                seconds=round(idle, 4), units=len(synthetic.units)),
+    ]
+
+
+#: The benchmarks of this module, by name.
+BENCHMARKS = {
+    'from_json': from_json,
+    'apply_delta': apply_delta,
+    'entity_access': entity_access,
+    'observers': observers,
+    'changeset_sorted': changeset_sorted,
+    'make_archive': make_archive,
+    'model_connect': model_connect,
+}
+
+
+def run(args, names=None):
+    results = []
+    for name in names or BENCHMARKS:
+        result = BENCHMARKS[name](args)
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+        results.extend(result)
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--applications', type=int, default=100)
+    parser.add_argument('--units', type=int, default=50,
+                        help='units per application')
+    parser.add_argument('--files', type=int, default=400,
+                        help='files in the charm directory to archive')
+    parser.add_argument('--seconds', type=float, default=1.0,
+                        help='how long to measure each operation for')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    add_arguments(parser)
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS))
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    for result in run(args, args.only):
+        print(json.dumps(result))
@@ -0,0 +1,105 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Measure how long it takes to import the client (or any other) modules,
+using the interpreter's own ``-X importtime`` instrumentation.
+
+Usage::
+
+    python -m benchmarks.import_time --repeat 5 juju.client.client juju.model
+    python -m benchmarks.import_time --max-ms 600 juju.client.client
+    python -m benchmarks.import_time --max-ms juju.client._definitions=450
+
+Every import runs in a fresh interpreter. The best cumulative time of all
+runs is reported per module, along with its slowest nested imports. With
+``--max-ms`` the exit status is non-zero when a module is slower than that,
+so the script can be used as a regression check. A ``MODULE=MS`` budget
+applies to that module only, and measures it even if it is not listed.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+def import_times(module):
+    """Import `module` in a fresh interpreter and return a dict mapping
+    every imported module name to its cumulative import time in
+    microseconds.
+
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        stderr=subprocess.PIPE, check=True, text=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # the header line
+    return times
+
+
+def measure(module, repeat, top):
+    runs = [import_times(module) for _ in range(repeat)]
+    best = min(runs, key=lambda times: times[module])
+    nested = sorted(
+        ((name, us) for name, us in best.items()
+         if name != module and name.startswith('juju')),
+        key=lambda item: item[1], reverse=True)
+    return {
+        'benchmark': 'import_time',
+        'case': module,
+        'module': module,
+        'repeat': repeat,
+        'best_ms': round(best[module] / 1000, 1),
+        'mean_ms': round(sum(times[module] for times in runs) / repeat / 1000, 1),
+        'slowest': [{'module': name, 'ms': us / 1000}
+                    for name, us in nested[:top]],
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('modules', nargs='*', default=['juju.client.client'])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5,
+                        help='how many of the slowest nested juju imports to report')
+    parser.add_argument('--max-ms', type=_budget, action='append', default=[],
+                        metavar='[MODULE=]MS',
+                        help='fail if the best import time exceeds this; '
+                             'may be given once per module')
+    return parser.parse_args(argv)
+
+
+def _budget(value):
+    module, _, ms = value.rpartition('=')
+    try:
+        return module or None, float(ms)
+    except ValueError:
+        raise argparse.ArgumentTypeError('not a budget: %r' % value)
+
+
+def main(args):
+    budgets = dict(args.max_ms)
+    default = budgets.pop(None, None)
+    modules = list(args.modules)
+    modules.extend(module for module in budgets if module not in modules)
+    failed = False
+    for module in modules:
+        result = measure(module, args.repeat, args.top)
+        print(json.dumps(result))
+        limit = budgets.get(module, default)
+        if limit is not None and result['best_ms'] > limit:
+            print('%s: %.1fms is over the %.1fms budget'
+                  % (module, result['best_ms'], limit), file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(parse_args()))
@@ -0,0 +1,84 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Measure encode and decode throughput of the connection codecs for typical
+FullStatus and AllWatcher.Next payloads.
+
+Usage::
+
+    python -m benchmarks.json_codec --applications 50 --units 20 --seconds 1
+
+The payloads are generated from a :class:`tests.fake_controller.SyntheticModel`:
+its FullStatus, and the AllWatcher.Next delta snapshot. Besides the
+available codecs, the pretty-printed encoding the connection used before is
+measured as ``json-indent``, and ``encode-typed`` rows encode the FullStatus result
+as generated Type objects (through their serialize hooks).
+"""
+
+import argparse
+import json
+
+from benchmarks import measure
+from juju.client import client
+from juju.client.codec import codecs
+from juju.client.facade import TypeEncoder
+from tests.fake_controller import SyntheticModel
+
+
+def run(args):
+    model = SyntheticModel(applications=args.applications, units=args.units)
+    payloads = {
+        'FullStatus': model.full_status(),
+        'AllWatcher.Next': {'deltas': model.snapshot()},
+    }
+    typed_status = client.FullStatus.from_json(payloads['FullStatus'])
+
+    results = []
+
+    def row(payload, codec, op, size, rate):
+        results.append({
+            'benchmark': 'json_codec',
+            'case': '{} {} {}'.format(payload, codec, op),
+            'payload': payload,
+            'codec': codec,
+            'op': op,
+            'bytes': size,
+            'ops_per_second': round(rate, 1),
+            'mb_per_second': round(rate * size / 2**20, 1),
+        })
+
+    for payload_name, payload in payloads.items():
+        baseline = json.dumps(payload, indent=2)
+        row(payload_name, 'json-indent', 'encode', len(baseline),
+            measure(lambda: json.dumps(payload, indent=2), args.seconds))
+
+        for codec_name, codec_cls in sorted(codecs.items()):
+            try:
+                codec = codec_cls()
+            except ImportError:
+                continue
+            encoded = codec.encode(payload)
+            row(payload_name, codec_name, 'encode', len(encoded),
+                measure(lambda: codec.encode(payload), args.seconds))
+            row(payload_name, codec_name, 'decode', len(encoded),
+                measure(lambda: codec.decode(encoded), args.seconds))
+            if payload_name == 'FullStatus':
+                row(payload_name, codec_name, 'encode-typed', len(encoded),
+                    measure(lambda: codec.encode(typed_status, TypeEncoder),
+                            args.seconds))
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--applications', type=int, default=50)
+    parser.add_argument('--units', type=int, default=20,
+                        help='units per application')
+    parser.add_argument('--seconds', type=float, default=1.0,
+                        help='how long to measure each operation for')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    for result in run(parse_args()):
+        print(json.dumps(result))
@@ -0,0 +1,104 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Measure how many RPCs per second a single Connection can push through
+one websocket to a local fake controller, for a range of concurrency levels.
+
+Usage::
+
+    python -m benchmarks.rpc_throughput --requests 5000 --concurrency 1 10 100 500
+
+The fake controller answers every request with an empty response, after an
+optional artificial latency, so the numbers only reflect the client side
+(encoding, dispatching, and the websocket itself).
+"""
+
+import argparse
+import json
+import time
+
+import websockets
+
+from juju import jasyncio
+from juju.client.connection import Connection
+from tests.fake_controller import self_signed_cert, server_ssl_context
+
+
+def make_handler(latency):
+    async def reply(ws, request):
+        if latency:
+            await jasyncio.sleep(latency)
+        if request.get('type') == 'Admin' and request.get('request') == 'Login':
+            response = {
+                'facades': [{'name': 'Pinger', 'versions': [1]}],
+                'server-version': '3.1.0',
+            }
+        else:
+            response = {}
+        await ws.send(json.dumps({
+            'request-id': request['request-id'],
+            'response': response,
+        }))
+
+    async def handler(ws, *args):
+        tasks = set()
+        async for message in ws:
+            task = jasyncio.ensure_future(reply(ws, json.loads(message)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    return handler
+
+
+async def run_requests(connection, requests, concurrency):
+    sem = jasyncio.Semaphore(concurrency)
+
+    async def one():
+        async with sem:
+            await connection.rpc({'type': 'Pinger', 'request': 'Ping', 'version': 1})
+
+    start = time.perf_counter()
+    await jasyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+async def main(args):
+    cert_pem, key_pem = self_signed_cert()
+    server = await websockets.serve(
+        make_handler(args.latency), '127.0.0.1', 0,
+        ssl=server_ssl_context(cert_pem, key_pem))
+    port = server.sockets[0].getsockname()[1]
+    connection = await Connection.connect(
+        '127.0.0.1:{}'.format(port),
+        username='admin', password='secret', cacert=cert_pem)
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            elapsed = await run_requests(connection, args.requests, concurrency)
+            results.append({
+                'benchmark': 'rpc_throughput',
+                'case': 'concurrency {}'.format(concurrency),
+                'concurrency': concurrency,
+                'requests': args.requests,
+                'ops_per_second': round(args.requests / elapsed, 1),
+                'in_flight_after': len(connection.messages),
+            })
+    finally:
+        await connection.close()
+        server.close()
+        await server.wait_closed()
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 100, 500])
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds the fake controller waits before replying')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    for result in jasyncio.run(main(parse_args())):
+        print(json.dumps(result))
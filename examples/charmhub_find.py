@@ -23,8 +23,8 @@ async def main():
         charms = await model.charmhub.find("kuber")
 
         print("Bundle\tName")
-        for resp in charms.result:
-            print("{}\t{}".format("N" if resp.type_ == "charm" else "Y", resp.name))
+        for resp in charms['results']:
+            print("{}\t{}".format("N" if resp['type'] == "charm" else "Y", resp['name']))
     finally:
         if model.is_connected():
             print('Disconnecting from model')
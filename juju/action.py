@@ -17,8 +17,12 @@ class Action(model.ModelEntity):
 
     async def fetch_output(self):
         completed_action = await self.model._get_completed_action(self.id)
-        self.results = completed_action.output or {}
-        self._status = completed_action.status
+        self._set_result(completed_action)
+
+    def _set_result(self, result):
+        # result is the ActionResult of the completed action
+        self.results = result.output or {}
+        self._status = result.status
 
     async def wait(self):
         self.results or await self.fetch_output()
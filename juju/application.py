@@ -1,10 +1,11 @@
 # Copyright 2023 Canonical Ltd.
 # Licensed under the Apache V2, see LICENCE file for details.
 
-import hashlib
+import io
 import json
 import logging
 import typing
+from functools import partial
 from pathlib import Path
 
 from . import jasyncio, model, tag, utils
@@ -52,10 +53,7 @@ class Application(model.ModelEntity):
 
     @property
     def units(self):
-        return [
-            unit for unit in self.model.units.values()
-            if unit.application == self.name
-        ]
+        return self.model.state.application_units(self.name)
 
     @property
     def subordinate_units(self):
@@ -64,7 +62,7 @@ class Application(model.ModelEntity):
 
     @property
     def relations(self) -> typing.List[Relation]:
-        return [rel for rel in self.model.relations if rel.matches(self.name)]
+        return self.model.state.application_relations(self.name)
 
     def related_applications(self, endpoint_name=None):
         apps = {}
@@ -457,7 +455,7 @@ class Application(model.ModelEntity):
             'Getting constraints for %s', self.name)
 
         result = (await app_facade.Get(application=self.name)).constraints
-        return vars(result) if result else result
+        return result._fields() if result else result
 
     async def get_actions(self, schema=False):
         """Get actions defined for this application.
@@ -477,16 +475,17 @@ class Application(model.ModelEntity):
             actions = {k: v.description for k, v in actions.items()}
         return actions
 
-    async def get_status(self):
+    async def get_status(self, full_status=None):
         """Get the application status using info from the FullStatus
         as well, because it might be more up to date than our model
 
+        :param full_status: An already fetched FullStatus result to use
+            instead of making a new FullStatus call.
         :return: str status
         """
+        if full_status is None:
+            full_status = await self.model.get_status()
 
-        client_facade = client.ClientFacade.from_connection(self.connection)
-
-        full_status = await client_facade.FullStatus(patterns=None)
         _app = full_status.applications.get(self.name, None)
         if not _app:
             raise JujuError(f"application is not in FullStatus : {self.name}")
@@ -494,25 +493,30 @@ class Application(model.ModelEntity):
         self._status = derive_status([self.status, _app.status.status])
         return self._status
 
-    def attach_resource(self, resource_name, file_name, file_obj):
+    async def attach_resource(self, resource_name, file_name, file_obj):
         """Updates the resource for an application by uploading file from
         local disk to the Juju controller.
 
+        The file is read and uploaded in an executor, so that the event loop
+        isn't blocked meanwhile.
+
         :param str resource_name: Name of the resource to be updated.
         :param str file_name: Name of the local file to be uploaded.
-        :param TextIOWrapper file_obj: Actual object to be read for data.
+        :param file_obj: Actual object to be read for data. Binary, seekable
+            files are streamed in chunks; anything else is read in full.
         """
         conn, headers, path_prefix = self.connection.https_connection()
 
         url = "{}/applications/{}/resources/{}".format(
             path_prefix, self.name, resource_name)
 
-        data = file_obj.read()
+        loop = jasyncio.get_running_loop()
+        if isinstance(file_obj, io.TextIOBase) or not file_obj.seekable():
+            data = await loop.run_in_executor(None, file_obj.read)
+            file_obj = io.BytesIO(
+                data if isinstance(data, bytes) else bytes(data, 'utf-8'))
 
         headers['Content-Type'] = 'application/octet-stream'
-        headers['Content-Length'] = len(data)
-        data_bytes = data if isinstance(data, bytes) else bytes(data, 'utf-8')
-        headers['Content-Sha384'] = hashlib.sha384(data_bytes).hexdigest()
 
         file_name = str(file_name)
         if not file_name.startswith('./'):
@@ -523,11 +527,8 @@ class Application(model.ModelEntity):
         headers['Bakery-Protocol-Version'] = 3
         headers['Connection'] = 'close'
 
-        conn.request('PUT', url, data, headers)
-        response = conn.getresponse()
-        result = response.read().decode()
-        if not response.status == 200:
-            raise JujuError(result)
+        await loop.run_in_executor(None, partial(
+            utils.upload_file, conn, 'PUT', url, file_obj, headers))
 
     async def get_resources(self):
         """Return resources for this application.
@@ -827,6 +828,9 @@ class Application(model.ModelEntity):
             path=None, resources=None):
         """Refresh the charm for this application with a local charm.
 
+        If the charm at ``path`` is the one the application already runs,
+        and no resources are given, nothing is done.
+
         :param dict charm_origin: The charm origin of the destination charm
             we're refreshing to
         :param bool force: Refresh even if validation checks fail
@@ -859,6 +863,13 @@ class Application(model.ModelEntity):
             if default_series:
                 series = default_series.value
         charm_url = await self.model.add_local_charm_dir(charm_dir, series)
+        if charm_url == self.data['charm-url'] and not resources:
+            # The charm is unchanged, so the controller returned the charm
+            # the application already runs; setting it again does nothing.
+            log.info('Charm %s of %s is unchanged, not refreshing',
+                     charm_url, self.name)
+            return
+
         metadata = utils.get_local_charm_metadata(path)
         if resources is not None:
             resources = await self.model.add_local_resources(self.entity_id,
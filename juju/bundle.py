@@ -1,11 +1,14 @@
 # Copyright 2023 Canonical Ltd.
 # Licensed under the Apache V2, see LICENCE file for details.
 
+import collections
+import hashlib
+import heapq
 import logging
-import io
 import os
+import tempfile
+import time
 import zipfile
-import requests
 import base64
 from contextlib import closing
 from pathlib import Path
@@ -17,7 +20,7 @@ from toposort import toposort_flatten
 from .client import client
 from .constraints import parse as parse_constraints
 from .errors import JujuError
-from . import utils, jasyncio
+from . import charmhub, utils, jasyncio
 from .origin import Channel, Source
 from .url import Schema, URL
 from .utils import get_base_from_origin_or_channel
@@ -31,18 +34,22 @@ class BundleHandler:
     steps and then dispatching each of those using the API.
     """
 
-    def __init__(self, model, trusted=False, forced=False):
+    def __init__(self, model, trusted=False, forced=False,
+                 max_concurrent_changes=8):
         self.model = model
         self.trusted = trusted
         self.forced = forced
+        self.max_concurrent_changes = max_concurrent_changes
         self.bundle = None
         self.overlays = []
         self.overlay_removed_charms = set()
 
         self.plan = []
         self.references = {}
+        self.timings = {}
         self._units_by_app = {}
         self.origins = {}
+        self._model_architecture = None
 
         for unit_name, unit in model.units.items():
             app_units = self._units_by_app.setdefault(unit.application, [])
@@ -325,6 +332,16 @@ class BundleHandler:
         else:
             charm_origin['base'] = origin.base
 
+        # A resolved origin already tells which archive it is, so a cached
+        # one needs no request at all
+        loop = jasyncio.get_running_loop()
+        cache = await loop.run_in_executor(None, BundleArchiveCache)
+        archive_path = await loop.run_in_executor(None, cache.get, cache.key(origin), origin.hash_)
+        if archive_path is not None:
+            bundle_yaml = await loop.run_in_executor(None, self._read_bundle_yaml, archive_path)
+            if bundle_yaml is not None:
+                return bundle_yaml
+
         resp = await self.charms_facade.GetDownloadInfos(entities=[{
             'charm-url': str(charm_url),
             'charm-origin': charm_origin
@@ -336,11 +353,40 @@ class BundleHandler:
         if not result.url:
             raise JujuError("no url found for bundle {}".format(charm_url.name))
 
-        bundle_resp = requests.get(result.url)
-        bundle_resp.raise_for_status()
+        download_origin = result.charm_origin or origin
+        key = cache.key(download_origin) or cache.key(origin)
+        archive_path = await loop.run_in_executor(
+            None, cache.get, key, download_origin.hash_)
+        if archive_path is not None:
+            bundle_yaml = await loop.run_in_executor(None, self._read_bundle_yaml, archive_path)
+            if bundle_yaml is not None:
+                return bundle_yaml
+
+        archive_path = await loop.run_in_executor(
+            None, cache.download, result.url, key, charmhub.default_client().session)
+        try:
+            bundle_yaml = await loop.run_in_executor(None, self._read_bundle_yaml, archive_path)
+        finally:
+            if key is None:
+                # Not cacheable, only downloaded to be read. An invalid
+                # archive is already gone.
+                archive_path.unlink(missing_ok=True)
+        if bundle_yaml is None:
+            raise JujuError("invalid bundle archive for {}".format(charm_url.name))
+        return bundle_yaml
+
+    def _read_bundle_yaml(self, archive_path):
+        """Return the bundle.yaml of the archive at ``archive_path``, or None
+        if it is not a valid archive, which is then removed.
 
-        with closing(bundle_resp), zipfile.ZipFile(io.BytesIO(bundle_resp.content)) as archive:
-            return self._get_bundle_yaml(archive)
+        """
+        try:
+            with zipfile.ZipFile(str(archive_path)) as archive:
+                return self._get_bundle_yaml(archive)
+        except zipfile.BadZipFile:
+            log.warning('Removing invalid bundle archive %s', archive_path)
+            archive_path.unlink()
+            return None
 
     def _get_bundle_yaml(self, archive):
         for member in archive.infolist():
@@ -353,11 +399,12 @@ class BundleHandler:
 
         specs = self.applications_specs
 
+        # name -> (charm url, channel, base, deployed application or None)
+        to_resolve = {}
         for name in self.applications:
             spec = specs[name]
             app = self.model.applications.get(name, None)
 
-            cons = None
             if app is not None:
                 deployed[name] = name
 
@@ -367,54 +414,92 @@ class BundleHandler:
                 if spec['charm'] == app.charm_url:
                     continue
 
-                cons = await app.get_constraints()
-
             if is_local_charm(spec['charm']):
                 continue
 
             charm_url = URL.parse(spec['charm'])
 
             channel = Channel.parse(spec['channel']) if 'channel' in spec else Channel('latest', 'stable')
-            track, risk = channel.track, channel.risk
             series = spec.get('series', self.bundle.get('series', None))
             base = get_base_from_origin_or_channel(channel, series)
-
-            if self.charms_facade is not None:
-                if cons is not None and cons['arch'] != '':
-                    architecture = cons['arch']
-                else:
-                    architecture = await self.model._resolve_architecture(charm_url)
-
-                origin = client.CharmOrigin(source=Source.CHARM_HUB.value,
-                                            architecture=architecture,
-                                            risk=risk,
-                                            track=track,
-                                            base=base,
-                                            )
-                charm_url, charm_origin = await self.model._resolve_charm(charm_url, origin)
-                spec['charm'] = str(charm_url)
+            to_resolve[name] = (charm_url, channel, base, app)
+
+        if not to_resolve:
+            return
+
+        names = list(to_resolve)
+        upgraded = []
+        if self.charms_facade is not None:
+            upgraded = [name for name in names if to_resolve[name][3] is not None]
+        constraints = dict(zip(upgraded, await jasyncio.gather(*(
+            to_resolve[name][3].get_constraints() for name in upgraded))))
+
+        charms = []
+        for name in names:
+            charm_url, channel, base, _ = to_resolve[name]
+            cons = constraints.get(name)
+            if self.charms_facade is not None and cons is not None and cons['arch'] != '':
+                architecture = cons['arch']
+            elif self.charms_facade is not None:
+                architecture = await self.resolve_architecture(charm_url)
             else:
-                charm_origin = client.CharmOrigin(source=Source.CHARM_HUB.value,
-                                                  risk=risk,
-                                                  track=track,
-                                                  base=base,
-                                                  )
-
+                architecture = None
+            charms.append((charm_url, client.CharmOrigin(source=Source.CHARM_HUB.value,
+                                                         architecture=architecture,
+                                                         risk=channel.risk,
+                                                         track=channel.track,
+                                                         base=base,
+                                                         )))
+
+        if self.charms_facade is not None:
+            # All the charms of the bundle are resolved with a single call
+            charms = await self.model._resolve_charms(charms)
+            for name, (charm_url, _) in zip(names, charms):
+                specs[name]['charm'] = str(charm_url)
+
+        for name, (charm_url, charm_origin) in zip(names, charms):
+            channel = to_resolve[name][1]
             if str(channel) not in self.origins:
                 self.origins[str(charm_url)] = {}
             self.origins[str(charm_url)][str(channel)] = charm_origin
 
+    async def resolve_architecture(self, url=None):
+        """Return the architecture to resolve the charm ``url`` for, like
+        `Model._resolve_architecture`, looking up the model constraints only
+        once per bundle.
+
+        """
+        if url is not None and url.architecture:
+            return url.architecture
+        if self._model_architecture is None:
+            self._model_architecture = jasyncio.ensure_future(
+                self.model._resolve_architecture())
+        return await jasyncio.shield(self._model_architecture)
+
     async def execute_plan(self):
+        """Apply the changes of the plan. Independent changes are applied
+        concurrently, up to max_concurrent_changes at a time, and each
+        change is started once all the changes it requires are done (so
+        the $references it uses are already resolved).
+
+        How long each change took is recorded in ``self.timings``.
+        """
         await self._resolve_charms()
 
         changes = ChangeSet(self.plan.changes)
-        for step in changes.sorted():
-            change_cls = self.change_types.get(step.method)
-            if change_cls is None:
+        for step in changes.changes:
+            if step.method not in self.change_types:
                 raise NotImplementedError("unknown change type: {}".format(step.method))
-            change = change_cls(step.id_, step.requires, step.args)
-            log.info("Applying change: {}".format(change))
-            self.references[step.id_] = await change.run(self)
+        await changes.run(self._apply_change, self.max_concurrent_changes)
+
+    async def _apply_change(self, step):
+        change_cls = self.change_types[step.method]
+        change = change_cls(step.id_, step.requires, step.args)
+        log.info("Applying change: {}".format(change))
+        start = time.monotonic()
+        self.references[step.id_] = await change.run(self)
+        self.timings[step.id_] = time.monotonic() - start
+        log.debug("Applied change %s in %.3fs", step.id_, self.timings[step.id_])
 
     @property
     def applications(self):
@@ -440,6 +525,115 @@ class BundleHandler:
         return reference
 
 
+class BundleArchiveCache:
+    """
+    Cache of the bundle archives downloaded from the store, keyed by the
+    id and revision of their origin, so that deploying the same bundle
+    revision again doesn't download it again. When the hash of the origin
+    is known, it is checked against the cached archive.
+
+    This is used automatically by ``BundleHandler._download_bundle``.
+    """
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path=None, max_archives=20):
+        """
+        :param path: Cache folder, defaults to a ``bundles`` folder in
+            :func:`juju.utils.libjuju_cache_dir`
+        :param max_archives: How many archives to keep, the least recently
+            used ones are removed first
+
+        The cache folder is created if needed, so this is blocking.
+        """
+        self.path = Path(path or utils.libjuju_cache_dir('bundles'))
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_archives = max_archives
+
+    @staticmethod
+    def key(origin):
+        """Return the cache key of the archive of ``origin``, or None if the
+        origin doesn't identify a single archive.
+
+        """
+        if origin is None or origin.revision is None or not origin.id_:
+            return None
+        return '{}-{}'.format(origin.id_, origin.revision)
+
+    def _archive_path(self, key):
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.path / '{}.bundle'.format(digest)
+
+    def get(self, key, hash_=None):
+        """Return the path of the cached archive for ``key``, or None.
+        Blocking.
+
+        An archive whose sha256 doesn't match ``hash_``, when given, is
+        removed.
+
+        """
+        if key is None:
+            return None
+        archive_path = self._archive_path(key)
+        try:
+            # mark it as recently used
+            os.utime(str(archive_path))
+            if hash_ and self._sha256(archive_path) != hash_:
+                log.warning('Removing bundle archive %s, its hash does not match', archive_path)
+                archive_path.unlink(missing_ok=True)
+                return None
+        except FileNotFoundError:
+            # not cached, or pruned by another process meanwhile
+            return None
+        return archive_path
+
+    def _sha256(self, archive_path):
+        digest = hashlib.sha256()
+        with archive_path.open('rb') as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def download(self, url, key, session):
+        """Stream the archive at ``url`` to the cache with the requests
+        ``session``, and return its path. Blocking.
+
+        Without a ``key``, the archive is saved to a temporary file of the
+        cache folder that the caller removes.
+
+        """
+        fd, tmp = tempfile.mkstemp(dir=str(self.path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f, \
+                    closing(session.get(url, stream=True, timeout=60)) as resp:
+                resp.raise_for_status()
+                for chunk in resp.iter_content(self.CHUNK_SIZE):
+                    f.write(chunk)
+            if key is None:
+                return Path(tmp)
+            archive_path = self._archive_path(key)
+            os.replace(tmp, str(archive_path))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._prune()
+        return archive_path
+
+    def _prune(self):
+        archives = []
+        for archive_path in self.path.glob('*.bundle'):
+            try:
+                archives.append((archive_path.stat().st_mtime, archive_path))
+            except OSError:
+                # removed by another process meanwhile
+                pass
+        archives.sort(reverse=True)
+        for _, stale in archives[self.max_archives:]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
 def is_local_charm(charm_url):
     return charm_url.startswith('.') or charm_url.startswith('local:') or os.path.isabs(charm_url)
 
@@ -495,16 +689,65 @@ class ChangeSet:
             return []
 
         changes = {}
+        by_id = {}
         for change in self.changes:
             changes[change.id_] = set(change.requires)
-        sorted_changes = toposort_flatten(changes)
-        results = []
-        for change_id in sorted_changes:
-            for change in self.changes:
-                if change_id == change.id_:
-                    results.append(change)
+            by_id.setdefault(change.id_, change)
+        return [by_id[change_id] for change_id in toposort_flatten(changes)
+                if change_id in by_id]
+
+    async def run(self, apply, max_concurrency=None):
+        """Await ``apply(change)`` for every change, starting each one as
+        soon as all the changes it requires are done, with at most
+        ``max_concurrency`` of them running at once (no limit if None).
+
+        Changes that are ready at the same time are started in the order
+        of sorted(), so with a limit of 1 this runs them exactly in that
+        order. After a change fails no further changes are started, and
+        the first error is raised once the running ones are done.
+
+        """
+        order = self.sorted()
+        position = {change.id_: i for i, change in enumerate(order)}
+        waiting_on = {}
+        dependents = collections.defaultdict(list)
+        for change in order:
+            requires = {r for r in change.requires
+                        if r in position and r != change.id_}
+            waiting_on[change.id_] = requires
+            for r in requires:
+                dependents[r].append(change.id_)
+        ready = [position[change.id_] for change in order
+                 if not waiting_on[change.id_]]
+        heapq.heapify(ready)
+
+        running = {}
+        error = None
+        try:
+            while ready or running:
+                while ready and error is None and (
+                        not max_concurrency or len(running) < max_concurrency):
+                    change = order[heapq.heappop(ready)]
+                    running[jasyncio.ensure_future(apply(change))] = change
+                if not running:
                     break
-        return results
+                done, _ = await jasyncio.wait(
+                    set(running), return_when=jasyncio.FIRST_COMPLETED)
+                for task in done:
+                    change = running.pop(task)
+                    if task.exception() is not None:
+                        if error is None:
+                            error = task.exception()
+                        continue
+                    for dependent in dependents[change.id_]:
+                        waiting_on[dependent].discard(change.id_)
+                        if not waiting_on[dependent]:
+                            heapq.heappush(ready, position[dependent])
+        finally:
+            for task in running:
+                task.cancel()
+        if error is not None:
+            raise error
 
 
 class ChangeInfo:
@@ -706,7 +949,7 @@ class AddCharmChange(ChangeInfo):
                 ch = Channel.parse(self.channel).normalize()
             arch = self.architecture
             if not arch:
-                arch = await context.model._resolve_architecture(url)
+                arch = await context.resolve_architecture(url)
             base = get_base_from_origin_or_channel(ch, self.series)
             origin = client.CharmOrigin(source=Source.CHARM_HUB.value,
                                         architecture=arch,
@@ -1,46 +1,248 @@
 # Copyright 2023 Canonical Ltd.
 # Licensed under the Apache V2, see LICENCE file for details.
 
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import utils
 from .client import client
 from .errors import JujuError
+from .origin import Channel
+from .url import Schema, URL
+from .version import DEFAULT_ARCHITECTURE
 from juju import jasyncio
 
-import requests
-import json
+log = logging.getLogger(__name__)
+
+
+class CharmHubClient:
+    """
+    HTTP client for the CharmHub API, that doesn't block the event loop.
+
+    Requests are made with a pooled keep-alive ``requests.Session`` in the
+    default executor. Responses are cached on disk: a response younger
+    than ``ttl`` seconds is reused without any request, and an older one is
+    revalidated with its ETag or Last-Modified date. Failed requests are
+    retried with exponential backoff and jitter.
+
+    One client is shared by all the models of the process, see
+    `default_client`.
+    """
+    # Statuses worth retrying, other errors are raised at once
+    RETRY_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+
+    def __init__(self, cache_dir=None, ttl=300.0, retries=5, backoff=0.5,
+                 max_backoff=10.0, timeout=30.0, pool_size=10):
+        """
+        :param cache_dir: Response cache folder, defaults to a ``charmhub``
+            folder in :func:`juju.utils.libjuju_cache_dir`
+        :param float ttl: Seconds a cached response is used without
+            revalidating it, 0 to always revalidate
+        :param int retries: How many times a request is attempted
+        :param float backoff: Upper bound of the first retry delay, doubled
+            for each further retry up to ``max_backoff``
+        :param float timeout: Seconds to wait for the server to answer
+        :param int pool_size: How many keep-alive connections to keep
+        """
+        self._cache_dir = cache_dir
+        self.ttl = ttl
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @property
+    def cache_dir(self):
+        if self._cache_dir is None:
+            self._cache_dir = utils.libjuju_cache_dir('charmhub')
+        return Path(self._cache_dir)
+
+    async def get(self, url):
+        """Return the decoded JSON response of a GET of ``url``.
+
+        :raises: :class:`JujuError` if the request fails, with the status
+            code in its message
+        """
+        return await self._request(self._get, url)
+
+    async def post(self, url, body):
+        """Return the decoded JSON response of a POST of the JSON ``body``
+        to ``url``. Such responses are not cached.
+
+        """
+        return await self._request(self._post, url, body)
+
+    async def _request(self, method, url, *args):
+        loop = jasyncio.get_running_loop()
+        for attempt in range(self.retries):
+            try:
+                status, body = await loop.run_in_executor(None, method, url, *args)
+            except requests.RequestException as e:
+                status, body = None, e
+            if status == 200:
+                return json.loads(body)
+            if status is not None and status not in self.RETRY_STATUSES:
+                break
+            if attempt + 1 < self.retries:
+                delay = self._delay(attempt)
+                log.debug('Retrying %s in %.1fs after %s', url, delay, status or body)
+                await jasyncio.sleep(delay)
+        if status is None:
+            raise JujuError("Failed to get {}: {}".format(url, body))
+        raise JujuError("Got {} from {}".format(status, url))
+
+    def _delay(self, attempt):
+        # "Full jitter": spread the retries of concurrent callers
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _get(self, url):
+        """Return the status and body of a GET of ``url``, from the cache
+        where possible. Blocking, run in an executor.
+
+        """
+        path = self.cache_dir / (hashlib.sha256(url.encode()).hexdigest() + '.json')
+        entry = self._read(path)
+        if entry is not None and time.time() - entry['fetched'] < self.ttl:
+            return 200, entry['body']
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last-modified'):
+                headers['If-Modified-Since'] = entry['last-modified']
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and entry is not None:
+            entry['fetched'] = time.time()
+            self._write(path, entry)
+            return 200, entry['body']
+        if response.status_code == 200:
+            self._write(path, {
+                'url': url,
+                'fetched': time.time(),
+                'etag': response.headers.get('ETag'),
+                'last-modified': response.headers.get('Last-Modified'),
+                'body': response.text,
+            })
+            return 200, response.text
+        return response.status_code, None
+
+    def _post(self, url, body):
+        response = self.session.post(url, json=body, timeout=self.timeout)
+        return response.status_code, response.text
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(str(path)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path, entry):
+        try:
+            fd, tmp = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp, str(path))
+        except OSError:
+            log.debug('Cannot cache %s', entry['url'], exc_info=True)
+
+    def clear(self):
+        """Remove all the cached responses."""
+        for path in self.cache_dir.glob('*.json'):
+            path.unlink()
+
+
+_default_client = None
+
+
+def default_client():
+    """Return the CharmHubClient shared by all the models of the process."""
+    global _default_client
+    if _default_client is None:
+        _default_client = CharmHubClient()
+    return _default_client
 
 
 class CharmHub:
-    def __init__(self, model):
+    def __init__(self, model, http=None):
+        """
+        :param model: The model to look up the charmhub-url of
+        :param http: The CharmHubClient to make requests with, defaults to
+            `default_client`
+        """
         self.model = model
+        self._http = http
+        self._url = None
+
+    @property
+    def http(self):
+        if self._http is None:
+            self._http = default_client()
+        return self._http
 
     async def _charmhub_url(self):
-        model_conf = await self.model.get_config()
-        return model_conf['charmhub-url']
+        # The charmhub-url of a model is set when the model is created
+        if self._url is None:
+            model_conf = await self.model.get_config()
+            self._url = model_conf['charmhub-url'].value
+        return self._url
 
     async def request_charmhub_with_retry(self, url, retries):
+        """GET ``url`` without caching, trying up to ``retries`` times (at
+        least once) like :class:`CharmHubClient`, and return the response.
+
+        """
+        loop = jasyncio.get_running_loop()
+        retries = max(retries, 1)
         for attempt in range(retries):
-            _response = requests.get(url)
-            if _response.status_code == 200:
+            try:
+                _response = await loop.run_in_executor(
+                    None, partial(self.http.session.get, url, timeout=self.http.timeout))
+            except requests.RequestException as e:
+                status, _response = None, e
+            else:
+                status = _response.status_code
+            if status == 200:
                 return _response
-            await jasyncio.sleep(5)
-        raise JujuError("Got {} from {}".format(_response.status_code, url))
+            if status is not None and status not in self.http.RETRY_STATUSES:
+                break
+            if attempt + 1 < retries:
+                await jasyncio.sleep(self.http._delay(attempt))
+        if status is None:
+            raise JujuError("Failed to get {}: {}".format(url, _response))
+        raise JujuError("Got {} from {}".format(status, url))
 
-    async def get_charm_id(self, charm_name):
-        conn, headers, path_prefix = self.model.connection().https_connection()
+    async def _get(self, path, **params):
+        url = '{}/v2/charms/{}'.format(await self._charmhub_url(), path)
+        params = {k: v for k, v in params.items() if v is not None}
+        if params:
+            url = '{}?{}'.format(url, urlencode(params, doseq=True))
+        return await self.http.get(url)
 
-        charmhub_url = await self._charmhub_url()
-        url = "{}/v2/charms/info/{}".format(charmhub_url.value, charm_name)
-        _response = await self.request_charmhub_with_retry(url, 5)
-        response = json.loads(_response.text)
+    async def get_charm_id(self, charm_name):
+        response = await self._get('info/{}'.format(charm_name))
         return response['id'], response['name']
 
     async def is_subordinate(self, charm_name):
-        conn, headers, path_prefix = self.model.connection().https_connection()
-
-        charmhub_url = await self._charmhub_url()
-        url = "{}/v2/charms/info/{}?fields=default-release.revision.subordinate".format(charmhub_url.value, charm_name)
-        _response = await self.request_charmhub_with_retry(url, 5)
-        response = json.loads(_response.text)
+        response = await self._get('info/{}'.format(charm_name),
+                                   fields='default-release.revision.subordinate')
         rev_response = response['default-release']['revision']
         return 'subordinate' in rev_response and rev_response['subordinate']
 
@@ -48,12 +250,8 @@ class CharmHub:
     #  api call without needing the CharmHub facade
 
     async def list_resources(self, charm_name):
-        conn, headers, path_prefix = self.model.connection().https_connection()
-
-        charmhub_url = await self._charmhub_url()
-        url = "{}/v2/charms/info/{}?fields=default-release.resources".format(charmhub_url.value, charm_name)
-        _response = await self.request_charmhub_with_retry(url, 5)
-        response = json.loads(_response.text)
+        response = await self._get('info/{}'.format(charm_name),
+                                   fields='default-release.resources')
         return response['default-release']['resources']
 
     async def info(self, name, channel=None):
@@ -85,15 +283,12 @@ class CharmHub:
                 channel=channel)
             result = result.serialize()
         else:
-            charmhub_url = await self._charmhub_url()
-            url = "{}/v2/charms/info/{}?fields=channel-map".format(
-                charmhub_url.value, name)
             try:
-                _response = await self.request_charmhub_with_retry(url, 5)
+                result = await self._get('info/{}'.format(name), fields='channel-map')
             except JujuError as e:
                 if '404' in e.message:
                     raise JujuError(f'{name} not found') from e
-            result = json.loads(_response.text)
+                raise
             result['channel-map'] = CharmHub._channel_list_to_map(result['channel-map'],
                                                                   name,
                                                                   channel=channel)
@@ -157,14 +352,95 @@ class CharmHub:
                    relation_requires=None, relation_provides=None):
         """find queries the CharmHub store for available charms or bundles.
 
+        Returns the decoded response of the CharmHub find API, whose
+        ``results`` are the charms and bundles found.
+
         """
         if charm_type is not None and charm_type not in ["charm", "bundle"]:
             raise JujuError("expected either charm or bundle for charm_type")
 
-        facade = self._facade()
-        return await facade.Find(query=query, category=category, channel=channel,
-                                 type_=charm_type, platforms=platforms, publisher=publisher,
-                                 relation_provides=relation_provides, relation_requires=relation_requires)
+        return await self._get('find', q=query, category=category, channel=channel,
+                               type=charm_type, platforms=platforms, publisher=publisher,
+                               **{'relation-provides': relation_provides,
+                                  'relation-requires': relation_requires})
+
+    async def bulk_refresh_info(self, apps=None, channels=None):
+        """Look up the revisions the charms of many applications can be
+        refreshed to, with a single request to the CharmHub refresh API.
+
+        The charm, base and channel of each application come from its
+        charm url and the model status. Local charms are skipped.
+
+        :param [Application] apps: The applications to look up, defaults
+            to all the applications of the model
+        :param [str] channels: More channels to look up besides the one
+            each application tracks, e.g. ``['candidate', '2.0/edge']``; a
+            channel without track is in the tracked track
+        :return: A dict by application name of dicts with the ``charm``
+            name, its current ``revision`` and the ``channels`` looked up,
+            with the ``revision`` and ``version`` available in each, or the
+            ``error`` looking it up::
+
+                {'ubuntu': {'charm': 'ubuntu', 'revision': 21, 'channels': {
+                    'latest/stable': {'revision': 24, 'version': '24.04'}}}}
+
+            An application whose base is unknown gets an ``error`` instead
+            of ``channels``.
+        :raises: :class:`JujuError` if CharmHub rejects the whole request
+        """
+        if apps is None:
+            apps = list(self.model.applications.values())
+        status = await self.model.get_status()
+
+        results, actions = {}, []
+        for app in apps:
+            app_status = status.applications.get(app.name)
+            url = URL.parse(app.charm_url)
+            if app_status is None or not Schema.CHARM_HUB.matches(url.schema):
+                continue
+            tracked = Channel.parse(app_status.charm_channel or 'stable')
+            track = tracked.track or 'latest'
+            results[app.name] = {'charm': url.name, 'revision': url.revision}
+            base = app_status.base
+            if base is None or not base.channel:
+                # e.g. a controller too old to report bases
+                if url.series not in utils.UBUNTU_SERIES:
+                    results[app.name]['error'] = 'unknown base'
+                    continue
+                base = client.Base(name='ubuntu',
+                                   channel=utils.get_series_version(url.series))
+            results[app.name]['channels'] = {}
+            for channel in [tracked] + [Channel.parse(c) for c in channels or []]:
+                channel = '{}/{}'.format(channel.track or track, channel.risk)
+                if channel in results[app.name]['channels']:
+                    continue
+                results[app.name]['channels'][channel] = None
+                actions.append({
+                    'action': 'install',
+                    'instance-key': '{}/{}'.format(app.name, channel),
+                    'name': url.name,
+                    'channel': channel,
+                    'base': {'name': base.name,
+                             'channel': base.channel,
+                             'architecture': url.architecture or DEFAULT_ARCHITECTURE},
+                })
+        if not actions:
+            return results
+
+        response = await self.http.post(
+            '{}/v2/charms/refresh'.format(await self._charmhub_url()),
+            {'context': [], 'actions': actions, 'fields': ['revision', 'version']})
+        if response.get('error-list'):
+            raise JujuError([error.get('message') for error in response['error-list']])
+        for result in response.get('results') or []:
+            app_name, _, channel = result['instance-key'].partition('/')
+            if result.get('error'):
+                candidate = {'error': result['error'].get('message')}
+            else:
+                candidate = {'revision': result['charm']['revision'],
+                             'version': result['charm'].get('version')}
+            results[app_name]['channels'][channel] = candidate
+        return results
 
     def _facade(self):
         return client.CharmHubFacade.from_connection(self.model.connection())
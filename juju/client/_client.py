@@ -3,25 +3,54 @@
 
 from juju.client._definitions import *
 
+import importlib
+from collections.abc import Mapping
 
-from juju.client import _client7, _client1, _client3, _client4, _client2, _client17, _client6, _client11, _client10, _client5, _client9, _client18, _client19
-
-
-CLIENTS = {
-    "7": _client7,
-    "1": _client1,
-    "3": _client3,
-    "4": _client4,
-    "2": _client2,
-    "17": _client17,
-    "6": _client6,
-    "11": _client11,
-    "10": _client10,
-    "5": _client5,
-    "9": _client9,
-    "18": _client18,
-    "19": _client19
-}
+
+class ClientModules(Mapping):
+    """
+    Maps facade versions to their _client<version> module, importing each
+    module the first time it is looked up.
+
+    Callables in ``on_import`` are called with every newly imported module.
+
+    """
+    def __init__(self, names):
+        self._names = names
+        self._modules = {}
+        self.on_import = []
+
+    def __getitem__(self, version):
+        module = self._modules.get(version)
+        if module is None:
+            module = importlib.import_module(self._names[version])
+            for hook in self.on_import:
+                hook(module)
+            self._modules[version] = module
+        return module
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+CLIENTS = ClientModules({
+    "7": "juju.client._client7",
+    "1": "juju.client._client1",
+    "3": "juju.client._client3",
+    "4": "juju.client._client4",
+    "2": "juju.client._client2",
+    "17": "juju.client._client17",
+    "6": "juju.client._client6",
+    "11": "juju.client._client11",
+    "10": "juju.client._client10",
+    "5": "juju.client._client5",
+    "9": "juju.client._client9",
+    "18": "juju.client._client18",
+    "19": "juju.client._client19"
+})
 
 
 def lookup_facade(name, version):
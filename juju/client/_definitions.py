@@ -5,8 +5,10 @@ from juju.client.facade import Type, ReturnMapping
 
 
 class APIHostPortsResult(Type):
+    __slots__ = ('servers', 'unknown_fields')
     _toSchema = {'servers': 'servers'}
     _toPy = {'servers': 'servers'}
+    _wireTypes = {'servers': ('HostPort', 'list')}
     def __init__(self, servers=None, **unknown_fields):
         '''
         servers : typing.Sequence[~HostPort]
@@ -23,8 +25,10 @@ class APIHostPortsResult(Type):
 
 
 class Action(Type):
+    __slots__ = ('execution_group', 'name', 'parallel', 'parameters', 'receiver', 'tag', 'unknown_fields')
     _toSchema = {'execution_group': 'execution-group', 'name': 'name', 'parallel': 'parallel', 'parameters': 'parameters', 'receiver': 'receiver', 'tag': 'tag'}
     _toPy = {'execution-group': 'execution_group', 'name': 'name', 'parallel': 'parallel', 'parameters': 'parameters', 'receiver': 'receiver', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, execution_group=None, name=None, parallel=None, parameters=None, receiver=None, tag=None, **unknown_fields):
         '''
         execution_group : str
@@ -71,8 +75,10 @@ class Action(Type):
 
 
 class ActionExecutionResult(Type):
+    __slots__ = ('action_tag', 'message', 'results', 'status', 'unknown_fields')
     _toSchema = {'action_tag': 'action-tag', 'message': 'message', 'results': 'results', 'status': 'status'}
     _toPy = {'action-tag': 'action_tag', 'message': 'message', 'results': 'results', 'status': 'status'}
+    _wireTypes = {}
     def __init__(self, action_tag=None, message=None, results=None, status=None, **unknown_fields):
         '''
         action_tag : str
@@ -107,8 +113,10 @@ class ActionExecutionResult(Type):
 
 
 class ActionExecutionResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ActionExecutionResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ActionExecutionResult]
@@ -125,8 +133,10 @@ class ActionExecutionResults(Type):
 
 
 class ActionMessage(Type):
+    __slots__ = ('message', 'timestamp', 'unknown_fields')
     _toSchema = {'message': 'message', 'timestamp': 'timestamp'}
     _toPy = {'message': 'message', 'timestamp': 'timestamp'}
+    _wireTypes = {}
     def __init__(self, message=None, timestamp=None, **unknown_fields):
         '''
         message : str
@@ -149,8 +159,10 @@ class ActionMessage(Type):
 
 
 class ActionMessageParams(Type):
+    __slots__ = ('messages', 'unknown_fields')
     _toSchema = {'messages': 'messages'}
     _toPy = {'messages': 'messages'}
+    _wireTypes = {'messages': ('EntityString', 'list')}
     def __init__(self, messages=None, **unknown_fields):
         '''
         messages : typing.Sequence[~EntityString]
@@ -167,8 +179,10 @@ class ActionMessageParams(Type):
 
 
 class ActionPruneArgs(Type):
+    __slots__ = ('max_history_mb', 'max_history_time', 'unknown_fields')
     _toSchema = {'max_history_mb': 'max-history-mb', 'max_history_time': 'max-history-time'}
     _toPy = {'max-history-mb': 'max_history_mb', 'max-history-time': 'max_history_time'}
+    _wireTypes = {}
     def __init__(self, max_history_mb=None, max_history_time=None, **unknown_fields):
         '''
         max_history_mb : int
@@ -191,8 +205,10 @@ class ActionPruneArgs(Type):
 
 
 class ActionResult(Type):
+    __slots__ = ('action', 'completed', 'enqueued', 'error', 'log', 'message', 'output', 'started', 'status', 'unknown_fields')
     _toSchema = {'action': 'action', 'completed': 'completed', 'enqueued': 'enqueued', 'error': 'error', 'log': 'log', 'message': 'message', 'output': 'output', 'started': 'started', 'status': 'status'}
     _toPy = {'action': 'action', 'completed': 'completed', 'enqueued': 'enqueued', 'error': 'error', 'log': 'log', 'message': 'message', 'output': 'output', 'started': 'started', 'status': 'status'}
+    _wireTypes = {'action': ('Action', None), 'error': ('Error', None), 'log': ('ActionMessage', 'list')}
     def __init__(self, action=None, completed=None, enqueued=None, error=None, log=None, message=None, output=None, started=None, status=None, **unknown_fields):
         '''
         action : Action
@@ -257,8 +273,10 @@ class ActionResult(Type):
 
 
 class ActionResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ActionResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ActionResult]
@@ -275,8 +293,10 @@ class ActionResults(Type):
 
 
 class ActionSpec(Type):
+    __slots__ = ('description', 'params', 'unknown_fields')
     _toSchema = {'description': 'description', 'params': 'params'}
     _toPy = {'description': 'description', 'params': 'params'}
+    _wireTypes = {}
     def __init__(self, description=None, params=None, **unknown_fields):
         '''
         description : str
@@ -299,8 +319,10 @@ class ActionSpec(Type):
 
 
 class Actions(Type):
+    __slots__ = ('actions', 'unknown_fields')
     _toSchema = {'actions': 'actions'}
     _toPy = {'actions': 'actions'}
+    _wireTypes = {'actions': ('Action', 'list')}
     def __init__(self, actions=None, **unknown_fields):
         '''
         actions : typing.Sequence[~Action]
@@ -317,8 +339,10 @@ class Actions(Type):
 
 
 class ActionsByReceiver(Type):
+    __slots__ = ('actions', 'error', 'receiver', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'error': 'error', 'receiver': 'receiver'}
     _toPy = {'actions': 'actions', 'error': 'error', 'receiver': 'receiver'}
+    _wireTypes = {'actions': ('ActionResult', 'list'), 'error': ('Error', None)}
     def __init__(self, actions=None, error=None, receiver=None, **unknown_fields):
         '''
         actions : typing.Sequence[~ActionResult]
@@ -347,8 +371,10 @@ class ActionsByReceiver(Type):
 
 
 class ActionsByReceivers(Type):
+    __slots__ = ('actions', 'unknown_fields')
     _toSchema = {'actions': 'actions'}
     _toPy = {'actions': 'actions'}
+    _wireTypes = {'actions': ('ActionsByReceiver', 'list')}
     def __init__(self, actions=None, **unknown_fields):
         '''
         actions : typing.Sequence[~ActionsByReceiver]
@@ -365,8 +391,10 @@ class ActionsByReceivers(Type):
 
 
 class ActivateModelArgs(Type):
+    __slots__ = ('controller_alias', 'controller_tag', 'cross_model_uuids', 'model_tag', 'source_api_addrs', 'source_ca_cert', 'unknown_fields')
     _toSchema = {'controller_alias': 'controller-alias', 'controller_tag': 'controller-tag', 'cross_model_uuids': 'cross-model-uuids', 'model_tag': 'model-tag', 'source_api_addrs': 'source-api-addrs', 'source_ca_cert': 'source-ca-cert'}
     _toPy = {'controller-alias': 'controller_alias', 'controller-tag': 'controller_tag', 'cross-model-uuids': 'cross_model_uuids', 'model-tag': 'model_tag', 'source-api-addrs': 'source_api_addrs', 'source-ca-cert': 'source_ca_cert'}
+    _wireTypes = {}
     def __init__(self, controller_alias=None, controller_tag=None, cross_model_uuids=None, model_tag=None, source_api_addrs=None, source_ca_cert=None, **unknown_fields):
         '''
         controller_alias : str
@@ -413,8 +441,10 @@ class ActivateModelArgs(Type):
 
 
 class AddApplicationOffer(Type):
+    __slots__ = ('application_description', 'application_name', 'endpoints', 'model_tag', 'offer_name', 'owner_tag', 'unknown_fields')
     _toSchema = {'application_description': 'application-description', 'application_name': 'application-name', 'endpoints': 'endpoints', 'model_tag': 'model-tag', 'offer_name': 'offer-name', 'owner_tag': 'owner-tag'}
     _toPy = {'application-description': 'application_description', 'application-name': 'application_name', 'endpoints': 'endpoints', 'model-tag': 'model_tag', 'offer-name': 'offer_name', 'owner-tag': 'owner_tag'}
+    _wireTypes = {}
     def __init__(self, application_description=None, application_name=None, endpoints=None, model_tag=None, offer_name=None, owner_tag=None, **unknown_fields):
         '''
         application_description : str
@@ -461,8 +491,10 @@ class AddApplicationOffer(Type):
 
 
 class AddApplicationOffers(Type):
+    __slots__ = ('offers', 'unknown_fields')
     _toSchema = {'offers': 'Offers'}
     _toPy = {'Offers': 'offers'}
+    _wireTypes = {'offers': ('AddApplicationOffer', 'list')}
     def __init__(self, offers=None, **unknown_fields):
         '''
         offers : typing.Sequence[~AddApplicationOffer]
@@ -479,8 +511,10 @@ class AddApplicationOffers(Type):
 
 
 class AddApplicationUnits(Type):
+    __slots__ = ('application', 'attach_storage', 'num_units', 'placement', 'policy', 'unknown_fields')
     _toSchema = {'application': 'application', 'attach_storage': 'attach-storage', 'num_units': 'num-units', 'placement': 'placement', 'policy': 'policy'}
     _toPy = {'application': 'application', 'attach-storage': 'attach_storage', 'num-units': 'num_units', 'placement': 'placement', 'policy': 'policy'}
+    _wireTypes = {'placement': ('Placement', 'list')}
     def __init__(self, application=None, attach_storage=None, num_units=None, placement=None, policy=None, **unknown_fields):
         '''
         application : str
@@ -521,8 +555,10 @@ class AddApplicationUnits(Type):
 
 
 class AddApplicationUnitsResults(Type):
+    __slots__ = ('units', 'unknown_fields')
     _toSchema = {'units': 'units'}
     _toPy = {'units': 'units'}
+    _wireTypes = {}
     def __init__(self, units=None, **unknown_fields):
         '''
         units : typing.Sequence[str]
@@ -539,8 +575,10 @@ class AddApplicationUnitsResults(Type):
 
 
 class AddCharmWithOrigin(Type):
+    __slots__ = ('charm_origin', 'force', 'url', 'unknown_fields')
     _toSchema = {'charm_origin': 'charm-origin', 'force': 'force', 'url': 'url'}
     _toPy = {'charm-origin': 'charm_origin', 'force': 'force', 'url': 'url'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None)}
     def __init__(self, charm_origin=None, force=None, url=None, **unknown_fields):
         '''
         charm_origin : CharmOrigin
@@ -569,8 +607,10 @@ class AddCharmWithOrigin(Type):
 
 
 class AddCloudArgs(Type):
+    __slots__ = ('cloud', 'force', 'name', 'unknown_fields')
     _toSchema = {'cloud': 'cloud', 'force': 'force', 'name': 'name'}
     _toPy = {'cloud': 'cloud', 'force': 'force', 'name': 'name'}
+    _wireTypes = {'cloud': ('Cloud', None)}
     def __init__(self, cloud=None, force=None, name=None, **unknown_fields):
         '''
         cloud : Cloud
@@ -599,8 +639,10 @@ class AddCloudArgs(Type):
 
 
 class AddMachineParams(Type):
+    __slots__ = ('addresses', 'base', 'constraints', 'container_type', 'disks', 'hardware_characteristics', 'instance_id', 'jobs', 'nonce', 'parent_id', 'placement', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'base': 'base', 'constraints': 'constraints', 'container_type': 'container-type', 'disks': 'disks', 'hardware_characteristics': 'hardware-characteristics', 'instance_id': 'instance-id', 'jobs': 'jobs', 'nonce': 'nonce', 'parent_id': 'parent-id', 'placement': 'placement'}
     _toPy = {'addresses': 'addresses', 'base': 'base', 'constraints': 'constraints', 'container-type': 'container_type', 'disks': 'disks', 'hardware-characteristics': 'hardware_characteristics', 'instance-id': 'instance_id', 'jobs': 'jobs', 'nonce': 'nonce', 'parent-id': 'parent_id', 'placement': 'placement'}
+    _wireTypes = {'addresses': ('Address', 'list'), 'base': ('Base', None), 'constraints': ('Value', None), 'disks': ('Constraints', 'list'), 'hardware_characteristics': ('HardwareCharacteristics', None), 'placement': ('Placement', None)}
     def __init__(self, addresses=None, base=None, constraints=None, container_type=None, disks=None, hardware_characteristics=None, instance_id=None, jobs=None, nonce=None, parent_id=None, placement=None, **unknown_fields):
         '''
         addresses : typing.Sequence[~Address]
@@ -677,8 +719,10 @@ class AddMachineParams(Type):
 
 
 class AddMachines(Type):
+    __slots__ = ('params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
+    _wireTypes = {'params': ('AddMachineParams', 'list')}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~AddMachineParams]
@@ -695,8 +739,10 @@ class AddMachines(Type):
 
 
 class AddMachinesResult(Type):
+    __slots__ = ('error', 'machine', 'unknown_fields')
     _toSchema = {'error': 'error', 'machine': 'machine'}
     _toPy = {'error': 'error', 'machine': 'machine'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, machine=None, **unknown_fields):
         '''
         error : Error
@@ -719,8 +765,10 @@ class AddMachinesResult(Type):
 
 
 class AddMachinesResults(Type):
+    __slots__ = ('machines', 'unknown_fields')
     _toSchema = {'machines': 'machines'}
     _toPy = {'machines': 'machines'}
+    _wireTypes = {'machines': ('AddMachinesResult', 'list')}
     def __init__(self, machines=None, **unknown_fields):
         '''
         machines : typing.Sequence[~AddMachinesResult]
@@ -737,8 +785,10 @@ class AddMachinesResults(Type):
 
 
 class AddPendingResourcesArgsV2(Type):
+    __slots__ = ('entity', 'charm_origin', 'macaroon', 'resources', 'tag', 'url', 'unknown_fields')
     _toSchema = {'charm_origin': 'charm-origin', 'entity': 'Entity', 'macaroon': 'macaroon', 'resources': 'resources', 'tag': 'tag', 'url': 'url'}
     _toPy = {'Entity': 'entity', 'charm-origin': 'charm_origin', 'macaroon': 'macaroon', 'resources': 'resources', 'tag': 'tag', 'url': 'url'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None), 'entity': ('Entity', None), 'macaroon': ('Macaroon', None), 'resources': ('CharmResource', 'list')}
     def __init__(self, entity=None, charm_origin=None, macaroon=None, resources=None, tag=None, url=None, **unknown_fields):
         '''
         entity : Entity
@@ -785,8 +835,10 @@ class AddPendingResourcesArgsV2(Type):
 
 
 class AddPendingResourcesResult(Type):
+    __slots__ = ('errorresult', 'error', 'pending_ids', 'unknown_fields')
     _toSchema = {'error': 'error', 'errorresult': 'ErrorResult', 'pending_ids': 'pending-ids'}
     _toPy = {'ErrorResult': 'errorresult', 'error': 'error', 'pending-ids': 'pending_ids'}
+    _wireTypes = {'error': ('Error', None), 'errorresult': ('ErrorResult', None)}
     def __init__(self, errorresult=None, error=None, pending_ids=None, **unknown_fields):
         '''
         errorresult : ErrorResult
@@ -815,8 +867,10 @@ class AddPendingResourcesResult(Type):
 
 
 class AddRelation(Type):
+    __slots__ = ('endpoints', 'via_cidrs', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints', 'via_cidrs': 'via-cidrs'}
     _toPy = {'endpoints': 'endpoints', 'via-cidrs': 'via_cidrs'}
+    _wireTypes = {}
     def __init__(self, endpoints=None, via_cidrs=None, **unknown_fields):
         '''
         endpoints : typing.Sequence[str]
@@ -839,8 +893,10 @@ class AddRelation(Type):
 
 
 class AddRelationResults(Type):
+    __slots__ = ('endpoints', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints'}
     _toPy = {'endpoints': 'endpoints'}
+    _wireTypes = {'endpoints': ('CharmRelation', 'dict')}
     def __init__(self, endpoints=None, **unknown_fields):
         '''
         endpoints : typing.Mapping[str, ~CharmRelation]
@@ -857,8 +913,10 @@ class AddRelationResults(Type):
 
 
 class AddSecretBackendArg(Type):
+    __slots__ = ('secretbackend', 'backend_type', 'config', 'id_', 'name', 'token_rotate_interval', 'unknown_fields')
     _toSchema = {'backend_type': 'backend-type', 'config': 'config', 'id_': 'id', 'name': 'name', 'secretbackend': 'SecretBackend', 'token_rotate_interval': 'token-rotate-interval'}
     _toPy = {'SecretBackend': 'secretbackend', 'backend-type': 'backend_type', 'config': 'config', 'id': 'id_', 'name': 'name', 'token-rotate-interval': 'token_rotate_interval'}
+    _wireTypes = {'secretbackend': ('SecretBackend', None)}
     def __init__(self, secretbackend=None, backend_type=None, config=None, id_=None, name=None, token_rotate_interval=None, **unknown_fields):
         '''
         secretbackend : SecretBackend
@@ -905,8 +963,10 @@ class AddSecretBackendArg(Type):
 
 
 class AddSecretBackendArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('AddSecretBackendArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~AddSecretBackendArg]
@@ -923,8 +983,10 @@ class AddSecretBackendArgs(Type):
 
 
 class AddStorageDetails(Type):
+    __slots__ = ('storage_tags', 'unknown_fields')
     _toSchema = {'storage_tags': 'storage-tags'}
     _toPy = {'storage-tags': 'storage_tags'}
+    _wireTypes = {}
     def __init__(self, storage_tags=None, **unknown_fields):
         '''
         storage_tags : typing.Sequence[str]
@@ -941,8 +1003,10 @@ class AddStorageDetails(Type):
 
 
 class AddStorageResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('AddStorageDetails', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -965,8 +1029,10 @@ class AddStorageResult(Type):
 
 
 class AddStorageResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('AddStorageResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~AddStorageResult]
@@ -983,8 +1049,10 @@ class AddStorageResults(Type):
 
 
 class AddUser(Type):
+    __slots__ = ('display_name', 'password', 'username', 'unknown_fields')
     _toSchema = {'display_name': 'display-name', 'password': 'password', 'username': 'username'}
     _toPy = {'display-name': 'display_name', 'password': 'password', 'username': 'username'}
+    _wireTypes = {}
     def __init__(self, display_name=None, password=None, username=None, **unknown_fields):
         '''
         display_name : str
@@ -1013,8 +1081,10 @@ class AddUser(Type):
 
 
 class AddUserResult(Type):
+    __slots__ = ('error', 'secret_key', 'tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'secret_key': 'secret-key', 'tag': 'tag'}
     _toPy = {'error': 'error', 'secret-key': 'secret_key', 'tag': 'tag'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, secret_key=None, tag=None, **unknown_fields):
         '''
         error : Error
@@ -1043,8 +1113,10 @@ class AddUserResult(Type):
 
 
 class AddUserResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('AddUserResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~AddUserResult]
@@ -1061,8 +1133,10 @@ class AddUserResults(Type):
 
 
 class AddUsers(Type):
+    __slots__ = ('users', 'unknown_fields')
     _toSchema = {'users': 'users'}
     _toPy = {'users': 'users'}
+    _wireTypes = {'users': ('AddUser', 'list')}
     def __init__(self, users=None, **unknown_fields):
         '''
         users : typing.Sequence[~AddUser]
@@ -1079,8 +1153,10 @@ class AddUsers(Type):
 
 
 class Address(Type):
+    __slots__ = ('cidr', 'config_type', 'is_secondary', 'scope', 'space_id', 'space_name', 'type_', 'value', 'unknown_fields')
     _toSchema = {'cidr': 'cidr', 'config_type': 'config-type', 'is_secondary': 'is-secondary', 'scope': 'scope', 'space_id': 'space-id', 'space_name': 'space-name', 'type_': 'type', 'value': 'value'}
     _toPy = {'cidr': 'cidr', 'config-type': 'config_type', 'is-secondary': 'is_secondary', 'scope': 'scope', 'space-id': 'space_id', 'space-name': 'space_name', 'type': 'type_', 'value': 'value'}
+    _wireTypes = {}
     def __init__(self, cidr=None, config_type=None, is_secondary=None, scope=None, space_id=None, space_name=None, type_=None, value=None, **unknown_fields):
         '''
         cidr : str
@@ -1139,8 +1215,10 @@ class Address(Type):
 
 
 class AdoptResourcesArgs(Type):
+    __slots__ = ('model_tag', 'source_controller_version', 'unknown_fields')
     _toSchema = {'model_tag': 'model-tag', 'source_controller_version': 'source-controller-version'}
     _toPy = {'model-tag': 'model_tag', 'source-controller-version': 'source_controller_version'}
+    _wireTypes = {'source_controller_version': ('Number', None)}
     def __init__(self, model_tag=None, source_controller_version=None, **unknown_fields):
         '''
         model_tag : str
@@ -1163,8 +1241,10 @@ class AdoptResourcesArgs(Type):
 
 
 class AgentGetEntitiesResult(Type):
+    __slots__ = ('container_type', 'error', 'jobs', 'life', 'unknown_fields')
     _toSchema = {'container_type': 'container-type', 'error': 'error', 'jobs': 'jobs', 'life': 'life'}
     _toPy = {'container-type': 'container_type', 'error': 'error', 'jobs': 'jobs', 'life': 'life'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, container_type=None, error=None, jobs=None, life=None, **unknown_fields):
         '''
         container_type : str
@@ -1199,8 +1279,10 @@ class AgentGetEntitiesResult(Type):
 
 
 class AgentGetEntitiesResults(Type):
+    __slots__ = ('entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
+    _wireTypes = {'entities': ('AgentGetEntitiesResult', 'list')}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~AgentGetEntitiesResult]
@@ -1217,8 +1299,10 @@ class AgentGetEntitiesResults(Type):
 
 
 class AllWatcherId(Type):
+    __slots__ = ('watcher_id', 'unknown_fields')
     _toSchema = {'watcher_id': 'watcher-id'}
     _toPy = {'watcher-id': 'watcher_id'}
+    _wireTypes = {}
     def __init__(self, watcher_id=None, **unknown_fields):
         '''
         watcher_id : str
@@ -1235,8 +1319,10 @@ class AllWatcherId(Type):
 
 
 class AllWatcherNextResults(Type):
+    __slots__ = ('deltas', 'unknown_fields')
     _toSchema = {'deltas': 'deltas'}
     _toPy = {'deltas': 'deltas'}
+    _wireTypes = {'deltas': ('Delta', 'list')}
     def __init__(self, deltas=None, **unknown_fields):
         '''
         deltas : typing.Sequence[~Delta]
@@ -1253,8 +1339,10 @@ class AllWatcherNextResults(Type):
 
 
 class AnnotationsGetResult(Type):
+    __slots__ = ('annotations', 'entity', 'error', 'unknown_fields')
     _toSchema = {'annotations': 'annotations', 'entity': 'entity', 'error': 'error'}
     _toPy = {'annotations': 'annotations', 'entity': 'entity', 'error': 'error'}
+    _wireTypes = {'error': ('ErrorResult', None)}
     def __init__(self, annotations=None, entity=None, error=None, **unknown_fields):
         '''
         annotations : typing.Mapping[str, str]
@@ -1283,8 +1371,10 @@ class AnnotationsGetResult(Type):
 
 
 class AnnotationsGetResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('AnnotationsGetResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~AnnotationsGetResult]
@@ -1301,8 +1391,10 @@ class AnnotationsGetResults(Type):
 
 
 class AnnotationsSet(Type):
+    __slots__ = ('annotations', 'unknown_fields')
     _toSchema = {'annotations': 'annotations'}
     _toPy = {'annotations': 'annotations'}
+    _wireTypes = {'annotations': ('EntityAnnotations', 'list')}
     def __init__(self, annotations=None, **unknown_fields):
         '''
         annotations : typing.Sequence[~EntityAnnotations]
@@ -1319,8 +1411,10 @@ class AnnotationsSet(Type):
 
 
 class ApplicationCharm(Type):
+    __slots__ = ('charm_modified_version', 'deployment_mode', 'force_upgrade', 'sha256', 'url', 'unknown_fields')
     _toSchema = {'charm_modified_version': 'charm-modified-version', 'deployment_mode': 'deployment-mode', 'force_upgrade': 'force-upgrade', 'sha256': 'sha256', 'url': 'url'}
     _toPy = {'charm-modified-version': 'charm_modified_version', 'deployment-mode': 'deployment_mode', 'force-upgrade': 'force_upgrade', 'sha256': 'sha256', 'url': 'url'}
+    _wireTypes = {}
     def __init__(self, charm_modified_version=None, deployment_mode=None, force_upgrade=None, sha256=None, url=None, **unknown_fields):
         '''
         charm_modified_version : int
@@ -1361,8 +1455,10 @@ class ApplicationCharm(Type):
 
 
 class ApplicationCharmActionsResult(Type):
+    __slots__ = ('actions', 'application_tag', 'error', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'application_tag': 'application-tag', 'error': 'error'}
     _toPy = {'actions': 'actions', 'application-tag': 'application_tag', 'error': 'error'}
+    _wireTypes = {'actions': ('ActionSpec', 'dict'), 'error': ('Error', None)}
     def __init__(self, actions=None, application_tag=None, error=None, **unknown_fields):
         '''
         actions : typing.Mapping[str, ~ActionSpec]
@@ -1391,8 +1487,10 @@ class ApplicationCharmActionsResult(Type):
 
 
 class ApplicationCharmPlacement(Type):
+    __slots__ = ('application', 'charm_url', 'unknown_fields')
     _toSchema = {'application': 'application', 'charm_url': 'charm-url'}
     _toPy = {'application': 'application', 'charm-url': 'charm_url'}
+    _wireTypes = {}
     def __init__(self, application=None, charm_url=None, **unknown_fields):
         '''
         application : str
@@ -1415,8 +1513,10 @@ class ApplicationCharmPlacement(Type):
 
 
 class ApplicationCharmPlacements(Type):
+    __slots__ = ('placements', 'unknown_fields')
     _toSchema = {'placements': 'placements'}
     _toPy = {'placements': 'placements'}
+    _wireTypes = {'placements': ('ApplicationCharmPlacement', 'list')}
     def __init__(self, placements=None, **unknown_fields):
         '''
         placements : typing.Sequence[~ApplicationCharmPlacement]
@@ -1433,8 +1533,10 @@ class ApplicationCharmPlacements(Type):
 
 
 class ApplicationCharmRelations(Type):
+    __slots__ = ('application', 'unknown_fields')
     _toSchema = {'application': 'application'}
     _toPy = {'application': 'application'}
+    _wireTypes = {}
     def __init__(self, application=None, **unknown_fields):
         '''
         application : str
@@ -1451,8 +1553,10 @@ class ApplicationCharmRelations(Type):
 
 
 class ApplicationCharmRelationsResults(Type):
+    __slots__ = ('charm_relations', 'unknown_fields')
     _toSchema = {'charm_relations': 'charm-relations'}
     _toPy = {'charm-relations': 'charm_relations'}
+    _wireTypes = {}
     def __init__(self, charm_relations=None, **unknown_fields):
         '''
         charm_relations : typing.Sequence[str]
@@ -1469,8 +1573,10 @@ class ApplicationCharmRelationsResults(Type):
 
 
 class ApplicationCharmResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ApplicationCharm', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -1493,8 +1599,10 @@ class ApplicationCharmResult(Type):
 
 
 class ApplicationCharmResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ApplicationCharmResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationCharmResult]
@@ -1511,8 +1619,10 @@ class ApplicationCharmResults(Type):
 
 
 class ApplicationConfigUnsetArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
+    _wireTypes = {'args': ('ApplicationUnset', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ApplicationUnset]
@@ -1529,8 +1639,10 @@ class ApplicationConfigUnsetArgs(Type):
 
 
 class ApplicationConstraint(Type):
+    __slots__ = ('constraints', 'error', 'unknown_fields')
     _toSchema = {'constraints': 'constraints', 'error': 'error'}
     _toPy = {'constraints': 'constraints', 'error': 'error'}
+    _wireTypes = {'constraints': ('Value', None), 'error': ('Error', None)}
     def __init__(self, constraints=None, error=None, **unknown_fields):
         '''
         constraints : Value
@@ -1553,8 +1665,10 @@ class ApplicationConstraint(Type):
 
 
 class ApplicationDeploy(Type):
+    __slots__ = ('force', 'application', 'attach_storage', 'channel', 'charm_origin', 'charm_url', 'config', 'config_yaml', 'constraints', 'devices', 'endpoint_bindings', 'num_units', 'placement', 'policy', 'resources', 'storage', 'unknown_fields')
     _toSchema = {'application': 'application', 'attach_storage': 'attach-storage', 'channel': 'channel', 'charm_origin': 'charm-origin', 'charm_url': 'charm-url', 'config': 'config', 'config_yaml': 'config-yaml', 'constraints': 'constraints', 'devices': 'devices', 'endpoint_bindings': 'endpoint-bindings', 'force': 'Force', 'num_units': 'num-units', 'placement': 'placement', 'policy': 'policy', 'resources': 'resources', 'storage': 'storage'}
     _toPy = {'Force': 'force', 'application': 'application', 'attach-storage': 'attach_storage', 'channel': 'channel', 'charm-origin': 'charm_origin', 'charm-url': 'charm_url', 'config': 'config', 'config-yaml': 'config_yaml', 'constraints': 'constraints', 'devices': 'devices', 'endpoint-bindings': 'endpoint_bindings', 'num-units': 'num_units', 'placement': 'placement', 'policy': 'policy', 'resources': 'resources', 'storage': 'storage'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None), 'constraints': ('Value', None), 'devices': ('Constraints', 'dict'), 'placement': ('Placement', 'list'), 'storage': ('Constraints', 'dict')}
     def __init__(self, force=None, application=None, attach_storage=None, channel=None, charm_origin=None, charm_url=None, config=None, config_yaml=None, constraints=None, devices=None, endpoint_bindings=None, num_units=None, placement=None, policy=None, resources=None, storage=None, **unknown_fields):
         '''
         force : bool
@@ -1661,8 +1775,10 @@ class ApplicationDeploy(Type):
 
 
 class ApplicationExpose(Type):
+    __slots__ = ('application', 'exposed_endpoints', 'unknown_fields')
     _toSchema = {'application': 'application', 'exposed_endpoints': 'exposed-endpoints'}
     _toPy = {'application': 'application', 'exposed-endpoints': 'exposed_endpoints'}
+    _wireTypes = {'exposed_endpoints': ('ExposedEndpoint', 'dict')}
     def __init__(self, application=None, exposed_endpoints=None, **unknown_fields):
         '''
         application : str
@@ -1685,8 +1801,10 @@ class ApplicationExpose(Type):
 
 
 class ApplicationGet(Type):
+    __slots__ = ('application', 'branch', 'unknown_fields')
     _toSchema = {'application': 'application', 'branch': 'branch'}
     _toPy = {'application': 'application', 'branch': 'branch'}
+    _wireTypes = {}
     def __init__(self, application=None, branch=None, **unknown_fields):
         '''
         application : str
@@ -1709,8 +1827,10 @@ class ApplicationGet(Type):
 
 
 class ApplicationGetArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('ApplicationGet', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ApplicationGet]
@@ -1727,8 +1847,10 @@ class ApplicationGetArgs(Type):
 
 
 class ApplicationGetConfigResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'Results'}
     _toPy = {'Results': 'results'}
+    _wireTypes = {'results': ('ConfigResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConfigResult]
@@ -1745,8 +1867,10 @@ class ApplicationGetConfigResults(Type):
 
 
 class ApplicationGetConstraintsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ApplicationConstraint', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationConstraint]
@@ -1763,8 +1887,10 @@ class ApplicationGetConstraintsResults(Type):
 
 
 class ApplicationGetResults(Type):
+    __slots__ = ('application', 'application_config', 'base', 'channel', 'charm', 'config', 'constraints', 'endpoint_bindings', 'unknown_fields')
     _toSchema = {'application': 'application', 'application_config': 'application-config', 'base': 'base', 'channel': 'channel', 'charm': 'charm', 'config': 'config', 'constraints': 'constraints', 'endpoint_bindings': 'endpoint-bindings'}
     _toPy = {'application': 'application', 'application-config': 'application_config', 'base': 'base', 'channel': 'channel', 'charm': 'charm', 'config': 'config', 'constraints': 'constraints', 'endpoint-bindings': 'endpoint_bindings'}
+    _wireTypes = {'base': ('Base', None), 'constraints': ('Value', None)}
     def __init__(self, application=None, application_config=None, base=None, channel=None, charm=None, config=None, constraints=None, endpoint_bindings=None, **unknown_fields):
         '''
         application : str
@@ -1823,8 +1949,10 @@ class ApplicationGetResults(Type):
 
 
 class ApplicationInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ApplicationResult', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -1847,8 +1975,10 @@ class ApplicationInfoResult(Type):
 
 
 class ApplicationInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ApplicationInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationInfoResult]
@@ -1865,8 +1995,10 @@ class ApplicationInfoResults(Type):
 
 
 class ApplicationMergeBindings(Type):
+    __slots__ = ('application_tag', 'bindings', 'force', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'bindings': 'bindings', 'force': 'force'}
     _toPy = {'application-tag': 'application_tag', 'bindings': 'bindings', 'force': 'force'}
+    _wireTypes = {}
     def __init__(self, application_tag=None, bindings=None, force=None, **unknown_fields):
         '''
         application_tag : str
@@ -1895,8 +2027,10 @@ class ApplicationMergeBindings(Type):
 
 
 class ApplicationMergeBindingsArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('ApplicationMergeBindings', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ApplicationMergeBindings]
@@ -1913,8 +2047,10 @@ class ApplicationMergeBindingsArgs(Type):
 
 
 class ApplicationMetricCredential(Type):
+    __slots__ = ('application', 'metrics_credentials', 'unknown_fields')
     _toSchema = {'application': 'application', 'metrics_credentials': 'metrics-credentials'}
     _toPy = {'application': 'application', 'metrics-credentials': 'metrics_credentials'}
+    _wireTypes = {}
     def __init__(self, application=None, metrics_credentials=None, **unknown_fields):
         '''
         application : str
@@ -1937,8 +2073,10 @@ class ApplicationMetricCredential(Type):
 
 
 class ApplicationMetricCredentials(Type):
+    __slots__ = ('creds', 'unknown_fields')
     _toSchema = {'creds': 'creds'}
     _toPy = {'creds': 'creds'}
+    _wireTypes = {'creds': ('ApplicationMetricCredential', 'list')}
     def __init__(self, creds=None, **unknown_fields):
         '''
         creds : typing.Sequence[~ApplicationMetricCredential]
@@ -1955,8 +2093,10 @@ class ApplicationMetricCredentials(Type):
 
 
 class ApplicationOfferAdminDetails(Type):
+    __slots__ = ('applicationofferdetails', 'application_description', 'application_name', 'bindings', 'charm_url', 'connections', 'endpoints', 'offer_name', 'offer_url', 'offer_uuid', 'source_model_tag', 'spaces', 'users', 'unknown_fields')
     _toSchema = {'application_description': 'application-description', 'application_name': 'application-name', 'applicationofferdetails': 'ApplicationOfferDetails', 'bindings': 'bindings', 'charm_url': 'charm-url', 'connections': 'connections', 'endpoints': 'endpoints', 'offer_name': 'offer-name', 'offer_url': 'offer-url', 'offer_uuid': 'offer-uuid', 'source_model_tag': 'source-model-tag', 'spaces': 'spaces', 'users': 'users'}
     _toPy = {'ApplicationOfferDetails': 'applicationofferdetails', 'application-description': 'application_description', 'application-name': 'application_name', 'bindings': 'bindings', 'charm-url': 'charm_url', 'connections': 'connections', 'endpoints': 'endpoints', 'offer-name': 'offer_name', 'offer-url': 'offer_url', 'offer-uuid': 'offer_uuid', 'source-model-tag': 'source_model_tag', 'spaces': 'spaces', 'users': 'users'}
+    _wireTypes = {'applicationofferdetails': ('ApplicationOfferDetails', None), 'connections': ('OfferConnection', 'list'), 'endpoints': ('RemoteEndpoint', 'list'), 'spaces': ('RemoteSpace', 'list'), 'users': ('OfferUserDetails', 'list')}
     def __init__(self, applicationofferdetails=None, application_description=None, application_name=None, bindings=None, charm_url=None, connections=None, endpoints=None, offer_name=None, offer_url=None, offer_uuid=None, source_model_tag=None, spaces=None, users=None, **unknown_fields):
         '''
         applicationofferdetails : ApplicationOfferDetails
@@ -2045,8 +2185,10 @@ class ApplicationOfferAdminDetails(Type):
 
 
 class ApplicationOfferDetails(Type):
+    __slots__ = ('application_description', 'bindings', 'endpoints', 'offer_name', 'offer_url', 'offer_uuid', 'source_model_tag', 'spaces', 'users', 'unknown_fields')
     _toSchema = {'application_description': 'application-description', 'bindings': 'bindings', 'endpoints': 'endpoints', 'offer_name': 'offer-name', 'offer_url': 'offer-url', 'offer_uuid': 'offer-uuid', 'source_model_tag': 'source-model-tag', 'spaces': 'spaces', 'users': 'users'}
     _toPy = {'application-description': 'application_description', 'bindings': 'bindings', 'endpoints': 'endpoints', 'offer-name': 'offer_name', 'offer-url': 'offer_url', 'offer-uuid': 'offer_uuid', 'source-model-tag': 'source_model_tag', 'spaces': 'spaces', 'users': 'users'}
+    _wireTypes = {'endpoints': ('RemoteEndpoint', 'list'), 'spaces': ('RemoteSpace', 'list'), 'users': ('OfferUserDetails', 'list')}
     def __init__(self, application_description=None, bindings=None, endpoints=None, offer_name=None, offer_url=None, offer_uuid=None, source_model_tag=None, spaces=None, users=None, **unknown_fields):
         '''
         application_description : str
@@ -2111,8 +2253,10 @@ class ApplicationOfferDetails(Type):
 
 
 class ApplicationOfferResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ApplicationOfferAdminDetails', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -2135,8 +2279,10 @@ class ApplicationOfferResult(Type):
 
 
 class ApplicationOfferStatus(Type):
+    __slots__ = ('active_connected_count', 'application_name', 'charm', 'endpoints', 'err', 'offer_name', 'total_connected_count', 'unknown_fields')
     _toSchema = {'active_connected_count': 'active-connected-count', 'application_name': 'application-name', 'charm': 'charm', 'endpoints': 'endpoints', 'err': 'err', 'offer_name': 'offer-name', 'total_connected_count': 'total-connected-count'}
     _toPy = {'active-connected-count': 'active_connected_count', 'application-name': 'application_name', 'charm': 'charm', 'endpoints': 'endpoints', 'err': 'err', 'offer-name': 'offer_name', 'total-connected-count': 'total_connected_count'}
+    _wireTypes = {'endpoints': ('RemoteEndpoint', 'dict'), 'err': ('Error', None)}
     def __init__(self, active_connected_count=None, application_name=None, charm=None, endpoints=None, err=None, offer_name=None, total_connected_count=None, **unknown_fields):
         '''
         active_connected_count : int
@@ -2189,8 +2335,10 @@ class ApplicationOfferStatus(Type):
 
 
 class ApplicationOffersResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ApplicationOfferResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationOfferResult]
@@ -2207,8 +2355,10 @@ class ApplicationOffersResults(Type):
 
 
 class ApplicationOpenedPorts(Type):
+    __slots__ = ('endpoint', 'port_ranges', 'unknown_fields')
     _toSchema = {'endpoint': 'endpoint', 'port_ranges': 'port-ranges'}
     _toPy = {'endpoint': 'endpoint', 'port-ranges': 'port_ranges'}
+    _wireTypes = {'port_ranges': ('PortRange', 'list')}
     def __init__(self, endpoint=None, port_ranges=None, **unknown_fields):
         '''
         endpoint : str
@@ -2231,8 +2381,10 @@ class ApplicationOpenedPorts(Type):
 
 
 class ApplicationOpenedPortsResult(Type):
+    __slots__ = ('application_port_ranges', 'error', 'unknown_fields')
     _toSchema = {'application_port_ranges': 'application-port-ranges', 'error': 'error'}
     _toPy = {'application-port-ranges': 'application_port_ranges', 'error': 'error'}
+    _wireTypes = {'application_port_ranges': ('ApplicationOpenedPorts', 'list'), 'error': ('Error', None)}
     def __init__(self, application_port_ranges=None, error=None, **unknown_fields):
         '''
         application_port_ranges : typing.Sequence[~ApplicationOpenedPorts]
@@ -2255,8 +2407,10 @@ class ApplicationOpenedPortsResult(Type):
 
 
 class ApplicationOpenedPortsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ApplicationOpenedPortsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationOpenedPortsResult]
@@ -2273,8 +2427,10 @@ class ApplicationOpenedPortsResults(Type):
 
 
 class ApplicationResult(Type):
+    __slots__ = ('base', 'channel', 'charm', 'constraints', 'endpoint_bindings', 'exposed', 'exposed_endpoints', 'life', 'principal', 'remote', 'tag', 'unknown_fields')
     _toSchema = {'base': 'base', 'channel': 'channel', 'charm': 'charm', 'constraints': 'constraints', 'endpoint_bindings': 'endpoint-bindings', 'exposed': 'exposed', 'exposed_endpoints': 'exposed-endpoints', 'life': 'life', 'principal': 'principal', 'remote': 'remote', 'tag': 'tag'}
     _toPy = {'base': 'base', 'channel': 'channel', 'charm': 'charm', 'constraints': 'constraints', 'endpoint-bindings': 'endpoint_bindings', 'exposed': 'exposed', 'exposed-endpoints': 'exposed_endpoints', 'life': 'life', 'principal': 'principal', 'remote': 'remote', 'tag': 'tag'}
+    _wireTypes = {'base': ('Base', None), 'constraints': ('Value', None), 'exposed_endpoints': ('ExposedEndpoint', 'dict')}
     def __init__(self, base=None, channel=None, charm=None, constraints=None, endpoint_bindings=None, exposed=None, exposed_endpoints=None, life=None, principal=None, remote=None, tag=None, **unknown_fields):
         '''
         base : Base
@@ -2351,8 +2507,10 @@ class ApplicationResult(Type):
 
 
 class ApplicationSetCharm(Type):
+    __slots__ = ('application', 'channel', 'charm_origin', 'charm_url', 'config_settings', 'config_settings_yaml', 'endpoint_bindings', 'force', 'force_base', 'force_units', 'generation', 'resource_ids', 'storage_constraints', 'unknown_fields')
     _toSchema = {'application': 'application', 'channel': 'channel', 'charm_origin': 'charm-origin', 'charm_url': 'charm-url', 'config_settings': 'config-settings', 'config_settings_yaml': 'config-settings-yaml', 'endpoint_bindings': 'endpoint-bindings', 'force': 'force', 'force_base': 'force-base', 'force_units': 'force-units', 'generation': 'generation', 'resource_ids': 'resource-ids', 'storage_constraints': 'storage-constraints'}
     _toPy = {'application': 'application', 'channel': 'channel', 'charm-origin': 'charm_origin', 'charm-url': 'charm_url', 'config-settings': 'config_settings', 'config-settings-yaml': 'config_settings_yaml', 'endpoint-bindings': 'endpoint_bindings', 'force': 'force', 'force-base': 'force_base', 'force-units': 'force_units', 'generation': 'generation', 'resource-ids': 'resource_ids', 'storage-constraints': 'storage_constraints'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None), 'storage_constraints': ('StorageConstraints', 'dict')}
     def __init__(self, application=None, channel=None, charm_origin=None, charm_url=None, config_settings=None, config_settings_yaml=None, endpoint_bindings=None, force=None, force_base=None, force_units=None, generation=None, resource_ids=None, storage_constraints=None, **unknown_fields):
         '''
         application : str
@@ -2441,8 +2599,10 @@ class ApplicationSetCharm(Type):
 
 
 class ApplicationStatus(Type):
+    __slots__ = ('base', 'can_upgrade_to', 'charm', 'charm_channel', 'charm_profile', 'charm_version', 'endpoint_bindings', 'err', 'exposed', 'exposed_endpoints', 'int_', 'life', 'meter_statuses', 'provider_id', 'public_address', 'relations', 'status', 'subordinate_to', 'units', 'workload_version', 'unknown_fields')
     _toSchema = {'base': 'base', 'can_upgrade_to': 'can-upgrade-to', 'charm': 'charm', 'charm_channel': 'charm-channel', 'charm_profile': 'charm-profile', 'charm_version': 'charm-version', 'endpoint_bindings': 'endpoint-bindings', 'err': 'err', 'exposed': 'exposed', 'exposed_endpoints': 'exposed-endpoints', 'int_': 'int', 'life': 'life', 'meter_statuses': 'meter-statuses', 'provider_id': 'provider-id', 'public_address': 'public-address', 'relations': 'relations', 'status': 'status', 'subordinate_to': 'subordinate-to', 'units': 'units', 'workload_version': 'workload-version'}
     _toPy = {'base': 'base', 'can-upgrade-to': 'can_upgrade_to', 'charm': 'charm', 'charm-channel': 'charm_channel', 'charm-profile': 'charm_profile', 'charm-version': 'charm_version', 'endpoint-bindings': 'endpoint_bindings', 'err': 'err', 'exposed': 'exposed', 'exposed-endpoints': 'exposed_endpoints', 'int': 'int_', 'life': 'life', 'meter-statuses': 'meter_statuses', 'provider-id': 'provider_id', 'public-address': 'public_address', 'relations': 'relations', 'status': 'status', 'subordinate-to': 'subordinate_to', 'units': 'units', 'workload-version': 'workload_version'}
+    _wireTypes = {'base': ('Base', None), 'err': ('Error', None), 'exposed_endpoints': ('ExposedEndpoint', 'dict'), 'meter_statuses': ('MeterStatus', 'dict'), 'status': ('DetailedStatus', None), 'units': ('UnitStatus', 'dict')}
     def __init__(self, base=None, can_upgrade_to=None, charm=None, charm_channel=None, charm_profile=None, charm_version=None, endpoint_bindings=None, err=None, exposed=None, exposed_endpoints=None, int_=None, life=None, meter_statuses=None, provider_id=None, public_address=None, relations=None, status=None, subordinate_to=None, units=None, workload_version=None, **unknown_fields):
         '''
         base : Base
@@ -2573,8 +2733,10 @@ class ApplicationStatus(Type):
 
 
 class ApplicationStatusResult(Type):
+    __slots__ = ('application', 'error', 'units', 'unknown_fields')
     _toSchema = {'application': 'application', 'error': 'error', 'units': 'units'}
     _toPy = {'application': 'application', 'error': 'error', 'units': 'units'}
+    _wireTypes = {'application': ('StatusResult', None), 'error': ('Error', None), 'units': ('StatusResult', 'dict')}
     def __init__(self, application=None, error=None, units=None, **unknown_fields):
         '''
         application : StatusResult
@@ -2603,8 +2765,10 @@ class ApplicationStatusResult(Type):
 
 
 class ApplicationStatusResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ApplicationStatusResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationStatusResult]
@@ -2621,8 +2785,10 @@ class ApplicationStatusResults(Type):
 
 
 class ApplicationTag(Type):
+    __slots__ = ('name', 'unknown_fields')
     _toSchema = {'name': 'Name'}
     _toPy = {'Name': 'name'}
+    _wireTypes = {}
     def __init__(self, name=None, **unknown_fields):
         '''
         name : str
@@ -2639,8 +2805,10 @@ class ApplicationTag(Type):
 
 
 class ApplicationUnexpose(Type):
+    __slots__ = ('application', 'exposed_endpoints', 'unknown_fields')
     _toSchema = {'application': 'application', 'exposed_endpoints': 'exposed-endpoints'}
     _toPy = {'application': 'application', 'exposed-endpoints': 'exposed_endpoints'}
+    _wireTypes = {}
     def __init__(self, application=None, exposed_endpoints=None, **unknown_fields):
         '''
         application : str
@@ -2663,8 +2831,10 @@ class ApplicationUnexpose(Type):
 
 
 class ApplicationUnitInfo(Type):
+    __slots__ = ('provider_id', 'unit_tag', 'unknown_fields')
     _toSchema = {'provider_id': 'provider-id', 'unit_tag': 'unit-tag'}
     _toPy = {'provider-id': 'provider_id', 'unit-tag': 'unit_tag'}
+    _wireTypes = {}
     def __init__(self, provider_id=None, unit_tag=None, **unknown_fields):
         '''
         provider_id : str
@@ -2687,8 +2857,10 @@ class ApplicationUnitInfo(Type):
 
 
 class ApplicationUnitParams(Type):
+    __slots__ = ('address', 'data', 'filesystem_info', 'info', 'ports', 'provider_id', 'stateful', 'status', 'unit_tag', 'unknown_fields')
     _toSchema = {'address': 'address', 'data': 'data', 'filesystem_info': 'filesystem-info', 'info': 'info', 'ports': 'ports', 'provider_id': 'provider-id', 'stateful': 'stateful', 'status': 'status', 'unit_tag': 'unit-tag'}
     _toPy = {'address': 'address', 'data': 'data', 'filesystem-info': 'filesystem_info', 'info': 'info', 'ports': 'ports', 'provider-id': 'provider_id', 'stateful': 'stateful', 'status': 'status', 'unit-tag': 'unit_tag'}
+    _wireTypes = {'filesystem_info': ('KubernetesFilesystemInfo', 'list')}
     def __init__(self, address=None, data=None, filesystem_info=None, info=None, ports=None, provider_id=None, stateful=None, status=None, unit_tag=None, **unknown_fields):
         '''
         address : str
@@ -2753,8 +2925,10 @@ class ApplicationUnitParams(Type):
 
 
 class ApplicationUnset(Type):
+    __slots__ = ('application', 'branch', 'options', 'unknown_fields')
     _toSchema = {'application': 'application', 'branch': 'branch', 'options': 'options'}
     _toPy = {'application': 'application', 'branch': 'branch', 'options': 'options'}
+    _wireTypes = {}
     def __init__(self, application=None, branch=None, options=None, **unknown_fields):
         '''
         application : str
@@ -2783,8 +2957,10 @@ class ApplicationUnset(Type):
 
 
 class ApplicationsCharmActionsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ApplicationCharmActionsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationCharmActionsResult]
@@ -2801,8 +2977,10 @@ class ApplicationsCharmActionsResults(Type):
 
 
 class ApplicationsDeploy(Type):
+    __slots__ = ('applications', 'unknown_fields')
     _toSchema = {'applications': 'applications'}
     _toPy = {'applications': 'applications'}
+    _wireTypes = {'applications': ('ApplicationDeploy', 'list')}
     def __init__(self, applications=None, **unknown_fields):
         '''
         applications : typing.Sequence[~ApplicationDeploy]
@@ -2819,8 +2997,10 @@ class ApplicationsDeploy(Type):
 
 
 class AuthUserInfo(Type):
+    __slots__ = ('controller_access', 'credentials', 'display_name', 'identity', 'last_connection', 'model_access', 'unknown_fields')
     _toSchema = {'controller_access': 'controller-access', 'credentials': 'credentials', 'display_name': 'display-name', 'identity': 'identity', 'last_connection': 'last-connection', 'model_access': 'model-access'}
     _toPy = {'controller-access': 'controller_access', 'credentials': 'credentials', 'display-name': 'display_name', 'identity': 'identity', 'last-connection': 'last_connection', 'model-access': 'model_access'}
+    _wireTypes = {}
     def __init__(self, controller_access=None, credentials=None, display_name=None, identity=None, last_connection=None, model_access=None, **unknown_fields):
         '''
         controller_access : str
@@ -2867,8 +3047,10 @@ class AuthUserInfo(Type):
 
 
 class BackupsCreateArgs(Type):
+    __slots__ = ('no_download', 'notes', 'unknown_fields')
     _toSchema = {'no_download': 'no-download', 'notes': 'notes'}
     _toPy = {'no-download': 'no_download', 'notes': 'notes'}
+    _wireTypes = {}
     def __init__(self, no_download=None, notes=None, **unknown_fields):
         '''
         no_download : bool
@@ -2891,8 +3073,10 @@ class BackupsCreateArgs(Type):
 
 
 class BackupsMetadataResult(Type):
+    __slots__ = ('base', 'checksum', 'checksum_format', 'controller_machine_id', 'controller_machine_inst_id', 'controller_uuid', 'filename', 'finished', 'format_version', 'ha_nodes', 'hostname', 'id_', 'machine', 'model', 'notes', 'size', 'started', 'stored', 'version', 'unknown_fields')
     _toSchema = {'base': 'base', 'checksum': 'checksum', 'checksum_format': 'checksum-format', 'controller_machine_id': 'controller-machine-id', 'controller_machine_inst_id': 'controller-machine-inst-id', 'controller_uuid': 'controller-uuid', 'filename': 'filename', 'finished': 'finished', 'format_version': 'format-version', 'ha_nodes': 'ha-nodes', 'hostname': 'hostname', 'id_': 'id', 'machine': 'machine', 'model': 'model', 'notes': 'notes', 'size': 'size', 'started': 'started', 'stored': 'stored', 'version': 'version'}
     _toPy = {'base': 'base', 'checksum': 'checksum', 'checksum-format': 'checksum_format', 'controller-machine-id': 'controller_machine_id', 'controller-machine-inst-id': 'controller_machine_inst_id', 'controller-uuid': 'controller_uuid', 'filename': 'filename', 'finished': 'finished', 'format-version': 'format_version', 'ha-nodes': 'ha_nodes', 'hostname': 'hostname', 'id': 'id_', 'machine': 'machine', 'model': 'model', 'notes': 'notes', 'size': 'size', 'started': 'started', 'stored': 'stored', 'version': 'version'}
+    _wireTypes = {'version': ('Number', None)}
     def __init__(self, base=None, checksum=None, checksum_format=None, controller_machine_id=None, controller_machine_inst_id=None, controller_uuid=None, filename=None, finished=None, format_version=None, ha_nodes=None, hostname=None, id_=None, machine=None, model=None, notes=None, size=None, started=None, stored=None, version=None, **unknown_fields):
         '''
         base : str
@@ -3017,8 +3201,10 @@ class BackupsMetadataResult(Type):
 
 
 class Base(Type):
+    __slots__ = ('channel', 'name', 'unknown_fields')
     _toSchema = {'channel': 'channel', 'name': 'name'}
     _toPy = {'channel': 'channel', 'name': 'name'}
+    _wireTypes = {}
     def __init__(self, channel=None, name=None, **unknown_fields):
         '''
         channel : str
@@ -3041,8 +3227,10 @@ class Base(Type):
 
 
 class Binary(Type):
+    __slots__ = ('arch', 'build', 'major', 'minor', 'number', 'patch', 'release', 'tag', 'unknown_fields')
     _toSchema = {'arch': 'Arch', 'build': 'Build', 'major': 'Major', 'minor': 'Minor', 'number': 'Number', 'patch': 'Patch', 'release': 'Release', 'tag': 'Tag'}
     _toPy = {'Arch': 'arch', 'Build': 'build', 'Major': 'major', 'Minor': 'minor', 'Number': 'number', 'Patch': 'patch', 'Release': 'release', 'Tag': 'tag'}
+    _wireTypes = {'number': ('Number', None)}
     def __init__(self, arch=None, build=None, major=None, minor=None, number=None, patch=None, release=None, tag=None, **unknown_fields):
         '''
         arch : str
@@ -3101,8 +3289,10 @@ class Binary(Type):
 
 
 class Block(Type):
+    __slots__ = ('id_', 'message', 'tag', 'type_', 'unknown_fields')
     _toSchema = {'id_': 'id', 'message': 'message', 'tag': 'tag', 'type_': 'type'}
     _toPy = {'id': 'id_', 'message': 'message', 'tag': 'tag', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, id_=None, message=None, tag=None, type_=None, **unknown_fields):
         '''
         id_ : str
@@ -3137,8 +3327,10 @@ class Block(Type):
 
 
 class BlockDevice(Type):
+    __slots__ = ('busaddress', 'devicelinks', 'devicename', 'filesystemtype', 'hardwareid', 'inuse', 'label', 'mountpoint', 'serialid', 'size', 'uuid', 'wwn', 'unknown_fields')
     _toSchema = {'busaddress': 'BusAddress', 'devicelinks': 'DeviceLinks', 'devicename': 'DeviceName', 'filesystemtype': 'FilesystemType', 'hardwareid': 'HardwareId', 'inuse': 'InUse', 'label': 'Label', 'mountpoint': 'MountPoint', 'serialid': 'SerialId', 'size': 'Size', 'uuid': 'UUID', 'wwn': 'WWN'}
     _toPy = {'BusAddress': 'busaddress', 'DeviceLinks': 'devicelinks', 'DeviceName': 'devicename', 'FilesystemType': 'filesystemtype', 'HardwareId': 'hardwareid', 'InUse': 'inuse', 'Label': 'label', 'MountPoint': 'mountpoint', 'SerialId': 'serialid', 'Size': 'size', 'UUID': 'uuid', 'WWN': 'wwn'}
+    _wireTypes = {}
     def __init__(self, busaddress=None, devicelinks=None, devicename=None, filesystemtype=None, hardwareid=None, inuse=None, label=None, mountpoint=None, serialid=None, size=None, uuid=None, wwn=None, **unknown_fields):
         '''
         busaddress : str
@@ -3221,8 +3413,10 @@ class BlockDevice(Type):
 
 
 class BlockDeviceResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('BlockDevice', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -3245,8 +3439,10 @@ class BlockDeviceResult(Type):
 
 
 class BlockDeviceResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('BlockDeviceResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~BlockDeviceResult]
@@ -3263,8 +3459,10 @@ class BlockDeviceResults(Type):
 
 
 class BlockResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('Block', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -3287,8 +3485,10 @@ class BlockResult(Type):
 
 
 class BlockResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('BlockResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~BlockResult]
@@ -3305,8 +3505,10 @@ class BlockResults(Type):
 
 
 class BlockSwitchParams(Type):
+    __slots__ = ('message', 'type_', 'unknown_fields')
     _toSchema = {'message': 'message', 'type_': 'type'}
     _toPy = {'message': 'message', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, message=None, type_=None, **unknown_fields):
         '''
         message : str
@@ -3329,8 +3531,10 @@ class BlockSwitchParams(Type):
 
 
 class BoolResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -3353,8 +3557,10 @@ class BoolResult(Type):
 
 
 class BoolResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('BoolResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~BoolResult]
@@ -3371,8 +3577,10 @@ class BoolResults(Type):
 
 
 class BranchArg(Type):
+    __slots__ = ('branch', 'unknown_fields')
     _toSchema = {'branch': 'branch'}
     _toPy = {'branch': 'branch'}
+    _wireTypes = {}
     def __init__(self, branch=None, **unknown_fields):
         '''
         branch : str
@@ -3389,8 +3597,10 @@ class BranchArg(Type):
 
 
 class BranchInfoArgs(Type):
+    __slots__ = ('branches', 'detailed', 'unknown_fields')
     _toSchema = {'branches': 'branches', 'detailed': 'detailed'}
     _toPy = {'branches': 'branches', 'detailed': 'detailed'}
+    _wireTypes = {}
     def __init__(self, branches=None, detailed=None, **unknown_fields):
         '''
         branches : typing.Sequence[str]
@@ -3413,8 +3623,10 @@ class BranchInfoArgs(Type):
 
 
 class BranchResults(Type):
+    __slots__ = ('error', 'generations', 'unknown_fields')
     _toSchema = {'error': 'error', 'generations': 'generations'}
     _toPy = {'error': 'error', 'generations': 'generations'}
+    _wireTypes = {'error': ('Error', None), 'generations': ('Generation', 'list')}
     def __init__(self, error=None, generations=None, **unknown_fields):
         '''
         error : Error
@@ -3437,8 +3649,10 @@ class BranchResults(Type):
 
 
 class BranchStatus(Type):
+    __slots__ = ('assigned_units', 'created', 'created_by', 'unknown_fields')
     _toSchema = {'assigned_units': 'assigned-units', 'created': 'created', 'created_by': 'created-by'}
     _toPy = {'assigned-units': 'assigned_units', 'created': 'created', 'created-by': 'created_by'}
+    _wireTypes = {}
     def __init__(self, assigned_units=None, created=None, created_by=None, **unknown_fields):
         '''
         assigned_units : typing.Mapping[str, typing.Sequence[str]]
@@ -3467,8 +3681,10 @@ class BranchStatus(Type):
 
 
 class BranchTrackArg(Type):
+    __slots__ = ('branch', 'entities', 'num_units', 'unknown_fields')
     _toSchema = {'branch': 'branch', 'entities': 'entities', 'num_units': 'num-units'}
     _toPy = {'branch': 'branch', 'entities': 'entities', 'num-units': 'num_units'}
+    _wireTypes = {'entities': ('Entity', 'list')}
     def __init__(self, branch=None, entities=None, num_units=None, **unknown_fields):
         '''
         branch : str
@@ -3497,8 +3713,10 @@ class BranchTrackArg(Type):
 
 
 class BulkImportStorageParams(Type):
+    __slots__ = ('storage', 'unknown_fields')
     _toSchema = {'storage': 'storage'}
     _toPy = {'storage': 'storage'}
+    _wireTypes = {'storage': ('ImportStorageParams', 'list')}
     def __init__(self, storage=None, **unknown_fields):
         '''
         storage : typing.Sequence[~ImportStorageParams]
@@ -3515,8 +3733,10 @@ class BulkImportStorageParams(Type):
 
 
 class BundleChange(Type):
+    __slots__ = ('args', 'id_', 'method', 'requires', 'unknown_fields')
     _toSchema = {'args': 'args', 'id_': 'id', 'method': 'method', 'requires': 'requires'}
     _toPy = {'args': 'args', 'id': 'id_', 'method': 'method', 'requires': 'requires'}
+    _wireTypes = {}
     def __init__(self, args=None, id_=None, method=None, requires=None, **unknown_fields):
         '''
         args : typing.Sequence[typing.Any]
@@ -3551,8 +3771,10 @@ class BundleChange(Type):
 
 
 class BundleChangesMapArgs(Type):
+    __slots__ = ('args', 'id_', 'method', 'requires', 'unknown_fields')
     _toSchema = {'args': 'args', 'id_': 'id', 'method': 'method', 'requires': 'requires'}
     _toPy = {'args': 'args', 'id': 'id_', 'method': 'method', 'requires': 'requires'}
+    _wireTypes = {}
     def __init__(self, args=None, id_=None, method=None, requires=None, **unknown_fields):
         '''
         args : typing.Mapping[str, typing.Any]
@@ -3587,8 +3809,10 @@ class BundleChangesMapArgs(Type):
 
 
 class BundleChangesMapArgsResults(Type):
+    __slots__ = ('changes', 'errors', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'errors': 'errors'}
     _toPy = {'changes': 'changes', 'errors': 'errors'}
+    _wireTypes = {'changes': ('BundleChangesMapArgs', 'list')}
     def __init__(self, changes=None, errors=None, **unknown_fields):
         '''
         changes : typing.Sequence[~BundleChangesMapArgs]
@@ -3611,8 +3835,10 @@ class BundleChangesMapArgsResults(Type):
 
 
 class BundleChangesParams(Type):
+    __slots__ = ('bundleurl', 'yaml', 'unknown_fields')
     _toSchema = {'bundleurl': 'bundleURL', 'yaml': 'yaml'}
     _toPy = {'bundleURL': 'bundleurl', 'yaml': 'yaml'}
+    _wireTypes = {}
     def __init__(self, bundleurl=None, yaml=None, **unknown_fields):
         '''
         bundleurl : str
@@ -3635,8 +3861,10 @@ class BundleChangesParams(Type):
 
 
 class BundleChangesResults(Type):
+    __slots__ = ('changes', 'errors', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'errors': 'errors'}
     _toPy = {'changes': 'changes', 'errors': 'errors'}
+    _wireTypes = {'changes': ('BundleChange', 'list')}
     def __init__(self, changes=None, errors=None, **unknown_fields):
         '''
         changes : typing.Sequence[~BundleChange]
@@ -3659,8 +3887,10 @@ class BundleChangesResults(Type):
 
 
 class BytesResult(Type):
+    __slots__ = ('result', 'unknown_fields')
     _toSchema = {'result': 'result'}
     _toPy = {'result': 'result'}
+    _wireTypes = {}
     def __init__(self, result=None, **unknown_fields):
         '''
         result : typing.Sequence[int]
@@ -3677,8 +3907,10 @@ class BytesResult(Type):
 
 
 class CAASApplicationGarbageCollectArg(Type):
+    __slots__ = ('active_pod_names', 'application', 'desired_replicas', 'force', 'observed_units', 'unknown_fields')
     _toSchema = {'active_pod_names': 'active-pod-names', 'application': 'application', 'desired_replicas': 'desired-replicas', 'force': 'force', 'observed_units': 'observed-units'}
     _toPy = {'active-pod-names': 'active_pod_names', 'application': 'application', 'desired-replicas': 'desired_replicas', 'force': 'force', 'observed-units': 'observed_units'}
+    _wireTypes = {'application': ('Entity', None), 'observed_units': ('Entities', None)}
     def __init__(self, active_pod_names=None, application=None, desired_replicas=None, force=None, observed_units=None, **unknown_fields):
         '''
         active_pod_names : typing.Sequence[str]
@@ -3719,8 +3951,10 @@ class CAASApplicationGarbageCollectArg(Type):
 
 
 class CAASApplicationGarbageCollectArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('CAASApplicationGarbageCollectArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~CAASApplicationGarbageCollectArg]
@@ -3737,8 +3971,10 @@ class CAASApplicationGarbageCollectArgs(Type):
 
 
 class CAASApplicationOCIResourceResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('CAASApplicationOCIResources', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -3761,8 +3997,10 @@ class CAASApplicationOCIResourceResult(Type):
 
 
 class CAASApplicationOCIResourceResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CAASApplicationOCIResourceResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CAASApplicationOCIResourceResult]
@@ -3779,8 +4017,10 @@ class CAASApplicationOCIResourceResults(Type):
 
 
 class CAASApplicationOCIResources(Type):
+    __slots__ = ('images', 'unknown_fields')
     _toSchema = {'images': 'images'}
     _toPy = {'images': 'images'}
+    _wireTypes = {'images': ('DockerImageInfo', 'dict')}
     def __init__(self, images=None, **unknown_fields):
         '''
         images : typing.Mapping[str, ~DockerImageInfo]
@@ -3797,8 +4037,10 @@ class CAASApplicationOCIResources(Type):
 
 
 class CAASApplicationProvisionerConfig(Type):
+    __slots__ = ('unmanaged_applications', 'unknown_fields')
     _toSchema = {'unmanaged_applications': 'unmanaged-applications'}
     _toPy = {'unmanaged-applications': 'unmanaged_applications'}
+    _wireTypes = {'unmanaged_applications': ('Entities', None)}
     def __init__(self, unmanaged_applications=None, **unknown_fields):
         '''
         unmanaged_applications : Entities
@@ -3815,8 +4057,10 @@ class CAASApplicationProvisionerConfig(Type):
 
 
 class CAASApplicationProvisionerConfigResult(Type):
+    __slots__ = ('error', 'provisioner_config', 'unknown_fields')
     _toSchema = {'error': 'error', 'provisioner_config': 'provisioner-config'}
     _toPy = {'error': 'error', 'provisioner-config': 'provisioner_config'}
+    _wireTypes = {'error': ('Error', None), 'provisioner_config': ('CAASApplicationProvisionerConfig', None)}
     def __init__(self, error=None, provisioner_config=None, **unknown_fields):
         '''
         error : Error
@@ -3839,8 +4083,10 @@ class CAASApplicationProvisionerConfigResult(Type):
 
 
 class CAASApplicationProvisioningInfo(Type):
+    __slots__ = ('api_addresses', 'base', 'ca_cert', 'charm_modified_version', 'charm_url', 'constraints', 'devices', 'error', 'filesystems', 'image_repo', 'scale', 'tags', 'trust', 'version', 'volumes', 'unknown_fields')
     _toSchema = {'api_addresses': 'api-addresses', 'base': 'base', 'ca_cert': 'ca-cert', 'charm_modified_version': 'charm-modified-version', 'charm_url': 'charm-url', 'constraints': 'constraints', 'devices': 'devices', 'error': 'error', 'filesystems': 'filesystems', 'image_repo': 'image-repo', 'scale': 'scale', 'tags': 'tags', 'trust': 'trust', 'version': 'version', 'volumes': 'volumes'}
     _toPy = {'api-addresses': 'api_addresses', 'base': 'base', 'ca-cert': 'ca_cert', 'charm-modified-version': 'charm_modified_version', 'charm-url': 'charm_url', 'constraints': 'constraints', 'devices': 'devices', 'error': 'error', 'filesystems': 'filesystems', 'image-repo': 'image_repo', 'scale': 'scale', 'tags': 'tags', 'trust': 'trust', 'version': 'version', 'volumes': 'volumes'}
+    _wireTypes = {'base': ('Base', None), 'constraints': ('Value', None), 'devices': ('KubernetesDeviceParams', 'list'), 'error': ('Error', None), 'filesystems': ('KubernetesFilesystemParams', 'list'), 'image_repo': ('DockerImageInfo', None), 'version': ('Number', None), 'volumes': ('KubernetesVolumeParams', 'list')}
     def __init__(self, api_addresses=None, base=None, ca_cert=None, charm_modified_version=None, charm_url=None, constraints=None, devices=None, error=None, filesystems=None, image_repo=None, scale=None, tags=None, trust=None, version=None, volumes=None, **unknown_fields):
         '''
         api_addresses : typing.Sequence[str]
@@ -3941,8 +4187,10 @@ class CAASApplicationProvisioningInfo(Type):
 
 
 class CAASApplicationProvisioningInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CAASApplicationProvisioningInfo', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CAASApplicationProvisioningInfo]
@@ -3959,8 +4207,10 @@ class CAASApplicationProvisioningInfoResults(Type):
 
 
 class CAASApplicationProvisioningState(Type):
+    __slots__ = ('scale_target', 'scaling', 'unknown_fields')
     _toSchema = {'scale_target': 'scale-target', 'scaling': 'scaling'}
     _toPy = {'scale-target': 'scale_target', 'scaling': 'scaling'}
+    _wireTypes = {}
     def __init__(self, scale_target=None, scaling=None, **unknown_fields):
         '''
         scale_target : int
@@ -3983,8 +4233,10 @@ class CAASApplicationProvisioningState(Type):
 
 
 class CAASApplicationProvisioningStateArg(Type):
+    __slots__ = ('application', 'provisioning_state', 'unknown_fields')
     _toSchema = {'application': 'application', 'provisioning_state': 'provisioning-state'}
     _toPy = {'application': 'application', 'provisioning-state': 'provisioning_state'}
+    _wireTypes = {'application': ('Entity', None), 'provisioning_state': ('CAASApplicationProvisioningState', None)}
     def __init__(self, application=None, provisioning_state=None, **unknown_fields):
         '''
         application : Entity
@@ -4007,8 +4259,10 @@ class CAASApplicationProvisioningStateArg(Type):
 
 
 class CAASApplicationProvisioningStateResult(Type):
+    __slots__ = ('error', 'provisioning_state', 'unknown_fields')
     _toSchema = {'error': 'error', 'provisioning_state': 'provisioning-state'}
     _toPy = {'error': 'error', 'provisioning-state': 'provisioning_state'}
+    _wireTypes = {'error': ('Error', None), 'provisioning_state': ('CAASApplicationProvisioningState', None)}
     def __init__(self, error=None, provisioning_state=None, **unknown_fields):
         '''
         error : Error
@@ -4031,8 +4285,10 @@ class CAASApplicationProvisioningStateResult(Type):
 
 
 class CAASUnitInfo(Type):
+    __slots__ = ('tag', 'unit_status', 'unknown_fields')
     _toSchema = {'tag': 'tag', 'unit_status': 'unit-status'}
     _toPy = {'tag': 'tag', 'unit-status': 'unit_status'}
+    _wireTypes = {'unit_status': ('UnitStatus', None)}
     def __init__(self, tag=None, unit_status=None, **unknown_fields):
         '''
         tag : str
@@ -4055,8 +4311,10 @@ class CAASUnitInfo(Type):
 
 
 class CAASUnitIntroduction(Type):
+    __slots__ = ('agent_conf', 'unit_name', 'unknown_fields')
     _toSchema = {'agent_conf': 'agent-conf', 'unit_name': 'unit-name'}
     _toPy = {'agent-conf': 'agent_conf', 'unit-name': 'unit_name'}
+    _wireTypes = {}
     def __init__(self, agent_conf=None, unit_name=None, **unknown_fields):
         '''
         agent_conf : typing.Sequence[int]
@@ -4079,8 +4337,10 @@ class CAASUnitIntroduction(Type):
 
 
 class CAASUnitIntroductionArgs(Type):
+    __slots__ = ('pod_name', 'pod_uuid', 'unknown_fields')
     _toSchema = {'pod_name': 'pod-name', 'pod_uuid': 'pod-uuid'}
     _toPy = {'pod-name': 'pod_name', 'pod-uuid': 'pod_uuid'}
+    _wireTypes = {}
     def __init__(self, pod_name=None, pod_uuid=None, **unknown_fields):
         '''
         pod_name : str
@@ -4103,8 +4363,10 @@ class CAASUnitIntroductionArgs(Type):
 
 
 class CAASUnitIntroductionResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('CAASUnitIntroduction', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -4127,8 +4389,10 @@ class CAASUnitIntroductionResult(Type):
 
 
 class CAASUnitTerminationResult(Type):
+    __slots__ = ('error', 'willrestart', 'unknown_fields')
     _toSchema = {'error': 'Error', 'willrestart': 'WillRestart'}
     _toPy = {'Error': 'error', 'WillRestart': 'willrestart'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, willrestart=None, **unknown_fields):
         '''
         error : Error
@@ -4151,8 +4415,10 @@ class CAASUnitTerminationResult(Type):
 
 
 class CAASUnitsResult(Type):
+    __slots__ = ('error', 'units', 'unknown_fields')
     _toSchema = {'error': 'error', 'units': 'units'}
     _toPy = {'error': 'error', 'units': 'units'}
+    _wireTypes = {'error': ('Error', None), 'units': ('CAASUnitInfo', 'list')}
     def __init__(self, error=None, units=None, **unknown_fields):
         '''
         error : Error
@@ -4175,8 +4441,10 @@ class CAASUnitsResult(Type):
 
 
 class CAASUnitsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CAASUnitsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CAASUnitsResult]
@@ -4193,8 +4461,10 @@ class CAASUnitsResults(Type):
 
 
 class CIDRParams(Type):
+    __slots__ = ('cidrs', 'unknown_fields')
     _toSchema = {'cidrs': 'cidrs'}
     _toPy = {'cidrs': 'cidrs'}
+    _wireTypes = {}
     def __init__(self, cidrs=None, **unknown_fields):
         '''
         cidrs : typing.Sequence[str]
@@ -4211,8 +4481,10 @@ class CIDRParams(Type):
 
 
 class ChangeModelCredentialParams(Type):
+    __slots__ = ('credential_tag', 'model_tag', 'unknown_fields')
     _toSchema = {'credential_tag': 'credential-tag', 'model_tag': 'model-tag'}
     _toPy = {'credential-tag': 'credential_tag', 'model-tag': 'model_tag'}
+    _wireTypes = {}
     def __init__(self, credential_tag=None, model_tag=None, **unknown_fields):
         '''
         credential_tag : str
@@ -4235,8 +4507,10 @@ class ChangeModelCredentialParams(Type):
 
 
 class ChangeModelCredentialsParams(Type):
+    __slots__ = ('model_credentials', 'unknown_fields')
     _toSchema = {'model_credentials': 'model-credentials'}
     _toPy = {'model-credentials': 'model_credentials'}
+    _wireTypes = {'model_credentials': ('ChangeModelCredentialParams', 'list')}
     def __init__(self, model_credentials=None, **unknown_fields):
         '''
         model_credentials : typing.Sequence[~ChangeModelCredentialParams]
@@ -4253,8 +4527,10 @@ class ChangeModelCredentialsParams(Type):
 
 
 class ChangeSecretBackendArg(Type):
+    __slots__ = ('content', 'revision', 'uri', 'unknown_fields')
     _toSchema = {'content': 'content', 'revision': 'revision', 'uri': 'uri'}
     _toPy = {'content': 'content', 'revision': 'revision', 'uri': 'uri'}
+    _wireTypes = {'content': ('SecretContentParams', None)}
     def __init__(self, content=None, revision=None, uri=None, **unknown_fields):
         '''
         content : SecretContentParams
@@ -4283,8 +4559,10 @@ class ChangeSecretBackendArg(Type):
 
 
 class ChangeSecretBackendArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('ChangeSecretBackendArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ChangeSecretBackendArg]
@@ -4301,8 +4579,10 @@ class ChangeSecretBackendArgs(Type):
 
 
 class Channel(Type):
+    __slots__ = ('branch', 'risk', 'track', 'unknown_fields')
     _toSchema = {'branch': 'branch', 'risk': 'risk', 'track': 'track'}
     _toPy = {'branch': 'branch', 'risk': 'risk', 'track': 'track'}
+    _wireTypes = {}
     def __init__(self, branch=None, risk=None, track=None, **unknown_fields):
         '''
         branch : str
@@ -4331,8 +4611,10 @@ class Channel(Type):
 
 
 class Charm(Type):
+    __slots__ = ('actions', 'config', 'lxd_profile', 'manifest', 'meta', 'metrics', 'revision', 'url', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'config': 'config', 'lxd_profile': 'lxd-profile', 'manifest': 'manifest', 'meta': 'meta', 'metrics': 'metrics', 'revision': 'revision', 'url': 'url'}
     _toPy = {'actions': 'actions', 'config': 'config', 'lxd-profile': 'lxd_profile', 'manifest': 'manifest', 'meta': 'meta', 'metrics': 'metrics', 'revision': 'revision', 'url': 'url'}
+    _wireTypes = {'actions': ('CharmActions', None), 'config': ('CharmOption', 'dict'), 'lxd_profile': ('CharmLXDProfile', None), 'manifest': ('CharmManifest', None), 'meta': ('CharmMeta', None), 'metrics': ('CharmMetrics', None)}
     def __init__(self, actions=None, config=None, lxd_profile=None, manifest=None, meta=None, metrics=None, revision=None, url=None, **unknown_fields):
         '''
         actions : CharmActions
@@ -4391,8 +4673,10 @@ class Charm(Type):
 
 
 class CharmActionSpec(Type):
+    __slots__ = ('description', 'params', 'unknown_fields')
     _toSchema = {'description': 'description', 'params': 'params'}
     _toPy = {'description': 'description', 'params': 'params'}
+    _wireTypes = {}
     def __init__(self, description=None, params=None, **unknown_fields):
         '''
         description : str
@@ -4415,8 +4699,10 @@ class CharmActionSpec(Type):
 
 
 class CharmActions(Type):
+    __slots__ = ('specs', 'unknown_fields')
     _toSchema = {'specs': 'specs'}
     _toPy = {'specs': 'specs'}
+    _wireTypes = {'specs': ('CharmActionSpec', 'dict')}
     def __init__(self, specs=None, **unknown_fields):
         '''
         specs : typing.Mapping[str, ~CharmActionSpec]
@@ -4433,8 +4719,10 @@ class CharmActions(Type):
 
 
 class CharmBase(Type):
+    __slots__ = ('architectures', 'channel', 'name', 'unknown_fields')
     _toSchema = {'architectures': 'architectures', 'channel': 'channel', 'name': 'name'}
     _toPy = {'architectures': 'architectures', 'channel': 'channel', 'name': 'name'}
+    _wireTypes = {}
     def __init__(self, architectures=None, channel=None, name=None, **unknown_fields):
         '''
         architectures : typing.Sequence[str]
@@ -4463,8 +4751,10 @@ class CharmBase(Type):
 
 
 class CharmContainer(Type):
+    __slots__ = ('mounts', 'resource', 'unknown_fields')
     _toSchema = {'mounts': 'mounts', 'resource': 'resource'}
     _toPy = {'mounts': 'mounts', 'resource': 'resource'}
+    _wireTypes = {'mounts': ('CharmMount', 'list')}
     def __init__(self, mounts=None, resource=None, **unknown_fields):
         '''
         mounts : typing.Sequence[~CharmMount]
@@ -4487,8 +4777,10 @@ class CharmContainer(Type):
 
 
 class CharmDeployment(Type):
+    __slots__ = ('min_version', 'mode', 'service', 'type_', 'unknown_fields')
     _toSchema = {'min_version': 'min-version', 'mode': 'mode', 'service': 'service', 'type_': 'type'}
     _toPy = {'min-version': 'min_version', 'mode': 'mode', 'service': 'service', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, min_version=None, mode=None, service=None, type_=None, **unknown_fields):
         '''
         min_version : str
@@ -4523,8 +4815,10 @@ class CharmDeployment(Type):
 
 
 class CharmDevice(Type):
+    __slots__ = ('countmax', 'countmin', 'description', 'name', 'type_', 'unknown_fields')
     _toSchema = {'countmax': 'CountMax', 'countmin': 'CountMin', 'description': 'Description', 'name': 'Name', 'type_': 'Type'}
     _toPy = {'CountMax': 'countmax', 'CountMin': 'countmin', 'Description': 'description', 'Name': 'name', 'Type': 'type_'}
+    _wireTypes = {}
     def __init__(self, countmax=None, countmin=None, description=None, name=None, type_=None, **unknown_fields):
         '''
         countmax : int
@@ -4565,8 +4859,10 @@ class CharmDevice(Type):
 
 
 class CharmLXDProfile(Type):
+    __slots__ = ('config', 'description', 'devices', 'unknown_fields')
     _toSchema = {'config': 'config', 'description': 'description', 'devices': 'devices'}
     _toPy = {'config': 'config', 'description': 'description', 'devices': 'devices'}
+    _wireTypes = {}
     def __init__(self, config=None, description=None, devices=None, **unknown_fields):
         '''
         config : typing.Mapping[str, str]
@@ -4595,8 +4891,10 @@ class CharmLXDProfile(Type):
 
 
 class CharmManifest(Type):
+    __slots__ = ('bases', 'unknown_fields')
     _toSchema = {'bases': 'bases'}
     _toPy = {'bases': 'bases'}
+    _wireTypes = {'bases': ('CharmBase', 'list')}
     def __init__(self, bases=None, **unknown_fields):
         '''
         bases : typing.Sequence[~CharmBase]
@@ -4613,8 +4911,10 @@ class CharmManifest(Type):
 
 
 class CharmMeta(Type):
+    __slots__ = ('assumes_expr', 'categories', 'containers', 'deployment', 'description', 'devices', 'extra_bindings', 'min_juju_version', 'name', 'payload_classes', 'peers', 'provides', 'requires', 'resources', 'series', 'storage', 'subordinate', 'summary', 'tags', 'terms', 'unknown_fields')
     _toSchema = {'assumes_expr': 'assumes-expr', 'categories': 'categories', 'containers': 'containers', 'deployment': 'deployment', 'description': 'description', 'devices': 'devices', 'extra_bindings': 'extra-bindings', 'min_juju_version': 'min-juju-version', 'name': 'name', 'payload_classes': 'payload-classes', 'peers': 'peers', 'provides': 'provides', 'requires': 'requires', 'resources': 'resources', 'series': 'series', 'storage': 'storage', 'subordinate': 'subordinate', 'summary': 'summary', 'tags': 'tags', 'terms': 'terms'}
     _toPy = {'assumes-expr': 'assumes_expr', 'categories': 'categories', 'containers': 'containers', 'deployment': 'deployment', 'description': 'description', 'devices': 'devices', 'extra-bindings': 'extra_bindings', 'min-juju-version': 'min_juju_version', 'name': 'name', 'payload-classes': 'payload_classes', 'peers': 'peers', 'provides': 'provides', 'requires': 'requires', 'resources': 'resources', 'series': 'series', 'storage': 'storage', 'subordinate': 'subordinate', 'summary': 'summary', 'tags': 'tags', 'terms': 'terms'}
+    _wireTypes = {'assumes_expr': ('ExpressionTree', None), 'containers': ('CharmContainer', 'dict'), 'deployment': ('CharmDeployment', None), 'devices': ('CharmDevice', 'dict'), 'payload_classes': ('CharmPayloadClass', 'dict'), 'peers': ('CharmRelation', 'dict'), 'provides': ('CharmRelation', 'dict'), 'requires': ('CharmRelation', 'dict'), 'resources': ('CharmResourceMeta', 'dict'), 'storage': ('CharmStorage', 'dict')}
     def __init__(self, assumes_expr=None, categories=None, containers=None, deployment=None, description=None, devices=None, extra_bindings=None, min_juju_version=None, name=None, payload_classes=None, peers=None, provides=None, requires=None, resources=None, series=None, storage=None, subordinate=None, summary=None, tags=None, terms=None, **unknown_fields):
         '''
         assumes_expr : ExpressionTree
@@ -4745,8 +5045,10 @@ class CharmMeta(Type):
 
 
 class CharmMetric(Type):
+    __slots__ = ('description', 'type_', 'unknown_fields')
     _toSchema = {'description': 'description', 'type_': 'type'}
     _toPy = {'description': 'description', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, description=None, type_=None, **unknown_fields):
         '''
         description : str
@@ -4769,8 +5071,10 @@ class CharmMetric(Type):
 
 
 class CharmMetrics(Type):
+    __slots__ = ('metrics', 'plan', 'unknown_fields')
     _toSchema = {'metrics': 'metrics', 'plan': 'plan'}
     _toPy = {'metrics': 'metrics', 'plan': 'plan'}
+    _wireTypes = {'metrics': ('CharmMetric', 'dict'), 'plan': ('CharmPlan', None)}
     def __init__(self, metrics=None, plan=None, **unknown_fields):
         '''
         metrics : typing.Mapping[str, ~CharmMetric]
@@ -4793,8 +5097,10 @@ class CharmMetrics(Type):
 
 
 class CharmMount(Type):
+    __slots__ = ('location', 'storage', 'unknown_fields')
     _toSchema = {'location': 'location', 'storage': 'storage'}
     _toPy = {'location': 'location', 'storage': 'storage'}
+    _wireTypes = {}
     def __init__(self, location=None, storage=None, **unknown_fields):
         '''
         location : str
@@ -4817,8 +5123,10 @@ class CharmMount(Type):
 
 
 class CharmOption(Type):
+    __slots__ = ('default', 'description', 'type_', 'unknown_fields')
     _toSchema = {'default': 'default', 'description': 'description', 'type_': 'type'}
     _toPy = {'default': 'default', 'description': 'description', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, default=None, description=None, type_=None, **unknown_fields):
         '''
         default : Any
@@ -4844,8 +5152,10 @@ class CharmOption(Type):
 
 
 class CharmOrigin(Type):
+    __slots__ = ('architecture', 'base', 'branch', 'hash_', 'id_', 'instance_key', 'revision', 'risk', 'source', 'track', 'type_', 'unknown_fields')
     _toSchema = {'architecture': 'architecture', 'base': 'base', 'branch': 'branch', 'hash_': 'hash', 'id_': 'id', 'instance_key': 'instance-key', 'revision': 'revision', 'risk': 'risk', 'source': 'source', 'track': 'track', 'type_': 'type'}
     _toPy = {'architecture': 'architecture', 'base': 'base', 'branch': 'branch', 'hash': 'hash_', 'id': 'id_', 'instance-key': 'instance_key', 'revision': 'revision', 'risk': 'risk', 'source': 'source', 'track': 'track', 'type': 'type_'}
+    _wireTypes = {'base': ('Base', None)}
     def __init__(self, architecture=None, base=None, branch=None, hash_=None, id_=None, instance_key=None, revision=None, risk=None, source=None, track=None, type_=None, **unknown_fields):
         '''
         architecture : str
@@ -4922,8 +5232,10 @@ class CharmOrigin(Type):
 
 
 class CharmOriginResult(Type):
+    __slots__ = ('charm_origin', 'error', 'unknown_fields')
     _toSchema = {'charm_origin': 'charm-origin', 'error': 'error'}
     _toPy = {'charm-origin': 'charm_origin', 'error': 'error'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None), 'error': ('Error', None)}
     def __init__(self, charm_origin=None, error=None, **unknown_fields):
         '''
         charm_origin : CharmOrigin
@@ -4946,8 +5258,10 @@ class CharmOriginResult(Type):
 
 
 class CharmPayloadClass(Type):
+    __slots__ = ('name', 'type_', 'unknown_fields')
     _toSchema = {'name': 'name', 'type_': 'type'}
     _toPy = {'name': 'name', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, name=None, type_=None, **unknown_fields):
         '''
         name : str
@@ -4970,8 +5284,10 @@ class CharmPayloadClass(Type):
 
 
 class CharmPlan(Type):
+    __slots__ = ('required', 'unknown_fields')
     _toSchema = {'required': 'required'}
     _toPy = {'required': 'required'}
+    _wireTypes = {}
     def __init__(self, required=None, **unknown_fields):
         '''
         required : bool
@@ -4988,8 +5304,10 @@ class CharmPlan(Type):
 
 
 class CharmProfilingInfoResult(Type):
+    __slots__ = ('current_profiles', 'error', 'instance_id', 'model_name', 'profile_changes', 'unknown_fields')
     _toSchema = {'current_profiles': 'current-profiles', 'error': 'error', 'instance_id': 'instance-id', 'model_name': 'model-name', 'profile_changes': 'profile-changes'}
     _toPy = {'current-profiles': 'current_profiles', 'error': 'error', 'instance-id': 'instance_id', 'model-name': 'model_name', 'profile-changes': 'profile_changes'}
+    _wireTypes = {'error': ('Error', None), 'profile_changes': ('ProfileInfoResult', 'list')}
     def __init__(self, current_profiles=None, error=None, instance_id=None, model_name=None, profile_changes=None, **unknown_fields):
         '''
         current_profiles : typing.Sequence[str]
@@ -5030,8 +5348,10 @@ class CharmProfilingInfoResult(Type):
 
 
 class CharmRelation(Type):
+    __slots__ = ('interface', 'limit', 'name', 'optional', 'role', 'scope', 'unknown_fields')
     _toSchema = {'interface': 'interface', 'limit': 'limit', 'name': 'name', 'optional': 'optional', 'role': 'role', 'scope': 'scope'}
     _toPy = {'interface': 'interface', 'limit': 'limit', 'name': 'name', 'optional': 'optional', 'role': 'role', 'scope': 'scope'}
+    _wireTypes = {}
     def __init__(self, interface=None, limit=None, name=None, optional=None, role=None, scope=None, **unknown_fields):
         '''
         interface : str
@@ -5078,8 +5398,10 @@ class CharmRelation(Type):
 
 
 class CharmResource(Type):
+    __slots__ = ('description', 'fingerprint', 'name', 'origin', 'path', 'revision', 'size', 'type_', 'unknown_fields')
     _toSchema = {'description': 'description', 'fingerprint': 'fingerprint', 'name': 'name', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'type_': 'type'}
     _toPy = {'description': 'description', 'fingerprint': 'fingerprint', 'name': 'name', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, description=None, fingerprint=None, name=None, origin=None, path=None, revision=None, size=None, type_=None, **unknown_fields):
         '''
         description : str
@@ -5138,8 +5460,10 @@ class CharmResource(Type):
 
 
 class CharmResourceMeta(Type):
+    __slots__ = ('description', 'name', 'path', 'type_', 'unknown_fields')
     _toSchema = {'description': 'description', 'name': 'name', 'path': 'path', 'type_': 'type'}
     _toPy = {'description': 'description', 'name': 'name', 'path': 'path', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, description=None, name=None, path=None, type_=None, **unknown_fields):
         '''
         description : str
@@ -5174,8 +5498,10 @@ class CharmResourceMeta(Type):
 
 
 class CharmResourceResult(Type):
+    __slots__ = ('charmresource', 'errorresult', 'description', 'error', 'fingerprint', 'name', 'origin', 'path', 'revision', 'size', 'type_', 'unknown_fields')
     _toSchema = {'charmresource': 'CharmResource', 'description': 'description', 'error': 'error', 'errorresult': 'ErrorResult', 'fingerprint': 'fingerprint', 'name': 'name', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'type_': 'type'}
     _toPy = {'CharmResource': 'charmresource', 'ErrorResult': 'errorresult', 'description': 'description', 'error': 'error', 'fingerprint': 'fingerprint', 'name': 'name', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'type': 'type_'}
+    _wireTypes = {'charmresource': ('CharmResource', None), 'error': ('Error', None), 'errorresult': ('ErrorResult', None)}
     def __init__(self, charmresource=None, errorresult=None, description=None, error=None, fingerprint=None, name=None, origin=None, path=None, revision=None, size=None, type_=None, **unknown_fields):
         '''
         charmresource : CharmResource
@@ -5252,8 +5578,10 @@ class CharmResourceResult(Type):
 
 
 class CharmResourcesResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CharmResourceResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CharmResourceResult]
@@ -5270,8 +5598,10 @@ class CharmResourcesResults(Type):
 
 
 class CharmStorage(Type):
+    __slots__ = ('count_max', 'count_min', 'description', 'location', 'minimum_size', 'name', 'properties', 'read_only', 'shared', 'type_', 'unknown_fields')
     _toSchema = {'count_max': 'count-max', 'count_min': 'count-min', 'description': 'description', 'location': 'location', 'minimum_size': 'minimum-size', 'name': 'name', 'properties': 'properties', 'read_only': 'read-only', 'shared': 'shared', 'type_': 'type'}
     _toPy = {'count-max': 'count_max', 'count-min': 'count_min', 'description': 'description', 'location': 'location', 'minimum-size': 'minimum_size', 'name': 'name', 'properties': 'properties', 'read-only': 'read_only', 'shared': 'shared', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, count_max=None, count_min=None, description=None, location=None, minimum_size=None, name=None, properties=None, read_only=None, shared=None, type_=None, **unknown_fields):
         '''
         count_max : int
@@ -5342,8 +5672,10 @@ class CharmStorage(Type):
 
 
 class CharmURL(Type):
+    __slots__ = ('url', 'unknown_fields')
     _toSchema = {'url': 'url'}
     _toPy = {'url': 'url'}
+    _wireTypes = {}
     def __init__(self, url=None, **unknown_fields):
         '''
         url : str
@@ -5360,8 +5692,10 @@ class CharmURL(Type):
 
 
 class CharmURLAndOrigin(Type):
+    __slots__ = ('charm_origin', 'charm_url', 'macaroon', 'unknown_fields')
     _toSchema = {'charm_origin': 'charm-origin', 'charm_url': 'charm-url', 'macaroon': 'macaroon'}
     _toPy = {'charm-origin': 'charm_origin', 'charm-url': 'charm_url', 'macaroon': 'macaroon'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None), 'macaroon': ('Macaroon', None)}
     def __init__(self, charm_origin=None, charm_url=None, macaroon=None, **unknown_fields):
         '''
         charm_origin : CharmOrigin
@@ -5390,8 +5724,10 @@ class CharmURLAndOrigin(Type):
 
 
 class CharmURLAndOrigins(Type):
+    __slots__ = ('entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
+    _wireTypes = {'entities': ('CharmURLAndOrigin', 'list')}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~CharmURLAndOrigin]
@@ -5408,8 +5744,10 @@ class CharmURLAndOrigins(Type):
 
 
 class CharmURLOriginResult(Type):
+    __slots__ = ('charm_origin', 'error', 'url', 'unknown_fields')
     _toSchema = {'charm_origin': 'charm-origin', 'error': 'error', 'url': 'url'}
     _toPy = {'charm-origin': 'charm_origin', 'error': 'error', 'url': 'url'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None), 'error': ('Error', None)}
     def __init__(self, charm_origin=None, error=None, url=None, **unknown_fields):
         '''
         charm_origin : CharmOrigin
@@ -5438,8 +5776,10 @@ class CharmURLOriginResult(Type):
 
 
 class CharmURLs(Type):
+    __slots__ = ('urls', 'unknown_fields')
     _toSchema = {'urls': 'urls'}
     _toPy = {'urls': 'urls'}
+    _wireTypes = {'urls': ('CharmURL', 'list')}
     def __init__(self, urls=None, **unknown_fields):
         '''
         urls : typing.Sequence[~CharmURL]
@@ -5456,8 +5796,10 @@ class CharmURLs(Type):
 
 
 class CharmsList(Type):
+    __slots__ = ('names', 'unknown_fields')
     _toSchema = {'names': 'names'}
     _toPy = {'names': 'names'}
+    _wireTypes = {}
     def __init__(self, names=None, **unknown_fields):
         '''
         names : typing.Sequence[str]
@@ -5474,8 +5816,10 @@ class CharmsList(Type):
 
 
 class CharmsListResult(Type):
+    __slots__ = ('charm_urls', 'unknown_fields')
     _toSchema = {'charm_urls': 'charm-urls'}
     _toPy = {'charm-urls': 'charm_urls'}
+    _wireTypes = {}
     def __init__(self, charm_urls=None, **unknown_fields):
         '''
         charm_urls : typing.Sequence[str]
@@ -5492,8 +5836,10 @@ class CharmsListResult(Type):
 
 
 class ClaimLeadershipBulkParams(Type):
+    __slots__ = ('params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
+    _wireTypes = {'params': ('ClaimLeadershipParams', 'list')}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~ClaimLeadershipParams]
@@ -5510,8 +5856,10 @@ class ClaimLeadershipBulkParams(Type):
 
 
 class ClaimLeadershipBulkResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ErrorResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ErrorResult]
@@ -5528,8 +5876,10 @@ class ClaimLeadershipBulkResults(Type):
 
 
 class ClaimLeadershipParams(Type):
+    __slots__ = ('application_tag', 'duration', 'unit_tag', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'duration': 'duration', 'unit_tag': 'unit-tag'}
     _toPy = {'application-tag': 'application_tag', 'duration': 'duration', 'unit-tag': 'unit_tag'}
+    _wireTypes = {}
     def __init__(self, application_tag=None, duration=None, unit_tag=None, **unknown_fields):
         '''
         application_tag : str
@@ -5558,8 +5908,10 @@ class ClaimLeadershipParams(Type):
 
 
 class Cloud(Type):
+    __slots__ = ('auth_types', 'ca_certificates', 'config', 'endpoint', 'host_cloud_region', 'identity_endpoint', 'is_controller_cloud', 'region_config', 'regions', 'skip_tls_verify', 'storage_endpoint', 'type_', 'unknown_fields')
     _toSchema = {'auth_types': 'auth-types', 'ca_certificates': 'ca-certificates', 'config': 'config', 'endpoint': 'endpoint', 'host_cloud_region': 'host-cloud-region', 'identity_endpoint': 'identity-endpoint', 'is_controller_cloud': 'is-controller-cloud', 'region_config': 'region-config', 'regions': 'regions', 'skip_tls_verify': 'skip-tls-verify', 'storage_endpoint': 'storage-endpoint', 'type_': 'type'}
     _toPy = {'auth-types': 'auth_types', 'ca-certificates': 'ca_certificates', 'config': 'config', 'endpoint': 'endpoint', 'host-cloud-region': 'host_cloud_region', 'identity-endpoint': 'identity_endpoint', 'is-controller-cloud': 'is_controller_cloud', 'region-config': 'region_config', 'regions': 'regions', 'skip-tls-verify': 'skip_tls_verify', 'storage-endpoint': 'storage_endpoint', 'type': 'type_'}
+    _wireTypes = {'regions': ('CloudRegion', 'list')}
     def __init__(self, auth_types=None, ca_certificates=None, config=None, endpoint=None, host_cloud_region=None, identity_endpoint=None, is_controller_cloud=None, region_config=None, regions=None, skip_tls_verify=None, storage_endpoint=None, type_=None, **unknown_fields):
         '''
         auth_types : typing.Sequence[str]
@@ -5642,8 +5994,10 @@ class Cloud(Type):
 
 
 class CloudCredential(Type):
+    __slots__ = ('attrs', 'auth_type', 'redacted', 'unknown_fields')
     _toSchema = {'attrs': 'attrs', 'auth_type': 'auth-type', 'redacted': 'redacted'}
     _toPy = {'attrs': 'attrs', 'auth-type': 'auth_type', 'redacted': 'redacted'}
+    _wireTypes = {}
     def __init__(self, attrs=None, auth_type=None, redacted=None, **unknown_fields):
         '''
         attrs : typing.Mapping[str, str]
@@ -5672,8 +6026,10 @@ class CloudCredential(Type):
 
 
 class CloudCredentialArg(Type):
+    __slots__ = ('cloud_name', 'credential_name', 'unknown_fields')
     _toSchema = {'cloud_name': 'cloud-name', 'credential_name': 'credential-name'}
     _toPy = {'cloud-name': 'cloud_name', 'credential-name': 'credential_name'}
+    _wireTypes = {}
     def __init__(self, cloud_name=None, credential_name=None, **unknown_fields):
         '''
         cloud_name : str
@@ -5696,8 +6052,10 @@ class CloudCredentialArg(Type):
 
 
 class CloudCredentialArgs(Type):
+    __slots__ = ('credentials', 'include_secrets', 'unknown_fields')
     _toSchema = {'credentials': 'credentials', 'include_secrets': 'include-secrets'}
     _toPy = {'credentials': 'credentials', 'include-secrets': 'include_secrets'}
+    _wireTypes = {'credentials': ('CloudCredentialArg', 'list')}
     def __init__(self, credentials=None, include_secrets=None, **unknown_fields):
         '''
         credentials : typing.Sequence[~CloudCredentialArg]
@@ -5720,8 +6078,10 @@ class CloudCredentialArgs(Type):
 
 
 class CloudCredentialResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('CloudCredential', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -5744,8 +6104,10 @@ class CloudCredentialResult(Type):
 
 
 class CloudCredentialResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CloudCredentialResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CloudCredentialResult]
@@ -5762,8 +6124,10 @@ class CloudCredentialResults(Type):
 
 
 class CloudDetails(Type):
+    __slots__ = ('auth_types', 'endpoint', 'identity_endpoint', 'regions', 'storage_endpoint', 'type_', 'unknown_fields')
     _toSchema = {'auth_types': 'auth-types', 'endpoint': 'endpoint', 'identity_endpoint': 'identity-endpoint', 'regions': 'regions', 'storage_endpoint': 'storage-endpoint', 'type_': 'type'}
     _toPy = {'auth-types': 'auth_types', 'endpoint': 'endpoint', 'identity-endpoint': 'identity_endpoint', 'regions': 'regions', 'storage-endpoint': 'storage_endpoint', 'type': 'type_'}
+    _wireTypes = {'regions': ('CloudRegion', 'list')}
     def __init__(self, auth_types=None, endpoint=None, identity_endpoint=None, regions=None, storage_endpoint=None, type_=None, **unknown_fields):
         '''
         auth_types : typing.Sequence[str]
@@ -5810,8 +6174,10 @@ class CloudDetails(Type):
 
 
 class CloudImageMetadata(Type):
+    __slots__ = ('arch', 'image_id', 'priority', 'region', 'root_storage_size', 'root_storage_type', 'source', 'stream', 'version', 'virt_type', 'unknown_fields')
     _toSchema = {'arch': 'arch', 'image_id': 'image-id', 'priority': 'priority', 'region': 'region', 'root_storage_size': 'root-storage-size', 'root_storage_type': 'root-storage-type', 'source': 'source', 'stream': 'stream', 'version': 'version', 'virt_type': 'virt-type'}
     _toPy = {'arch': 'arch', 'image-id': 'image_id', 'priority': 'priority', 'region': 'region', 'root-storage-size': 'root_storage_size', 'root-storage-type': 'root_storage_type', 'source': 'source', 'stream': 'stream', 'version': 'version', 'virt-type': 'virt_type'}
+    _wireTypes = {}
     def __init__(self, arch=None, image_id=None, priority=None, region=None, root_storage_size=None, root_storage_type=None, source=None, stream=None, version=None, virt_type=None, **unknown_fields):
         '''
         arch : str
@@ -5882,8 +6248,10 @@ class CloudImageMetadata(Type):
 
 
 class CloudImageMetadataList(Type):
+    __slots__ = ('metadata', 'unknown_fields')
     _toSchema = {'metadata': 'metadata'}
     _toPy = {'metadata': 'metadata'}
+    _wireTypes = {'metadata': ('CloudImageMetadata', 'list')}
     def __init__(self, metadata=None, **unknown_fields):
         '''
         metadata : typing.Sequence[~CloudImageMetadata]
@@ -5900,8 +6268,10 @@ class CloudImageMetadataList(Type):
 
 
 class CloudInfo(Type):
+    __slots__ = ('clouddetails', 'users', 'unknown_fields')
     _toSchema = {'clouddetails': 'CloudDetails', 'users': 'users'}
     _toPy = {'CloudDetails': 'clouddetails', 'users': 'users'}
+    _wireTypes = {'clouddetails': ('CloudDetails', None), 'users': ('CloudUserInfo', 'list')}
     def __init__(self, clouddetails=None, users=None, **unknown_fields):
         '''
         clouddetails : CloudDetails
@@ -5924,8 +6294,10 @@ class CloudInfo(Type):
 
 
 class CloudInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('CloudInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -5948,8 +6320,10 @@ class CloudInfoResult(Type):
 
 
 class CloudInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CloudInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CloudInfoResult]
@@ -5966,8 +6340,10 @@ class CloudInfoResults(Type):
 
 
 class CloudInstanceTypesConstraint(Type):
+    __slots__ = ('cloud_tag', 'constraints', 'region', 'unknown_fields')
     _toSchema = {'cloud_tag': 'cloud-tag', 'constraints': 'constraints', 'region': 'region'}
     _toPy = {'cloud-tag': 'cloud_tag', 'constraints': 'constraints', 'region': 'region'}
+    _wireTypes = {'constraints': ('Value', None)}
     def __init__(self, cloud_tag=None, constraints=None, region=None, **unknown_fields):
         '''
         cloud_tag : str
@@ -5996,8 +6372,10 @@ class CloudInstanceTypesConstraint(Type):
 
 
 class CloudInstanceTypesConstraints(Type):
+    __slots__ = ('constraints', 'unknown_fields')
     _toSchema = {'constraints': 'constraints'}
     _toPy = {'constraints': 'constraints'}
+    _wireTypes = {'constraints': ('CloudInstanceTypesConstraint', 'list')}
     def __init__(self, constraints=None, **unknown_fields):
         '''
         constraints : typing.Sequence[~CloudInstanceTypesConstraint]
@@ -6014,8 +6392,10 @@ class CloudInstanceTypesConstraints(Type):
 
 
 class CloudRegion(Type):
+    __slots__ = ('endpoint', 'identity_endpoint', 'name', 'storage_endpoint', 'unknown_fields')
     _toSchema = {'endpoint': 'endpoint', 'identity_endpoint': 'identity-endpoint', 'name': 'name', 'storage_endpoint': 'storage-endpoint'}
     _toPy = {'endpoint': 'endpoint', 'identity-endpoint': 'identity_endpoint', 'name': 'name', 'storage-endpoint': 'storage_endpoint'}
+    _wireTypes = {}
     def __init__(self, endpoint=None, identity_endpoint=None, name=None, storage_endpoint=None, **unknown_fields):
         '''
         endpoint : str
@@ -6050,8 +6430,10 @@ class CloudRegion(Type):
 
 
 class CloudResult(Type):
+    __slots__ = ('cloud', 'error', 'unknown_fields')
     _toSchema = {'cloud': 'cloud', 'error': 'error'}
     _toPy = {'cloud': 'cloud', 'error': 'error'}
+    _wireTypes = {'cloud': ('Cloud', None), 'error': ('Error', None)}
     def __init__(self, cloud=None, error=None, **unknown_fields):
         '''
         cloud : Cloud
@@ -6074,8 +6456,10 @@ class CloudResult(Type):
 
 
 class CloudResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CloudResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CloudResult]
@@ -6092,8 +6476,10 @@ class CloudResults(Type):
 
 
 class CloudSpec(Type):
+    __slots__ = ('cacertificates', 'credential', 'endpoint', 'identity_endpoint', 'is_controller_cloud', 'name', 'region', 'skip_tls_verify', 'storage_endpoint', 'type_', 'unknown_fields')
     _toSchema = {'cacertificates': 'cacertificates', 'credential': 'credential', 'endpoint': 'endpoint', 'identity_endpoint': 'identity-endpoint', 'is_controller_cloud': 'is-controller-cloud', 'name': 'name', 'region': 'region', 'skip_tls_verify': 'skip-tls-verify', 'storage_endpoint': 'storage-endpoint', 'type_': 'type'}
     _toPy = {'cacertificates': 'cacertificates', 'credential': 'credential', 'endpoint': 'endpoint', 'identity-endpoint': 'identity_endpoint', 'is-controller-cloud': 'is_controller_cloud', 'name': 'name', 'region': 'region', 'skip-tls-verify': 'skip_tls_verify', 'storage-endpoint': 'storage_endpoint', 'type': 'type_'}
+    _wireTypes = {'credential': ('CloudCredential', None)}
     def __init__(self, cacertificates=None, credential=None, endpoint=None, identity_endpoint=None, is_controller_cloud=None, name=None, region=None, skip_tls_verify=None, storage_endpoint=None, type_=None, **unknown_fields):
         '''
         cacertificates : typing.Sequence[str]
@@ -6164,8 +6550,10 @@ class CloudSpec(Type):
 
 
 class CloudSpecResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('CloudSpec', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -6188,8 +6576,10 @@ class CloudSpecResult(Type):
 
 
 class CloudSpecResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CloudSpecResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CloudSpecResult]
@@ -6206,8 +6596,10 @@ class CloudSpecResults(Type):
 
 
 class CloudUserInfo(Type):
+    __slots__ = ('access', 'display_name', 'user', 'unknown_fields')
     _toSchema = {'access': 'access', 'display_name': 'display-name', 'user': 'user'}
     _toPy = {'access': 'access', 'display-name': 'display_name', 'user': 'user'}
+    _wireTypes = {}
     def __init__(self, access=None, display_name=None, user=None, **unknown_fields):
         '''
         access : str
@@ -6236,8 +6628,10 @@ class CloudUserInfo(Type):
 
 
 class CloudsResult(Type):
+    __slots__ = ('clouds', 'unknown_fields')
     _toSchema = {'clouds': 'clouds'}
     _toPy = {'clouds': 'clouds'}
+    _wireTypes = {'clouds': ('Cloud', 'dict')}
     def __init__(self, clouds=None, **unknown_fields):
         '''
         clouds : typing.Mapping[str, ~Cloud]
@@ -6254,8 +6648,10 @@ class CloudsResult(Type):
 
 
 class CommitHookChangesArg(Type):
+    __slots__ = ('add_storage', 'close_ports', 'open_ports', 'pod_spec', 'relation_unit_settings', 'secret_creates', 'secret_deletes', 'secret_grants', 'secret_revokes', 'secret_updates', 'set_raw_k8s_spec', 'tag', 'unit_state', 'update_network_info', 'unknown_fields')
     _toSchema = {'add_storage': 'add-storage', 'close_ports': 'close-ports', 'open_ports': 'open-ports', 'pod_spec': 'pod-spec', 'relation_unit_settings': 'relation-unit-settings', 'secret_creates': 'secret-creates', 'secret_deletes': 'secret-deletes', 'secret_grants': 'secret-grants', 'secret_revokes': 'secret-revokes', 'secret_updates': 'secret-updates', 'set_raw_k8s_spec': 'set-raw-k8s-spec', 'tag': 'tag', 'unit_state': 'unit-state', 'update_network_info': 'update-network-info'}
     _toPy = {'add-storage': 'add_storage', 'close-ports': 'close_ports', 'open-ports': 'open_ports', 'pod-spec': 'pod_spec', 'relation-unit-settings': 'relation_unit_settings', 'secret-creates': 'secret_creates', 'secret-deletes': 'secret_deletes', 'secret-grants': 'secret_grants', 'secret-revokes': 'secret_revokes', 'secret-updates': 'secret_updates', 'set-raw-k8s-spec': 'set_raw_k8s_spec', 'tag': 'tag', 'unit-state': 'unit_state', 'update-network-info': 'update_network_info'}
+    _wireTypes = {'add_storage': ('StorageAddParams', 'list'), 'close_ports': ('EntityPortRange', 'list'), 'open_ports': ('EntityPortRange', 'list'), 'pod_spec': ('PodSpec', None), 'relation_unit_settings': ('RelationUnitSettings', 'list'), 'secret_creates': ('CreateSecretArg', 'list'), 'secret_deletes': ('DeleteSecretArg', 'list'), 'secret_grants': ('GrantRevokeSecretArg', 'list'), 'secret_revokes': ('GrantRevokeSecretArg', 'list'), 'secret_updates': ('UpdateSecretArg', 'list'), 'set_raw_k8s_spec': ('PodSpec', None), 'unit_state': ('SetUnitStateArg', None)}
     def __init__(self, add_storage=None, close_ports=None, open_ports=None, pod_spec=None, relation_unit_settings=None, secret_creates=None, secret_deletes=None, secret_grants=None, secret_revokes=None, secret_updates=None, set_raw_k8s_spec=None, tag=None, unit_state=None, update_network_info=None, **unknown_fields):
         '''
         add_storage : typing.Sequence[~StorageAddParams]
@@ -6350,8 +6746,10 @@ class CommitHookChangesArg(Type):
 
 
 class CommitHookChangesArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('CommitHookChangesArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~CommitHookChangesArg]
@@ -6368,8 +6766,10 @@ class CommitHookChangesArgs(Type):
 
 
 class ConfigResult(Type):
+    __slots__ = ('config', 'error', 'unknown_fields')
     _toSchema = {'config': 'config', 'error': 'error'}
     _toPy = {'config': 'config', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, config=None, error=None, **unknown_fields):
         '''
         config : typing.Mapping[str, typing.Any]
@@ -6392,8 +6792,10 @@ class ConfigResult(Type):
 
 
 class ConfigSet(Type):
+    __slots__ = ('application', 'config', 'config_yaml', 'generation', 'unknown_fields')
     _toSchema = {'application': 'application', 'config': 'config', 'config_yaml': 'config-yaml', 'generation': 'generation'}
     _toPy = {'application': 'application', 'config': 'config', 'config-yaml': 'config_yaml', 'generation': 'generation'}
+    _wireTypes = {}
     def __init__(self, application=None, config=None, config_yaml=None, generation=None, **unknown_fields):
         '''
         application : str
@@ -6428,8 +6830,10 @@ class ConfigSet(Type):
 
 
 class ConfigSetArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
+    _wireTypes = {'args': ('ConfigSet', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ConfigSet]
@@ -6446,8 +6850,10 @@ class ConfigSetArgs(Type):
 
 
 class ConfigSettingsResult(Type):
+    __slots__ = ('error', 'settings', 'unknown_fields')
     _toSchema = {'error': 'error', 'settings': 'settings'}
     _toPy = {'error': 'error', 'settings': 'settings'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, settings=None, **unknown_fields):
         '''
         error : Error
@@ -6470,8 +6876,10 @@ class ConfigSettingsResult(Type):
 
 
 class ConfigSettingsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ConfigSettingsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConfigSettingsResult]
@@ -6488,8 +6896,10 @@ class ConfigSettingsResults(Type):
 
 
 class ConfigValue(Type):
+    __slots__ = ('source', 'value', 'unknown_fields')
     _toSchema = {'source': 'source', 'value': 'value'}
     _toPy = {'source': 'source', 'value': 'value'}
+    _wireTypes = {}
     def __init__(self, source=None, value=None, **unknown_fields):
         '''
         source : str
@@ -6509,8 +6919,10 @@ class ConfigValue(Type):
 
 
 class Constraints(Type):
+    __slots__ = ('count', 'pool', 'size', 'unknown_fields')
     _toSchema = {'count': 'Count', 'pool': 'Pool', 'size': 'Size'}
     _toPy = {'Count': 'count', 'Pool': 'pool', 'Size': 'size'}
+    _wireTypes = {}
     def __init__(self, count=None, pool=None, size=None, **unknown_fields):
         '''
         count : int
@@ -6539,8 +6951,10 @@ class Constraints(Type):
 
 
 class ConstraintsResult(Type):
+    __slots__ = ('constraints', 'error', 'unknown_fields')
     _toSchema = {'constraints': 'constraints', 'error': 'error'}
     _toPy = {'constraints': 'constraints', 'error': 'error'}
+    _wireTypes = {'constraints': ('Value', None), 'error': ('Error', None)}
     def __init__(self, constraints=None, error=None, **unknown_fields):
         '''
         constraints : Value
@@ -6563,8 +6977,10 @@ class ConstraintsResult(Type):
 
 
 class ConstraintsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ConstraintsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConstraintsResult]
@@ -6581,8 +6997,10 @@ class ConstraintsResults(Type):
 
 
 class ConsumeApplicationArg(Type):
+    __slots__ = ('applicationofferdetails', 'application_alias', 'application_description', 'bindings', 'endpoints', 'external_controller', 'macaroon', 'offer_name', 'offer_url', 'offer_uuid', 'source_model_tag', 'spaces', 'users', 'unknown_fields')
     _toSchema = {'application_alias': 'application-alias', 'application_description': 'application-description', 'applicationofferdetails': 'ApplicationOfferDetails', 'bindings': 'bindings', 'endpoints': 'endpoints', 'external_controller': 'external-controller', 'macaroon': 'macaroon', 'offer_name': 'offer-name', 'offer_url': 'offer-url', 'offer_uuid': 'offer-uuid', 'source_model_tag': 'source-model-tag', 'spaces': 'spaces', 'users': 'users'}
     _toPy = {'ApplicationOfferDetails': 'applicationofferdetails', 'application-alias': 'application_alias', 'application-description': 'application_description', 'bindings': 'bindings', 'endpoints': 'endpoints', 'external-controller': 'external_controller', 'macaroon': 'macaroon', 'offer-name': 'offer_name', 'offer-url': 'offer_url', 'offer-uuid': 'offer_uuid', 'source-model-tag': 'source_model_tag', 'spaces': 'spaces', 'users': 'users'}
+    _wireTypes = {'applicationofferdetails': ('ApplicationOfferDetails', None), 'endpoints': ('RemoteEndpoint', 'list'), 'external_controller': ('ExternalControllerInfo', None), 'macaroon': ('Macaroon', None), 'spaces': ('RemoteSpace', 'list'), 'users': ('OfferUserDetails', 'list')}
     def __init__(self, applicationofferdetails=None, application_alias=None, application_description=None, bindings=None, endpoints=None, external_controller=None, macaroon=None, offer_name=None, offer_url=None, offer_uuid=None, source_model_tag=None, spaces=None, users=None, **unknown_fields):
         '''
         applicationofferdetails : ApplicationOfferDetails
@@ -6671,8 +7089,10 @@ class ConsumeApplicationArg(Type):
 
 
 class ConsumeApplicationArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('ConsumeApplicationArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ConsumeApplicationArg]
@@ -6689,8 +7109,10 @@ class ConsumeApplicationArgs(Type):
 
 
 class ConsumeOfferDetails(Type):
+    __slots__ = ('external_controller', 'macaroon', 'offer', 'unknown_fields')
     _toSchema = {'external_controller': 'external-controller', 'macaroon': 'macaroon', 'offer': 'offer'}
     _toPy = {'external-controller': 'external_controller', 'macaroon': 'macaroon', 'offer': 'offer'}
+    _wireTypes = {'external_controller': ('ExternalControllerInfo', None), 'macaroon': ('Macaroon', None), 'offer': ('ApplicationOfferDetails', None)}
     def __init__(self, external_controller=None, macaroon=None, offer=None, **unknown_fields):
         '''
         external_controller : ExternalControllerInfo
@@ -6719,8 +7141,10 @@ class ConsumeOfferDetails(Type):
 
 
 class ConsumeOfferDetailsArg(Type):
+    __slots__ = ('offer_urls', 'user_tag', 'unknown_fields')
     _toSchema = {'offer_urls': 'offer-urls', 'user_tag': 'user-tag'}
     _toPy = {'offer-urls': 'offer_urls', 'user-tag': 'user_tag'}
+    _wireTypes = {'offer_urls': ('OfferURLs', None)}
     def __init__(self, offer_urls=None, user_tag=None, **unknown_fields):
         '''
         offer_urls : OfferURLs
@@ -6743,8 +7167,10 @@ class ConsumeOfferDetailsArg(Type):
 
 
 class ConsumeOfferDetailsResult(Type):
+    __slots__ = ('consumeofferdetails', 'error', 'external_controller', 'macaroon', 'offer', 'unknown_fields')
     _toSchema = {'consumeofferdetails': 'ConsumeOfferDetails', 'error': 'error', 'external_controller': 'external-controller', 'macaroon': 'macaroon', 'offer': 'offer'}
     _toPy = {'ConsumeOfferDetails': 'consumeofferdetails', 'error': 'error', 'external-controller': 'external_controller', 'macaroon': 'macaroon', 'offer': 'offer'}
+    _wireTypes = {'consumeofferdetails': ('ConsumeOfferDetails', None), 'error': ('Error', None), 'external_controller': ('ExternalControllerInfo', None), 'macaroon': ('Macaroon', None), 'offer': ('ApplicationOfferDetails', None)}
     def __init__(self, consumeofferdetails=None, error=None, external_controller=None, macaroon=None, offer=None, **unknown_fields):
         '''
         consumeofferdetails : ConsumeOfferDetails
@@ -6785,8 +7211,10 @@ class ConsumeOfferDetailsResult(Type):
 
 
 class ConsumeOfferDetailsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ConsumeOfferDetailsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ConsumeOfferDetailsResult]
@@ -6803,8 +7231,10 @@ class ConsumeOfferDetailsResults(Type):
 
 
 class ContainerConfig(Type):
+    __slots__ = ('updatebehavior', 'apt_mirror', 'apt_proxy', 'authorized_keys', 'cloudinit_userdata', 'container_inherit_properties', 'juju_proxy', 'legacy_proxy', 'provider_type', 'snap_proxy', 'snap_store_assertions', 'snap_store_proxy_id', 'snap_store_proxy_url', 'ssl_hostname_verification', 'unknown_fields')
     _toSchema = {'apt_mirror': 'apt-mirror', 'apt_proxy': 'apt-proxy', 'authorized_keys': 'authorized-keys', 'cloudinit_userdata': 'cloudinit-userdata', 'container_inherit_properties': 'container-inherit-properties', 'juju_proxy': 'juju-proxy', 'legacy_proxy': 'legacy-proxy', 'provider_type': 'provider-type', 'snap_proxy': 'snap-proxy', 'snap_store_assertions': 'snap-store-assertions', 'snap_store_proxy_id': 'snap-store-proxy-id', 'snap_store_proxy_url': 'snap-store-proxy-url', 'ssl_hostname_verification': 'ssl-hostname-verification', 'updatebehavior': 'UpdateBehavior'}
     _toPy = {'UpdateBehavior': 'updatebehavior', 'apt-mirror': 'apt_mirror', 'apt-proxy': 'apt_proxy', 'authorized-keys': 'authorized_keys', 'cloudinit-userdata': 'cloudinit_userdata', 'container-inherit-properties': 'container_inherit_properties', 'juju-proxy': 'juju_proxy', 'legacy-proxy': 'legacy_proxy', 'provider-type': 'provider_type', 'snap-proxy': 'snap_proxy', 'snap-store-assertions': 'snap_store_assertions', 'snap-store-proxy-id': 'snap_store_proxy_id', 'snap-store-proxy-url': 'snap_store_proxy_url', 'ssl-hostname-verification': 'ssl_hostname_verification'}
+    _wireTypes = {'apt_proxy': ('Settings', None), 'juju_proxy': ('Settings', None), 'legacy_proxy': ('Settings', None), 'snap_proxy': ('Settings', None), 'updatebehavior': ('UpdateBehavior', None)}
     def __init__(self, updatebehavior=None, apt_mirror=None, apt_proxy=None, authorized_keys=None, cloudinit_userdata=None, container_inherit_properties=None, juju_proxy=None, legacy_proxy=None, provider_type=None, snap_proxy=None, snap_store_assertions=None, snap_store_proxy_id=None, snap_store_proxy_url=None, ssl_hostname_verification=None, **unknown_fields):
         '''
         updatebehavior : UpdateBehavior
@@ -6899,8 +7329,10 @@ class ContainerConfig(Type):
 
 
 class ContainerLXDProfile(Type):
+    __slots__ = ('name', 'profile', 'unknown_fields')
     _toSchema = {'name': 'name', 'profile': 'profile'}
     _toPy = {'name': 'name', 'profile': 'profile'}
+    _wireTypes = {'profile': ('CharmLXDProfile', None)}
     def __init__(self, name=None, profile=None, **unknown_fields):
         '''
         name : str
@@ -6923,8 +7355,10 @@ class ContainerLXDProfile(Type):
 
 
 class ContainerManagerConfig(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
+    _wireTypes = {}
     def __init__(self, config=None, **unknown_fields):
         '''
         config : typing.Mapping[str, str]
@@ -6941,8 +7375,10 @@ class ContainerManagerConfig(Type):
 
 
 class ContainerManagerConfigParams(Type):
+    __slots__ = ('type_', 'unknown_fields')
     _toSchema = {'type_': 'type'}
     _toPy = {'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, type_=None, **unknown_fields):
         '''
         type_ : str
@@ -6959,8 +7395,10 @@ class ContainerManagerConfigParams(Type):
 
 
 class ContainerProfileResult(Type):
+    __slots__ = ('error', 'lxd_profiles', 'unknown_fields')
     _toSchema = {'error': 'error', 'lxd_profiles': 'lxd-profiles'}
     _toPy = {'error': 'error', 'lxd-profiles': 'lxd_profiles'}
+    _wireTypes = {'error': ('Error', None), 'lxd_profiles': ('ContainerLXDProfile', 'list')}
     def __init__(self, error=None, lxd_profiles=None, **unknown_fields):
         '''
         error : Error
@@ -6983,8 +7421,10 @@ class ContainerProfileResult(Type):
 
 
 class ContainerProfileResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ContainerProfileResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ContainerProfileResult]
@@ -7001,8 +7441,10 @@ class ContainerProfileResults(Type):
 
 
 class ContainerTypeResult(Type):
+    __slots__ = ('container_type', 'error', 'unknown_fields')
     _toSchema = {'container_type': 'container-type', 'error': 'error'}
     _toPy = {'container-type': 'container_type', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, container_type=None, error=None, **unknown_fields):
         '''
         container_type : str
@@ -7025,8 +7467,10 @@ class ContainerTypeResult(Type):
 
 
 class ControllerAPIInfoResult(Type):
+    __slots__ = ('addresses', 'cacert', 'error', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'cacert': 'cacert', 'error': 'error'}
     _toPy = {'addresses': 'addresses', 'cacert': 'cacert', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, addresses=None, cacert=None, error=None, **unknown_fields):
         '''
         addresses : typing.Sequence[str]
@@ -7055,8 +7499,10 @@ class ControllerAPIInfoResult(Type):
 
 
 class ControllerAPIInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ControllerAPIInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ControllerAPIInfoResult]
@@ -7073,8 +7519,10 @@ class ControllerAPIInfoResults(Type):
 
 
 class ControllerConfigResult(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
+    _wireTypes = {}
     def __init__(self, config=None, **unknown_fields):
         '''
         config : typing.Mapping[str, typing.Any]
@@ -7091,8 +7539,10 @@ class ControllerConfigResult(Type):
 
 
 class ControllerConfigSet(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
+    _wireTypes = {}
     def __init__(self, config=None, **unknown_fields):
         '''
         config : typing.Mapping[str, typing.Any]
@@ -7109,8 +7559,10 @@ class ControllerConfigSet(Type):
 
 
 class ControllerCredentialInfo(Type):
+    __slots__ = ('content', 'models', 'unknown_fields')
     _toSchema = {'content': 'content', 'models': 'models'}
     _toPy = {'content': 'content', 'models': 'models'}
+    _wireTypes = {'content': ('CredentialContent', None), 'models': ('ModelAccess', 'list')}
     def __init__(self, content=None, models=None, **unknown_fields):
         '''
         content : CredentialContent
@@ -7133,8 +7585,10 @@ class ControllerCredentialInfo(Type):
 
 
 class ControllerVersionResults(Type):
+    __slots__ = ('git_commit', 'version', 'unknown_fields')
     _toSchema = {'git_commit': 'git-commit', 'version': 'version'}
     _toPy = {'git-commit': 'git_commit', 'version': 'version'}
+    _wireTypes = {}
     def __init__(self, git_commit=None, version=None, **unknown_fields):
         '''
         git_commit : str
@@ -7157,8 +7611,10 @@ class ControllerVersionResults(Type):
 
 
 class ControllersChangeResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ControllersChanges', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -7181,8 +7637,10 @@ class ControllersChangeResult(Type):
 
 
 class ControllersChangeResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ControllersChangeResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ControllersChangeResult]
@@ -7199,8 +7657,10 @@ class ControllersChangeResults(Type):
 
 
 class ControllersChanges(Type):
+    __slots__ = ('added', 'converted', 'maintained', 'removed', 'unknown_fields')
     _toSchema = {'added': 'added', 'converted': 'converted', 'maintained': 'maintained', 'removed': 'removed'}
     _toPy = {'added': 'added', 'converted': 'converted', 'maintained': 'maintained', 'removed': 'removed'}
+    _wireTypes = {}
     def __init__(self, added=None, converted=None, maintained=None, removed=None, **unknown_fields):
         '''
         added : typing.Sequence[str]
@@ -7235,8 +7695,10 @@ class ControllersChanges(Type):
 
 
 class ControllersSpec(Type):
+    __slots__ = ('constraints', 'num_controllers', 'placement', 'unknown_fields')
     _toSchema = {'constraints': 'constraints', 'num_controllers': 'num-controllers', 'placement': 'placement'}
     _toPy = {'constraints': 'constraints', 'num-controllers': 'num_controllers', 'placement': 'placement'}
+    _wireTypes = {'constraints': ('Value', None)}
     def __init__(self, constraints=None, num_controllers=None, placement=None, **unknown_fields):
         '''
         constraints : Value
@@ -7265,8 +7727,10 @@ class ControllersSpec(Type):
 
 
 class ControllersSpecs(Type):
+    __slots__ = ('specs', 'unknown_fields')
     _toSchema = {'specs': 'specs'}
     _toPy = {'specs': 'specs'}
+    _wireTypes = {'specs': ('ControllersSpec', 'list')}
     def __init__(self, specs=None, **unknown_fields):
         '''
         specs : typing.Sequence[~ControllersSpec]
@@ -7283,8 +7747,10 @@ class ControllersSpecs(Type):
 
 
 class CreateSecretArg(Type):
+    __slots__ = ('upsertsecretarg', 'content', 'description', 'expire_time', 'label', 'owner_tag', 'params', 'rotate_policy', 'uri', 'unknown_fields')
     _toSchema = {'content': 'content', 'description': 'description', 'expire_time': 'expire-time', 'label': 'label', 'owner_tag': 'owner-tag', 'params': 'params', 'rotate_policy': 'rotate-policy', 'upsertsecretarg': 'UpsertSecretArg', 'uri': 'uri'}
     _toPy = {'UpsertSecretArg': 'upsertsecretarg', 'content': 'content', 'description': 'description', 'expire-time': 'expire_time', 'label': 'label', 'owner-tag': 'owner_tag', 'params': 'params', 'rotate-policy': 'rotate_policy', 'uri': 'uri'}
+    _wireTypes = {'content': ('SecretContentParams', None), 'upsertsecretarg': ('UpsertSecretArg', None)}
     def __init__(self, upsertsecretarg=None, content=None, description=None, expire_time=None, label=None, owner_tag=None, params=None, rotate_policy=None, uri=None, **unknown_fields):
         '''
         upsertsecretarg : UpsertSecretArg
@@ -7349,8 +7815,10 @@ class CreateSecretArg(Type):
 
 
 class CreateSecretArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('CreateSecretArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~CreateSecretArg]
@@ -7367,8 +7835,10 @@ class CreateSecretArgs(Type):
 
 
 class CreateSecretURIsArg(Type):
+    __slots__ = ('count', 'unknown_fields')
     _toSchema = {'count': 'count'}
     _toPy = {'count': 'count'}
+    _wireTypes = {}
     def __init__(self, count=None, **unknown_fields):
         '''
         count : int
@@ -7385,8 +7855,10 @@ class CreateSecretURIsArg(Type):
 
 
 class CreateSpaceParams(Type):
+    __slots__ = ('cidrs', 'provider_id', 'public', 'space_tag', 'unknown_fields')
     _toSchema = {'cidrs': 'cidrs', 'provider_id': 'provider-id', 'public': 'public', 'space_tag': 'space-tag'}
     _toPy = {'cidrs': 'cidrs', 'provider-id': 'provider_id', 'public': 'public', 'space-tag': 'space_tag'}
+    _wireTypes = {}
     def __init__(self, cidrs=None, provider_id=None, public=None, space_tag=None, **unknown_fields):
         '''
         cidrs : typing.Sequence[str]
@@ -7421,8 +7893,10 @@ class CreateSpaceParams(Type):
 
 
 class CreateSpacesParams(Type):
+    __slots__ = ('spaces', 'unknown_fields')
     _toSchema = {'spaces': 'spaces'}
     _toPy = {'spaces': 'spaces'}
+    _wireTypes = {'spaces': ('CreateSpaceParams', 'list')}
     def __init__(self, spaces=None, **unknown_fields):
         '''
         spaces : typing.Sequence[~CreateSpaceParams]
@@ -7439,8 +7913,10 @@ class CreateSpacesParams(Type):
 
 
 class CredentialContent(Type):
+    __slots__ = ('attrs', 'auth_type', 'cloud', 'name', 'valid', 'unknown_fields')
     _toSchema = {'attrs': 'attrs', 'auth_type': 'auth-type', 'cloud': 'cloud', 'name': 'name', 'valid': 'valid'}
     _toPy = {'attrs': 'attrs', 'auth-type': 'auth_type', 'cloud': 'cloud', 'name': 'name', 'valid': 'valid'}
+    _wireTypes = {}
     def __init__(self, attrs=None, auth_type=None, cloud=None, name=None, valid=None, **unknown_fields):
         '''
         attrs : typing.Mapping[str, str]
@@ -7481,8 +7957,10 @@ class CredentialContent(Type):
 
 
 class CredentialContentResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ControllerCredentialInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -7505,8 +7983,10 @@ class CredentialContentResult(Type):
 
 
 class CredentialContentResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('CredentialContentResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~CredentialContentResult]
@@ -7523,8 +8003,10 @@ class CredentialContentResults(Type):
 
 
 class DashboardConnectionInfo(Type):
+    __slots__ = ('error', 'proxy_connection', 'ssh_connection', 'unknown_fields')
     _toSchema = {'error': 'error', 'proxy_connection': 'proxy-connection', 'ssh_connection': 'ssh-connection'}
     _toPy = {'error': 'error', 'proxy-connection': 'proxy_connection', 'ssh-connection': 'ssh_connection'}
+    _wireTypes = {'error': ('Error', None), 'proxy_connection': ('Proxy', None), 'ssh_connection': ('DashboardConnectionSSHTunnel', None)}
     def __init__(self, error=None, proxy_connection=None, ssh_connection=None, **unknown_fields):
         '''
         error : Error
@@ -7553,8 +8035,10 @@ class DashboardConnectionInfo(Type):
 
 
 class DashboardConnectionSSHTunnel(Type):
+    __slots__ = ('entity', 'host', 'model', 'port', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'host': 'host', 'model': 'model', 'port': 'port'}
     _toPy = {'entity': 'entity', 'host': 'host', 'model': 'model', 'port': 'port'}
+    _wireTypes = {}
     def __init__(self, entity=None, host=None, model=None, port=None, **unknown_fields):
         '''
         entity : str
@@ -7589,8 +8073,10 @@ class DashboardConnectionSSHTunnel(Type):
 
 
 class DeleteSecretArg(Type):
+    __slots__ = ('label', 'revisions', 'uri', 'unknown_fields')
     _toSchema = {'label': 'label', 'revisions': 'revisions', 'uri': 'uri'}
     _toPy = {'label': 'label', 'revisions': 'revisions', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, label=None, revisions=None, uri=None, **unknown_fields):
         '''
         label : str
@@ -7619,8 +8105,10 @@ class DeleteSecretArg(Type):
 
 
 class DeleteSecretArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('DeleteSecretArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~DeleteSecretArg]
@@ -7637,8 +8125,10 @@ class DeleteSecretArgs(Type):
 
 
 class Delta(Type):
+    __slots__ = ('entity', 'removed', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'removed': 'removed'}
     _toPy = {'entity': 'entity', 'removed': 'removed'}
+    _wireTypes = {}
     def __init__(self, entity=None, removed=None, **unknown_fields):
         '''
         entity : Any
@@ -7658,8 +8148,10 @@ class Delta(Type):
 
 
 class DeployFromRepositoryArg(Type):
+    __slots__ = ('applicationname', 'attachstorage', 'charmname', 'configyaml', 'cons', 'devices', 'dryrun', 'placement', 'storage', 'trust', 'base', 'channel', 'endpoint_bindings', 'force', 'num_units', 'resources', 'revision', 'unknown_fields')
     _toSchema = {'applicationname': 'ApplicationName', 'attachstorage': 'AttachStorage', 'base': 'base', 'channel': 'channel', 'charmname': 'CharmName', 'configyaml': 'ConfigYAML', 'cons': 'Cons', 'devices': 'Devices', 'dryrun': 'DryRun', 'endpoint_bindings': 'endpoint-bindings', 'force': 'force', 'num_units': 'num-units', 'placement': 'Placement', 'resources': 'resources', 'revision': 'revision', 'storage': 'Storage', 'trust': 'Trust'}
     _toPy = {'ApplicationName': 'applicationname', 'AttachStorage': 'attachstorage', 'CharmName': 'charmname', 'ConfigYAML': 'configyaml', 'Cons': 'cons', 'Devices': 'devices', 'DryRun': 'dryrun', 'Placement': 'placement', 'Storage': 'storage', 'Trust': 'trust', 'base': 'base', 'channel': 'channel', 'endpoint-bindings': 'endpoint_bindings', 'force': 'force', 'num-units': 'num_units', 'resources': 'resources', 'revision': 'revision'}
+    _wireTypes = {'base': ('Base', None), 'cons': ('Value', None), 'devices': ('Constraints', 'dict'), 'placement': ('Placement', 'list'), 'storage': ('Constraints', 'dict')}
     def __init__(self, applicationname=None, attachstorage=None, charmname=None, configyaml=None, cons=None, devices=None, dryrun=None, placement=None, storage=None, trust=None, base=None, channel=None, endpoint_bindings=None, force=None, num_units=None, resources=None, revision=None, **unknown_fields):
         '''
         applicationname : str
@@ -7772,8 +8264,10 @@ class DeployFromRepositoryArg(Type):
 
 
 class DeployFromRepositoryArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
+    _wireTypes = {'args': ('DeployFromRepositoryArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~DeployFromRepositoryArg]
@@ -7790,8 +8284,10 @@ class DeployFromRepositoryArgs(Type):
 
 
 class DeployFromRepositoryInfo(Type):
+    __slots__ = ('architecture', 'base', 'channel', 'effective_channel', 'name', 'revision', 'unknown_fields')
     _toSchema = {'architecture': 'architecture', 'base': 'base', 'channel': 'channel', 'effective_channel': 'effective-channel', 'name': 'name', 'revision': 'revision'}
     _toPy = {'architecture': 'architecture', 'base': 'base', 'channel': 'channel', 'effective-channel': 'effective_channel', 'name': 'name', 'revision': 'revision'}
+    _wireTypes = {'base': ('Base', None)}
     def __init__(self, architecture=None, base=None, channel=None, effective_channel=None, name=None, revision=None, **unknown_fields):
         '''
         architecture : str
@@ -7838,8 +8334,10 @@ class DeployFromRepositoryInfo(Type):
 
 
 class DeployFromRepositoryResult(Type):
+    __slots__ = ('errors', 'info', 'pendingresourceuploads', 'unknown_fields')
     _toSchema = {'errors': 'Errors', 'info': 'Info', 'pendingresourceuploads': 'PendingResourceUploads'}
     _toPy = {'Errors': 'errors', 'Info': 'info', 'PendingResourceUploads': 'pendingresourceuploads'}
+    _wireTypes = {'errors': ('Error', 'list'), 'info': ('DeployFromRepositoryInfo', None), 'pendingresourceuploads': ('PendingResourceUpload', 'list')}
     def __init__(self, errors=None, info=None, pendingresourceuploads=None, **unknown_fields):
         '''
         errors : typing.Sequence[~Error]
@@ -7868,8 +8366,10 @@ class DeployFromRepositoryResult(Type):
 
 
 class DeployFromRepositoryResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'Results'}
     _toPy = {'Results': 'results'}
+    _wireTypes = {'results': ('DeployFromRepositoryResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DeployFromRepositoryResult]
@@ -7886,8 +8386,10 @@ class DeployFromRepositoryResults(Type):
 
 
 class DeployerConnectionValues(Type):
+    __slots__ = ('api_addresses', 'unknown_fields')
     _toSchema = {'api_addresses': 'api-addresses'}
     _toPy = {'api-addresses': 'api_addresses'}
+    _wireTypes = {}
     def __init__(self, api_addresses=None, **unknown_fields):
         '''
         api_addresses : typing.Sequence[str]
@@ -7904,8 +8406,10 @@ class DeployerConnectionValues(Type):
 
 
 class DestroyApplicationInfo(Type):
+    __slots__ = ('destroyed_storage', 'destroyed_units', 'detached_storage', 'unknown_fields')
     _toSchema = {'destroyed_storage': 'destroyed-storage', 'destroyed_units': 'destroyed-units', 'detached_storage': 'detached-storage'}
     _toPy = {'destroyed-storage': 'destroyed_storage', 'destroyed-units': 'destroyed_units', 'detached-storage': 'detached_storage'}
+    _wireTypes = {'destroyed_storage': ('Entity', 'list'), 'destroyed_units': ('Entity', 'list'), 'detached_storage': ('Entity', 'list')}
     def __init__(self, destroyed_storage=None, destroyed_units=None, detached_storage=None, **unknown_fields):
         '''
         destroyed_storage : typing.Sequence[~Entity]
@@ -7934,8 +8438,10 @@ class DestroyApplicationInfo(Type):
 
 
 class DestroyApplicationOffers(Type):
+    __slots__ = ('force', 'offer_urls', 'unknown_fields')
     _toSchema = {'force': 'force', 'offer_urls': 'offer-urls'}
     _toPy = {'force': 'force', 'offer-urls': 'offer_urls'}
+    _wireTypes = {}
     def __init__(self, force=None, offer_urls=None, **unknown_fields):
         '''
         force : bool
@@ -7958,8 +8464,10 @@ class DestroyApplicationOffers(Type):
 
 
 class DestroyApplicationParams(Type):
+    __slots__ = ('application_tag', 'destroy_storage', 'dry_run', 'force', 'max_wait', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'destroy_storage': 'destroy-storage', 'dry_run': 'dry-run', 'force': 'force', 'max_wait': 'max-wait'}
     _toPy = {'application-tag': 'application_tag', 'destroy-storage': 'destroy_storage', 'dry-run': 'dry_run', 'force': 'force', 'max-wait': 'max_wait'}
+    _wireTypes = {}
     def __init__(self, application_tag=None, destroy_storage=None, dry_run=None, force=None, max_wait=None, **unknown_fields):
         '''
         application_tag : str
@@ -8000,8 +8508,10 @@ class DestroyApplicationParams(Type):
 
 
 class DestroyApplicationResult(Type):
+    __slots__ = ('error', 'info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
+    _wireTypes = {'error': ('Error', None), 'info': ('DestroyApplicationInfo', None)}
     def __init__(self, error=None, info=None, **unknown_fields):
         '''
         error : Error
@@ -8024,8 +8534,10 @@ class DestroyApplicationResult(Type):
 
 
 class DestroyApplicationResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('DestroyApplicationResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DestroyApplicationResult]
@@ -8042,8 +8554,10 @@ class DestroyApplicationResults(Type):
 
 
 class DestroyApplicationsParams(Type):
+    __slots__ = ('applications', 'unknown_fields')
     _toSchema = {'applications': 'applications'}
     _toPy = {'applications': 'applications'}
+    _wireTypes = {'applications': ('DestroyApplicationParams', 'list')}
     def __init__(self, applications=None, **unknown_fields):
         '''
         applications : typing.Sequence[~DestroyApplicationParams]
@@ -8060,8 +8574,10 @@ class DestroyApplicationsParams(Type):
 
 
 class DestroyConsumedApplicationParams(Type):
+    __slots__ = ('application_tag', 'force', 'max_wait', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'force': 'force', 'max_wait': 'max-wait'}
     _toPy = {'application-tag': 'application_tag', 'force': 'force', 'max-wait': 'max_wait'}
+    _wireTypes = {}
     def __init__(self, application_tag=None, force=None, max_wait=None, **unknown_fields):
         '''
         application_tag : str
@@ -8090,8 +8606,10 @@ class DestroyConsumedApplicationParams(Type):
 
 
 class DestroyConsumedApplicationsParams(Type):
+    __slots__ = ('applications', 'unknown_fields')
     _toSchema = {'applications': 'applications'}
     _toPy = {'applications': 'applications'}
+    _wireTypes = {'applications': ('DestroyConsumedApplicationParams', 'list')}
     def __init__(self, applications=None, **unknown_fields):
         '''
         applications : typing.Sequence[~DestroyConsumedApplicationParams]
@@ -8108,8 +8626,10 @@ class DestroyConsumedApplicationsParams(Type):
 
 
 class DestroyControllerArgs(Type):
+    __slots__ = ('destroy_models', 'destroy_storage', 'force', 'max_wait', 'model_timeout', 'unknown_fields')
     _toSchema = {'destroy_models': 'destroy-models', 'destroy_storage': 'destroy-storage', 'force': 'force', 'max_wait': 'max-wait', 'model_timeout': 'model-timeout'}
     _toPy = {'destroy-models': 'destroy_models', 'destroy-storage': 'destroy_storage', 'force': 'force', 'max-wait': 'max_wait', 'model-timeout': 'model_timeout'}
+    _wireTypes = {}
     def __init__(self, destroy_models=None, destroy_storage=None, force=None, max_wait=None, model_timeout=None, **unknown_fields):
         '''
         destroy_models : bool
@@ -8150,8 +8670,10 @@ class DestroyControllerArgs(Type):
 
 
 class DestroyMachineInfo(Type):
+    __slots__ = ('destroyed_containers', 'destroyed_storage', 'destroyed_units', 'detached_storage', 'machine_id', 'unknown_fields')
     _toSchema = {'destroyed_containers': 'destroyed-containers', 'destroyed_storage': 'destroyed-storage', 'destroyed_units': 'destroyed-units', 'detached_storage': 'detached-storage', 'machine_id': 'machine-id'}
     _toPy = {'destroyed-containers': 'destroyed_containers', 'destroyed-storage': 'destroyed_storage', 'destroyed-units': 'destroyed_units', 'detached-storage': 'detached_storage', 'machine-id': 'machine_id'}
+    _wireTypes = {'destroyed_containers': ('DestroyMachineResult', 'list'), 'destroyed_storage': ('Entity', 'list'), 'destroyed_units': ('Entity', 'list'), 'detached_storage': ('Entity', 'list')}
     def __init__(self, destroyed_containers=None, destroyed_storage=None, destroyed_units=None, detached_storage=None, machine_id=None, **unknown_fields):
         '''
         destroyed_containers : typing.Sequence[~DestroyMachineResult]
@@ -8192,8 +8714,10 @@ class DestroyMachineInfo(Type):
 
 
 class DestroyMachineResult(Type):
+    __slots__ = ('error', 'info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
+    _wireTypes = {'error': ('Error', None), 'info': ('DestroyMachineInfo', None)}
     def __init__(self, error=None, info=None, **unknown_fields):
         '''
         error : Error
@@ -8216,8 +8740,10 @@ class DestroyMachineResult(Type):
 
 
 class DestroyMachineResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('DestroyMachineResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DestroyMachineResult]
@@ -8234,8 +8760,10 @@ class DestroyMachineResults(Type):
 
 
 class DestroyMachinesParams(Type):
+    __slots__ = ('dry_run', 'force', 'keep', 'machine_tags', 'max_wait', 'unknown_fields')
     _toSchema = {'dry_run': 'dry-run', 'force': 'force', 'keep': 'keep', 'machine_tags': 'machine-tags', 'max_wait': 'max-wait'}
     _toPy = {'dry-run': 'dry_run', 'force': 'force', 'keep': 'keep', 'machine-tags': 'machine_tags', 'max-wait': 'max_wait'}
+    _wireTypes = {}
     def __init__(self, dry_run=None, force=None, keep=None, machine_tags=None, max_wait=None, **unknown_fields):
         '''
         dry_run : bool
@@ -8276,8 +8804,10 @@ class DestroyMachinesParams(Type):
 
 
 class DestroyModelParams(Type):
+    __slots__ = ('destroy_storage', 'force', 'max_wait', 'model_tag', 'timeout', 'unknown_fields')
     _toSchema = {'destroy_storage': 'destroy-storage', 'force': 'force', 'max_wait': 'max-wait', 'model_tag': 'model-tag', 'timeout': 'timeout'}
     _toPy = {'destroy-storage': 'destroy_storage', 'force': 'force', 'max-wait': 'max_wait', 'model-tag': 'model_tag', 'timeout': 'timeout'}
+    _wireTypes = {}
     def __init__(self, destroy_storage=None, force=None, max_wait=None, model_tag=None, timeout=None, **unknown_fields):
         '''
         destroy_storage : bool
@@ -8318,8 +8848,10 @@ class DestroyModelParams(Type):
 
 
 class DestroyModelsParams(Type):
+    __slots__ = ('models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
+    _wireTypes = {'models': ('DestroyModelParams', 'list')}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~DestroyModelParams]
@@ -8336,8 +8868,10 @@ class DestroyModelsParams(Type):
 
 
 class DestroyRelation(Type):
+    __slots__ = ('endpoints', 'force', 'max_wait', 'relation_id', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints', 'force': 'force', 'max_wait': 'max-wait', 'relation_id': 'relation-id'}
     _toPy = {'endpoints': 'endpoints', 'force': 'force', 'max-wait': 'max_wait', 'relation-id': 'relation_id'}
+    _wireTypes = {}
     def __init__(self, endpoints=None, force=None, max_wait=None, relation_id=None, **unknown_fields):
         '''
         endpoints : typing.Sequence[str]
@@ -8372,8 +8906,10 @@ class DestroyRelation(Type):
 
 
 class DestroyUnitInfo(Type):
+    __slots__ = ('destroyed_storage', 'detached_storage', 'unknown_fields')
     _toSchema = {'destroyed_storage': 'destroyed-storage', 'detached_storage': 'detached-storage'}
     _toPy = {'destroyed-storage': 'destroyed_storage', 'detached-storage': 'detached_storage'}
+    _wireTypes = {'destroyed_storage': ('Entity', 'list'), 'detached_storage': ('Entity', 'list')}
     def __init__(self, destroyed_storage=None, detached_storage=None, **unknown_fields):
         '''
         destroyed_storage : typing.Sequence[~Entity]
@@ -8396,8 +8932,10 @@ class DestroyUnitInfo(Type):
 
 
 class DestroyUnitParams(Type):
+    __slots__ = ('destroy_storage', 'dry_run', 'force', 'max_wait', 'unit_tag', 'unknown_fields')
     _toSchema = {'destroy_storage': 'destroy-storage', 'dry_run': 'dry-run', 'force': 'force', 'max_wait': 'max-wait', 'unit_tag': 'unit-tag'}
     _toPy = {'destroy-storage': 'destroy_storage', 'dry-run': 'dry_run', 'force': 'force', 'max-wait': 'max_wait', 'unit-tag': 'unit_tag'}
+    _wireTypes = {}
     def __init__(self, destroy_storage=None, dry_run=None, force=None, max_wait=None, unit_tag=None, **unknown_fields):
         '''
         destroy_storage : bool
@@ -8438,8 +8976,10 @@ class DestroyUnitParams(Type):
 
 
 class DestroyUnitResult(Type):
+    __slots__ = ('error', 'info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
+    _wireTypes = {'error': ('Error', None), 'info': ('DestroyUnitInfo', None)}
     def __init__(self, error=None, info=None, **unknown_fields):
         '''
         error : Error
@@ -8462,8 +9002,10 @@ class DestroyUnitResult(Type):
 
 
 class DestroyUnitResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('DestroyUnitResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DestroyUnitResult]
@@ -8480,8 +9022,10 @@ class DestroyUnitResults(Type):
 
 
 class DestroyUnitsParams(Type):
+    __slots__ = ('units', 'unknown_fields')
     _toSchema = {'units': 'units'}
     _toPy = {'units': 'units'}
+    _wireTypes = {'units': ('DestroyUnitParams', 'list')}
     def __init__(self, units=None, **unknown_fields):
         '''
         units : typing.Sequence[~DestroyUnitParams]
@@ -8498,8 +9042,10 @@ class DestroyUnitsParams(Type):
 
 
 class DetailedStatus(Type):
+    __slots__ = ('data', 'err', 'info', 'kind', 'life', 'since', 'status', 'version', 'unknown_fields')
     _toSchema = {'data': 'data', 'err': 'err', 'info': 'info', 'kind': 'kind', 'life': 'life', 'since': 'since', 'status': 'status', 'version': 'version'}
     _toPy = {'data': 'data', 'err': 'err', 'info': 'info', 'kind': 'kind', 'life': 'life', 'since': 'since', 'status': 'status', 'version': 'version'}
+    _wireTypes = {'err': ('Error', None)}
     def __init__(self, data=None, err=None, info=None, kind=None, life=None, since=None, status=None, version=None, **unknown_fields):
         '''
         data : typing.Mapping[str, typing.Any]
@@ -8558,8 +9104,10 @@ class DetailedStatus(Type):
 
 
 class DeviceBridgeInfo(Type):
+    __slots__ = ('bridge_name', 'host_device_name', 'mac_address', 'unknown_fields')
     _toSchema = {'bridge_name': 'bridge-name', 'host_device_name': 'host-device-name', 'mac_address': 'mac-address'}
     _toPy = {'bridge-name': 'bridge_name', 'host-device-name': 'host_device_name', 'mac-address': 'mac_address'}
+    _wireTypes = {}
     def __init__(self, bridge_name=None, host_device_name=None, mac_address=None, **unknown_fields):
         '''
         bridge_name : str
@@ -8588,8 +9136,10 @@ class DeviceBridgeInfo(Type):
 
 
 class DistributionGroupResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -8612,8 +9162,10 @@ class DistributionGroupResult(Type):
 
 
 class DistributionGroupResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('DistributionGroupResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DistributionGroupResult]
@@ -8630,8 +9182,10 @@ class DistributionGroupResults(Type):
 
 
 class DockerImageInfo(Type):
+    __slots__ = ('auth', 'email', 'identitytoken', 'image_name', 'password', 'registrytoken', 'repository', 'serveraddress', 'username', 'unknown_fields')
     _toSchema = {'auth': 'auth', 'email': 'email', 'identitytoken': 'identitytoken', 'image_name': 'image-name', 'password': 'password', 'registrytoken': 'registrytoken', 'repository': 'repository', 'serveraddress': 'serveraddress', 'username': 'username'}
     _toPy = {'auth': 'auth', 'email': 'email', 'identitytoken': 'identitytoken', 'image-name': 'image_name', 'password': 'password', 'registrytoken': 'registrytoken', 'repository': 'repository', 'serveraddress': 'serveraddress', 'username': 'username'}
+    _wireTypes = {}
     def __init__(self, auth=None, email=None, identitytoken=None, image_name=None, password=None, registrytoken=None, repository=None, serveraddress=None, username=None, **unknown_fields):
         '''
         auth : str
@@ -8696,8 +9250,10 @@ class DockerImageInfo(Type):
 
 
 class DownloadInfoResult(Type):
+    __slots__ = ('charm_origin', 'url', 'unknown_fields')
     _toSchema = {'charm_origin': 'charm-origin', 'url': 'url'}
     _toPy = {'charm-origin': 'charm_origin', 'url': 'url'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None)}
     def __init__(self, charm_origin=None, url=None, **unknown_fields):
         '''
         charm_origin : CharmOrigin
@@ -8720,8 +9276,10 @@ class DownloadInfoResult(Type):
 
 
 class DownloadInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('DownloadInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~DownloadInfoResult]
@@ -8738,8 +9296,10 @@ class DownloadInfoResults(Type):
 
 
 class DumpModelRequest(Type):
+    __slots__ = ('entities', 'simplified', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'simplified': 'simplified'}
     _toPy = {'entities': 'entities', 'simplified': 'simplified'}
+    _wireTypes = {'entities': ('Entity', 'list')}
     def __init__(self, entities=None, simplified=None, **unknown_fields):
         '''
         entities : typing.Sequence[~Entity]
@@ -8762,8 +9322,10 @@ class DumpModelRequest(Type):
 
 
 class Endpoint(Type):
+    __slots__ = ('application_name', 'relation', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'relation': 'relation'}
     _toPy = {'application-name': 'application_name', 'relation': 'relation'}
+    _wireTypes = {'relation': ('CharmRelation', None)}
     def __init__(self, application_name=None, relation=None, **unknown_fields):
         '''
         application_name : str
@@ -8786,8 +9348,10 @@ class Endpoint(Type):
 
 
 class EndpointFilterAttributes(Type):
+    __slots__ = ('interface', 'name', 'role', 'unknown_fields')
     _toSchema = {'interface': 'interface', 'name': 'name', 'role': 'role'}
     _toPy = {'interface': 'interface', 'name': 'name', 'role': 'role'}
+    _wireTypes = {}
     def __init__(self, interface=None, name=None, role=None, **unknown_fields):
         '''
         interface : str
@@ -8816,8 +9380,10 @@ class EndpointFilterAttributes(Type):
 
 
 class EndpointRelationData(Type):
+    __slots__ = ('applicationdata', 'cross_model', 'endpoint', 'related_endpoint', 'relation_id', 'unit_relation_data', 'unknown_fields')
     _toSchema = {'applicationdata': 'ApplicationData', 'cross_model': 'cross-model', 'endpoint': 'endpoint', 'related_endpoint': 'related-endpoint', 'relation_id': 'relation-id', 'unit_relation_data': 'unit-relation-data'}
     _toPy = {'ApplicationData': 'applicationdata', 'cross-model': 'cross_model', 'endpoint': 'endpoint', 'related-endpoint': 'related_endpoint', 'relation-id': 'relation_id', 'unit-relation-data': 'unit_relation_data'}
+    _wireTypes = {'unit_relation_data': ('RelationData', 'dict')}
     def __init__(self, applicationdata=None, cross_model=None, endpoint=None, related_endpoint=None, relation_id=None, unit_relation_data=None, **unknown_fields):
         '''
         applicationdata : typing.Mapping[str, typing.Any]
@@ -8864,8 +9430,10 @@ class EndpointRelationData(Type):
 
 
 class EndpointStatus(Type):
+    __slots__ = ('application', 'name', 'role', 'subordinate', 'unknown_fields')
     _toSchema = {'application': 'application', 'name': 'name', 'role': 'role', 'subordinate': 'subordinate'}
     _toPy = {'application': 'application', 'name': 'name', 'role': 'role', 'subordinate': 'subordinate'}
+    _wireTypes = {}
     def __init__(self, application=None, name=None, role=None, subordinate=None, **unknown_fields):
         '''
         application : str
@@ -8900,8 +9468,10 @@ class EndpointStatus(Type):
 
 
 class EnqueuedActions(Type):
+    __slots__ = ('actions', 'operation', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'operation': 'operation'}
     _toPy = {'actions': 'actions', 'operation': 'operation'}
+    _wireTypes = {'actions': ('ActionResult', 'list')}
     def __init__(self, actions=None, operation=None, **unknown_fields):
         '''
         actions : typing.Sequence[~ActionResult]
@@ -8924,8 +9494,10 @@ class EnqueuedActions(Type):
 
 
 class Entities(Type):
+    __slots__ = ('entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
+    _wireTypes = {'entities': ('Entity', 'list')}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~Entity]
@@ -8942,8 +9514,10 @@ class Entities(Type):
 
 
 class EntitiesCharmURL(Type):
+    __slots__ = ('entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
+    _wireTypes = {'entities': ('EntityCharmURL', 'list')}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~EntityCharmURL]
@@ -8960,8 +9534,10 @@ class EntitiesCharmURL(Type):
 
 
 class EntitiesResult(Type):
+    __slots__ = ('entities', 'error', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'error': 'error'}
     _toPy = {'entities': 'entities', 'error': 'error'}
+    _wireTypes = {'entities': ('Entity', 'list'), 'error': ('Error', None)}
     def __init__(self, entities=None, error=None, **unknown_fields):
         '''
         entities : typing.Sequence[~Entity]
@@ -8984,8 +9560,10 @@ class EntitiesResult(Type):
 
 
 class EntitiesResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('EntitiesResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~EntitiesResult]
@@ -9002,8 +9580,10 @@ class EntitiesResults(Type):
 
 
 class EntitiesVersion(Type):
+    __slots__ = ('agent_tools', 'unknown_fields')
     _toSchema = {'agent_tools': 'agent-tools'}
     _toPy = {'agent-tools': 'agent_tools'}
+    _wireTypes = {'agent_tools': ('EntityVersion', 'list')}
     def __init__(self, agent_tools=None, **unknown_fields):
         '''
         agent_tools : typing.Sequence[~EntityVersion]
@@ -9020,8 +9600,10 @@ class EntitiesVersion(Type):
 
 
 class EntitiesWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : typing.Sequence[str]
@@ -9050,8 +9632,10 @@ class EntitiesWatchResult(Type):
 
 
 class Entity(Type):
+    __slots__ = ('tag', 'unknown_fields')
     _toSchema = {'tag': 'tag'}
     _toPy = {'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, tag=None, **unknown_fields):
         '''
         tag : str
@@ -9068,8 +9652,10 @@ class Entity(Type):
 
 
 class EntityAnnotations(Type):
+    __slots__ = ('annotations', 'entity', 'unknown_fields')
     _toSchema = {'annotations': 'annotations', 'entity': 'entity'}
     _toPy = {'annotations': 'annotations', 'entity': 'entity'}
+    _wireTypes = {}
     def __init__(self, annotations=None, entity=None, **unknown_fields):
         '''
         annotations : typing.Mapping[str, str]
@@ -9092,8 +9678,10 @@ class EntityAnnotations(Type):
 
 
 class EntityCharmURL(Type):
+    __slots__ = ('charm_url', 'tag', 'unknown_fields')
     _toSchema = {'charm_url': 'charm-url', 'tag': 'tag'}
     _toPy = {'charm-url': 'charm_url', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, charm_url=None, tag=None, **unknown_fields):
         '''
         charm_url : str
@@ -9116,8 +9704,10 @@ class EntityCharmURL(Type):
 
 
 class EntityMacaroonArg(Type):
+    __slots__ = ('macaroon', 'tag', 'unknown_fields')
     _toSchema = {'macaroon': 'macaroon', 'tag': 'tag'}
     _toPy = {'macaroon': 'macaroon', 'tag': 'tag'}
+    _wireTypes = {'macaroon': ('Macaroon', None)}
     def __init__(self, macaroon=None, tag=None, **unknown_fields):
         '''
         macaroon : Macaroon
@@ -9140,8 +9730,10 @@ class EntityMacaroonArg(Type):
 
 
 class EntityMacaroonArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
+    _wireTypes = {'args': ('EntityMacaroonArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~EntityMacaroonArg]
@@ -9158,8 +9750,10 @@ class EntityMacaroonArgs(Type):
 
 
 class EntityMetrics(Type):
+    __slots__ = ('error', 'metrics', 'unknown_fields')
     _toSchema = {'error': 'error', 'metrics': 'metrics'}
     _toPy = {'error': 'error', 'metrics': 'metrics'}
+    _wireTypes = {'error': ('Error', None), 'metrics': ('MetricResult', 'list')}
     def __init__(self, error=None, metrics=None, **unknown_fields):
         '''
         error : Error
@@ -9182,8 +9776,10 @@ class EntityMetrics(Type):
 
 
 class EntityPassword(Type):
+    __slots__ = ('password', 'tag', 'unknown_fields')
     _toSchema = {'password': 'password', 'tag': 'tag'}
     _toPy = {'password': 'password', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, password=None, tag=None, **unknown_fields):
         '''
         password : str
@@ -9206,8 +9802,10 @@ class EntityPassword(Type):
 
 
 class EntityPasswords(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('EntityPassword', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~EntityPassword]
@@ -9224,8 +9822,10 @@ class EntityPasswords(Type):
 
 
 class EntityPortRange(Type):
+    __slots__ = ('endpoint', 'from_port', 'protocol', 'tag', 'to_port', 'unknown_fields')
     _toSchema = {'endpoint': 'endpoint', 'from_port': 'from-port', 'protocol': 'protocol', 'tag': 'tag', 'to_port': 'to-port'}
     _toPy = {'endpoint': 'endpoint', 'from-port': 'from_port', 'protocol': 'protocol', 'tag': 'tag', 'to-port': 'to_port'}
+    _wireTypes = {}
     def __init__(self, endpoint=None, from_port=None, protocol=None, tag=None, to_port=None, **unknown_fields):
         '''
         endpoint : str
@@ -9266,8 +9866,10 @@ class EntityPortRange(Type):
 
 
 class EntityStatus(Type):
+    __slots__ = ('data', 'info', 'since', 'status', 'unknown_fields')
     _toSchema = {'data': 'data', 'info': 'info', 'since': 'since', 'status': 'status'}
     _toPy = {'data': 'data', 'info': 'info', 'since': 'since', 'status': 'status'}
+    _wireTypes = {}
     def __init__(self, data=None, info=None, since=None, status=None, **unknown_fields):
         '''
         data : typing.Mapping[str, typing.Any]
@@ -9302,8 +9904,10 @@ class EntityStatus(Type):
 
 
 class EntityStatusArgs(Type):
+    __slots__ = ('data', 'info', 'status', 'tag', 'unknown_fields')
     _toSchema = {'data': 'data', 'info': 'info', 'status': 'status', 'tag': 'tag'}
     _toPy = {'data': 'data', 'info': 'info', 'status': 'status', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, data=None, info=None, status=None, tag=None, **unknown_fields):
         '''
         data : typing.Mapping[str, typing.Any]
@@ -9338,8 +9942,10 @@ class EntityStatusArgs(Type):
 
 
 class EntityString(Type):
+    __slots__ = ('tag', 'value', 'unknown_fields')
     _toSchema = {'tag': 'tag', 'value': 'value'}
     _toPy = {'tag': 'tag', 'value': 'value'}
+    _wireTypes = {}
     def __init__(self, tag=None, value=None, **unknown_fields):
         '''
         tag : str
@@ -9362,8 +9968,10 @@ class EntityString(Type):
 
 
 class EntityVersion(Type):
+    __slots__ = ('tag', 'tools', 'unknown_fields')
     _toSchema = {'tag': 'tag', 'tools': 'tools'}
     _toPy = {'tag': 'tag', 'tools': 'tools'}
+    _wireTypes = {'tools': ('Version', None)}
     def __init__(self, tag=None, tools=None, **unknown_fields):
         '''
         tag : str
@@ -9386,8 +9994,10 @@ class EntityVersion(Type):
 
 
 class EntityWorkloadVersion(Type):
+    __slots__ = ('tag', 'workload_version', 'unknown_fields')
     _toSchema = {'tag': 'tag', 'workload_version': 'workload-version'}
     _toPy = {'tag': 'tag', 'workload-version': 'workload_version'}
+    _wireTypes = {}
     def __init__(self, tag=None, workload_version=None, **unknown_fields):
         '''
         tag : str
@@ -9410,8 +10020,10 @@ class EntityWorkloadVersion(Type):
 
 
 class EntityWorkloadVersions(Type):
+    __slots__ = ('entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
+    _wireTypes = {'entities': ('EntityWorkloadVersion', 'list')}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~EntityWorkloadVersion]
@@ -9428,8 +10040,10 @@ class EntityWorkloadVersions(Type):
 
 
 class Error(Type):
+    __slots__ = ('code', 'info', 'message', 'unknown_fields')
     _toSchema = {'code': 'code', 'info': 'info', 'message': 'message'}
     _toPy = {'code': 'code', 'info': 'info', 'message': 'message'}
+    _wireTypes = {}
     def __init__(self, code=None, info=None, message=None, **unknown_fields):
         '''
         code : str
@@ -9458,8 +10072,10 @@ class Error(Type):
 
 
 class ErrorResult(Type):
+    __slots__ = ('error', 'unknown_fields')
     _toSchema = {'error': 'error'}
     _toPy = {'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, **unknown_fields):
         '''
         error : Error
@@ -9476,8 +10092,10 @@ class ErrorResult(Type):
 
 
 class ErrorResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ErrorResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ErrorResult]
@@ -9494,8 +10112,10 @@ class ErrorResults(Type):
 
 
 class ExportBundleParams(Type):
+    __slots__ = ('include_charm_defaults', 'include_series', 'unknown_fields')
     _toSchema = {'include_charm_defaults': 'include-charm-defaults', 'include_series': 'include-series'}
     _toPy = {'include-charm-defaults': 'include_charm_defaults', 'include-series': 'include_series'}
+    _wireTypes = {}
     def __init__(self, include_charm_defaults=None, include_series=None, **unknown_fields):
         '''
         include_charm_defaults : bool
@@ -9518,8 +10138,10 @@ class ExportBundleParams(Type):
 
 
 class ExposeInfoResult(Type):
+    __slots__ = ('error', 'exposed', 'exposed_endpoints', 'unknown_fields')
     _toSchema = {'error': 'error', 'exposed': 'exposed', 'exposed_endpoints': 'exposed-endpoints'}
     _toPy = {'error': 'error', 'exposed': 'exposed', 'exposed-endpoints': 'exposed_endpoints'}
+    _wireTypes = {'error': ('Error', None), 'exposed_endpoints': ('ExposedEndpoint', 'dict')}
     def __init__(self, error=None, exposed=None, exposed_endpoints=None, **unknown_fields):
         '''
         error : Error
@@ -9548,8 +10170,10 @@ class ExposeInfoResult(Type):
 
 
 class ExposeInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ExposeInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ExposeInfoResult]
@@ -9566,8 +10190,10 @@ class ExposeInfoResults(Type):
 
 
 class ExposedEndpoint(Type):
+    __slots__ = ('expose_to_cidrs', 'expose_to_spaces', 'unknown_fields')
     _toSchema = {'expose_to_cidrs': 'expose-to-cidrs', 'expose_to_spaces': 'expose-to-spaces'}
     _toPy = {'expose-to-cidrs': 'expose_to_cidrs', 'expose-to-spaces': 'expose_to_spaces'}
+    _wireTypes = {}
     def __init__(self, expose_to_cidrs=None, expose_to_spaces=None, **unknown_fields):
         '''
         expose_to_cidrs : typing.Sequence[str]
@@ -9590,8 +10216,10 @@ class ExposedEndpoint(Type):
 
 
 class ExpressionTree(Type):
+    __slots__ = ('expression', 'unknown_fields')
     _toSchema = {'expression': 'Expression'}
     _toPy = {'Expression': 'expression'}
+    _wireTypes = {}
     def __init__(self, expression=None, **unknown_fields):
         '''
         expression : Any
@@ -9605,8 +10233,10 @@ class ExpressionTree(Type):
 
 
 class ExternalControllerInfo(Type):
+    __slots__ = ('addrs', 'ca_cert', 'controller_alias', 'controller_tag', 'unknown_fields')
     _toSchema = {'addrs': 'addrs', 'ca_cert': 'ca-cert', 'controller_alias': 'controller-alias', 'controller_tag': 'controller-tag'}
     _toPy = {'addrs': 'addrs', 'ca-cert': 'ca_cert', 'controller-alias': 'controller_alias', 'controller-tag': 'controller_tag'}
+    _wireTypes = {}
     def __init__(self, addrs=None, ca_cert=None, controller_alias=None, controller_tag=None, **unknown_fields):
         '''
         addrs : typing.Sequence[str]
@@ -9641,8 +10271,10 @@ class ExternalControllerInfo(Type):
 
 
 class ExternalControllerInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ExternalControllerInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -9665,8 +10297,10 @@ class ExternalControllerInfoResult(Type):
 
 
 class ExternalControllerInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ExternalControllerInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ExternalControllerInfoResult]
@@ -9683,8 +10317,10 @@ class ExternalControllerInfoResults(Type):
 
 
 class FanConfigEntry(Type):
+    __slots__ = ('overlay', 'underlay', 'unknown_fields')
     _toSchema = {'overlay': 'overlay', 'underlay': 'underlay'}
     _toPy = {'overlay': 'overlay', 'underlay': 'underlay'}
+    _wireTypes = {}
     def __init__(self, overlay=None, underlay=None, **unknown_fields):
         '''
         overlay : str
@@ -9707,8 +10343,10 @@ class FanConfigEntry(Type):
 
 
 class FanConfigResult(Type):
+    __slots__ = ('fans', 'unknown_fields')
     _toSchema = {'fans': 'fans'}
     _toPy = {'fans': 'fans'}
+    _wireTypes = {'fans': ('FanConfigEntry', 'list')}
     def __init__(self, fans=None, **unknown_fields):
         '''
         fans : typing.Sequence[~FanConfigEntry]
@@ -9725,8 +10363,10 @@ class FanConfigResult(Type):
 
 
 class Filesystem(Type):
+    __slots__ = ('filesystem_tag', 'info', 'volume_tag', 'unknown_fields')
     _toSchema = {'filesystem_tag': 'filesystem-tag', 'info': 'info', 'volume_tag': 'volume-tag'}
     _toPy = {'filesystem-tag': 'filesystem_tag', 'info': 'info', 'volume-tag': 'volume_tag'}
+    _wireTypes = {'info': ('FilesystemInfo', None)}
     def __init__(self, filesystem_tag=None, info=None, volume_tag=None, **unknown_fields):
         '''
         filesystem_tag : str
@@ -9755,8 +10395,10 @@ class Filesystem(Type):
 
 
 class FilesystemAttachment(Type):
+    __slots__ = ('filesystem_tag', 'info', 'machine_tag', 'unknown_fields')
     _toSchema = {'filesystem_tag': 'filesystem-tag', 'info': 'info', 'machine_tag': 'machine-tag'}
     _toPy = {'filesystem-tag': 'filesystem_tag', 'info': 'info', 'machine-tag': 'machine_tag'}
+    _wireTypes = {'info': ('FilesystemAttachmentInfo', None)}
     def __init__(self, filesystem_tag=None, info=None, machine_tag=None, **unknown_fields):
         '''
         filesystem_tag : str
@@ -9785,8 +10427,10 @@ class FilesystemAttachment(Type):
 
 
 class FilesystemAttachmentDetails(Type):
+    __slots__ = ('filesystemattachmentinfo', 'life', 'mount_point', 'read_only', 'unknown_fields')
     _toSchema = {'filesystemattachmentinfo': 'FilesystemAttachmentInfo', 'life': 'life', 'mount_point': 'mount-point', 'read_only': 'read-only'}
     _toPy = {'FilesystemAttachmentInfo': 'filesystemattachmentinfo', 'life': 'life', 'mount-point': 'mount_point', 'read-only': 'read_only'}
+    _wireTypes = {'filesystemattachmentinfo': ('FilesystemAttachmentInfo', None)}
     def __init__(self, filesystemattachmentinfo=None, life=None, mount_point=None, read_only=None, **unknown_fields):
         '''
         filesystemattachmentinfo : FilesystemAttachmentInfo
@@ -9821,8 +10465,10 @@ class FilesystemAttachmentDetails(Type):
 
 
 class FilesystemAttachmentInfo(Type):
+    __slots__ = ('mount_point', 'read_only', 'unknown_fields')
     _toSchema = {'mount_point': 'mount-point', 'read_only': 'read-only'}
     _toPy = {'mount-point': 'mount_point', 'read-only': 'read_only'}
+    _wireTypes = {}
     def __init__(self, mount_point=None, read_only=None, **unknown_fields):
         '''
         mount_point : str
@@ -9845,8 +10491,10 @@ class FilesystemAttachmentInfo(Type):
 
 
 class FilesystemAttachmentParams(Type):
+    __slots__ = ('filesystem_id', 'filesystem_tag', 'instance_id', 'machine_tag', 'mount_point', 'provider', 'read_only', 'unknown_fields')
     _toSchema = {'filesystem_id': 'filesystem-id', 'filesystem_tag': 'filesystem-tag', 'instance_id': 'instance-id', 'machine_tag': 'machine-tag', 'mount_point': 'mount-point', 'provider': 'provider', 'read_only': 'read-only'}
     _toPy = {'filesystem-id': 'filesystem_id', 'filesystem-tag': 'filesystem_tag', 'instance-id': 'instance_id', 'machine-tag': 'machine_tag', 'mount-point': 'mount_point', 'provider': 'provider', 'read-only': 'read_only'}
+    _wireTypes = {}
     def __init__(self, filesystem_id=None, filesystem_tag=None, instance_id=None, machine_tag=None, mount_point=None, provider=None, read_only=None, **unknown_fields):
         '''
         filesystem_id : str
@@ -9899,8 +10547,10 @@ class FilesystemAttachmentParams(Type):
 
 
 class FilesystemAttachmentParamsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('FilesystemAttachmentParams', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -9923,8 +10573,10 @@ class FilesystemAttachmentParamsResult(Type):
 
 
 class FilesystemAttachmentParamsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('FilesystemAttachmentParamsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemAttachmentParamsResult]
@@ -9941,8 +10593,10 @@ class FilesystemAttachmentParamsResults(Type):
 
 
 class FilesystemAttachmentResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('FilesystemAttachment', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -9965,8 +10619,10 @@ class FilesystemAttachmentResult(Type):
 
 
 class FilesystemAttachmentResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('FilesystemAttachmentResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemAttachmentResult]
@@ -9983,8 +10639,10 @@ class FilesystemAttachmentResults(Type):
 
 
 class FilesystemAttachments(Type):
+    __slots__ = ('filesystem_attachments', 'unknown_fields')
     _toSchema = {'filesystem_attachments': 'filesystem-attachments'}
     _toPy = {'filesystem-attachments': 'filesystem_attachments'}
+    _wireTypes = {'filesystem_attachments': ('FilesystemAttachment', 'list')}
     def __init__(self, filesystem_attachments=None, **unknown_fields):
         '''
         filesystem_attachments : typing.Sequence[~FilesystemAttachment]
@@ -10001,8 +10659,10 @@ class FilesystemAttachments(Type):
 
 
 class FilesystemDetails(Type):
+    __slots__ = ('filesystem_tag', 'info', 'life', 'machine_attachments', 'status', 'storage', 'unit_attachments', 'volume_tag', 'unknown_fields')
     _toSchema = {'filesystem_tag': 'filesystem-tag', 'info': 'info', 'life': 'life', 'machine_attachments': 'machine-attachments', 'status': 'status', 'storage': 'storage', 'unit_attachments': 'unit-attachments', 'volume_tag': 'volume-tag'}
     _toPy = {'filesystem-tag': 'filesystem_tag', 'info': 'info', 'life': 'life', 'machine-attachments': 'machine_attachments', 'status': 'status', 'storage': 'storage', 'unit-attachments': 'unit_attachments', 'volume-tag': 'volume_tag'}
+    _wireTypes = {'info': ('FilesystemInfo', None), 'machine_attachments': ('FilesystemAttachmentDetails', 'dict'), 'status': ('EntityStatus', None), 'storage': ('StorageDetails', None), 'unit_attachments': ('FilesystemAttachmentDetails', 'dict')}
     def __init__(self, filesystem_tag=None, info=None, life=None, machine_attachments=None, status=None, storage=None, unit_attachments=None, volume_tag=None, **unknown_fields):
         '''
         filesystem_tag : str
@@ -10061,8 +10721,10 @@ class FilesystemDetails(Type):
 
 
 class FilesystemDetailsListResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('FilesystemDetails', 'list')}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -10085,8 +10747,10 @@ class FilesystemDetailsListResult(Type):
 
 
 class FilesystemDetailsListResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('FilesystemDetailsListResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemDetailsListResult]
@@ -10103,8 +10767,10 @@ class FilesystemDetailsListResults(Type):
 
 
 class FilesystemFilter(Type):
+    __slots__ = ('machines', 'unknown_fields')
     _toSchema = {'machines': 'machines'}
     _toPy = {'machines': 'machines'}
+    _wireTypes = {}
     def __init__(self, machines=None, **unknown_fields):
         '''
         machines : typing.Sequence[str]
@@ -10121,8 +10787,10 @@ class FilesystemFilter(Type):
 
 
 class FilesystemFilters(Type):
+    __slots__ = ('filters', 'unknown_fields')
     _toSchema = {'filters': 'filters'}
     _toPy = {'filters': 'filters'}
+    _wireTypes = {'filters': ('FilesystemFilter', 'list')}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~FilesystemFilter]
@@ -10139,8 +10807,10 @@ class FilesystemFilters(Type):
 
 
 class FilesystemInfo(Type):
+    __slots__ = ('filesystem_id', 'pool', 'size', 'unknown_fields')
     _toSchema = {'filesystem_id': 'filesystem-id', 'pool': 'pool', 'size': 'size'}
     _toPy = {'filesystem-id': 'filesystem_id', 'pool': 'pool', 'size': 'size'}
+    _wireTypes = {}
     def __init__(self, filesystem_id=None, pool=None, size=None, **unknown_fields):
         '''
         filesystem_id : str
@@ -10169,8 +10839,10 @@ class FilesystemInfo(Type):
 
 
 class FilesystemParams(Type):
+    __slots__ = ('attachment', 'attributes', 'filesystem_tag', 'provider', 'size', 'tags', 'volume_tag', 'unknown_fields')
     _toSchema = {'attachment': 'attachment', 'attributes': 'attributes', 'filesystem_tag': 'filesystem-tag', 'provider': 'provider', 'size': 'size', 'tags': 'tags', 'volume_tag': 'volume-tag'}
     _toPy = {'attachment': 'attachment', 'attributes': 'attributes', 'filesystem-tag': 'filesystem_tag', 'provider': 'provider', 'size': 'size', 'tags': 'tags', 'volume-tag': 'volume_tag'}
+    _wireTypes = {'attachment': ('FilesystemAttachmentParams', None)}
     def __init__(self, attachment=None, attributes=None, filesystem_tag=None, provider=None, size=None, tags=None, volume_tag=None, **unknown_fields):
         '''
         attachment : FilesystemAttachmentParams
@@ -10223,8 +10895,10 @@ class FilesystemParams(Type):
 
 
 class FilesystemParamsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('FilesystemParams', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -10247,8 +10921,10 @@ class FilesystemParamsResult(Type):
 
 
 class FilesystemParamsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('FilesystemParamsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemParamsResult]
@@ -10265,8 +10941,10 @@ class FilesystemParamsResults(Type):
 
 
 class FilesystemResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('Filesystem', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -10289,8 +10967,10 @@ class FilesystemResult(Type):
 
 
 class FilesystemResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('FilesystemResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~FilesystemResult]
@@ -10307,8 +10987,10 @@ class FilesystemResults(Type):
 
 
 class Filesystems(Type):
+    __slots__ = ('filesystems', 'unknown_fields')
     _toSchema = {'filesystems': 'filesystems'}
     _toPy = {'filesystems': 'filesystems'}
+    _wireTypes = {'filesystems': ('Filesystem', 'list')}
     def __init__(self, filesystems=None, **unknown_fields):
         '''
         filesystems : typing.Sequence[~Filesystem]
@@ -10325,8 +11007,10 @@ class Filesystems(Type):
 
 
 class FindToolsParams(Type):
+    __slots__ = ('agentstream', 'arch', 'major', 'number', 'os_type', 'unknown_fields')
     _toSchema = {'agentstream': 'agentstream', 'arch': 'arch', 'major': 'major', 'number': 'number', 'os_type': 'os-type'}
     _toPy = {'agentstream': 'agentstream', 'arch': 'arch', 'major': 'major', 'number': 'number', 'os-type': 'os_type'}
+    _wireTypes = {'number': ('Number', None)}
     def __init__(self, agentstream=None, arch=None, major=None, number=None, os_type=None, **unknown_fields):
         '''
         agentstream : str
@@ -10367,8 +11051,10 @@ class FindToolsParams(Type):
 
 
 class FindToolsResult(Type):
+    __slots__ = ('error', 'list_', 'unknown_fields')
     _toSchema = {'error': 'error', 'list_': 'list'}
     _toPy = {'error': 'error', 'list': 'list_'}
+    _wireTypes = {'error': ('Error', None), 'list_': ('Tools', 'list')}
     def __init__(self, error=None, list_=None, **unknown_fields):
         '''
         error : Error
@@ -10391,8 +11077,10 @@ class FindToolsResult(Type):
 
 
 class FirewallRule(Type):
+    __slots__ = ('known_service', 'whitelist_cidrs', 'unknown_fields')
     _toSchema = {'known_service': 'known-service', 'whitelist_cidrs': 'whitelist-cidrs'}
     _toPy = {'known-service': 'known_service', 'whitelist-cidrs': 'whitelist_cidrs'}
+    _wireTypes = {}
     def __init__(self, known_service=None, whitelist_cidrs=None, **unknown_fields):
         '''
         known_service : str
@@ -10415,8 +11103,10 @@ class FirewallRule(Type):
 
 
 class FirewallRuleArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('FirewallRule', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~FirewallRule]
@@ -10433,8 +11123,10 @@ class FirewallRuleArgs(Type):
 
 
 class FullStatus(Type):
+    __slots__ = ('applications', 'branches', 'controller_timestamp', 'filesystems', 'machines', 'model', 'offers', 'relations', 'remote_applications', 'storage', 'volumes', 'unknown_fields')
     _toSchema = {'applications': 'applications', 'branches': 'branches', 'controller_timestamp': 'controller-timestamp', 'filesystems': 'filesystems', 'machines': 'machines', 'model': 'model', 'offers': 'offers', 'relations': 'relations', 'remote_applications': 'remote-applications', 'storage': 'storage', 'volumes': 'volumes'}
     _toPy = {'applications': 'applications', 'branches': 'branches', 'controller-timestamp': 'controller_timestamp', 'filesystems': 'filesystems', 'machines': 'machines', 'model': 'model', 'offers': 'offers', 'relations': 'relations', 'remote-applications': 'remote_applications', 'storage': 'storage', 'volumes': 'volumes'}
+    _wireTypes = {'applications': ('ApplicationStatus', 'dict'), 'branches': ('BranchStatus', 'dict'), 'filesystems': ('FilesystemDetails', 'list'), 'machines': ('MachineStatus', 'dict'), 'model': ('ModelStatusInfo', None), 'offers': ('ApplicationOfferStatus', 'dict'), 'relations': ('RelationStatus', 'list'), 'remote_applications': ('RemoteApplicationStatus', 'dict'), 'storage': ('StorageDetails', 'list'), 'volumes': ('VolumeDetails', 'list')}
     def __init__(self, applications=None, branches=None, controller_timestamp=None, filesystems=None, machines=None, model=None, offers=None, relations=None, remote_applications=None, storage=None, volumes=None, **unknown_fields):
         '''
         applications : typing.Mapping[str, ~ApplicationStatus]
@@ -10511,8 +11203,10 @@ class FullStatus(Type):
 
 
 class Generation(Type):
+    __slots__ = ('applications', 'branch', 'completed', 'completed_by', 'created', 'created_by', 'generation_id', 'unknown_fields')
     _toSchema = {'applications': 'applications', 'branch': 'branch', 'completed': 'completed', 'completed_by': 'completed-by', 'created': 'created', 'created_by': 'created-by', 'generation_id': 'generation-id'}
     _toPy = {'applications': 'applications', 'branch': 'branch', 'completed': 'completed', 'completed-by': 'completed_by', 'created': 'created', 'created-by': 'created_by', 'generation-id': 'generation_id'}
+    _wireTypes = {'applications': ('GenerationApplication', 'list')}
     def __init__(self, applications=None, branch=None, completed=None, completed_by=None, created=None, created_by=None, generation_id=None, **unknown_fields):
         '''
         applications : typing.Sequence[~GenerationApplication]
@@ -10565,8 +11259,10 @@ class Generation(Type):
 
 
 class GenerationApplication(Type):
+    __slots__ = ('application', 'config', 'pending', 'progress', 'tracking', 'unknown_fields')
     _toSchema = {'application': 'application', 'config': 'config', 'pending': 'pending', 'progress': 'progress', 'tracking': 'tracking'}
     _toPy = {'application': 'application', 'config': 'config', 'pending': 'pending', 'progress': 'progress', 'tracking': 'tracking'}
+    _wireTypes = {}
     def __init__(self, application=None, config=None, pending=None, progress=None, tracking=None, **unknown_fields):
         '''
         application : str
@@ -10607,8 +11303,10 @@ class GenerationApplication(Type):
 
 
 class GenerationId(Type):
+    __slots__ = ('generation_id', 'unknown_fields')
     _toSchema = {'generation_id': 'generation-id'}
     _toPy = {'generation-id': 'generation_id'}
+    _wireTypes = {}
     def __init__(self, generation_id=None, **unknown_fields):
         '''
         generation_id : int
@@ -10625,8 +11323,10 @@ class GenerationId(Type):
 
 
 class GenerationResult(Type):
+    __slots__ = ('error', 'generation', 'unknown_fields')
     _toSchema = {'error': 'error', 'generation': 'generation'}
     _toPy = {'error': 'error', 'generation': 'generation'}
+    _wireTypes = {'error': ('Error', None), 'generation': ('Generation', None)}
     def __init__(self, error=None, generation=None, **unknown_fields):
         '''
         error : Error
@@ -10649,8 +11349,10 @@ class GenerationResult(Type):
 
 
 class GetConstraintsResults(Type):
+    __slots__ = ('constraints', 'unknown_fields')
     _toSchema = {'constraints': 'constraints'}
     _toPy = {'constraints': 'constraints'}
+    _wireTypes = {'constraints': ('Value', None)}
     def __init__(self, constraints=None, **unknown_fields):
         '''
         constraints : Value
@@ -10667,8 +11369,10 @@ class GetConstraintsResults(Type):
 
 
 class GetLeadershipSettingsBulkResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('GetLeadershipSettingsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~GetLeadershipSettingsResult]
@@ -10685,8 +11389,10 @@ class GetLeadershipSettingsBulkResults(Type):
 
 
 class GetLeadershipSettingsResult(Type):
+    __slots__ = ('error', 'settings', 'unknown_fields')
     _toSchema = {'error': 'error', 'settings': 'settings'}
     _toPy = {'error': 'error', 'settings': 'settings'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, settings=None, **unknown_fields):
         '''
         error : Error
@@ -10709,8 +11415,10 @@ class GetLeadershipSettingsResult(Type):
 
 
 class GetRemoteSecretAccessArg(Type):
+    __slots__ = ('application_token', 'unit_id', 'uri', 'unknown_fields')
     _toSchema = {'application_token': 'application-token', 'unit_id': 'unit-id', 'uri': 'uri'}
     _toPy = {'application-token': 'application_token', 'unit-id': 'unit_id', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, application_token=None, unit_id=None, uri=None, **unknown_fields):
         '''
         application_token : str
@@ -10739,8 +11447,10 @@ class GetRemoteSecretAccessArg(Type):
 
 
 class GetRemoteSecretAccessArgs(Type):
+    __slots__ = ('relations', 'unknown_fields')
     _toSchema = {'relations': 'relations'}
     _toPy = {'relations': 'relations'}
+    _wireTypes = {'relations': ('GetRemoteSecretAccessArg', 'list')}
     def __init__(self, relations=None, **unknown_fields):
         '''
         relations : typing.Sequence[~GetRemoteSecretAccessArg]
@@ -10757,8 +11467,10 @@ class GetRemoteSecretAccessArgs(Type):
 
 
 class GetRemoteSecretContentArg(Type):
+    __slots__ = ('application_token', 'bakery_version', 'macaroons', 'peek', 'refresh', 'revision', 'unit_id', 'uri', 'unknown_fields')
     _toSchema = {'application_token': 'application-token', 'bakery_version': 'bakery-version', 'macaroons': 'macaroons', 'peek': 'peek', 'refresh': 'refresh', 'revision': 'revision', 'unit_id': 'unit-id', 'uri': 'uri'}
     _toPy = {'application-token': 'application_token', 'bakery-version': 'bakery_version', 'macaroons': 'macaroons', 'peek': 'peek', 'refresh': 'refresh', 'revision': 'revision', 'unit-id': 'unit_id', 'uri': 'uri'}
+    _wireTypes = {'macaroons': ('Macaroon', 'list')}
     def __init__(self, application_token=None, bakery_version=None, macaroons=None, peek=None, refresh=None, revision=None, unit_id=None, uri=None, **unknown_fields):
         '''
         application_token : str
@@ -10817,8 +11529,10 @@ class GetRemoteSecretContentArg(Type):
 
 
 class GetRemoteSecretContentArgs(Type):
+    __slots__ = ('relations', 'unknown_fields')
     _toSchema = {'relations': 'relations'}
     _toPy = {'relations': 'relations'}
+    _wireTypes = {'relations': ('GetRemoteSecretContentArg', 'list')}
     def __init__(self, relations=None, **unknown_fields):
         '''
         relations : typing.Sequence[~GetRemoteSecretContentArg]
@@ -10835,8 +11549,10 @@ class GetRemoteSecretContentArgs(Type):
 
 
 class GetSecretConsumerInfoArgs(Type):
+    __slots__ = ('consumer_tag', 'uris', 'unknown_fields')
     _toSchema = {'consumer_tag': 'consumer-tag', 'uris': 'uris'}
     _toPy = {'consumer-tag': 'consumer_tag', 'uris': 'uris'}
+    _wireTypes = {}
     def __init__(self, consumer_tag=None, uris=None, **unknown_fields):
         '''
         consumer_tag : str
@@ -10859,8 +11575,10 @@ class GetSecretConsumerInfoArgs(Type):
 
 
 class GetSecretContentArg(Type):
+    __slots__ = ('label', 'peek', 'refresh', 'uri', 'unknown_fields')
     _toSchema = {'label': 'label', 'peek': 'peek', 'refresh': 'refresh', 'uri': 'uri'}
     _toPy = {'label': 'label', 'peek': 'peek', 'refresh': 'refresh', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, label=None, peek=None, refresh=None, uri=None, **unknown_fields):
         '''
         label : str
@@ -10895,8 +11613,10 @@ class GetSecretContentArg(Type):
 
 
 class GetSecretContentArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('GetSecretContentArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~GetSecretContentArg]
@@ -10913,8 +11633,10 @@ class GetSecretContentArgs(Type):
 
 
 class GetTokenArg(Type):
+    __slots__ = ('tag', 'unknown_fields')
     _toSchema = {'tag': 'tag'}
     _toPy = {'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, tag=None, **unknown_fields):
         '''
         tag : str
@@ -10931,8 +11653,10 @@ class GetTokenArg(Type):
 
 
 class GetTokenArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
+    _wireTypes = {'args': ('GetTokenArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~GetTokenArg]
@@ -10949,8 +11673,10 @@ class GetTokenArgs(Type):
 
 
 class GoalState(Type):
+    __slots__ = ('relations', 'units', 'unknown_fields')
     _toSchema = {'relations': 'relations', 'units': 'units'}
     _toPy = {'relations': 'relations', 'units': 'units'}
+    _wireTypes = {'units': ('GoalStateStatus', 'dict')}
     def __init__(self, relations=None, units=None, **unknown_fields):
         '''
         relations : typing.Mapping[str, typing.Any]
@@ -10973,8 +11699,10 @@ class GoalState(Type):
 
 
 class GoalStateResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('GoalState', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -10997,8 +11725,10 @@ class GoalStateResult(Type):
 
 
 class GoalStateResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('GoalStateResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~GoalStateResult]
@@ -11015,8 +11745,10 @@ class GoalStateResults(Type):
 
 
 class GoalStateStatus(Type):
+    __slots__ = ('since', 'status', 'unknown_fields')
     _toSchema = {'since': 'since', 'status': 'status'}
     _toPy = {'since': 'since', 'status': 'status'}
+    _wireTypes = {}
     def __init__(self, since=None, status=None, **unknown_fields):
         '''
         since : str
@@ -11039,8 +11771,10 @@ class GoalStateStatus(Type):
 
 
 class GrantRevokeSecretArg(Type):
+    __slots__ = ('role', 'scope_tag', 'subject_tags', 'uri', 'unknown_fields')
     _toSchema = {'role': 'role', 'scope_tag': 'scope-tag', 'subject_tags': 'subject-tags', 'uri': 'uri'}
     _toPy = {'role': 'role', 'scope-tag': 'scope_tag', 'subject-tags': 'subject_tags', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, role=None, scope_tag=None, subject_tags=None, uri=None, **unknown_fields):
         '''
         role : str
@@ -11075,8 +11809,10 @@ class GrantRevokeSecretArg(Type):
 
 
 class GrantRevokeSecretArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('GrantRevokeSecretArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~GrantRevokeSecretArg]
@@ -11093,8 +11829,10 @@ class GrantRevokeSecretArgs(Type):
 
 
 class GrantRevokeUserSecretArg(Type):
+    __slots__ = ('applications', 'label', 'uri', 'unknown_fields')
     _toSchema = {'applications': 'applications', 'label': 'label', 'uri': 'uri'}
     _toPy = {'applications': 'applications', 'label': 'label', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, applications=None, label=None, uri=None, **unknown_fields):
         '''
         applications : typing.Sequence[str]
@@ -11123,8 +11861,10 @@ class GrantRevokeUserSecretArg(Type):
 
 
 class HardwareCharacteristics(Type):
+    __slots__ = ('arch', 'availability_zone', 'cpu_cores', 'cpu_power', 'mem', 'root_disk', 'root_disk_source', 'tags', 'virt_type', 'unknown_fields')
     _toSchema = {'arch': 'arch', 'availability_zone': 'availability-zone', 'cpu_cores': 'cpu-cores', 'cpu_power': 'cpu-power', 'mem': 'mem', 'root_disk': 'root-disk', 'root_disk_source': 'root-disk-source', 'tags': 'tags', 'virt_type': 'virt-type'}
     _toPy = {'arch': 'arch', 'availability-zone': 'availability_zone', 'cpu-cores': 'cpu_cores', 'cpu-power': 'cpu_power', 'mem': 'mem', 'root-disk': 'root_disk', 'root-disk-source': 'root_disk_source', 'tags': 'tags', 'virt-type': 'virt_type'}
+    _wireTypes = {}
     def __init__(self, arch=None, availability_zone=None, cpu_cores=None, cpu_power=None, mem=None, root_disk=None, root_disk_source=None, tags=None, virt_type=None, **unknown_fields):
         '''
         arch : str
@@ -11189,8 +11929,10 @@ class HardwareCharacteristics(Type):
 
 
 class History(Type):
+    __slots__ = ('error', 'statuses', 'unknown_fields')
     _toSchema = {'error': 'error', 'statuses': 'statuses'}
     _toPy = {'error': 'error', 'statuses': 'statuses'}
+    _wireTypes = {'error': ('Error', None), 'statuses': ('DetailedStatus', 'list')}
     def __init__(self, error=None, statuses=None, **unknown_fields):
         '''
         error : Error
@@ -11213,8 +11955,10 @@ class History(Type):
 
 
 class HostNetworkChange(Type):
+    __slots__ = ('error', 'new_bridges', 'reconfigure_delay', 'unknown_fields')
     _toSchema = {'error': 'error', 'new_bridges': 'new-bridges', 'reconfigure_delay': 'reconfigure-delay'}
     _toPy = {'error': 'error', 'new-bridges': 'new_bridges', 'reconfigure-delay': 'reconfigure_delay'}
+    _wireTypes = {'error': ('Error', None), 'new_bridges': ('DeviceBridgeInfo', 'list')}
     def __init__(self, error=None, new_bridges=None, reconfigure_delay=None, **unknown_fields):
         '''
         error : Error
@@ -11243,8 +11987,10 @@ class HostNetworkChange(Type):
 
 
 class HostNetworkChangeResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('HostNetworkChange', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~HostNetworkChange]
@@ -11261,8 +12007,10 @@ class HostNetworkChangeResults(Type):
 
 
 class HostPort(Type):
+    __slots__ = ('address', 'cidr', 'config_type', 'is_secondary', 'port', 'scope', 'space_id', 'space_name', 'type_', 'value', 'unknown_fields')
     _toSchema = {'address': 'Address', 'cidr': 'cidr', 'config_type': 'config-type', 'is_secondary': 'is-secondary', 'port': 'port', 'scope': 'scope', 'space_id': 'space-id', 'space_name': 'space-name', 'type_': 'type', 'value': 'value'}
     _toPy = {'Address': 'address', 'cidr': 'cidr', 'config-type': 'config_type', 'is-secondary': 'is_secondary', 'port': 'port', 'scope': 'scope', 'space-id': 'space_id', 'space-name': 'space_name', 'type': 'type_', 'value': 'value'}
+    _wireTypes = {'address': ('Address', None)}
     def __init__(self, address=None, cidr=None, config_type=None, is_secondary=None, port=None, scope=None, space_id=None, space_name=None, type_=None, value=None, **unknown_fields):
         '''
         address : Address
@@ -11333,8 +12081,10 @@ class HostPort(Type):
 
 
 class HostedModelConfig(Type):
+    __slots__ = ('cloud_spec', 'config', 'error', 'name', 'owner', 'unknown_fields')
     _toSchema = {'cloud_spec': 'cloud-spec', 'config': 'config', 'error': 'error', 'name': 'name', 'owner': 'owner'}
     _toPy = {'cloud-spec': 'cloud_spec', 'config': 'config', 'error': 'error', 'name': 'name', 'owner': 'owner'}
+    _wireTypes = {'cloud_spec': ('CloudSpec', None), 'error': ('Error', None)}
     def __init__(self, cloud_spec=None, config=None, error=None, name=None, owner=None, **unknown_fields):
         '''
         cloud_spec : CloudSpec
@@ -11375,8 +12125,10 @@ class HostedModelConfig(Type):
 
 
 class HostedModelConfigsResults(Type):
+    __slots__ = ('models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
+    _wireTypes = {'models': ('HostedModelConfig', 'list')}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~HostedModelConfig]
@@ -11393,8 +12145,10 @@ class HostedModelConfigsResults(Type):
 
 
 class ImageMetadataFilter(Type):
+    __slots__ = ('arches', 'region', 'root_storage_type', 'stream', 'versions', 'virt_type', 'unknown_fields')
     _toSchema = {'arches': 'arches', 'region': 'region', 'root_storage_type': 'root-storage-type', 'stream': 'stream', 'versions': 'versions', 'virt_type': 'virt-type'}
     _toPy = {'arches': 'arches', 'region': 'region', 'root-storage-type': 'root_storage_type', 'stream': 'stream', 'versions': 'versions', 'virt-type': 'virt_type'}
+    _wireTypes = {}
     def __init__(self, arches=None, region=None, root_storage_type=None, stream=None, versions=None, virt_type=None, **unknown_fields):
         '''
         arches : typing.Sequence[str]
@@ -11441,8 +12195,10 @@ class ImageMetadataFilter(Type):
 
 
 class ImportStorageDetails(Type):
+    __slots__ = ('storage_tag', 'unknown_fields')
     _toSchema = {'storage_tag': 'storage-tag'}
     _toPy = {'storage-tag': 'storage_tag'}
+    _wireTypes = {}
     def __init__(self, storage_tag=None, **unknown_fields):
         '''
         storage_tag : str
@@ -11459,8 +12215,10 @@ class ImportStorageDetails(Type):
 
 
 class ImportStorageParams(Type):
+    __slots__ = ('kind', 'pool', 'provider_id', 'storage_name', 'unknown_fields')
     _toSchema = {'kind': 'kind', 'pool': 'pool', 'provider_id': 'provider-id', 'storage_name': 'storage-name'}
     _toPy = {'kind': 'kind', 'pool': 'pool', 'provider-id': 'provider_id', 'storage-name': 'storage_name'}
+    _wireTypes = {}
     def __init__(self, kind=None, pool=None, provider_id=None, storage_name=None, **unknown_fields):
         '''
         kind : int
@@ -11495,8 +12253,10 @@ class ImportStorageParams(Type):
 
 
 class ImportStorageResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ImportStorageDetails', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -11519,8 +12279,10 @@ class ImportStorageResult(Type):
 
 
 class ImportStorageResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ImportStorageResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ImportStorageResult]
@@ -11537,8 +12299,10 @@ class ImportStorageResults(Type):
 
 
 class IngressNetworksChangeEvent(Type):
+    __slots__ = ('bakery_version', 'ingress_required', 'macaroons', 'networks', 'relation_token', 'unknown_fields')
     _toSchema = {'bakery_version': 'bakery-version', 'ingress_required': 'ingress-required', 'macaroons': 'macaroons', 'networks': 'networks', 'relation_token': 'relation-token'}
     _toPy = {'bakery-version': 'bakery_version', 'ingress-required': 'ingress_required', 'macaroons': 'macaroons', 'networks': 'networks', 'relation-token': 'relation_token'}
+    _wireTypes = {'macaroons': ('Macaroon', 'list')}
     def __init__(self, bakery_version=None, ingress_required=None, macaroons=None, networks=None, relation_token=None, **unknown_fields):
         '''
         bakery_version : int
@@ -11579,8 +12343,10 @@ class IngressNetworksChangeEvent(Type):
 
 
 class IngressNetworksChanges(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('IngressNetworksChangeEvent', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~IngressNetworksChangeEvent]
@@ -11597,8 +12363,10 @@ class IngressNetworksChanges(Type):
 
 
 class IngressRule(Type):
+    __slots__ = ('port_range', 'source_cidrs', 'unknown_fields')
     _toSchema = {'port_range': 'port-range', 'source_cidrs': 'source-cidrs'}
     _toPy = {'port-range': 'port_range', 'source-cidrs': 'source_cidrs'}
+    _wireTypes = {'port_range': ('PortRange', None)}
     def __init__(self, port_range=None, source_cidrs=None, **unknown_fields):
         '''
         port_range : PortRange
@@ -11621,8 +12389,10 @@ class IngressRule(Type):
 
 
 class IngressRulesResult(Type):
+    __slots__ = ('error', 'rules', 'unknown_fields')
     _toSchema = {'error': 'error', 'rules': 'rules'}
     _toPy = {'error': 'error', 'rules': 'rules'}
+    _wireTypes = {'error': ('Error', None), 'rules': ('IngressRule', 'list')}
     def __init__(self, error=None, rules=None, **unknown_fields):
         '''
         error : Error
@@ -11645,8 +12415,10 @@ class IngressRulesResult(Type):
 
 
 class InitiateMigrationArgs(Type):
+    __slots__ = ('specs', 'unknown_fields')
     _toSchema = {'specs': 'specs'}
     _toPy = {'specs': 'specs'}
+    _wireTypes = {'specs': ('MigrationSpec', 'list')}
     def __init__(self, specs=None, **unknown_fields):
         '''
         specs : typing.Sequence[~MigrationSpec]
@@ -11663,8 +12435,10 @@ class InitiateMigrationArgs(Type):
 
 
 class InitiateMigrationResult(Type):
+    __slots__ = ('error', 'migration_id', 'model_tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'migration_id': 'migration-id', 'model_tag': 'model-tag'}
     _toPy = {'error': 'error', 'migration-id': 'migration_id', 'model-tag': 'model_tag'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, migration_id=None, model_tag=None, **unknown_fields):
         '''
         error : Error
@@ -11693,8 +12467,10 @@ class InitiateMigrationResult(Type):
 
 
 class InitiateMigrationResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('InitiateMigrationResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~InitiateMigrationResult]
@@ -11711,8 +12487,10 @@ class InitiateMigrationResults(Type):
 
 
 class InstanceInfo(Type):
+    __slots__ = ('characteristics', 'charm_profiles', 'display_name', 'instance_id', 'network_config', 'nonce', 'tag', 'volume_attachments', 'volumes', 'unknown_fields')
     _toSchema = {'characteristics': 'characteristics', 'charm_profiles': 'charm-profiles', 'display_name': 'display-name', 'instance_id': 'instance-id', 'network_config': 'network-config', 'nonce': 'nonce', 'tag': 'tag', 'volume_attachments': 'volume-attachments', 'volumes': 'volumes'}
     _toPy = {'characteristics': 'characteristics', 'charm-profiles': 'charm_profiles', 'display-name': 'display_name', 'instance-id': 'instance_id', 'network-config': 'network_config', 'nonce': 'nonce', 'tag': 'tag', 'volume-attachments': 'volume_attachments', 'volumes': 'volumes'}
+    _wireTypes = {'characteristics': ('HardwareCharacteristics', None), 'network_config': ('NetworkConfig', 'list'), 'volume_attachments': ('VolumeAttachmentInfo', 'dict'), 'volumes': ('Volume', 'list')}
     def __init__(self, characteristics=None, charm_profiles=None, display_name=None, instance_id=None, network_config=None, nonce=None, tag=None, volume_attachments=None, volumes=None, **unknown_fields):
         '''
         characteristics : HardwareCharacteristics
@@ -11777,8 +12555,10 @@ class InstanceInfo(Type):
 
 
 class InstanceType(Type):
+    __slots__ = ('arches', 'cost', 'cpu_cores', 'memory', 'name', 'root_disk', 'virt_type', 'unknown_fields')
     _toSchema = {'arches': 'arches', 'cost': 'cost', 'cpu_cores': 'cpu-cores', 'memory': 'memory', 'name': 'name', 'root_disk': 'root-disk', 'virt_type': 'virt-type'}
     _toPy = {'arches': 'arches', 'cost': 'cost', 'cpu-cores': 'cpu_cores', 'memory': 'memory', 'name': 'name', 'root-disk': 'root_disk', 'virt-type': 'virt_type'}
+    _wireTypes = {}
     def __init__(self, arches=None, cost=None, cpu_cores=None, memory=None, name=None, root_disk=None, virt_type=None, **unknown_fields):
         '''
         arches : typing.Sequence[str]
@@ -11831,8 +12611,10 @@ class InstanceType(Type):
 
 
 class InstanceTypesResult(Type):
+    __slots__ = ('cost_currency', 'cost_divisor', 'cost_unit', 'error', 'instance_types', 'unknown_fields')
     _toSchema = {'cost_currency': 'cost-currency', 'cost_divisor': 'cost-divisor', 'cost_unit': 'cost-unit', 'error': 'error', 'instance_types': 'instance-types'}
     _toPy = {'cost-currency': 'cost_currency', 'cost-divisor': 'cost_divisor', 'cost-unit': 'cost_unit', 'error': 'error', 'instance-types': 'instance_types'}
+    _wireTypes = {'error': ('Error', None), 'instance_types': ('InstanceType', 'list')}
     def __init__(self, cost_currency=None, cost_divisor=None, cost_unit=None, error=None, instance_types=None, **unknown_fields):
         '''
         cost_currency : str
@@ -11873,8 +12655,10 @@ class InstanceTypesResult(Type):
 
 
 class InstanceTypesResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('InstanceTypesResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~InstanceTypesResult]
@@ -11891,8 +12675,10 @@ class InstanceTypesResults(Type):
 
 
 class InstancesInfo(Type):
+    __slots__ = ('machines', 'unknown_fields')
     _toSchema = {'machines': 'machines'}
     _toPy = {'machines': 'machines'}
+    _wireTypes = {'machines': ('InstanceInfo', 'list')}
     def __init__(self, machines=None, **unknown_fields):
         '''
         machines : typing.Sequence[~InstanceInfo]
@@ -11909,8 +12695,10 @@ class InstancesInfo(Type):
 
 
 class IntResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -11933,8 +12721,10 @@ class IntResult(Type):
 
 
 class IntResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('IntResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~IntResult]
@@ -11951,8 +12741,10 @@ class IntResults(Type):
 
 
 class InterfaceAddress(Type):
+    __slots__ = ('cidr', 'hostname', 'value', 'unknown_fields')
     _toSchema = {'cidr': 'cidr', 'hostname': 'hostname', 'value': 'value'}
     _toPy = {'cidr': 'cidr', 'hostname': 'hostname', 'value': 'value'}
+    _wireTypes = {}
     def __init__(self, cidr=None, hostname=None, value=None, **unknown_fields):
         '''
         cidr : str
@@ -11981,8 +12773,10 @@ class InterfaceAddress(Type):
 
 
 class InvalidateCredentialArg(Type):
+    __slots__ = ('reason', 'unknown_fields')
     _toSchema = {'reason': 'reason'}
     _toPy = {'reason': 'reason'}
+    _wireTypes = {}
     def __init__(self, reason=None, **unknown_fields):
         '''
         reason : str
@@ -11999,8 +12793,10 @@ class InvalidateCredentialArg(Type):
 
 
 class IsMasterResult(Type):
+    __slots__ = ('master', 'unknown_fields')
     _toSchema = {'master': 'master'}
     _toPy = {'master': 'master'}
+    _wireTypes = {}
     def __init__(self, master=None, **unknown_fields):
         '''
         master : bool
@@ -12017,8 +12813,10 @@ class IsMasterResult(Type):
 
 
 class IsMeteredResult(Type):
+    __slots__ = ('metered', 'unknown_fields')
     _toSchema = {'metered': 'metered'}
     _toPy = {'metered': 'metered'}
+    _wireTypes = {}
     def __init__(self, metered=None, **unknown_fields):
         '''
         metered : bool
@@ -12035,8 +12833,10 @@ class IsMeteredResult(Type):
 
 
 class IssueOperatorCertificateResult(Type):
+    __slots__ = ('ca_cert', 'cert', 'error', 'private_key', 'unknown_fields')
     _toSchema = {'ca_cert': 'ca-cert', 'cert': 'cert', 'error': 'error', 'private_key': 'private-key'}
     _toPy = {'ca-cert': 'ca_cert', 'cert': 'cert', 'error': 'error', 'private-key': 'private_key'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, ca_cert=None, cert=None, error=None, private_key=None, **unknown_fields):
         '''
         ca_cert : str
@@ -12071,8 +12871,10 @@ class IssueOperatorCertificateResult(Type):
 
 
 class IssueOperatorCertificateResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('IssueOperatorCertificateResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~IssueOperatorCertificateResult]
@@ -12089,8 +12891,10 @@ class IssueOperatorCertificateResults(Type):
 
 
 class JobsResult(Type):
+    __slots__ = ('error', 'jobs', 'unknown_fields')
     _toSchema = {'error': 'error', 'jobs': 'jobs'}
     _toPy = {'error': 'error', 'jobs': 'jobs'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, jobs=None, **unknown_fields):
         '''
         error : Error
@@ -12113,8 +12917,10 @@ class JobsResult(Type):
 
 
 class JobsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('JobsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~JobsResult]
@@ -12131,8 +12937,10 @@ class JobsResults(Type):
 
 
 class KnownServiceArgs(Type):
+    __slots__ = ('known_services', 'unknown_fields')
     _toSchema = {'known_services': 'known-services'}
     _toPy = {'known-services': 'known_services'}
+    _wireTypes = {}
     def __init__(self, known_services=None, **unknown_fields):
         '''
         known_services : typing.Sequence[str]
@@ -12149,8 +12957,10 @@ class KnownServiceArgs(Type):
 
 
 class KubernetesDeploymentInfo(Type):
+    __slots__ = ('deployment_type', 'service_type', 'unknown_fields')
     _toSchema = {'deployment_type': 'deployment-type', 'service_type': 'service-type'}
     _toPy = {'deployment-type': 'deployment_type', 'service-type': 'service_type'}
+    _wireTypes = {}
     def __init__(self, deployment_type=None, service_type=None, **unknown_fields):
         '''
         deployment_type : str
@@ -12173,8 +12983,10 @@ class KubernetesDeploymentInfo(Type):
 
 
 class KubernetesDeviceParams(Type):
+    __slots__ = ('attributes', 'count', 'type_', 'unknown_fields')
     _toSchema = {'attributes': 'Attributes', 'count': 'Count', 'type_': 'Type'}
     _toPy = {'Attributes': 'attributes', 'Count': 'count', 'Type': 'type_'}
+    _wireTypes = {}
     def __init__(self, attributes=None, count=None, type_=None, **unknown_fields):
         '''
         attributes : typing.Mapping[str, str]
@@ -12203,8 +13015,10 @@ class KubernetesDeviceParams(Type):
 
 
 class KubernetesFilesystemAttachmentParams(Type):
+    __slots__ = ('mount_point', 'provider', 'read_only', 'unknown_fields')
     _toSchema = {'mount_point': 'mount-point', 'provider': 'provider', 'read_only': 'read-only'}
     _toPy = {'mount-point': 'mount_point', 'provider': 'provider', 'read-only': 'read_only'}
+    _wireTypes = {}
     def __init__(self, mount_point=None, provider=None, read_only=None, **unknown_fields):
         '''
         mount_point : str
@@ -12233,8 +13047,10 @@ class KubernetesFilesystemAttachmentParams(Type):
 
 
 class KubernetesFilesystemInfo(Type):
+    __slots__ = ('data', 'filesystem_id', 'info', 'mount_point', 'pool', 'read_only', 'size', 'status', 'storagename', 'volume', 'unknown_fields')
     _toSchema = {'data': 'data', 'filesystem_id': 'filesystem-id', 'info': 'info', 'mount_point': 'mount-point', 'pool': 'pool', 'read_only': 'read-only', 'size': 'size', 'status': 'status', 'storagename': 'storagename', 'volume': 'volume'}
     _toPy = {'data': 'data', 'filesystem-id': 'filesystem_id', 'info': 'info', 'mount-point': 'mount_point', 'pool': 'pool', 'read-only': 'read_only', 'size': 'size', 'status': 'status', 'storagename': 'storagename', 'volume': 'volume'}
+    _wireTypes = {'volume': ('KubernetesVolumeInfo', None)}
     def __init__(self, data=None, filesystem_id=None, info=None, mount_point=None, pool=None, read_only=None, size=None, status=None, storagename=None, volume=None, **unknown_fields):
         '''
         data : typing.Mapping[str, typing.Any]
@@ -12305,8 +13121,10 @@ class KubernetesFilesystemInfo(Type):
 
 
 class KubernetesFilesystemParams(Type):
+    __slots__ = ('attachment', 'attributes', 'provider', 'size', 'storagename', 'tags', 'unknown_fields')
     _toSchema = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'storagename': 'storagename', 'tags': 'tags'}
     _toPy = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'storagename': 'storagename', 'tags': 'tags'}
+    _wireTypes = {'attachment': ('KubernetesFilesystemAttachmentParams', None)}
     def __init__(self, attachment=None, attributes=None, provider=None, size=None, storagename=None, tags=None, **unknown_fields):
         '''
         attachment : KubernetesFilesystemAttachmentParams
@@ -12353,8 +13171,10 @@ class KubernetesFilesystemParams(Type):
 
 
 class KubernetesProvisioningInfo(Type):
+    __slots__ = ('charm_modified_version', 'constraints', 'deployment_info', 'devices', 'filesystems', 'image_repo', 'pod_spec', 'raw_k8s_spec', 'tags', 'volumes', 'unknown_fields')
     _toSchema = {'charm_modified_version': 'charm-modified-version', 'constraints': 'constraints', 'deployment_info': 'deployment-info', 'devices': 'devices', 'filesystems': 'filesystems', 'image_repo': 'image-repo', 'pod_spec': 'pod-spec', 'raw_k8s_spec': 'raw-k8s-spec', 'tags': 'tags', 'volumes': 'volumes'}
     _toPy = {'charm-modified-version': 'charm_modified_version', 'constraints': 'constraints', 'deployment-info': 'deployment_info', 'devices': 'devices', 'filesystems': 'filesystems', 'image-repo': 'image_repo', 'pod-spec': 'pod_spec', 'raw-k8s-spec': 'raw_k8s_spec', 'tags': 'tags', 'volumes': 'volumes'}
+    _wireTypes = {'constraints': ('Value', None), 'deployment_info': ('KubernetesDeploymentInfo', None), 'devices': ('KubernetesDeviceParams', 'list'), 'filesystems': ('KubernetesFilesystemParams', 'list'), 'image_repo': ('DockerImageInfo', None), 'volumes': ('KubernetesVolumeParams', 'list')}
     def __init__(self, charm_modified_version=None, constraints=None, deployment_info=None, devices=None, filesystems=None, image_repo=None, pod_spec=None, raw_k8s_spec=None, tags=None, volumes=None, **unknown_fields):
         '''
         charm_modified_version : int
@@ -12425,8 +13245,10 @@ class KubernetesProvisioningInfo(Type):
 
 
 class KubernetesProvisioningInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('KubernetesProvisioningInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -12449,8 +13271,10 @@ class KubernetesProvisioningInfoResult(Type):
 
 
 class KubernetesProvisioningInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('KubernetesProvisioningInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~KubernetesProvisioningInfoResult]
@@ -12467,8 +13291,10 @@ class KubernetesProvisioningInfoResults(Type):
 
 
 class KubernetesUpgradeArg(Type):
+    __slots__ = ('agent_tag', 'version', 'unknown_fields')
     _toSchema = {'agent_tag': 'agent-tag', 'version': 'version'}
     _toPy = {'agent-tag': 'agent_tag', 'version': 'version'}
+    _wireTypes = {'version': ('Number', None)}
     def __init__(self, agent_tag=None, version=None, **unknown_fields):
         '''
         agent_tag : str
@@ -12491,8 +13317,10 @@ class KubernetesUpgradeArg(Type):
 
 
 class KubernetesVolumeAttachmentParams(Type):
+    __slots__ = ('provider', 'read_only', 'unknown_fields')
     _toSchema = {'provider': 'provider', 'read_only': 'read-only'}
     _toPy = {'provider': 'provider', 'read-only': 'read_only'}
+    _wireTypes = {}
     def __init__(self, provider=None, read_only=None, **unknown_fields):
         '''
         provider : str
@@ -12515,8 +13343,10 @@ class KubernetesVolumeAttachmentParams(Type):
 
 
 class KubernetesVolumeInfo(Type):
+    __slots__ = ('data', 'info', 'persistent', 'pool', 'size', 'status', 'volume_id', 'unknown_fields')
     _toSchema = {'data': 'data', 'info': 'info', 'persistent': 'persistent', 'pool': 'pool', 'size': 'size', 'status': 'status', 'volume_id': 'volume-id'}
     _toPy = {'data': 'data', 'info': 'info', 'persistent': 'persistent', 'pool': 'pool', 'size': 'size', 'status': 'status', 'volume-id': 'volume_id'}
+    _wireTypes = {}
     def __init__(self, data=None, info=None, persistent=None, pool=None, size=None, status=None, volume_id=None, **unknown_fields):
         '''
         data : typing.Mapping[str, typing.Any]
@@ -12569,8 +13399,10 @@ class KubernetesVolumeInfo(Type):
 
 
 class KubernetesVolumeParams(Type):
+    __slots__ = ('attachment', 'attributes', 'provider', 'size', 'storagename', 'tags', 'unknown_fields')
     _toSchema = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'storagename': 'storagename', 'tags': 'tags'}
     _toPy = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'storagename': 'storagename', 'tags': 'tags'}
+    _wireTypes = {'attachment': ('KubernetesVolumeAttachmentParams', None)}
     def __init__(self, attachment=None, attributes=None, provider=None, size=None, storagename=None, tags=None, **unknown_fields):
         '''
         attachment : KubernetesVolumeAttachmentParams
@@ -12617,8 +13449,10 @@ class KubernetesVolumeParams(Type):
 
 
 class LXDProfile(Type):
+    __slots__ = ('config', 'description', 'devices', 'unknown_fields')
     _toSchema = {'config': 'config', 'description': 'description', 'devices': 'devices'}
     _toPy = {'config': 'config', 'description': 'description', 'devices': 'devices'}
+    _wireTypes = {}
     def __init__(self, config=None, description=None, devices=None, **unknown_fields):
         '''
         config : typing.Mapping[str, str]
@@ -12647,8 +13481,10 @@ class LXDProfile(Type):
 
 
 class LatestSecretRevisionChanges(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('SecretRevisionChange', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~SecretRevisionChange]
@@ -12665,8 +13501,10 @@ class LatestSecretRevisionChanges(Type):
 
 
 class LeaseOperationCommand(Type):
+    __slots__ = ('duration', 'holder', 'lease', 'model_uuid', 'namespace', 'new_time', 'old_time', 'operation', 'pin_entity', 'version', 'unknown_fields')
     _toSchema = {'duration': 'duration', 'holder': 'holder', 'lease': 'lease', 'model_uuid': 'model-uuid', 'namespace': 'namespace', 'new_time': 'new-time', 'old_time': 'old-time', 'operation': 'operation', 'pin_entity': 'pin-entity', 'version': 'version'}
     _toPy = {'duration': 'duration', 'holder': 'holder', 'lease': 'lease', 'model-uuid': 'model_uuid', 'namespace': 'namespace', 'new-time': 'new_time', 'old-time': 'old_time', 'operation': 'operation', 'pin-entity': 'pin_entity', 'version': 'version'}
+    _wireTypes = {}
     def __init__(self, duration=None, holder=None, lease=None, model_uuid=None, namespace=None, new_time=None, old_time=None, operation=None, pin_entity=None, version=None, **unknown_fields):
         '''
         duration : int
@@ -12737,8 +13575,10 @@ class LeaseOperationCommand(Type):
 
 
 class LeaseOperationsV2(Type):
+    __slots__ = ('commands', 'unknown_fields')
     _toSchema = {'commands': 'commands'}
     _toPy = {'commands': 'commands'}
+    _wireTypes = {'commands': ('LeaseOperationCommand', 'list')}
     def __init__(self, commands=None, **unknown_fields):
         '''
         commands : typing.Sequence[~LeaseOperationCommand]
@@ -12755,8 +13595,10 @@ class LeaseOperationsV2(Type):
 
 
 class LifeResult(Type):
+    __slots__ = ('error', 'life', 'unknown_fields')
     _toSchema = {'error': 'error', 'life': 'life'}
     _toPy = {'error': 'error', 'life': 'life'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, life=None, **unknown_fields):
         '''
         error : Error
@@ -12779,8 +13621,10 @@ class LifeResult(Type):
 
 
 class LifeResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('LifeResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~LifeResult]
@@ -12797,8 +13641,10 @@ class LifeResults(Type):
 
 
 class ListCloudImageMetadataResult(Type):
+    __slots__ = ('result', 'unknown_fields')
     _toSchema = {'result': 'result'}
     _toPy = {'result': 'result'}
+    _wireTypes = {'result': ('CloudImageMetadata', 'list')}
     def __init__(self, result=None, **unknown_fields):
         '''
         result : typing.Sequence[~CloudImageMetadata]
@@ -12815,8 +13661,10 @@ class ListCloudImageMetadataResult(Type):
 
 
 class ListCloudInfo(Type):
+    __slots__ = ('clouddetails', 'user_access', 'unknown_fields')
     _toSchema = {'clouddetails': 'CloudDetails', 'user_access': 'user-access'}
     _toPy = {'CloudDetails': 'clouddetails', 'user-access': 'user_access'}
+    _wireTypes = {'clouddetails': ('CloudDetails', None)}
     def __init__(self, clouddetails=None, user_access=None, **unknown_fields):
         '''
         clouddetails : CloudDetails
@@ -12839,8 +13687,10 @@ class ListCloudInfo(Type):
 
 
 class ListCloudInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ListCloudInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -12863,8 +13713,10 @@ class ListCloudInfoResult(Type):
 
 
 class ListCloudInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ListCloudInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ListCloudInfoResult]
@@ -12881,8 +13733,10 @@ class ListCloudInfoResults(Type):
 
 
 class ListCloudsRequest(Type):
+    __slots__ = ('all_', 'user_tag', 'unknown_fields')
     _toSchema = {'all_': 'all', 'user_tag': 'user-tag'}
     _toPy = {'all': 'all_', 'user-tag': 'user_tag'}
+    _wireTypes = {}
     def __init__(self, all_=None, user_tag=None, **unknown_fields):
         '''
         all_ : bool
@@ -12905,8 +13759,10 @@ class ListCloudsRequest(Type):
 
 
 class ListFirewallRulesResults(Type):
+    __slots__ = ('rules', 'unknown_fields')
     _toSchema = {'rules': 'Rules'}
     _toPy = {'Rules': 'rules'}
+    _wireTypes = {'rules': ('FirewallRule', 'list')}
     def __init__(self, rules=None, **unknown_fields):
         '''
         rules : typing.Sequence[~FirewallRule]
@@ -12923,8 +13779,10 @@ class ListFirewallRulesResults(Type):
 
 
 class ListResourcesArgs(Type):
+    __slots__ = ('entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
+    _wireTypes = {'entities': ('Entity', 'list')}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~Entity]
@@ -12941,8 +13799,10 @@ class ListResourcesArgs(Type):
 
 
 class ListSSHKeys(Type):
+    __slots__ = ('entities', 'mode', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'mode': 'mode'}
     _toPy = {'entities': 'entities', 'mode': 'mode'}
+    _wireTypes = {'entities': ('Entities', None)}
     def __init__(self, entities=None, mode=None, **unknown_fields):
         '''
         entities : Entities
@@ -12965,8 +13825,10 @@ class ListSSHKeys(Type):
 
 
 class ListSecretBackendsArgs(Type):
+    __slots__ = ('names', 'reveal', 'unknown_fields')
     _toSchema = {'names': 'names', 'reveal': 'reveal'}
     _toPy = {'names': 'names', 'reveal': 'reveal'}
+    _wireTypes = {}
     def __init__(self, names=None, reveal=None, **unknown_fields):
         '''
         names : typing.Sequence[str]
@@ -12989,8 +13851,10 @@ class ListSecretBackendsArgs(Type):
 
 
 class ListSecretBackendsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SecretBackendResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SecretBackendResult]
@@ -13007,8 +13871,10 @@ class ListSecretBackendsResults(Type):
 
 
 class ListSecretResult(Type):
+    __slots__ = ('create_time', 'description', 'label', 'latest_expire_time', 'latest_revision', 'next_rotate_time', 'owner_tag', 'revisions', 'rotate_policy', 'update_time', 'uri', 'value', 'version', 'unknown_fields')
     _toSchema = {'create_time': 'create-time', 'description': 'description', 'label': 'label', 'latest_expire_time': 'latest-expire-time', 'latest_revision': 'latest-revision', 'next_rotate_time': 'next-rotate-time', 'owner_tag': 'owner-tag', 'revisions': 'revisions', 'rotate_policy': 'rotate-policy', 'update_time': 'update-time', 'uri': 'uri', 'value': 'value', 'version': 'version'}
     _toPy = {'create-time': 'create_time', 'description': 'description', 'label': 'label', 'latest-expire-time': 'latest_expire_time', 'latest-revision': 'latest_revision', 'next-rotate-time': 'next_rotate_time', 'owner-tag': 'owner_tag', 'revisions': 'revisions', 'rotate-policy': 'rotate_policy', 'update-time': 'update_time', 'uri': 'uri', 'value': 'value', 'version': 'version'}
+    _wireTypes = {'revisions': ('SecretRevision', 'list'), 'value': ('SecretValueResult', None)}
     def __init__(self, create_time=None, description=None, label=None, latest_expire_time=None, latest_revision=None, next_rotate_time=None, owner_tag=None, revisions=None, rotate_policy=None, update_time=None, uri=None, value=None, version=None, **unknown_fields):
         '''
         create_time : str
@@ -13097,8 +13963,10 @@ class ListSecretResult(Type):
 
 
 class ListSecretResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ListSecretResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ListSecretResult]
@@ -13115,8 +13983,10 @@ class ListSecretResults(Type):
 
 
 class ListSecretsArgs(Type):
+    __slots__ = ('filter_', 'show_secrets', 'unknown_fields')
     _toSchema = {'filter_': 'filter', 'show_secrets': 'show-secrets'}
     _toPy = {'filter': 'filter_', 'show-secrets': 'show_secrets'}
+    _wireTypes = {'filter_': ('SecretsFilter', None)}
     def __init__(self, filter_=None, show_secrets=None, **unknown_fields):
         '''
         filter_ : SecretsFilter
@@ -13139,8 +14009,10 @@ class ListSecretsArgs(Type):
 
 
 class ListSpacesResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('Space', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~Space]
@@ -13157,8 +14029,10 @@ class ListSpacesResults(Type):
 
 
 class ListSubnetsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('Subnet', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~Subnet]
@@ -13175,8 +14049,10 @@ class ListSubnetsResults(Type):
 
 
 class ListUnitResourcesArgs(Type):
+    __slots__ = ('resource_names', 'unknown_fields')
     _toSchema = {'resource_names': 'resource-names'}
     _toPy = {'resource-names': 'resource_names'}
+    _wireTypes = {}
     def __init__(self, resource_names=None, **unknown_fields):
         '''
         resource_names : typing.Sequence[str]
@@ -13193,8 +14069,10 @@ class ListUnitResourcesArgs(Type):
 
 
 class LogForwardingGetLastSentParams(Type):
+    __slots__ = ('ids', 'unknown_fields')
     _toSchema = {'ids': 'ids'}
     _toPy = {'ids': 'ids'}
+    _wireTypes = {'ids': ('LogForwardingID', 'list')}
     def __init__(self, ids=None, **unknown_fields):
         '''
         ids : typing.Sequence[~LogForwardingID]
@@ -13211,8 +14089,10 @@ class LogForwardingGetLastSentParams(Type):
 
 
 class LogForwardingGetLastSentResult(Type):
+    __slots__ = ('err', 'record_id', 'record_timestamp', 'unknown_fields')
     _toSchema = {'err': 'err', 'record_id': 'record-id', 'record_timestamp': 'record-timestamp'}
     _toPy = {'err': 'err', 'record-id': 'record_id', 'record-timestamp': 'record_timestamp'}
+    _wireTypes = {'err': ('Error', None)}
     def __init__(self, err=None, record_id=None, record_timestamp=None, **unknown_fields):
         '''
         err : Error
@@ -13241,8 +14121,10 @@ class LogForwardingGetLastSentResult(Type):
 
 
 class LogForwardingGetLastSentResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('LogForwardingGetLastSentResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~LogForwardingGetLastSentResult]
@@ -13259,8 +14141,10 @@ class LogForwardingGetLastSentResults(Type):
 
 
 class LogForwardingID(Type):
+    __slots__ = ('model', 'sink', 'unknown_fields')
     _toSchema = {'model': 'model', 'sink': 'sink'}
     _toPy = {'model': 'model', 'sink': 'sink'}
+    _wireTypes = {}
     def __init__(self, model=None, sink=None, **unknown_fields):
         '''
         model : str
@@ -13283,8 +14167,10 @@ class LogForwardingID(Type):
 
 
 class LogForwardingSetLastSentParam(Type):
+    __slots__ = ('logforwardingid', 'model', 'record_id', 'record_timestamp', 'sink', 'unknown_fields')
     _toSchema = {'logforwardingid': 'LogForwardingID', 'model': 'model', 'record_id': 'record-id', 'record_timestamp': 'record-timestamp', 'sink': 'sink'}
     _toPy = {'LogForwardingID': 'logforwardingid', 'model': 'model', 'record-id': 'record_id', 'record-timestamp': 'record_timestamp', 'sink': 'sink'}
+    _wireTypes = {'logforwardingid': ('LogForwardingID', None)}
     def __init__(self, logforwardingid=None, model=None, record_id=None, record_timestamp=None, sink=None, **unknown_fields):
         '''
         logforwardingid : LogForwardingID
@@ -13325,8 +14211,10 @@ class LogForwardingSetLastSentParam(Type):
 
 
 class LogForwardingSetLastSentParams(Type):
+    __slots__ = ('params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
+    _wireTypes = {'params': ('LogForwardingSetLastSentParam', 'list')}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~LogForwardingSetLastSentParam]
@@ -13343,8 +14231,10 @@ class LogForwardingSetLastSentParams(Type):
 
 
 class LoginRequest(Type):
+    __slots__ = ('auth_tag', 'bakery_version', 'cli_args', 'client_version', 'credentials', 'macaroons', 'nonce', 'token', 'user_data', 'unknown_fields')
     _toSchema = {'auth_tag': 'auth-tag', 'bakery_version': 'bakery-version', 'cli_args': 'cli-args', 'client_version': 'client-version', 'credentials': 'credentials', 'macaroons': 'macaroons', 'nonce': 'nonce', 'token': 'token', 'user_data': 'user-data'}
     _toPy = {'auth-tag': 'auth_tag', 'bakery-version': 'bakery_version', 'cli-args': 'cli_args', 'client-version': 'client_version', 'credentials': 'credentials', 'macaroons': 'macaroons', 'nonce': 'nonce', 'token': 'token', 'user-data': 'user_data'}
+    _wireTypes = {'macaroons': ('Macaroon', 'list')}
     def __init__(self, auth_tag=None, bakery_version=None, cli_args=None, client_version=None, credentials=None, macaroons=None, nonce=None, token=None, user_data=None, **unknown_fields):
         '''
         auth_tag : str
@@ -13409,8 +14299,10 @@ class LoginRequest(Type):
 
 
 class LoginResult(Type):
+    __slots__ = ('bakery_discharge_required', 'controller_tag', 'discharge_required', 'discharge_required_error', 'facades', 'model_tag', 'public_dns_name', 'server_version', 'servers', 'user_info', 'unknown_fields')
     _toSchema = {'bakery_discharge_required': 'bakery-discharge-required', 'controller_tag': 'controller-tag', 'discharge_required': 'discharge-required', 'discharge_required_error': 'discharge-required-error', 'facades': 'facades', 'model_tag': 'model-tag', 'public_dns_name': 'public-dns-name', 'server_version': 'server-version', 'servers': 'servers', 'user_info': 'user-info'}
     _toPy = {'bakery-discharge-required': 'bakery_discharge_required', 'controller-tag': 'controller_tag', 'discharge-required': 'discharge_required', 'discharge-required-error': 'discharge_required_error', 'facades': 'facades', 'model-tag': 'model_tag', 'public-dns-name': 'public_dns_name', 'server-version': 'server_version', 'servers': 'servers', 'user-info': 'user_info'}
+    _wireTypes = {'bakery_discharge_required': ('Macaroon', None), 'discharge_required': ('Macaroon', None), 'facades': ('FacadeVersions', 'list'), 'servers': ('HostPort', 'list'), 'user_info': ('AuthUserInfo', None)}
     def __init__(self, bakery_discharge_required=None, controller_tag=None, discharge_required=None, discharge_required_error=None, facades=None, model_tag=None, public_dns_name=None, server_version=None, servers=None, user_info=None, **unknown_fields):
         '''
         bakery_discharge_required : Macaroon
@@ -13481,8 +14373,10 @@ class LoginResult(Type):
 
 
 class LookUpPayloadArg(Type):
+    __slots__ = ('id_', 'name', 'unknown_fields')
     _toSchema = {'id_': 'id', 'name': 'name'}
     _toPy = {'id': 'id_', 'name': 'name'}
+    _wireTypes = {}
     def __init__(self, id_=None, name=None, **unknown_fields):
         '''
         id_ : str
@@ -13505,8 +14399,10 @@ class LookUpPayloadArg(Type):
 
 
 class LookUpPayloadArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('LookUpPayloadArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~LookUpPayloadArg]
@@ -13523,8 +14419,10 @@ class LookUpPayloadArgs(Type):
 
 
 class Macaroon(Type):
+    __slots__ = ('unknown_fields',)
     _toSchema = {}
     _toPy = {}
+    _wireTypes = {}
     def __init__(self, **unknown_fields):
         '''
 
@@ -13534,8 +14432,10 @@ class Macaroon(Type):
 
 
 class MacaroonResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('Macaroon', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -13558,8 +14458,10 @@ class MacaroonResult(Type):
 
 
 class MacaroonResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('MacaroonResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MacaroonResult]
@@ -13576,8 +14478,10 @@ class MacaroonResults(Type):
 
 
 class MachineAddresses(Type):
+    __slots__ = ('addresses', 'tag', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'tag': 'tag'}
     _toPy = {'addresses': 'addresses', 'tag': 'tag'}
+    _wireTypes = {'addresses': ('Address', 'list')}
     def __init__(self, addresses=None, tag=None, **unknown_fields):
         '''
         addresses : typing.Sequence[~Address]
@@ -13600,8 +14504,10 @@ class MachineAddresses(Type):
 
 
 class MachineAddressesResult(Type):
+    __slots__ = ('addresses', 'error', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'error': 'error'}
     _toPy = {'addresses': 'addresses', 'error': 'error'}
+    _wireTypes = {'addresses': ('Address', 'list'), 'error': ('Error', None)}
     def __init__(self, addresses=None, error=None, **unknown_fields):
         '''
         addresses : typing.Sequence[~Address]
@@ -13624,8 +14530,10 @@ class MachineAddressesResult(Type):
 
 
 class MachineAddressesResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('MachineAddressesResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MachineAddressesResult]
@@ -13642,8 +14550,10 @@ class MachineAddressesResults(Type):
 
 
 class MachineBlockDevices(Type):
+    __slots__ = ('block_devices', 'machine', 'unknown_fields')
     _toSchema = {'block_devices': 'block-devices', 'machine': 'machine'}
     _toPy = {'block-devices': 'block_devices', 'machine': 'machine'}
+    _wireTypes = {'block_devices': ('BlockDevice', 'list')}
     def __init__(self, block_devices=None, machine=None, **unknown_fields):
         '''
         block_devices : typing.Sequence[~BlockDevice]
@@ -13666,8 +14576,10 @@ class MachineBlockDevices(Type):
 
 
 class MachineContainerResult(Type):
+    __slots__ = ('container_types', 'determined', 'error', 'unknown_fields')
     _toSchema = {'container_types': 'container-types', 'determined': 'determined', 'error': 'error'}
     _toPy = {'container-types': 'container_types', 'determined': 'determined', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, container_types=None, determined=None, error=None, **unknown_fields):
         '''
         container_types : typing.Sequence[str]
@@ -13696,8 +14608,10 @@ class MachineContainerResult(Type):
 
 
 class MachineContainerResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('MachineContainerResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MachineContainerResult]
@@ -13714,8 +14628,10 @@ class MachineContainerResults(Type):
 
 
 class MachineContainers(Type):
+    __slots__ = ('container_types', 'machine_tag', 'unknown_fields')
     _toSchema = {'container_types': 'container-types', 'machine_tag': 'machine-tag'}
     _toPy = {'container-types': 'container_types', 'machine-tag': 'machine_tag'}
+    _wireTypes = {}
     def __init__(self, container_types=None, machine_tag=None, **unknown_fields):
         '''
         container_types : typing.Sequence[str]
@@ -13738,8 +14654,10 @@ class MachineContainers(Type):
 
 
 class MachineContainersParams(Type):
+    __slots__ = ('params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
+    _wireTypes = {'params': ('MachineContainers', 'list')}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~MachineContainers]
@@ -13756,8 +14674,10 @@ class MachineContainersParams(Type):
 
 
 class MachineHardware(Type):
+    __slots__ = ('arch', 'availability_zone', 'cores', 'cpu_power', 'mem', 'root_disk', 'tags', 'virt_type', 'unknown_fields')
     _toSchema = {'arch': 'arch', 'availability_zone': 'availability-zone', 'cores': 'cores', 'cpu_power': 'cpu-power', 'mem': 'mem', 'root_disk': 'root-disk', 'tags': 'tags', 'virt_type': 'virt-type'}
     _toPy = {'arch': 'arch', 'availability-zone': 'availability_zone', 'cores': 'cores', 'cpu-power': 'cpu_power', 'mem': 'mem', 'root-disk': 'root_disk', 'tags': 'tags', 'virt-type': 'virt_type'}
+    _wireTypes = {}
     def __init__(self, arch=None, availability_zone=None, cores=None, cpu_power=None, mem=None, root_disk=None, tags=None, virt_type=None, **unknown_fields):
         '''
         arch : str
@@ -13816,8 +14736,10 @@ class MachineHardware(Type):
 
 
 class MachineNetworkConfigResult(Type):
+    __slots__ = ('error', 'info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
+    _wireTypes = {'error': ('Error', None), 'info': ('NetworkConfig', 'list')}
     def __init__(self, error=None, info=None, **unknown_fields):
         '''
         error : Error
@@ -13840,8 +14762,10 @@ class MachineNetworkConfigResult(Type):
 
 
 class MachineNetworkConfigResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('MachineNetworkConfigResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MachineNetworkConfigResult]
@@ -13858,8 +14782,10 @@ class MachineNetworkConfigResults(Type):
 
 
 class MachineStatus(Type):
+    __slots__ = ('agent_status', 'base', 'constraints', 'containers', 'display_name', 'dns_name', 'hardware', 'has_vote', 'hostname', 'id_', 'instance_id', 'instance_status', 'ip_addresses', 'jobs', 'lxd_profiles', 'modification_status', 'network_interfaces', 'primary_controller_machine', 'wants_vote', 'unknown_fields')
     _toSchema = {'agent_status': 'agent-status', 'base': 'base', 'constraints': 'constraints', 'containers': 'containers', 'display_name': 'display-name', 'dns_name': 'dns-name', 'hardware': 'hardware', 'has_vote': 'has-vote', 'hostname': 'hostname', 'id_': 'id', 'instance_id': 'instance-id', 'instance_status': 'instance-status', 'ip_addresses': 'ip-addresses', 'jobs': 'jobs', 'lxd_profiles': 'lxd-profiles', 'modification_status': 'modification-status', 'network_interfaces': 'network-interfaces', 'primary_controller_machine': 'primary-controller-machine', 'wants_vote': 'wants-vote'}
     _toPy = {'agent-status': 'agent_status', 'base': 'base', 'constraints': 'constraints', 'containers': 'containers', 'display-name': 'display_name', 'dns-name': 'dns_name', 'hardware': 'hardware', 'has-vote': 'has_vote', 'hostname': 'hostname', 'id': 'id_', 'instance-id': 'instance_id', 'instance-status': 'instance_status', 'ip-addresses': 'ip_addresses', 'jobs': 'jobs', 'lxd-profiles': 'lxd_profiles', 'modification-status': 'modification_status', 'network-interfaces': 'network_interfaces', 'primary-controller-machine': 'primary_controller_machine', 'wants-vote': 'wants_vote'}
+    _wireTypes = {'agent_status': ('DetailedStatus', None), 'base': ('Base', None), 'containers': ('MachineStatus', 'dict'), 'instance_status': ('DetailedStatus', None), 'lxd_profiles': ('LXDProfile', 'dict'), 'modification_status': ('DetailedStatus', None), 'network_interfaces': ('NetworkInterface', 'dict')}
     def __init__(self, agent_status=None, base=None, constraints=None, containers=None, display_name=None, dns_name=None, hardware=None, has_vote=None, hostname=None, id_=None, instance_id=None, instance_status=None, ip_addresses=None, jobs=None, lxd_profiles=None, modification_status=None, network_interfaces=None, primary_controller_machine=None, wants_vote=None, **unknown_fields):
         '''
         agent_status : DetailedStatus
@@ -13984,8 +14910,10 @@ class MachineStatus(Type):
 
 
 class MachineStorageId(Type):
+    __slots__ = ('attachment_tag', 'machine_tag', 'unknown_fields')
     _toSchema = {'attachment_tag': 'attachment-tag', 'machine_tag': 'machine-tag'}
     _toPy = {'attachment-tag': 'attachment_tag', 'machine-tag': 'machine_tag'}
+    _wireTypes = {}
     def __init__(self, attachment_tag=None, machine_tag=None, **unknown_fields):
         '''
         attachment_tag : str
@@ -14008,8 +14936,10 @@ class MachineStorageId(Type):
 
 
 class MachineStorageIds(Type):
+    __slots__ = ('ids', 'unknown_fields')
     _toSchema = {'ids': 'ids'}
     _toPy = {'ids': 'ids'}
+    _wireTypes = {'ids': ('MachineStorageId', 'list')}
     def __init__(self, ids=None, **unknown_fields):
         '''
         ids : typing.Sequence[~MachineStorageId]
@@ -14026,8 +14956,10 @@ class MachineStorageIds(Type):
 
 
 class MachineStorageIdsWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'changes': ('MachineStorageId', 'list'), 'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : typing.Sequence[~MachineStorageId]
@@ -14056,8 +14988,10 @@ class MachineStorageIdsWatchResult(Type):
 
 
 class MachineStorageIdsWatchResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('MachineStorageIdsWatchResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MachineStorageIdsWatchResult]
@@ -14074,8 +15008,10 @@ class MachineStorageIdsWatchResults(Type):
 
 
 class MapResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -14098,8 +15034,10 @@ class MapResult(Type):
 
 
 class MapResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('MapResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MapResult]
@@ -14116,8 +15054,10 @@ class MapResults(Type):
 
 
 class MasterMigrationStatus(Type):
+    __slots__ = ('migration_id', 'phase', 'phase_changed_time', 'spec', 'unknown_fields')
     _toSchema = {'migration_id': 'migration-id', 'phase': 'phase', 'phase_changed_time': 'phase-changed-time', 'spec': 'spec'}
     _toPy = {'migration-id': 'migration_id', 'phase': 'phase', 'phase-changed-time': 'phase_changed_time', 'spec': 'spec'}
+    _wireTypes = {'spec': ('MigrationSpec', None)}
     def __init__(self, migration_id=None, phase=None, phase_changed_time=None, spec=None, **unknown_fields):
         '''
         migration_id : str
@@ -14152,8 +15092,10 @@ class MasterMigrationStatus(Type):
 
 
 class MergeLeadershipSettingsBulkParams(Type):
+    __slots__ = ('params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
+    _wireTypes = {'params': ('MergeLeadershipSettingsParam', 'list')}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~MergeLeadershipSettingsParam]
@@ -14170,8 +15112,10 @@ class MergeLeadershipSettingsBulkParams(Type):
 
 
 class MergeLeadershipSettingsParam(Type):
+    __slots__ = ('application_tag', 'settings', 'unit_tag', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'settings': 'settings', 'unit_tag': 'unit-tag'}
     _toPy = {'application-tag': 'application_tag', 'settings': 'settings', 'unit-tag': 'unit_tag'}
+    _wireTypes = {}
     def __init__(self, application_tag=None, settings=None, unit_tag=None, **unknown_fields):
         '''
         application_tag : str
@@ -14200,8 +15144,10 @@ class MergeLeadershipSettingsParam(Type):
 
 
 class MetadataImageIds(Type):
+    __slots__ = ('image_ids', 'unknown_fields')
     _toSchema = {'image_ids': 'image-ids'}
     _toPy = {'image-ids': 'image_ids'}
+    _wireTypes = {}
     def __init__(self, image_ids=None, **unknown_fields):
         '''
         image_ids : typing.Sequence[str]
@@ -14218,8 +15164,10 @@ class MetadataImageIds(Type):
 
 
 class MetadataSaveParams(Type):
+    __slots__ = ('metadata', 'unknown_fields')
     _toSchema = {'metadata': 'metadata'}
     _toPy = {'metadata': 'metadata'}
+    _wireTypes = {'metadata': ('CloudImageMetadataList', 'list')}
     def __init__(self, metadata=None, **unknown_fields):
         '''
         metadata : typing.Sequence[~CloudImageMetadataList]
@@ -14236,8 +15184,10 @@ class MetadataSaveParams(Type):
 
 
 class MeterStatus(Type):
+    __slots__ = ('color', 'message', 'unknown_fields')
     _toSchema = {'color': 'color', 'message': 'message'}
     _toPy = {'color': 'color', 'message': 'message'}
+    _wireTypes = {}
     def __init__(self, color=None, message=None, **unknown_fields):
         '''
         color : str
@@ -14260,8 +15210,10 @@ class MeterStatus(Type):
 
 
 class MeterStatusParam(Type):
+    __slots__ = ('code', 'info', 'tag', 'unknown_fields')
     _toSchema = {'code': 'code', 'info': 'info', 'tag': 'tag'}
     _toPy = {'code': 'code', 'info': 'info', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, code=None, info=None, tag=None, **unknown_fields):
         '''
         code : str
@@ -14290,8 +15242,10 @@ class MeterStatusParam(Type):
 
 
 class MeterStatusParams(Type):
+    __slots__ = ('statues', 'unknown_fields')
     _toSchema = {'statues': 'statues'}
     _toPy = {'statues': 'statues'}
+    _wireTypes = {'statues': ('MeterStatusParam', 'list')}
     def __init__(self, statues=None, **unknown_fields):
         '''
         statues : typing.Sequence[~MeterStatusParam]
@@ -14308,8 +15262,10 @@ class MeterStatusParams(Type):
 
 
 class MeterStatusResult(Type):
+    __slots__ = ('code', 'error', 'info', 'unknown_fields')
     _toSchema = {'code': 'code', 'error': 'error', 'info': 'info'}
     _toPy = {'code': 'code', 'error': 'error', 'info': 'info'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, code=None, error=None, info=None, **unknown_fields):
         '''
         code : str
@@ -14338,8 +15294,10 @@ class MeterStatusResult(Type):
 
 
 class MeterStatusResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('MeterStatusResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MeterStatusResult]
@@ -14356,8 +15314,10 @@ class MeterStatusResults(Type):
 
 
 class Metric(Type):
+    __slots__ = ('key', 'labels', 'time', 'value', 'unknown_fields')
     _toSchema = {'key': 'key', 'labels': 'labels', 'time': 'time', 'value': 'value'}
     _toPy = {'key': 'key', 'labels': 'labels', 'time': 'time', 'value': 'value'}
+    _wireTypes = {}
     def __init__(self, key=None, labels=None, time=None, value=None, **unknown_fields):
         '''
         key : str
@@ -14392,8 +15352,10 @@ class Metric(Type):
 
 
 class MetricBatch(Type):
+    __slots__ = ('charm_url', 'created', 'metrics', 'uuid', 'unknown_fields')
     _toSchema = {'charm_url': 'charm-url', 'created': 'created', 'metrics': 'metrics', 'uuid': 'uuid'}
     _toPy = {'charm-url': 'charm_url', 'created': 'created', 'metrics': 'metrics', 'uuid': 'uuid'}
+    _wireTypes = {'metrics': ('Metric', 'list')}
     def __init__(self, charm_url=None, created=None, metrics=None, uuid=None, **unknown_fields):
         '''
         charm_url : str
@@ -14428,8 +15390,10 @@ class MetricBatch(Type):
 
 
 class MetricBatchParam(Type):
+    __slots__ = ('batch', 'tag', 'unknown_fields')
     _toSchema = {'batch': 'batch', 'tag': 'tag'}
     _toPy = {'batch': 'batch', 'tag': 'tag'}
+    _wireTypes = {'batch': ('MetricBatch', None)}
     def __init__(self, batch=None, tag=None, **unknown_fields):
         '''
         batch : MetricBatch
@@ -14452,8 +15416,10 @@ class MetricBatchParam(Type):
 
 
 class MetricBatchParams(Type):
+    __slots__ = ('batches', 'unknown_fields')
     _toSchema = {'batches': 'batches'}
     _toPy = {'batches': 'batches'}
+    _wireTypes = {'batches': ('MetricBatchParam', 'list')}
     def __init__(self, batches=None, **unknown_fields):
         '''
         batches : typing.Sequence[~MetricBatchParam]
@@ -14470,8 +15436,10 @@ class MetricBatchParams(Type):
 
 
 class MetricResult(Type):
+    __slots__ = ('key', 'labels', 'time', 'unit', 'value', 'unknown_fields')
     _toSchema = {'key': 'key', 'labels': 'labels', 'time': 'time', 'unit': 'unit', 'value': 'value'}
     _toPy = {'key': 'key', 'labels': 'labels', 'time': 'time', 'unit': 'unit', 'value': 'value'}
+    _wireTypes = {}
     def __init__(self, key=None, labels=None, time=None, unit=None, value=None, **unknown_fields):
         '''
         key : str
@@ -14512,8 +15480,10 @@ class MetricResult(Type):
 
 
 class MetricResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('EntityMetrics', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~EntityMetrics]
@@ -14530,8 +15500,10 @@ class MetricResults(Type):
 
 
 class MigrationModelInfo(Type):
+    __slots__ = ('agent_version', 'controller_agent_version', 'name', 'owner_tag', 'uuid', 'unknown_fields')
     _toSchema = {'agent_version': 'agent-version', 'controller_agent_version': 'controller-agent-version', 'name': 'name', 'owner_tag': 'owner-tag', 'uuid': 'uuid'}
     _toPy = {'agent-version': 'agent_version', 'controller-agent-version': 'controller_agent_version', 'name': 'name', 'owner-tag': 'owner_tag', 'uuid': 'uuid'}
+    _wireTypes = {'agent_version': ('Number', None), 'controller_agent_version': ('Number', None)}
     def __init__(self, agent_version=None, controller_agent_version=None, name=None, owner_tag=None, uuid=None, **unknown_fields):
         '''
         agent_version : Number
@@ -14572,8 +15544,10 @@ class MigrationModelInfo(Type):
 
 
 class MigrationSourceInfo(Type):
+    __slots__ = ('addrs', 'ca_cert', 'controller_alias', 'controller_tag', 'local_related_models', 'unknown_fields')
     _toSchema = {'addrs': 'addrs', 'ca_cert': 'ca-cert', 'controller_alias': 'controller-alias', 'controller_tag': 'controller-tag', 'local_related_models': 'local-related-models'}
     _toPy = {'addrs': 'addrs', 'ca-cert': 'ca_cert', 'controller-alias': 'controller_alias', 'controller-tag': 'controller_tag', 'local-related-models': 'local_related_models'}
+    _wireTypes = {}
     def __init__(self, addrs=None, ca_cert=None, controller_alias=None, controller_tag=None, local_related_models=None, **unknown_fields):
         '''
         addrs : typing.Sequence[str]
@@ -14614,8 +15588,10 @@ class MigrationSourceInfo(Type):
 
 
 class MigrationSpec(Type):
+    __slots__ = ('model_tag', 'target_info', 'unknown_fields')
     _toSchema = {'model_tag': 'model-tag', 'target_info': 'target-info'}
     _toPy = {'model-tag': 'model_tag', 'target-info': 'target_info'}
+    _wireTypes = {'target_info': ('MigrationTargetInfo', None)}
     def __init__(self, model_tag=None, target_info=None, **unknown_fields):
         '''
         model_tag : str
@@ -14638,8 +15614,10 @@ class MigrationSpec(Type):
 
 
 class MigrationStatus(Type):
+    __slots__ = ('attempt', 'migration_id', 'phase', 'source_api_addrs', 'source_ca_cert', 'target_api_addrs', 'target_ca_cert', 'unknown_fields')
     _toSchema = {'attempt': 'attempt', 'migration_id': 'migration-id', 'phase': 'phase', 'source_api_addrs': 'source-api-addrs', 'source_ca_cert': 'source-ca-cert', 'target_api_addrs': 'target-api-addrs', 'target_ca_cert': 'target-ca-cert'}
     _toPy = {'attempt': 'attempt', 'migration-id': 'migration_id', 'phase': 'phase', 'source-api-addrs': 'source_api_addrs', 'source-ca-cert': 'source_ca_cert', 'target-api-addrs': 'target_api_addrs', 'target-ca-cert': 'target_ca_cert'}
+    _wireTypes = {}
     def __init__(self, attempt=None, migration_id=None, phase=None, source_api_addrs=None, source_ca_cert=None, target_api_addrs=None, target_ca_cert=None, **unknown_fields):
         '''
         attempt : int
@@ -14692,8 +15670,10 @@ class MigrationStatus(Type):
 
 
 class MigrationTargetInfo(Type):
+    __slots__ = ('addrs', 'auth_tag', 'ca_cert', 'controller_alias', 'controller_tag', 'macaroons', 'password', 'unknown_fields')
     _toSchema = {'addrs': 'addrs', 'auth_tag': 'auth-tag', 'ca_cert': 'ca-cert', 'controller_alias': 'controller-alias', 'controller_tag': 'controller-tag', 'macaroons': 'macaroons', 'password': 'password'}
     _toPy = {'addrs': 'addrs', 'auth-tag': 'auth_tag', 'ca-cert': 'ca_cert', 'controller-alias': 'controller_alias', 'controller-tag': 'controller_tag', 'macaroons': 'macaroons', 'password': 'password'}
+    _wireTypes = {}
     def __init__(self, addrs=None, auth_tag=None, ca_cert=None, controller_alias=None, controller_tag=None, macaroons=None, password=None, **unknown_fields):
         '''
         addrs : typing.Sequence[str]
@@ -14746,8 +15726,10 @@ class MigrationTargetInfo(Type):
 
 
 class MinionReport(Type):
+    __slots__ = ('migration_id', 'phase', 'success', 'unknown_fields')
     _toSchema = {'migration_id': 'migration-id', 'phase': 'phase', 'success': 'success'}
     _toPy = {'migration-id': 'migration_id', 'phase': 'phase', 'success': 'success'}
+    _wireTypes = {}
     def __init__(self, migration_id=None, phase=None, success=None, **unknown_fields):
         '''
         migration_id : str
@@ -14776,8 +15758,10 @@ class MinionReport(Type):
 
 
 class MinionReports(Type):
+    __slots__ = ('failed', 'migration_id', 'phase', 'success_count', 'unknown_count', 'unknown_sample', 'unknown_fields')
     _toSchema = {'failed': 'failed', 'migration_id': 'migration-id', 'phase': 'phase', 'success_count': 'success-count', 'unknown_count': 'unknown-count', 'unknown_sample': 'unknown-sample'}
     _toPy = {'failed': 'failed', 'migration-id': 'migration_id', 'phase': 'phase', 'success-count': 'success_count', 'unknown-count': 'unknown_count', 'unknown-sample': 'unknown_sample'}
+    _wireTypes = {}
     def __init__(self, failed=None, migration_id=None, phase=None, success_count=None, unknown_count=None, unknown_sample=None, **unknown_fields):
         '''
         failed : typing.Sequence[str]
@@ -14824,8 +15808,10 @@ class MinionReports(Type):
 
 
 class Model(Type):
+    __slots__ = ('name', 'owner_tag', 'type_', 'uuid', 'unknown_fields')
     _toSchema = {'name': 'name', 'owner_tag': 'owner-tag', 'type_': 'type', 'uuid': 'uuid'}
     _toPy = {'name': 'name', 'owner-tag': 'owner_tag', 'type': 'type_', 'uuid': 'uuid'}
+    _wireTypes = {}
     def __init__(self, name=None, owner_tag=None, type_=None, uuid=None, **unknown_fields):
         '''
         name : str
@@ -14860,8 +15846,10 @@ class Model(Type):
 
 
 class ModelAbstract(Type):
+    __slots__ = ('admins', 'annotations', 'cloud', 'controller', 'credential', 'messages', 'name', 'region', 'removed', 'size', 'status', 'uuid', 'unknown_fields')
     _toSchema = {'admins': 'admins', 'annotations': 'annotations', 'cloud': 'cloud', 'controller': 'controller', 'credential': 'credential', 'messages': 'messages', 'name': 'name', 'region': 'region', 'removed': 'removed', 'size': 'size', 'status': 'status', 'uuid': 'uuid'}
     _toPy = {'admins': 'admins', 'annotations': 'annotations', 'cloud': 'cloud', 'controller': 'controller', 'credential': 'credential', 'messages': 'messages', 'name': 'name', 'region': 'region', 'removed': 'removed', 'size': 'size', 'status': 'status', 'uuid': 'uuid'}
+    _wireTypes = {'messages': ('ModelSummaryMessage', 'list'), 'size': ('ModelSummarySize', None)}
     def __init__(self, admins=None, annotations=None, cloud=None, controller=None, credential=None, messages=None, name=None, region=None, removed=None, size=None, status=None, uuid=None, **unknown_fields):
         '''
         admins : typing.Sequence[str]
@@ -14944,8 +15932,10 @@ class ModelAbstract(Type):
 
 
 class ModelAccess(Type):
+    __slots__ = ('access', 'model', 'unknown_fields')
     _toSchema = {'access': 'access', 'model': 'model'}
     _toPy = {'access': 'access', 'model': 'model'}
+    _wireTypes = {}
     def __init__(self, access=None, model=None, **unknown_fields):
         '''
         access : str
@@ -14968,8 +15958,10 @@ class ModelAccess(Type):
 
 
 class ModelApplicationInfo(Type):
+    __slots__ = ('name', 'unknown_fields')
     _toSchema = {'name': 'name'}
     _toPy = {'name': 'name'}
+    _wireTypes = {}
     def __init__(self, name=None, **unknown_fields):
         '''
         name : str
@@ -14986,8 +15978,10 @@ class ModelApplicationInfo(Type):
 
 
 class ModelArgs(Type):
+    __slots__ = ('model_tag', 'unknown_fields')
     _toSchema = {'model_tag': 'model-tag'}
     _toPy = {'model-tag': 'model_tag'}
+    _wireTypes = {}
     def __init__(self, model_tag=None, **unknown_fields):
         '''
         model_tag : str
@@ -15004,8 +15998,10 @@ class ModelArgs(Type):
 
 
 class ModelBlockInfo(Type):
+    __slots__ = ('blocks', 'model_uuid', 'name', 'owner_tag', 'unknown_fields')
     _toSchema = {'blocks': 'blocks', 'model_uuid': 'model-uuid', 'name': 'name', 'owner_tag': 'owner-tag'}
     _toPy = {'blocks': 'blocks', 'model-uuid': 'model_uuid', 'name': 'name', 'owner-tag': 'owner_tag'}
+    _wireTypes = {}
     def __init__(self, blocks=None, model_uuid=None, name=None, owner_tag=None, **unknown_fields):
         '''
         blocks : typing.Sequence[str]
@@ -15040,8 +16036,10 @@ class ModelBlockInfo(Type):
 
 
 class ModelBlockInfoList(Type):
+    __slots__ = ('models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
+    _wireTypes = {'models': ('ModelBlockInfo', 'list')}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~ModelBlockInfo]
@@ -15058,8 +16056,10 @@ class ModelBlockInfoList(Type):
 
 
 class ModelConfigResult(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
+    _wireTypes = {}
     def __init__(self, config=None, **unknown_fields):
         '''
         config : typing.Mapping[str, typing.Any]
@@ -15076,8 +16076,10 @@ class ModelConfigResult(Type):
 
 
 class ModelConfigResults(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
+    _wireTypes = {'config': ('ConfigValue', 'dict')}
     def __init__(self, config=None, **unknown_fields):
         '''
         config : typing.Mapping[str, ~ConfigValue]
@@ -15094,8 +16096,10 @@ class ModelConfigResults(Type):
 
 
 class ModelCreateArgs(Type):
+    __slots__ = ('cloud_tag', 'config', 'credential', 'name', 'owner_tag', 'region', 'unknown_fields')
     _toSchema = {'cloud_tag': 'cloud-tag', 'config': 'config', 'credential': 'credential', 'name': 'name', 'owner_tag': 'owner-tag', 'region': 'region'}
     _toPy = {'cloud-tag': 'cloud_tag', 'config': 'config', 'credential': 'credential', 'name': 'name', 'owner-tag': 'owner_tag', 'region': 'region'}
+    _wireTypes = {}
     def __init__(self, cloud_tag=None, config=None, credential=None, name=None, owner_tag=None, region=None, **unknown_fields):
         '''
         cloud_tag : str
@@ -15142,8 +16146,10 @@ class ModelCreateArgs(Type):
 
 
 class ModelCredential(Type):
+    __slots__ = ('credential_tag', 'exists', 'model_tag', 'valid', 'unknown_fields')
     _toSchema = {'credential_tag': 'credential-tag', 'exists': 'exists', 'model_tag': 'model-tag', 'valid': 'valid'}
     _toPy = {'credential-tag': 'credential_tag', 'exists': 'exists', 'model-tag': 'model_tag', 'valid': 'valid'}
+    _wireTypes = {}
     def __init__(self, credential_tag=None, exists=None, model_tag=None, valid=None, **unknown_fields):
         '''
         credential_tag : str
@@ -15178,8 +16184,10 @@ class ModelCredential(Type):
 
 
 class ModelDefaultValues(Type):
+    __slots__ = ('cloud_region', 'cloud_tag', 'config', 'unknown_fields')
     _toSchema = {'cloud_region': 'cloud-region', 'cloud_tag': 'cloud-tag', 'config': 'config'}
     _toPy = {'cloud-region': 'cloud_region', 'cloud-tag': 'cloud_tag', 'config': 'config'}
+    _wireTypes = {}
     def __init__(self, cloud_region=None, cloud_tag=None, config=None, **unknown_fields):
         '''
         cloud_region : str
@@ -15208,8 +16216,10 @@ class ModelDefaultValues(Type):
 
 
 class ModelDefaults(Type):
+    __slots__ = ('controller', 'default', 'regions', 'unknown_fields')
     _toSchema = {'controller': 'controller', 'default': 'default', 'regions': 'regions'}
     _toPy = {'controller': 'controller', 'default': 'default', 'regions': 'regions'}
+    _wireTypes = {'regions': ('RegionDefaults', 'list')}
     def __init__(self, controller=None, default=None, regions=None, **unknown_fields):
         '''
         controller : Any
@@ -15232,8 +16242,10 @@ class ModelDefaults(Type):
 
 
 class ModelDefaultsResult(Type):
+    __slots__ = ('config', 'error', 'unknown_fields')
     _toSchema = {'config': 'config', 'error': 'error'}
     _toPy = {'config': 'config', 'error': 'error'}
+    _wireTypes = {'config': ('ModelDefaults', 'dict'), 'error': ('Error', None)}
     def __init__(self, config=None, error=None, **unknown_fields):
         '''
         config : typing.Mapping[str, ~ModelDefaults]
@@ -15256,8 +16268,10 @@ class ModelDefaultsResult(Type):
 
 
 class ModelDefaultsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ModelDefaultsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ModelDefaultsResult]
@@ -15274,8 +16288,10 @@ class ModelDefaultsResults(Type):
 
 
 class ModelEntityCount(Type):
+    __slots__ = ('count', 'entity', 'unknown_fields')
     _toSchema = {'count': 'count', 'entity': 'entity'}
     _toPy = {'count': 'count', 'entity': 'entity'}
+    _wireTypes = {}
     def __init__(self, count=None, entity=None, **unknown_fields):
         '''
         count : int
@@ -15298,8 +16314,10 @@ class ModelEntityCount(Type):
 
 
 class ModelFilesystemInfo(Type):
+    __slots__ = ('detachable', 'id_', 'message', 'provider_id', 'status', 'unknown_fields')
     _toSchema = {'detachable': 'detachable', 'id_': 'id', 'message': 'message', 'provider_id': 'provider-id', 'status': 'status'}
     _toPy = {'detachable': 'detachable', 'id': 'id_', 'message': 'message', 'provider-id': 'provider_id', 'status': 'status'}
+    _wireTypes = {}
     def __init__(self, detachable=None, id_=None, message=None, provider_id=None, status=None, **unknown_fields):
         '''
         detachable : bool
@@ -15340,8 +16358,10 @@ class ModelFilesystemInfo(Type):
 
 
 class ModelInfo(Type):
+    __slots__ = ('agent_version', 'cloud_credential_tag', 'cloud_credential_validity', 'cloud_region', 'cloud_tag', 'controller_uuid', 'default_base', 'default_series', 'is_controller', 'life', 'machines', 'migration', 'name', 'owner_tag', 'provider_type', 'secret_backends', 'sla', 'status', 'supported_features', 'type_', 'users', 'uuid', 'unknown_fields')
     _toSchema = {'agent_version': 'agent-version', 'cloud_credential_tag': 'cloud-credential-tag', 'cloud_credential_validity': 'cloud-credential-validity', 'cloud_region': 'cloud-region', 'cloud_tag': 'cloud-tag', 'controller_uuid': 'controller-uuid', 'default_base': 'default-base', 'default_series': 'default-series', 'is_controller': 'is-controller', 'life': 'life', 'machines': 'machines', 'migration': 'migration', 'name': 'name', 'owner_tag': 'owner-tag', 'provider_type': 'provider-type', 'secret_backends': 'secret-backends', 'sla': 'sla', 'status': 'status', 'supported_features': 'supported-features', 'type_': 'type', 'users': 'users', 'uuid': 'uuid'}
     _toPy = {'agent-version': 'agent_version', 'cloud-credential-tag': 'cloud_credential_tag', 'cloud-credential-validity': 'cloud_credential_validity', 'cloud-region': 'cloud_region', 'cloud-tag': 'cloud_tag', 'controller-uuid': 'controller_uuid', 'default-base': 'default_base', 'default-series': 'default_series', 'is-controller': 'is_controller', 'life': 'life', 'machines': 'machines', 'migration': 'migration', 'name': 'name', 'owner-tag': 'owner_tag', 'provider-type': 'provider_type', 'secret-backends': 'secret_backends', 'sla': 'sla', 'status': 'status', 'supported-features': 'supported_features', 'type': 'type_', 'users': 'users', 'uuid': 'uuid'}
+    _wireTypes = {'agent_version': ('Number', None), 'machines': ('ModelMachineInfo', 'list'), 'migration': ('ModelMigrationStatus', None), 'secret_backends': ('SecretBackendResult', 'list'), 'sla': ('ModelSLAInfo', None), 'status': ('EntityStatus', None), 'supported_features': ('SupportedFeature', 'list'), 'users': ('ModelUserInfo', 'list')}
     def __init__(self, agent_version=None, cloud_credential_tag=None, cloud_credential_validity=None, cloud_region=None, cloud_tag=None, controller_uuid=None, default_base=None, default_series=None, is_controller=None, life=None, machines=None, migration=None, name=None, owner_tag=None, provider_type=None, secret_backends=None, sla=None, status=None, supported_features=None, type_=None, users=None, uuid=None, **unknown_fields):
         '''
         agent_version : Number
@@ -15484,8 +16504,10 @@ class ModelInfo(Type):
 
 
 class ModelInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ModelInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -15508,8 +16530,10 @@ class ModelInfoResult(Type):
 
 
 class ModelInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ModelInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ModelInfoResult]
@@ -15526,8 +16550,10 @@ class ModelInfoResults(Type):
 
 
 class ModelInstanceTypesConstraint(Type):
+    __slots__ = ('value', 'unknown_fields')
     _toSchema = {'value': 'value'}
     _toPy = {'value': 'value'}
+    _wireTypes = {'value': ('Value', None)}
     def __init__(self, value=None, **unknown_fields):
         '''
         value : Value
@@ -15544,8 +16570,10 @@ class ModelInstanceTypesConstraint(Type):
 
 
 class ModelInstanceTypesConstraints(Type):
+    __slots__ = ('constraints', 'unknown_fields')
     _toSchema = {'constraints': 'constraints'}
     _toPy = {'constraints': 'constraints'}
+    _wireTypes = {'constraints': ('ModelInstanceTypesConstraint', 'list')}
     def __init__(self, constraints=None, **unknown_fields):
         '''
         constraints : typing.Sequence[~ModelInstanceTypesConstraint]
@@ -15562,8 +16590,10 @@ class ModelInstanceTypesConstraints(Type):
 
 
 class ModelMachineInfo(Type):
+    __slots__ = ('display_name', 'ha_primary', 'hardware', 'has_vote', 'id_', 'instance_id', 'message', 'status', 'wants_vote', 'unknown_fields')
     _toSchema = {'display_name': 'display-name', 'ha_primary': 'ha-primary', 'hardware': 'hardware', 'has_vote': 'has-vote', 'id_': 'id', 'instance_id': 'instance-id', 'message': 'message', 'status': 'status', 'wants_vote': 'wants-vote'}
     _toPy = {'display-name': 'display_name', 'ha-primary': 'ha_primary', 'hardware': 'hardware', 'has-vote': 'has_vote', 'id': 'id_', 'instance-id': 'instance_id', 'message': 'message', 'status': 'status', 'wants-vote': 'wants_vote'}
+    _wireTypes = {'hardware': ('MachineHardware', None)}
     def __init__(self, display_name=None, ha_primary=None, hardware=None, has_vote=None, id_=None, instance_id=None, message=None, status=None, wants_vote=None, **unknown_fields):
         '''
         display_name : str
@@ -15628,8 +16658,10 @@ class ModelMachineInfo(Type):
 
 
 class ModelMigrationStatus(Type):
+    __slots__ = ('end', 'start', 'status', 'unknown_fields')
     _toSchema = {'end': 'end', 'start': 'start', 'status': 'status'}
     _toPy = {'end': 'end', 'start': 'start', 'status': 'status'}
+    _wireTypes = {}
     def __init__(self, end=None, start=None, status=None, **unknown_fields):
         '''
         end : str
@@ -15658,8 +16690,10 @@ class ModelMigrationStatus(Type):
 
 
 class ModelOperatorInfo(Type):
+    __slots__ = ('api_addresses', 'image_details', 'version', 'unknown_fields')
     _toSchema = {'api_addresses': 'api-addresses', 'image_details': 'image-details', 'version': 'version'}
     _toPy = {'api-addresses': 'api_addresses', 'image-details': 'image_details', 'version': 'version'}
+    _wireTypes = {'image_details': ('DockerImageInfo', None), 'version': ('Number', None)}
     def __init__(self, api_addresses=None, image_details=None, version=None, **unknown_fields):
         '''
         api_addresses : typing.Sequence[str]
@@ -15688,8 +16722,10 @@ class ModelOperatorInfo(Type):
 
 
 class ModelParam(Type):
+    __slots__ = ('model_tag', 'unknown_fields')
     _toSchema = {'model_tag': 'model-tag'}
     _toPy = {'model-tag': 'model_tag'}
+    _wireTypes = {}
     def __init__(self, model_tag=None, **unknown_fields):
         '''
         model_tag : str
@@ -15706,8 +16742,10 @@ class ModelParam(Type):
 
 
 class ModelResult(Type):
+    __slots__ = ('error', 'name', 'type_', 'uuid', 'unknown_fields')
     _toSchema = {'error': 'error', 'name': 'name', 'type_': 'type', 'uuid': 'uuid'}
     _toPy = {'error': 'error', 'name': 'name', 'type': 'type_', 'uuid': 'uuid'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, name=None, type_=None, uuid=None, **unknown_fields):
         '''
         error : Error
@@ -15742,8 +16780,10 @@ class ModelResult(Type):
 
 
 class ModelSLA(Type):
+    __slots__ = ('modelslainfo', 'creds', 'level', 'owner', 'unknown_fields')
     _toSchema = {'creds': 'creds', 'level': 'level', 'modelslainfo': 'ModelSLAInfo', 'owner': 'owner'}
     _toPy = {'ModelSLAInfo': 'modelslainfo', 'creds': 'creds', 'level': 'level', 'owner': 'owner'}
+    _wireTypes = {'modelslainfo': ('ModelSLAInfo', None)}
     def __init__(self, modelslainfo=None, creds=None, level=None, owner=None, **unknown_fields):
         '''
         modelslainfo : ModelSLAInfo
@@ -15778,8 +16818,10 @@ class ModelSLA(Type):
 
 
 class ModelSLAInfo(Type):
+    __slots__ = ('level', 'owner', 'unknown_fields')
     _toSchema = {'level': 'level', 'owner': 'owner'}
     _toPy = {'level': 'level', 'owner': 'owner'}
+    _wireTypes = {}
     def __init__(self, level=None, owner=None, **unknown_fields):
         '''
         level : str
@@ -15802,8 +16844,10 @@ class ModelSLAInfo(Type):
 
 
 class ModelSequencesResult(Type):
+    __slots__ = ('sequences', 'unknown_fields')
     _toSchema = {'sequences': 'sequences'}
     _toPy = {'sequences': 'sequences'}
+    _wireTypes = {}
     def __init__(self, sequences=None, **unknown_fields):
         '''
         sequences : typing.Mapping[str, int]
@@ -15820,8 +16864,10 @@ class ModelSequencesResult(Type):
 
 
 class ModelSet(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
+    _wireTypes = {}
     def __init__(self, config=None, **unknown_fields):
         '''
         config : typing.Mapping[str, typing.Any]
@@ -15838,8 +16884,10 @@ class ModelSet(Type):
 
 
 class ModelStatus(Type):
+    __slots__ = ('application_count', 'applications', 'error', 'filesystems', 'hosted_machine_count', 'life', 'machines', 'model_tag', 'owner_tag', 'type_', 'unit_count', 'volumes', 'unknown_fields')
     _toSchema = {'application_count': 'application-count', 'applications': 'applications', 'error': 'error', 'filesystems': 'filesystems', 'hosted_machine_count': 'hosted-machine-count', 'life': 'life', 'machines': 'machines', 'model_tag': 'model-tag', 'owner_tag': 'owner-tag', 'type_': 'type', 'unit_count': 'unit-count', 'volumes': 'volumes'}
     _toPy = {'application-count': 'application_count', 'applications': 'applications', 'error': 'error', 'filesystems': 'filesystems', 'hosted-machine-count': 'hosted_machine_count', 'life': 'life', 'machines': 'machines', 'model-tag': 'model_tag', 'owner-tag': 'owner_tag', 'type': 'type_', 'unit-count': 'unit_count', 'volumes': 'volumes'}
+    _wireTypes = {'applications': ('ModelApplicationInfo', 'list'), 'error': ('Error', None), 'filesystems': ('ModelFilesystemInfo', 'list'), 'machines': ('ModelMachineInfo', 'list'), 'volumes': ('ModelVolumeInfo', 'list')}
     def __init__(self, application_count=None, applications=None, error=None, filesystems=None, hosted_machine_count=None, life=None, machines=None, model_tag=None, owner_tag=None, type_=None, unit_count=None, volumes=None, **unknown_fields):
         '''
         application_count : int
@@ -15922,8 +16970,10 @@ class ModelStatus(Type):
 
 
 class ModelStatusInfo(Type):
+    __slots__ = ('available_version', 'cloud_tag', 'meter_status', 'model_status', 'name', 'region', 'sla', 'type_', 'version', 'unknown_fields')
     _toSchema = {'available_version': 'available-version', 'cloud_tag': 'cloud-tag', 'meter_status': 'meter-status', 'model_status': 'model-status', 'name': 'name', 'region': 'region', 'sla': 'sla', 'type_': 'type', 'version': 'version'}
     _toPy = {'available-version': 'available_version', 'cloud-tag': 'cloud_tag', 'meter-status': 'meter_status', 'model-status': 'model_status', 'name': 'name', 'region': 'region', 'sla': 'sla', 'type': 'type_', 'version': 'version'}
+    _wireTypes = {'meter_status': ('MeterStatus', None), 'model_status': ('DetailedStatus', None)}
     def __init__(self, available_version=None, cloud_tag=None, meter_status=None, model_status=None, name=None, region=None, sla=None, type_=None, version=None, **unknown_fields):
         '''
         available_version : str
@@ -15988,8 +17038,10 @@ class ModelStatusInfo(Type):
 
 
 class ModelStatusResults(Type):
+    __slots__ = ('models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
+    _wireTypes = {'models': ('ModelStatus', 'list')}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~ModelStatus]
@@ -16006,8 +17058,10 @@ class ModelStatusResults(Type):
 
 
 class ModelSummariesRequest(Type):
+    __slots__ = ('all_', 'user_tag', 'unknown_fields')
     _toSchema = {'all_': 'all', 'user_tag': 'user-tag'}
     _toPy = {'all': 'all_', 'user-tag': 'user_tag'}
+    _wireTypes = {}
     def __init__(self, all_=None, user_tag=None, **unknown_fields):
         '''
         all_ : bool
@@ -16030,8 +17084,10 @@ class ModelSummariesRequest(Type):
 
 
 class ModelSummary(Type):
+    __slots__ = ('agent_version', 'cloud_credential_tag', 'cloud_region', 'cloud_tag', 'controller_uuid', 'counts', 'default_series', 'is_controller', 'last_connection', 'life', 'migration', 'name', 'owner_tag', 'provider_type', 'sla', 'status', 'type_', 'user_access', 'uuid', 'unknown_fields')
     _toSchema = {'agent_version': 'agent-version', 'cloud_credential_tag': 'cloud-credential-tag', 'cloud_region': 'cloud-region', 'cloud_tag': 'cloud-tag', 'controller_uuid': 'controller-uuid', 'counts': 'counts', 'default_series': 'default-series', 'is_controller': 'is-controller', 'last_connection': 'last-connection', 'life': 'life', 'migration': 'migration', 'name': 'name', 'owner_tag': 'owner-tag', 'provider_type': 'provider-type', 'sla': 'sla', 'status': 'status', 'type_': 'type', 'user_access': 'user-access', 'uuid': 'uuid'}
     _toPy = {'agent-version': 'agent_version', 'cloud-credential-tag': 'cloud_credential_tag', 'cloud-region': 'cloud_region', 'cloud-tag': 'cloud_tag', 'controller-uuid': 'controller_uuid', 'counts': 'counts', 'default-series': 'default_series', 'is-controller': 'is_controller', 'last-connection': 'last_connection', 'life': 'life', 'migration': 'migration', 'name': 'name', 'owner-tag': 'owner_tag', 'provider-type': 'provider_type', 'sla': 'sla', 'status': 'status', 'type': 'type_', 'user-access': 'user_access', 'uuid': 'uuid'}
+    _wireTypes = {'agent_version': ('Number', None), 'counts': ('ModelEntityCount', 'list'), 'migration': ('ModelMigrationStatus', None), 'sla': ('ModelSLAInfo', None), 'status': ('EntityStatus', None)}
     def __init__(self, agent_version=None, cloud_credential_tag=None, cloud_region=None, cloud_tag=None, controller_uuid=None, counts=None, default_series=None, is_controller=None, last_connection=None, life=None, migration=None, name=None, owner_tag=None, provider_type=None, sla=None, status=None, type_=None, user_access=None, uuid=None, **unknown_fields):
         '''
         agent_version : Number
@@ -16156,8 +17212,10 @@ class ModelSummary(Type):
 
 
 class ModelSummaryMessage(Type):
+    __slots__ = ('agent', 'message', 'unknown_fields')
     _toSchema = {'agent': 'agent', 'message': 'message'}
     _toPy = {'agent': 'agent', 'message': 'message'}
+    _wireTypes = {}
     def __init__(self, agent=None, message=None, **unknown_fields):
         '''
         agent : str
@@ -16180,8 +17238,10 @@ class ModelSummaryMessage(Type):
 
 
 class ModelSummaryResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ModelSummary', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -16204,8 +17264,10 @@ class ModelSummaryResult(Type):
 
 
 class ModelSummaryResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ModelSummaryResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ModelSummaryResult]
@@ -16222,8 +17284,10 @@ class ModelSummaryResults(Type):
 
 
 class ModelSummarySize(Type):
+    __slots__ = ('applications', 'containers', 'machines', 'relations', 'units', 'unknown_fields')
     _toSchema = {'applications': 'applications', 'containers': 'containers', 'machines': 'machines', 'relations': 'relations', 'units': 'units'}
     _toPy = {'applications': 'applications', 'containers': 'containers', 'machines': 'machines', 'relations': 'relations', 'units': 'units'}
+    _wireTypes = {}
     def __init__(self, applications=None, containers=None, machines=None, relations=None, units=None, **unknown_fields):
         '''
         applications : int
@@ -16264,8 +17328,10 @@ class ModelSummarySize(Type):
 
 
 class ModelTag(Type):
+    __slots__ = ('unknown_fields',)
     _toSchema = {}
     _toPy = {}
+    _wireTypes = {}
     def __init__(self, **unknown_fields):
         '''
 
@@ -16275,8 +17341,10 @@ class ModelTag(Type):
 
 
 class ModelUnset(Type):
+    __slots__ = ('keys', 'unknown_fields')
     _toSchema = {'keys': 'keys'}
     _toPy = {'keys': 'keys'}
+    _wireTypes = {}
     def __init__(self, keys=None, **unknown_fields):
         '''
         keys : typing.Sequence[str]
@@ -16293,8 +17361,10 @@ class ModelUnset(Type):
 
 
 class ModelUnsetKeys(Type):
+    __slots__ = ('cloud_region', 'cloud_tag', 'keys', 'unknown_fields')
     _toSchema = {'cloud_region': 'cloud-region', 'cloud_tag': 'cloud-tag', 'keys': 'keys'}
     _toPy = {'cloud-region': 'cloud_region', 'cloud-tag': 'cloud_tag', 'keys': 'keys'}
+    _wireTypes = {}
     def __init__(self, cloud_region=None, cloud_tag=None, keys=None, **unknown_fields):
         '''
         cloud_region : str
@@ -16323,8 +17393,10 @@ class ModelUnsetKeys(Type):
 
 
 class ModelUserInfo(Type):
+    __slots__ = ('access', 'display_name', 'last_connection', 'model_tag', 'user', 'unknown_fields')
     _toSchema = {'access': 'access', 'display_name': 'display-name', 'last_connection': 'last-connection', 'model_tag': 'model-tag', 'user': 'user'}
     _toPy = {'access': 'access', 'display-name': 'display_name', 'last-connection': 'last_connection', 'model-tag': 'model_tag', 'user': 'user'}
+    _wireTypes = {}
     def __init__(self, access=None, display_name=None, last_connection=None, model_tag=None, user=None, **unknown_fields):
         '''
         access : str
@@ -16365,8 +17437,10 @@ class ModelUserInfo(Type):
 
 
 class ModelUserInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ModelUserInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -16389,8 +17463,10 @@ class ModelUserInfoResult(Type):
 
 
 class ModelUserInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ModelUserInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ModelUserInfoResult]
@@ -16407,8 +17483,10 @@ class ModelUserInfoResults(Type):
 
 
 class ModelVolumeInfo(Type):
+    __slots__ = ('detachable', 'id_', 'message', 'provider_id', 'status', 'unknown_fields')
     _toSchema = {'detachable': 'detachable', 'id_': 'id', 'message': 'message', 'provider_id': 'provider-id', 'status': 'status'}
     _toPy = {'detachable': 'detachable', 'id': 'id_', 'message': 'message', 'provider-id': 'provider_id', 'status': 'status'}
+    _wireTypes = {}
     def __init__(self, detachable=None, id_=None, message=None, provider_id=None, status=None, **unknown_fields):
         '''
         detachable : bool
@@ -16449,8 +17527,10 @@ class ModelVolumeInfo(Type):
 
 
 class ModifyCloudAccess(Type):
+    __slots__ = ('access', 'action', 'cloud_tag', 'user_tag', 'unknown_fields')
     _toSchema = {'access': 'access', 'action': 'action', 'cloud_tag': 'cloud-tag', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'action': 'action', 'cloud-tag': 'cloud_tag', 'user-tag': 'user_tag'}
+    _wireTypes = {}
     def __init__(self, access=None, action=None, cloud_tag=None, user_tag=None, **unknown_fields):
         '''
         access : str
@@ -16485,8 +17565,10 @@ class ModifyCloudAccess(Type):
 
 
 class ModifyCloudAccessRequest(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('ModifyCloudAccess', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~ModifyCloudAccess]
@@ -16503,8 +17585,10 @@ class ModifyCloudAccessRequest(Type):
 
 
 class ModifyControllerAccess(Type):
+    __slots__ = ('access', 'action', 'user_tag', 'unknown_fields')
     _toSchema = {'access': 'access', 'action': 'action', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'action': 'action', 'user-tag': 'user_tag'}
+    _wireTypes = {}
     def __init__(self, access=None, action=None, user_tag=None, **unknown_fields):
         '''
         access : str
@@ -16533,8 +17617,10 @@ class ModifyControllerAccess(Type):
 
 
 class ModifyControllerAccessRequest(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('ModifyControllerAccess', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~ModifyControllerAccess]
@@ -16551,8 +17637,10 @@ class ModifyControllerAccessRequest(Type):
 
 
 class ModifyModelAccess(Type):
+    __slots__ = ('access', 'action', 'model_tag', 'user_tag', 'unknown_fields')
     _toSchema = {'access': 'access', 'action': 'action', 'model_tag': 'model-tag', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'action': 'action', 'model-tag': 'model_tag', 'user-tag': 'user_tag'}
+    _wireTypes = {}
     def __init__(self, access=None, action=None, model_tag=None, user_tag=None, **unknown_fields):
         '''
         access : str
@@ -16587,8 +17675,10 @@ class ModifyModelAccess(Type):
 
 
 class ModifyModelAccessRequest(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('ModifyModelAccess', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~ModifyModelAccess]
@@ -16605,8 +17695,10 @@ class ModifyModelAccessRequest(Type):
 
 
 class ModifyOfferAccess(Type):
+    __slots__ = ('access', 'action', 'offer_url', 'user_tag', 'unknown_fields')
     _toSchema = {'access': 'access', 'action': 'action', 'offer_url': 'offer-url', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'action': 'action', 'offer-url': 'offer_url', 'user-tag': 'user_tag'}
+    _wireTypes = {}
     def __init__(self, access=None, action=None, offer_url=None, user_tag=None, **unknown_fields):
         '''
         access : str
@@ -16641,8 +17733,10 @@ class ModifyOfferAccess(Type):
 
 
 class ModifyOfferAccessRequest(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('ModifyOfferAccess', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~ModifyOfferAccess]
@@ -16659,8 +17753,10 @@ class ModifyOfferAccessRequest(Type):
 
 
 class ModifyUserSSHKeys(Type):
+    __slots__ = ('ssh_keys', 'user', 'unknown_fields')
     _toSchema = {'ssh_keys': 'ssh-keys', 'user': 'user'}
     _toPy = {'ssh-keys': 'ssh_keys', 'user': 'user'}
+    _wireTypes = {}
     def __init__(self, ssh_keys=None, user=None, **unknown_fields):
         '''
         ssh_keys : typing.Sequence[str]
@@ -16683,8 +17779,10 @@ class ModifyUserSSHKeys(Type):
 
 
 class MoveSubnetsParam(Type):
+    __slots__ = ('force', 'space_tag', 'subnets', 'unknown_fields')
     _toSchema = {'force': 'force', 'space_tag': 'space-tag', 'subnets': 'subnets'}
     _toPy = {'force': 'force', 'space-tag': 'space_tag', 'subnets': 'subnets'}
+    _wireTypes = {}
     def __init__(self, force=None, space_tag=None, subnets=None, **unknown_fields):
         '''
         force : bool
@@ -16713,8 +17811,10 @@ class MoveSubnetsParam(Type):
 
 
 class MoveSubnetsParams(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('MoveSubnetsParam', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~MoveSubnetsParam]
@@ -16731,8 +17831,10 @@ class MoveSubnetsParams(Type):
 
 
 class MoveSubnetsResult(Type):
+    __slots__ = ('error', 'moved_subnets', 'new_space', 'unknown_fields')
     _toSchema = {'error': 'error', 'moved_subnets': 'moved-subnets', 'new_space': 'new-space'}
     _toPy = {'error': 'error', 'moved-subnets': 'moved_subnets', 'new-space': 'new_space'}
+    _wireTypes = {'error': ('Error', None), 'moved_subnets': ('MovedSubnet', 'list')}
     def __init__(self, error=None, moved_subnets=None, new_space=None, **unknown_fields):
         '''
         error : Error
@@ -16761,8 +17863,10 @@ class MoveSubnetsResult(Type):
 
 
 class MoveSubnetsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('MoveSubnetsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~MoveSubnetsResult]
@@ -16779,8 +17883,10 @@ class MoveSubnetsResults(Type):
 
 
 class MovedSubnet(Type):
+    __slots__ = ('cidr', 'old_space', 'subnet', 'unknown_fields')
     _toSchema = {'cidr': 'cidr', 'old_space': 'old-space', 'subnet': 'subnet'}
     _toPy = {'cidr': 'cidr', 'old-space': 'old_space', 'subnet': 'subnet'}
+    _wireTypes = {}
     def __init__(self, cidr=None, old_space=None, subnet=None, **unknown_fields):
         '''
         cidr : str
@@ -16809,8 +17915,10 @@ class MovedSubnet(Type):
 
 
 class NetworkConfig(Type):
+    __slots__ = ('address', 'addresses', 'cidr', 'config_type', 'device_index', 'disabled', 'dns_search_domains', 'dns_servers', 'gateway_address', 'interface_name', 'interface_type', 'is_default_gateway', 'mac_address', 'mtu', 'no_auto_start', 'origin', 'parent_interface_name', 'provider_address_id', 'provider_id', 'provider_network_id', 'provider_space_id', 'provider_subnet_id', 'provider_vlan_id', 'routes', 'shadow_addresses', 'virtual_port_type', 'vlan_tag', 'unknown_fields')
     _toSchema = {'address': 'address', 'addresses': 'addresses', 'cidr': 'cidr', 'config_type': 'config-type', 'device_index': 'device-index', 'disabled': 'disabled', 'dns_search_domains': 'dns-search-domains', 'dns_servers': 'dns-servers', 'gateway_address': 'gateway-address', 'interface_name': 'interface-name', 'interface_type': 'interface-type', 'is_default_gateway': 'is-default-gateway', 'mac_address': 'mac-address', 'mtu': 'mtu', 'no_auto_start': 'no-auto-start', 'origin': 'origin', 'parent_interface_name': 'parent-interface-name', 'provider_address_id': 'provider-address-id', 'provider_id': 'provider-id', 'provider_network_id': 'provider-network-id', 'provider_space_id': 'provider-space-id', 'provider_subnet_id': 'provider-subnet-id', 'provider_vlan_id': 'provider-vlan-id', 'routes': 'routes', 'shadow_addresses': 'shadow-addresses', 'virtual_port_type': 'virtual-port-type', 'vlan_tag': 'vlan-tag'}
     _toPy = {'address': 'address', 'addresses': 'addresses', 'cidr': 'cidr', 'config-type': 'config_type', 'device-index': 'device_index', 'disabled': 'disabled', 'dns-search-domains': 'dns_search_domains', 'dns-servers': 'dns_servers', 'gateway-address': 'gateway_address', 'interface-name': 'interface_name', 'interface-type': 'interface_type', 'is-default-gateway': 'is_default_gateway', 'mac-address': 'mac_address', 'mtu': 'mtu', 'no-auto-start': 'no_auto_start', 'origin': 'origin', 'parent-interface-name': 'parent_interface_name', 'provider-address-id': 'provider_address_id', 'provider-id': 'provider_id', 'provider-network-id': 'provider_network_id', 'provider-space-id': 'provider_space_id', 'provider-subnet-id': 'provider_subnet_id', 'provider-vlan-id': 'provider_vlan_id', 'routes': 'routes', 'shadow-addresses': 'shadow_addresses', 'virtual-port-type': 'virtual_port_type', 'vlan-tag': 'vlan_tag'}
+    _wireTypes = {'addresses': ('Address', 'list'), 'routes': ('NetworkRoute', 'list'), 'shadow_addresses': ('Address', 'list')}
     def __init__(self, address=None, addresses=None, cidr=None, config_type=None, device_index=None, disabled=None, dns_search_domains=None, dns_servers=None, gateway_address=None, interface_name=None, interface_type=None, is_default_gateway=None, mac_address=None, mtu=None, no_auto_start=None, origin=None, parent_interface_name=None, provider_address_id=None, provider_id=None, provider_network_id=None, provider_space_id=None, provider_subnet_id=None, provider_vlan_id=None, routes=None, shadow_addresses=None, virtual_port_type=None, vlan_tag=None, **unknown_fields):
         '''
         address : str
@@ -16983,8 +18091,10 @@ class NetworkConfig(Type):
 
 
 class NetworkInfo(Type):
+    __slots__ = ('addresses', 'interface_name', 'mac_address', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'interface_name': 'interface-name', 'mac_address': 'mac-address'}
     _toPy = {'addresses': 'addresses', 'interface-name': 'interface_name', 'mac-address': 'mac_address'}
+    _wireTypes = {'addresses': ('InterfaceAddress', 'list')}
     def __init__(self, addresses=None, interface_name=None, mac_address=None, **unknown_fields):
         '''
         addresses : typing.Sequence[~InterfaceAddress]
@@ -17013,8 +18123,10 @@ class NetworkInfo(Type):
 
 
 class NetworkInfoParams(Type):
+    __slots__ = ('bindings', 'relation_id', 'unit', 'unknown_fields')
     _toSchema = {'bindings': 'bindings', 'relation_id': 'relation-id', 'unit': 'unit'}
     _toPy = {'bindings': 'bindings', 'relation-id': 'relation_id', 'unit': 'unit'}
+    _wireTypes = {}
     def __init__(self, bindings=None, relation_id=None, unit=None, **unknown_fields):
         '''
         bindings : typing.Sequence[str]
@@ -17043,8 +18155,10 @@ class NetworkInfoParams(Type):
 
 
 class NetworkInfoResult(Type):
+    __slots__ = ('bind_addresses', 'egress_subnets', 'error', 'ingress_addresses', 'unknown_fields')
     _toSchema = {'bind_addresses': 'bind-addresses', 'egress_subnets': 'egress-subnets', 'error': 'error', 'ingress_addresses': 'ingress-addresses'}
     _toPy = {'bind-addresses': 'bind_addresses', 'egress-subnets': 'egress_subnets', 'error': 'error', 'ingress-addresses': 'ingress_addresses'}
+    _wireTypes = {'bind_addresses': ('NetworkInfo', 'list'), 'error': ('Error', None)}
     def __init__(self, bind_addresses=None, egress_subnets=None, error=None, ingress_addresses=None, **unknown_fields):
         '''
         bind_addresses : typing.Sequence[~NetworkInfo]
@@ -17079,8 +18193,10 @@ class NetworkInfoResult(Type):
 
 
 class NetworkInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('NetworkInfoResult', 'dict')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Mapping[str, ~NetworkInfoResult]
@@ -17097,8 +18213,10 @@ class NetworkInfoResults(Type):
 
 
 class NetworkInterface(Type):
+    __slots__ = ('dns_nameservers', 'gateway', 'ip_addresses', 'is_up', 'mac_address', 'space', 'unknown_fields')
     _toSchema = {'dns_nameservers': 'dns-nameservers', 'gateway': 'gateway', 'ip_addresses': 'ip-addresses', 'is_up': 'is-up', 'mac_address': 'mac-address', 'space': 'space'}
     _toPy = {'dns-nameservers': 'dns_nameservers', 'gateway': 'gateway', 'ip-addresses': 'ip_addresses', 'is-up': 'is_up', 'mac-address': 'mac_address', 'space': 'space'}
+    _wireTypes = {}
     def __init__(self, dns_nameservers=None, gateway=None, ip_addresses=None, is_up=None, mac_address=None, space=None, **unknown_fields):
         '''
         dns_nameservers : typing.Sequence[str]
@@ -17145,8 +18263,10 @@ class NetworkInterface(Type):
 
 
 class NetworkRoute(Type):
+    __slots__ = ('destination_cidr', 'gateway_ip', 'metric', 'unknown_fields')
     _toSchema = {'destination_cidr': 'destination-cidr', 'gateway_ip': 'gateway-ip', 'metric': 'metric'}
     _toPy = {'destination-cidr': 'destination_cidr', 'gateway-ip': 'gateway_ip', 'metric': 'metric'}
+    _wireTypes = {}
     def __init__(self, destination_cidr=None, gateway_ip=None, metric=None, **unknown_fields):
         '''
         destination_cidr : str
@@ -17175,8 +18295,10 @@ class NetworkRoute(Type):
 
 
 class NotifyWatchResult(Type):
+    __slots__ = ('notifywatcherid', 'error', 'unknown_fields')
     _toSchema = {'error': 'error', 'notifywatcherid': 'NotifyWatcherId'}
     _toPy = {'NotifyWatcherId': 'notifywatcherid', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, notifywatcherid=None, error=None, **unknown_fields):
         '''
         notifywatcherid : str
@@ -17199,8 +18321,10 @@ class NotifyWatchResult(Type):
 
 
 class NotifyWatchResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('NotifyWatchResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~NotifyWatchResult]
@@ -17217,8 +18341,10 @@ class NotifyWatchResults(Type):
 
 
 class Number(Type):
+    __slots__ = ('build', 'major', 'minor', 'patch', 'tag', 'unknown_fields')
     _toSchema = {'build': 'Build', 'major': 'Major', 'minor': 'Minor', 'patch': 'Patch', 'tag': 'Tag'}
     _toPy = {'Build': 'build', 'Major': 'major', 'Minor': 'minor', 'Patch': 'patch', 'Tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, build=None, major=None, minor=None, patch=None, tag=None, **unknown_fields):
         '''
         build : int
@@ -17259,8 +18385,10 @@ class Number(Type):
 
 
 class OfferArg(Type):
+    __slots__ = ('bakery_version', 'macaroons', 'offer_uuid', 'unknown_fields')
     _toSchema = {'bakery_version': 'bakery-version', 'macaroons': 'macaroons', 'offer_uuid': 'offer-uuid'}
     _toPy = {'bakery-version': 'bakery_version', 'macaroons': 'macaroons', 'offer-uuid': 'offer_uuid'}
+    _wireTypes = {'macaroons': ('Macaroon', 'list')}
     def __init__(self, bakery_version=None, macaroons=None, offer_uuid=None, **unknown_fields):
         '''
         bakery_version : int
@@ -17289,8 +18417,10 @@ class OfferArg(Type):
 
 
 class OfferArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('OfferArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~OfferArg]
@@ -17307,8 +18437,10 @@ class OfferArgs(Type):
 
 
 class OfferConnection(Type):
+    __slots__ = ('endpoint', 'ingress_subnets', 'relation_id', 'source_model_tag', 'status', 'username', 'unknown_fields')
     _toSchema = {'endpoint': 'endpoint', 'ingress_subnets': 'ingress-subnets', 'relation_id': 'relation-id', 'source_model_tag': 'source-model-tag', 'status': 'status', 'username': 'username'}
     _toPy = {'endpoint': 'endpoint', 'ingress-subnets': 'ingress_subnets', 'relation-id': 'relation_id', 'source-model-tag': 'source_model_tag', 'status': 'status', 'username': 'username'}
+    _wireTypes = {'status': ('EntityStatus', None)}
     def __init__(self, endpoint=None, ingress_subnets=None, relation_id=None, source_model_tag=None, status=None, username=None, **unknown_fields):
         '''
         endpoint : str
@@ -17355,8 +18487,10 @@ class OfferConnection(Type):
 
 
 class OfferFilter(Type):
+    __slots__ = ('allowed_users', 'application_description', 'application_name', 'application_user', 'connected_users', 'endpoints', 'model_name', 'offer_name', 'owner_name', 'unknown_fields')
     _toSchema = {'allowed_users': 'allowed-users', 'application_description': 'application-description', 'application_name': 'application-name', 'application_user': 'application-user', 'connected_users': 'connected-users', 'endpoints': 'endpoints', 'model_name': 'model-name', 'offer_name': 'offer-name', 'owner_name': 'owner-name'}
     _toPy = {'allowed-users': 'allowed_users', 'application-description': 'application_description', 'application-name': 'application_name', 'application-user': 'application_user', 'connected-users': 'connected_users', 'endpoints': 'endpoints', 'model-name': 'model_name', 'offer-name': 'offer_name', 'owner-name': 'owner_name'}
+    _wireTypes = {'endpoints': ('EndpointFilterAttributes', 'list')}
     def __init__(self, allowed_users=None, application_description=None, application_name=None, application_user=None, connected_users=None, endpoints=None, model_name=None, offer_name=None, owner_name=None, **unknown_fields):
         '''
         allowed_users : typing.Sequence[str]
@@ -17421,8 +18555,10 @@ class OfferFilter(Type):
 
 
 class OfferFilters(Type):
+    __slots__ = ('filters', 'unknown_fields')
     _toSchema = {'filters': 'Filters'}
     _toPy = {'Filters': 'filters'}
+    _wireTypes = {'filters': ('OfferFilter', 'list')}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~OfferFilter]
@@ -17439,8 +18575,10 @@ class OfferFilters(Type):
 
 
 class OfferStatusChange(Type):
+    __slots__ = ('offer_name', 'status', 'unknown_fields')
     _toSchema = {'offer_name': 'offer-name', 'status': 'status'}
     _toPy = {'offer-name': 'offer_name', 'status': 'status'}
+    _wireTypes = {'status': ('EntityStatus', None)}
     def __init__(self, offer_name=None, status=None, **unknown_fields):
         '''
         offer_name : str
@@ -17463,8 +18601,10 @@ class OfferStatusChange(Type):
 
 
 class OfferStatusWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'changes': ('OfferStatusChange', 'list'), 'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : typing.Sequence[~OfferStatusChange]
@@ -17493,8 +18633,10 @@ class OfferStatusWatchResult(Type):
 
 
 class OfferStatusWatchResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('OfferStatusWatchResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~OfferStatusWatchResult]
@@ -17511,8 +18653,10 @@ class OfferStatusWatchResults(Type):
 
 
 class OfferURLs(Type):
+    __slots__ = ('bakery_version', 'offer_urls', 'unknown_fields')
     _toSchema = {'bakery_version': 'bakery-version', 'offer_urls': 'offer-urls'}
     _toPy = {'bakery-version': 'bakery_version', 'offer-urls': 'offer_urls'}
+    _wireTypes = {}
     def __init__(self, bakery_version=None, offer_urls=None, **unknown_fields):
         '''
         bakery_version : int
@@ -17535,8 +18679,10 @@ class OfferURLs(Type):
 
 
 class OfferUserDetails(Type):
+    __slots__ = ('access', 'display_name', 'user', 'unknown_fields')
     _toSchema = {'access': 'access', 'display_name': 'display-name', 'user': 'user'}
     _toPy = {'access': 'access', 'display-name': 'display_name', 'user': 'user'}
+    _wireTypes = {}
     def __init__(self, access=None, display_name=None, user=None, **unknown_fields):
         '''
         access : str
@@ -17565,8 +18711,10 @@ class OfferUserDetails(Type):
 
 
 class OpenMachinePortRangesByEndpointResult(Type):
+    __slots__ = ('error', 'unit_port_ranges', 'unknown_fields')
     _toSchema = {'error': 'error', 'unit_port_ranges': 'unit-port-ranges'}
     _toPy = {'error': 'error', 'unit-port-ranges': 'unit_port_ranges'}
+    _wireTypes = {'error': ('Error', None), 'unit_port_ranges': ('OpenUnitPortRangesByEndpoint', 'dict')}
     def __init__(self, error=None, unit_port_ranges=None, **unknown_fields):
         '''
         error : Error
@@ -17589,8 +18737,10 @@ class OpenMachinePortRangesByEndpointResult(Type):
 
 
 class OpenMachinePortRangesByEndpointResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('OpenMachinePortRangesByEndpointResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~OpenMachinePortRangesByEndpointResult]
@@ -17607,8 +18757,10 @@ class OpenMachinePortRangesByEndpointResults(Type):
 
 
 class OpenMachinePortRangesResult(Type):
+    __slots__ = ('error', 'unit_port_ranges', 'unknown_fields')
     _toSchema = {'error': 'error', 'unit_port_ranges': 'unit-port-ranges'}
     _toPy = {'error': 'error', 'unit-port-ranges': 'unit_port_ranges'}
+    _wireTypes = {'error': ('Error', None), 'unit_port_ranges': ('OpenUnitPortRanges', 'dict')}
     def __init__(self, error=None, unit_port_ranges=None, **unknown_fields):
         '''
         error : Error
@@ -17631,8 +18783,10 @@ class OpenMachinePortRangesResult(Type):
 
 
 class OpenMachinePortRangesResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('OpenMachinePortRangesResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~OpenMachinePortRangesResult]
@@ -17649,8 +18803,10 @@ class OpenMachinePortRangesResults(Type):
 
 
 class OpenPortRangesByEndpointResult(Type):
+    __slots__ = ('error', 'unit_port_ranges', 'unknown_fields')
     _toSchema = {'error': 'error', 'unit_port_ranges': 'unit-port-ranges'}
     _toPy = {'error': 'error', 'unit-port-ranges': 'unit_port_ranges'}
+    _wireTypes = {'error': ('Error', None), 'unit_port_ranges': ('OpenUnitPortRangesByEndpoint', 'dict')}
     def __init__(self, error=None, unit_port_ranges=None, **unknown_fields):
         '''
         error : Error
@@ -17673,8 +18829,10 @@ class OpenPortRangesByEndpointResult(Type):
 
 
 class OpenPortRangesByEndpointResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('OpenPortRangesByEndpointResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~OpenPortRangesByEndpointResult]
@@ -17691,8 +18849,10 @@ class OpenPortRangesByEndpointResults(Type):
 
 
 class OpenUnitPortRanges(Type):
+    __slots__ = ('endpoint', 'port_ranges', 'subnet_cidrs', 'unknown_fields')
     _toSchema = {'endpoint': 'endpoint', 'port_ranges': 'port-ranges', 'subnet_cidrs': 'subnet-cidrs'}
     _toPy = {'endpoint': 'endpoint', 'port-ranges': 'port_ranges', 'subnet-cidrs': 'subnet_cidrs'}
+    _wireTypes = {'port_ranges': ('PortRange', 'list')}
     def __init__(self, endpoint=None, port_ranges=None, subnet_cidrs=None, **unknown_fields):
         '''
         endpoint : str
@@ -17721,8 +18881,10 @@ class OpenUnitPortRanges(Type):
 
 
 class OpenUnitPortRangesByEndpoint(Type):
+    __slots__ = ('endpoint', 'port_ranges', 'unknown_fields')
     _toSchema = {'endpoint': 'endpoint', 'port_ranges': 'port-ranges'}
     _toPy = {'endpoint': 'endpoint', 'port-ranges': 'port_ranges'}
+    _wireTypes = {'port_ranges': ('PortRange', 'list')}
     def __init__(self, endpoint=None, port_ranges=None, **unknown_fields):
         '''
         endpoint : str
@@ -17745,8 +18907,10 @@ class OpenUnitPortRangesByEndpoint(Type):
 
 
 class OperationQueryArgs(Type):
+    __slots__ = ('actions', 'applications', 'limit', 'machines', 'offset', 'status', 'units', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'applications': 'applications', 'limit': 'limit', 'machines': 'machines', 'offset': 'offset', 'status': 'status', 'units': 'units'}
     _toPy = {'actions': 'actions', 'applications': 'applications', 'limit': 'limit', 'machines': 'machines', 'offset': 'offset', 'status': 'status', 'units': 'units'}
+    _wireTypes = {}
     def __init__(self, actions=None, applications=None, limit=None, machines=None, offset=None, status=None, units=None, **unknown_fields):
         '''
         actions : typing.Sequence[str]
@@ -17799,8 +18963,10 @@ class OperationQueryArgs(Type):
 
 
 class OperationResult(Type):
+    __slots__ = ('actions', 'completed', 'enqueued', 'error', 'fail', 'operation', 'started', 'status', 'summary', 'unknown_fields')
     _toSchema = {'actions': 'actions', 'completed': 'completed', 'enqueued': 'enqueued', 'error': 'error', 'fail': 'fail', 'operation': 'operation', 'started': 'started', 'status': 'status', 'summary': 'summary'}
     _toPy = {'actions': 'actions', 'completed': 'completed', 'enqueued': 'enqueued', 'error': 'error', 'fail': 'fail', 'operation': 'operation', 'started': 'started', 'status': 'status', 'summary': 'summary'}
+    _wireTypes = {'actions': ('ActionResult', 'list'), 'error': ('Error', None)}
     def __init__(self, actions=None, completed=None, enqueued=None, error=None, fail=None, operation=None, started=None, status=None, summary=None, **unknown_fields):
         '''
         actions : typing.Sequence[~ActionResult]
@@ -17865,8 +19031,10 @@ class OperationResult(Type):
 
 
 class OperationResults(Type):
+    __slots__ = ('results', 'truncated', 'unknown_fields')
     _toSchema = {'results': 'results', 'truncated': 'truncated'}
     _toPy = {'results': 'results', 'truncated': 'truncated'}
+    _wireTypes = {'results': ('OperationResult', 'list')}
     def __init__(self, results=None, truncated=None, **unknown_fields):
         '''
         results : typing.Sequence[~OperationResult]
@@ -17889,8 +19057,10 @@ class OperationResults(Type):
 
 
 class OperatorProvisioningInfo(Type):
+    __slots__ = ('api_addresses', 'base_image_details', 'charm_storage', 'error', 'image_details', 'tags', 'version', 'unknown_fields')
     _toSchema = {'api_addresses': 'api-addresses', 'base_image_details': 'base-image-details', 'charm_storage': 'charm-storage', 'error': 'error', 'image_details': 'image-details', 'tags': 'tags', 'version': 'version'}
     _toPy = {'api-addresses': 'api_addresses', 'base-image-details': 'base_image_details', 'charm-storage': 'charm_storage', 'error': 'error', 'image-details': 'image_details', 'tags': 'tags', 'version': 'version'}
+    _wireTypes = {'base_image_details': ('DockerImageInfo', None), 'charm_storage': ('KubernetesFilesystemParams', None), 'error': ('Error', None), 'image_details': ('DockerImageInfo', None), 'version': ('Number', None)}
     def __init__(self, api_addresses=None, base_image_details=None, charm_storage=None, error=None, image_details=None, tags=None, version=None, **unknown_fields):
         '''
         api_addresses : typing.Sequence[str]
@@ -17943,8 +19113,10 @@ class OperatorProvisioningInfo(Type):
 
 
 class OperatorProvisioningInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('OperatorProvisioningInfo', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~OperatorProvisioningInfo]
@@ -17961,8 +19133,10 @@ class OperatorProvisioningInfoResults(Type):
 
 
 class Payload(Type):
+    __slots__ = ('class_', 'id_', 'labels', 'machine', 'status', 'type_', 'unit', 'unknown_fields')
     _toSchema = {'class_': 'class', 'id_': 'id', 'labels': 'labels', 'machine': 'machine', 'status': 'status', 'type_': 'type', 'unit': 'unit'}
     _toPy = {'class': 'class_', 'id': 'id_', 'labels': 'labels', 'machine': 'machine', 'status': 'status', 'type': 'type_', 'unit': 'unit'}
+    _wireTypes = {}
     def __init__(self, class_=None, id_=None, labels=None, machine=None, status=None, type_=None, unit=None, **unknown_fields):
         '''
         class_ : str
@@ -18015,8 +19189,10 @@ class Payload(Type):
 
 
 class PayloadListArgs(Type):
+    __slots__ = ('patterns', 'unknown_fields')
     _toSchema = {'patterns': 'patterns'}
     _toPy = {'patterns': 'patterns'}
+    _wireTypes = {}
     def __init__(self, patterns=None, **unknown_fields):
         '''
         patterns : typing.Sequence[str]
@@ -18033,8 +19209,10 @@ class PayloadListArgs(Type):
 
 
 class PayloadListResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('Payload', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~Payload]
@@ -18051,8 +19229,10 @@ class PayloadListResults(Type):
 
 
 class PayloadResult(Type):
+    __slots__ = ('entity', 'error', 'not_found', 'payload', 'tag', 'unknown_fields')
     _toSchema = {'entity': 'Entity', 'error': 'error', 'not_found': 'not-found', 'payload': 'payload', 'tag': 'tag'}
     _toPy = {'Entity': 'entity', 'error': 'error', 'not-found': 'not_found', 'payload': 'payload', 'tag': 'tag'}
+    _wireTypes = {'entity': ('Entity', None), 'error': ('Error', None), 'payload': ('Payload', None)}
     def __init__(self, entity=None, error=None, not_found=None, payload=None, tag=None, **unknown_fields):
         '''
         entity : Entity
@@ -18093,8 +19273,10 @@ class PayloadResult(Type):
 
 
 class PayloadResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('PayloadResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~PayloadResult]
@@ -18111,8 +19293,10 @@ class PayloadResults(Type):
 
 
 class PendingResourceUpload(Type):
+    __slots__ = ('filename', 'name', 'type_', 'unknown_fields')
     _toSchema = {'filename': 'Filename', 'name': 'Name', 'type_': 'Type'}
     _toPy = {'Filename': 'filename', 'Name': 'name', 'Type': 'type_'}
+    _wireTypes = {}
     def __init__(self, filename=None, name=None, type_=None, **unknown_fields):
         '''
         filename : str
@@ -18141,8 +19325,10 @@ class PendingResourceUpload(Type):
 
 
 class PhaseResult(Type):
+    __slots__ = ('error', 'phase', 'unknown_fields')
     _toSchema = {'error': 'error', 'phase': 'phase'}
     _toPy = {'error': 'error', 'phase': 'phase'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, phase=None, **unknown_fields):
         '''
         error : Error
@@ -18165,8 +19351,10 @@ class PhaseResult(Type):
 
 
 class PhaseResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('PhaseResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~PhaseResult]
@@ -18183,8 +19371,10 @@ class PhaseResults(Type):
 
 
 class PinApplicationResult(Type):
+    __slots__ = ('application_name', 'error', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'error': 'error'}
     _toPy = {'application-name': 'application_name', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, application_name=None, error=None, **unknown_fields):
         '''
         application_name : str
@@ -18207,8 +19397,10 @@ class PinApplicationResult(Type):
 
 
 class PinApplicationsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('PinApplicationResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~PinApplicationResult]
@@ -18225,8 +19417,10 @@ class PinApplicationsResults(Type):
 
 
 class PinnedLeadershipResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -18249,8 +19443,10 @@ class PinnedLeadershipResult(Type):
 
 
 class Placement(Type):
+    __slots__ = ('directive', 'scope', 'unknown_fields')
     _toSchema = {'directive': 'directive', 'scope': 'scope'}
     _toPy = {'directive': 'directive', 'scope': 'scope'}
+    _wireTypes = {}
     def __init__(self, directive=None, scope=None, **unknown_fields):
         '''
         directive : str
@@ -18273,8 +19469,10 @@ class Placement(Type):
 
 
 class PodSpec(Type):
+    __slots__ = ('spec', 'tag', 'unknown_fields')
     _toSchema = {'spec': 'spec', 'tag': 'tag'}
     _toPy = {'spec': 'spec', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, spec=None, tag=None, **unknown_fields):
         '''
         spec : str
@@ -18297,8 +19495,10 @@ class PodSpec(Type):
 
 
 class PortRange(Type):
+    __slots__ = ('from_port', 'protocol', 'to_port', 'unknown_fields')
     _toSchema = {'from_port': 'from-port', 'protocol': 'protocol', 'to_port': 'to-port'}
     _toPy = {'from-port': 'from_port', 'protocol': 'protocol', 'to-port': 'to_port'}
+    _wireTypes = {}
     def __init__(self, from_port=None, protocol=None, to_port=None, **unknown_fields):
         '''
         from_port : int
@@ -18327,8 +19527,10 @@ class PortRange(Type):
 
 
 class PrechecksArgs(Type):
+    __slots__ = ('target_controller_version', 'unknown_fields')
     _toSchema = {'target_controller_version': 'target-controller-version'}
     _toPy = {'target-controller-version': 'target_controller_version'}
+    _wireTypes = {'target_controller_version': ('Number', None)}
     def __init__(self, target_controller_version=None, **unknown_fields):
         '''
         target_controller_version : Number
@@ -18345,8 +19547,10 @@ class PrechecksArgs(Type):
 
 
 class ProcessRelations(Type):
+    __slots__ = ('controller_alias', 'unknown_fields')
     _toSchema = {'controller_alias': 'controller-alias'}
     _toPy = {'controller-alias': 'controller_alias'}
+    _wireTypes = {}
     def __init__(self, controller_alias=None, **unknown_fields):
         '''
         controller_alias : str
@@ -18363,8 +19567,10 @@ class ProcessRelations(Type):
 
 
 class ProfileInfoResult(Type):
+    __slots__ = ('application_name', 'error', 'profile', 'revision', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'error': 'error', 'profile': 'profile', 'revision': 'revision'}
     _toPy = {'application-name': 'application_name', 'error': 'error', 'profile': 'profile', 'revision': 'revision'}
+    _wireTypes = {'error': ('Error', None), 'profile': ('CharmLXDProfile', None)}
     def __init__(self, application_name=None, error=None, profile=None, revision=None, **unknown_fields):
         '''
         application_name : str
@@ -18399,8 +19605,10 @@ class ProfileInfoResult(Type):
 
 
 class ProviderInterfaceInfo(Type):
+    __slots__ = ('interface_name', 'mac_address', 'provider_id', 'unknown_fields')
     _toSchema = {'interface_name': 'interface-name', 'mac_address': 'mac-address', 'provider_id': 'provider-id'}
     _toPy = {'interface-name': 'interface_name', 'mac-address': 'mac_address', 'provider-id': 'provider_id'}
+    _wireTypes = {}
     def __init__(self, interface_name=None, mac_address=None, provider_id=None, **unknown_fields):
         '''
         interface_name : str
@@ -18429,8 +19637,10 @@ class ProviderInterfaceInfo(Type):
 
 
 class ProviderInterfaceInfoResult(Type):
+    __slots__ = ('error', 'interfaces', 'machine_tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'interfaces': 'interfaces', 'machine_tag': 'machine-tag'}
     _toPy = {'error': 'error', 'interfaces': 'interfaces', 'machine-tag': 'machine_tag'}
+    _wireTypes = {'error': ('Error', None), 'interfaces': ('ProviderInterfaceInfo', 'list')}
     def __init__(self, error=None, interfaces=None, machine_tag=None, **unknown_fields):
         '''
         error : Error
@@ -18459,8 +19669,10 @@ class ProviderInterfaceInfoResult(Type):
 
 
 class ProviderInterfaceInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ProviderInterfaceInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ProviderInterfaceInfoResult]
@@ -18477,8 +19689,10 @@ class ProviderInterfaceInfoResults(Type):
 
 
 class ProviderNetworkConfig(Type):
+    __slots__ = ('config', 'tag', 'unknown_fields')
     _toSchema = {'config': 'config', 'tag': 'tag'}
     _toPy = {'config': 'config', 'tag': 'tag'}
+    _wireTypes = {'config': ('NetworkConfig', 'list')}
     def __init__(self, config=None, tag=None, **unknown_fields):
         '''
         config : typing.Sequence[~NetworkConfig]
@@ -18501,8 +19715,10 @@ class ProviderNetworkConfig(Type):
 
 
 class ProvisioningInfo(Type):
+    __slots__ = ('provisioningnetworktopology', 'base', 'charm_lxd_profiles', 'cloudinit_userdata', 'constraints', 'controller_config', 'endpoint_bindings', 'image_metadata', 'jobs', 'placement', 'root_disk', 'space_subnets', 'subnet_zones', 'tags', 'volume_attachments', 'volumes', 'unknown_fields')
     _toSchema = {'base': 'base', 'charm_lxd_profiles': 'charm-lxd-profiles', 'cloudinit_userdata': 'cloudinit-userdata', 'constraints': 'constraints', 'controller_config': 'controller-config', 'endpoint_bindings': 'endpoint-bindings', 'image_metadata': 'image-metadata', 'jobs': 'jobs', 'placement': 'placement', 'provisioningnetworktopology': 'ProvisioningNetworkTopology', 'root_disk': 'root-disk', 'space_subnets': 'space-subnets', 'subnet_zones': 'subnet-zones', 'tags': 'tags', 'volume_attachments': 'volume-attachments', 'volumes': 'volumes'}
     _toPy = {'ProvisioningNetworkTopology': 'provisioningnetworktopology', 'base': 'base', 'charm-lxd-profiles': 'charm_lxd_profiles', 'cloudinit-userdata': 'cloudinit_userdata', 'constraints': 'constraints', 'controller-config': 'controller_config', 'endpoint-bindings': 'endpoint_bindings', 'image-metadata': 'image_metadata', 'jobs': 'jobs', 'placement': 'placement', 'root-disk': 'root_disk', 'space-subnets': 'space_subnets', 'subnet-zones': 'subnet_zones', 'tags': 'tags', 'volume-attachments': 'volume_attachments', 'volumes': 'volumes'}
+    _wireTypes = {'base': ('Base', None), 'constraints': ('Value', None), 'image_metadata': ('CloudImageMetadata', 'list'), 'provisioningnetworktopology': ('ProvisioningNetworkTopology', None), 'root_disk': ('VolumeParams', None), 'volume_attachments': ('VolumeAttachmentParams', 'list'), 'volumes': ('VolumeParams', 'list')}
     def __init__(self, provisioningnetworktopology=None, base=None, charm_lxd_profiles=None, cloudinit_userdata=None, constraints=None, controller_config=None, endpoint_bindings=None, image_metadata=None, jobs=None, placement=None, root_disk=None, space_subnets=None, subnet_zones=None, tags=None, volume_attachments=None, volumes=None, **unknown_fields):
         '''
         provisioningnetworktopology : ProvisioningNetworkTopology
@@ -18609,8 +19825,10 @@ class ProvisioningInfo(Type):
 
 
 class ProvisioningInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('ProvisioningInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -18633,8 +19851,10 @@ class ProvisioningInfoResult(Type):
 
 
 class ProvisioningInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ProvisioningInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ProvisioningInfoResult]
@@ -18651,8 +19871,10 @@ class ProvisioningInfoResults(Type):
 
 
 class ProvisioningNetworkTopology(Type):
+    __slots__ = ('space_subnets', 'subnet_zones', 'unknown_fields')
     _toSchema = {'space_subnets': 'space-subnets', 'subnet_zones': 'subnet-zones'}
     _toPy = {'space-subnets': 'space_subnets', 'subnet-zones': 'subnet_zones'}
+    _wireTypes = {}
     def __init__(self, space_subnets=None, subnet_zones=None, **unknown_fields):
         '''
         space_subnets : typing.Mapping[str, typing.Sequence[str]]
@@ -18675,8 +19897,10 @@ class ProvisioningNetworkTopology(Type):
 
 
 class ProvisioningScriptParams(Type):
+    __slots__ = ('data_dir', 'disable_package_commands', 'machine_id', 'nonce', 'unknown_fields')
     _toSchema = {'data_dir': 'data-dir', 'disable_package_commands': 'disable-package-commands', 'machine_id': 'machine-id', 'nonce': 'nonce'}
     _toPy = {'data-dir': 'data_dir', 'disable-package-commands': 'disable_package_commands', 'machine-id': 'machine_id', 'nonce': 'nonce'}
+    _wireTypes = {}
     def __init__(self, data_dir=None, disable_package_commands=None, machine_id=None, nonce=None, **unknown_fields):
         '''
         data_dir : str
@@ -18711,8 +19935,10 @@ class ProvisioningScriptParams(Type):
 
 
 class ProvisioningScriptResult(Type):
+    __slots__ = ('script', 'unknown_fields')
     _toSchema = {'script': 'script'}
     _toPy = {'script': 'script'}
+    _wireTypes = {}
     def __init__(self, script=None, **unknown_fields):
         '''
         script : str
@@ -18729,8 +19955,10 @@ class ProvisioningScriptResult(Type):
 
 
 class Proxy(Type):
+    __slots__ = ('config', 'type_', 'unknown_fields')
     _toSchema = {'config': 'config', 'type_': 'type'}
     _toPy = {'config': 'config', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, config=None, type_=None, **unknown_fields):
         '''
         config : typing.Mapping[str, typing.Any]
@@ -18753,8 +19981,10 @@ class Proxy(Type):
 
 
 class ProxyConfig(Type):
+    __slots__ = ('ftp', 'http', 'https', 'no_proxy', 'unknown_fields')
     _toSchema = {'ftp': 'ftp', 'http': 'http', 'https': 'https', 'no_proxy': 'no-proxy'}
     _toPy = {'ftp': 'ftp', 'http': 'http', 'https': 'https', 'no-proxy': 'no_proxy'}
+    _wireTypes = {}
     def __init__(self, ftp=None, http=None, https=None, no_proxy=None, **unknown_fields):
         '''
         ftp : str
@@ -18789,8 +20019,10 @@ class ProxyConfig(Type):
 
 
 class ProxyConfigResult(Type):
+    __slots__ = ('apt_mirror', 'apt_proxy_settings', 'error', 'juju_proxy_settings', 'legacy_proxy_settings', 'snap_proxy_settings', 'snap_store_assertions', 'snap_store_id', 'snap_store_proxy_url', 'unknown_fields')
     _toSchema = {'apt_mirror': 'apt-mirror', 'apt_proxy_settings': 'apt-proxy-settings', 'error': 'error', 'juju_proxy_settings': 'juju-proxy-settings', 'legacy_proxy_settings': 'legacy-proxy-settings', 'snap_proxy_settings': 'snap-proxy-settings', 'snap_store_assertions': 'snap-store-assertions', 'snap_store_id': 'snap-store-id', 'snap_store_proxy_url': 'snap-store-proxy-url'}
     _toPy = {'apt-mirror': 'apt_mirror', 'apt-proxy-settings': 'apt_proxy_settings', 'error': 'error', 'juju-proxy-settings': 'juju_proxy_settings', 'legacy-proxy-settings': 'legacy_proxy_settings', 'snap-proxy-settings': 'snap_proxy_settings', 'snap-store-assertions': 'snap_store_assertions', 'snap-store-id': 'snap_store_id', 'snap-store-proxy-url': 'snap_store_proxy_url'}
+    _wireTypes = {'apt_proxy_settings': ('ProxyConfig', None), 'error': ('Error', None), 'juju_proxy_settings': ('ProxyConfig', None), 'legacy_proxy_settings': ('ProxyConfig', None), 'snap_proxy_settings': ('ProxyConfig', None)}
     def __init__(self, apt_mirror=None, apt_proxy_settings=None, error=None, juju_proxy_settings=None, legacy_proxy_settings=None, snap_proxy_settings=None, snap_store_assertions=None, snap_store_id=None, snap_store_proxy_url=None, **unknown_fields):
         '''
         apt_mirror : str
@@ -18855,8 +20087,10 @@ class ProxyConfigResult(Type):
 
 
 class ProxyConfigResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ProxyConfigResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ProxyConfigResult]
@@ -18873,8 +20107,10 @@ class ProxyConfigResults(Type):
 
 
 class QueryApplicationOffersResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ApplicationOfferAdminDetails', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ApplicationOfferAdminDetails]
@@ -18891,8 +20127,10 @@ class QueryApplicationOffersResults(Type):
 
 
 class RebootActionResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -18915,8 +20153,10 @@ class RebootActionResult(Type):
 
 
 class RebootActionResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RebootActionResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RebootActionResult]
@@ -18933,8 +20173,10 @@ class RebootActionResults(Type):
 
 
 class RecordAgentStartInformationArg(Type):
+    __slots__ = ('hostname', 'tag', 'unknown_fields')
     _toSchema = {'hostname': 'hostname', 'tag': 'tag'}
     _toPy = {'hostname': 'hostname', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, hostname=None, tag=None, **unknown_fields):
         '''
         hostname : str
@@ -18957,8 +20199,10 @@ class RecordAgentStartInformationArg(Type):
 
 
 class RecordAgentStartInformationArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('RecordAgentStartInformationArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RecordAgentStartInformationArg]
@@ -18975,8 +20219,10 @@ class RecordAgentStartInformationArgs(Type):
 
 
 class RedirectInfoResult(Type):
+    __slots__ = ('ca_cert', 'servers', 'unknown_fields')
     _toSchema = {'ca_cert': 'ca-cert', 'servers': 'servers'}
     _toPy = {'ca-cert': 'ca_cert', 'servers': 'servers'}
+    _wireTypes = {'servers': ('HostPort', 'list')}
     def __init__(self, ca_cert=None, servers=None, **unknown_fields):
         '''
         ca_cert : str
@@ -18999,8 +20245,10 @@ class RedirectInfoResult(Type):
 
 
 class RegionDefaults(Type):
+    __slots__ = ('region_name', 'value', 'unknown_fields')
     _toSchema = {'region_name': 'region-name', 'value': 'value'}
     _toPy = {'region-name': 'region_name', 'value': 'value'}
+    _wireTypes = {}
     def __init__(self, region_name=None, value=None, **unknown_fields):
         '''
         region_name : str
@@ -19020,8 +20268,10 @@ class RegionDefaults(Type):
 
 
 class RegisterRemoteRelationArg(Type):
+    __slots__ = ('application_token', 'bakery_version', 'consume_version', 'local_endpoint_name', 'macaroons', 'offer_uuid', 'relation_token', 'remote_endpoint', 'remote_space', 'source_model_tag', 'unknown_fields')
     _toSchema = {'application_token': 'application-token', 'bakery_version': 'bakery-version', 'consume_version': 'consume-version', 'local_endpoint_name': 'local-endpoint-name', 'macaroons': 'macaroons', 'offer_uuid': 'offer-uuid', 'relation_token': 'relation-token', 'remote_endpoint': 'remote-endpoint', 'remote_space': 'remote-space', 'source_model_tag': 'source-model-tag'}
     _toPy = {'application-token': 'application_token', 'bakery-version': 'bakery_version', 'consume-version': 'consume_version', 'local-endpoint-name': 'local_endpoint_name', 'macaroons': 'macaroons', 'offer-uuid': 'offer_uuid', 'relation-token': 'relation_token', 'remote-endpoint': 'remote_endpoint', 'remote-space': 'remote_space', 'source-model-tag': 'source_model_tag'}
+    _wireTypes = {'macaroons': ('Macaroon', 'list'), 'remote_endpoint': ('RemoteEndpoint', None), 'remote_space': ('RemoteSpace', None)}
     def __init__(self, application_token=None, bakery_version=None, consume_version=None, local_endpoint_name=None, macaroons=None, offer_uuid=None, relation_token=None, remote_endpoint=None, remote_space=None, source_model_tag=None, **unknown_fields):
         '''
         application_token : str
@@ -19092,8 +20342,10 @@ class RegisterRemoteRelationArg(Type):
 
 
 class RegisterRemoteRelationArgs(Type):
+    __slots__ = ('relations', 'unknown_fields')
     _toSchema = {'relations': 'relations'}
     _toPy = {'relations': 'relations'}
+    _wireTypes = {'relations': ('RegisterRemoteRelationArg', 'list')}
     def __init__(self, relations=None, **unknown_fields):
         '''
         relations : typing.Sequence[~RegisterRemoteRelationArg]
@@ -19110,8 +20362,10 @@ class RegisterRemoteRelationArgs(Type):
 
 
 class RegisterRemoteRelationResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('RemoteRelationDetails', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -19134,8 +20388,10 @@ class RegisterRemoteRelationResult(Type):
 
 
 class RegisterRemoteRelationResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RegisterRemoteRelationResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RegisterRemoteRelationResult]
@@ -19152,8 +20408,10 @@ class RegisterRemoteRelationResults(Type):
 
 
 class RelationData(Type):
+    __slots__ = ('inscope', 'unitdata', 'unknown_fields')
     _toSchema = {'inscope': 'InScope', 'unitdata': 'UnitData'}
     _toPy = {'InScope': 'inscope', 'UnitData': 'unitdata'}
+    _wireTypes = {}
     def __init__(self, inscope=None, unitdata=None, **unknown_fields):
         '''
         inscope : bool
@@ -19176,8 +20434,10 @@ class RelationData(Type):
 
 
 class RelationIds(Type):
+    __slots__ = ('relation_ids', 'unknown_fields')
     _toSchema = {'relation_ids': 'relation-ids'}
     _toPy = {'relation-ids': 'relation_ids'}
+    _wireTypes = {}
     def __init__(self, relation_ids=None, **unknown_fields):
         '''
         relation_ids : typing.Sequence[int]
@@ -19194,8 +20454,10 @@ class RelationIds(Type):
 
 
 class RelationLifeSuspendedStatusChange(Type):
+    __slots__ = ('key', 'life', 'suspended', 'suspended_reason', 'unknown_fields')
     _toSchema = {'key': 'key', 'life': 'life', 'suspended': 'suspended', 'suspended_reason': 'suspended-reason'}
     _toPy = {'key': 'key', 'life': 'life', 'suspended': 'suspended', 'suspended-reason': 'suspended_reason'}
+    _wireTypes = {}
     def __init__(self, key=None, life=None, suspended=None, suspended_reason=None, **unknown_fields):
         '''
         key : str
@@ -19230,8 +20492,10 @@ class RelationLifeSuspendedStatusChange(Type):
 
 
 class RelationLifeSuspendedStatusWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'changes': ('RelationLifeSuspendedStatusChange', 'list'), 'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : typing.Sequence[~RelationLifeSuspendedStatusChange]
@@ -19260,8 +20524,10 @@ class RelationLifeSuspendedStatusWatchResult(Type):
 
 
 class RelationResult(Type):
+    __slots__ = ('bool_', 'endpoint', 'error', 'id_', 'key', 'life', 'other_application', 'unknown_fields')
     _toSchema = {'bool_': 'bool', 'endpoint': 'endpoint', 'error': 'error', 'id_': 'id', 'key': 'key', 'life': 'life', 'other_application': 'other-application'}
     _toPy = {'bool': 'bool_', 'endpoint': 'endpoint', 'error': 'error', 'id': 'id_', 'key': 'key', 'life': 'life', 'other-application': 'other_application'}
+    _wireTypes = {'endpoint': ('Endpoint', None), 'error': ('Error', None)}
     def __init__(self, bool_=None, endpoint=None, error=None, id_=None, key=None, life=None, other_application=None, **unknown_fields):
         '''
         bool_ : bool
@@ -19314,8 +20580,10 @@ class RelationResult(Type):
 
 
 class RelationResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RelationResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RelationResult]
@@ -19332,8 +20600,10 @@ class RelationResults(Type):
 
 
 class RelationStatus(Type):
+    __slots__ = ('endpoints', 'id_', 'interface', 'key', 'scope', 'status', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints', 'id_': 'id', 'interface': 'interface', 'key': 'key', 'scope': 'scope', 'status': 'status'}
     _toPy = {'endpoints': 'endpoints', 'id': 'id_', 'interface': 'interface', 'key': 'key', 'scope': 'scope', 'status': 'status'}
+    _wireTypes = {'endpoints': ('EndpointStatus', 'list'), 'status': ('DetailedStatus', None)}
     def __init__(self, endpoints=None, id_=None, interface=None, key=None, scope=None, status=None, **unknown_fields):
         '''
         endpoints : typing.Sequence[~EndpointStatus]
@@ -19380,8 +20650,10 @@ class RelationStatus(Type):
 
 
 class RelationStatusArg(Type):
+    __slots__ = ('message', 'relation_id', 'status', 'unit_tag', 'unknown_fields')
     _toSchema = {'message': 'message', 'relation_id': 'relation-id', 'status': 'status', 'unit_tag': 'unit-tag'}
     _toPy = {'message': 'message', 'relation-id': 'relation_id', 'status': 'status', 'unit-tag': 'unit_tag'}
+    _wireTypes = {}
     def __init__(self, message=None, relation_id=None, status=None, unit_tag=None, **unknown_fields):
         '''
         message : str
@@ -19416,8 +20688,10 @@ class RelationStatusArg(Type):
 
 
 class RelationStatusArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('RelationStatusArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RelationStatusArg]
@@ -19434,8 +20708,10 @@ class RelationStatusArgs(Type):
 
 
 class RelationStatusWatchResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RelationLifeSuspendedStatusWatchResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RelationLifeSuspendedStatusWatchResult]
@@ -19452,8 +20728,10 @@ class RelationStatusWatchResults(Type):
 
 
 class RelationSuspendedArg(Type):
+    __slots__ = ('message', 'relation_id', 'suspended', 'unknown_fields')
     _toSchema = {'message': 'message', 'relation_id': 'relation-id', 'suspended': 'suspended'}
     _toPy = {'message': 'message', 'relation-id': 'relation_id', 'suspended': 'suspended'}
+    _wireTypes = {}
     def __init__(self, message=None, relation_id=None, suspended=None, **unknown_fields):
         '''
         message : str
@@ -19482,8 +20760,10 @@ class RelationSuspendedArg(Type):
 
 
 class RelationSuspendedArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('RelationSuspendedArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RelationSuspendedArg]
@@ -19500,8 +20780,10 @@ class RelationSuspendedArgs(Type):
 
 
 class RelationUnit(Type):
+    __slots__ = ('relation', 'unit', 'unknown_fields')
     _toSchema = {'relation': 'relation', 'unit': 'unit'}
     _toPy = {'relation': 'relation', 'unit': 'unit'}
+    _wireTypes = {}
     def __init__(self, relation=None, unit=None, **unknown_fields):
         '''
         relation : str
@@ -19524,8 +20806,10 @@ class RelationUnit(Type):
 
 
 class RelationUnitPair(Type):
+    __slots__ = ('local_unit', 'relation', 'remote_unit', 'unknown_fields')
     _toSchema = {'local_unit': 'local-unit', 'relation': 'relation', 'remote_unit': 'remote-unit'}
     _toPy = {'local-unit': 'local_unit', 'relation': 'relation', 'remote-unit': 'remote_unit'}
+    _wireTypes = {}
     def __init__(self, local_unit=None, relation=None, remote_unit=None, **unknown_fields):
         '''
         local_unit : str
@@ -19554,8 +20838,10 @@ class RelationUnitPair(Type):
 
 
 class RelationUnitPairs(Type):
+    __slots__ = ('relation_unit_pairs', 'unknown_fields')
     _toSchema = {'relation_unit_pairs': 'relation-unit-pairs'}
     _toPy = {'relation-unit-pairs': 'relation_unit_pairs'}
+    _wireTypes = {'relation_unit_pairs': ('RelationUnitPair', 'list')}
     def __init__(self, relation_unit_pairs=None, **unknown_fields):
         '''
         relation_unit_pairs : typing.Sequence[~RelationUnitPair]
@@ -19572,8 +20858,10 @@ class RelationUnitPairs(Type):
 
 
 class RelationUnitSettings(Type):
+    __slots__ = ('application_settings', 'relation', 'settings', 'unit', 'unknown_fields')
     _toSchema = {'application_settings': 'application-settings', 'relation': 'relation', 'settings': 'settings', 'unit': 'unit'}
     _toPy = {'application-settings': 'application_settings', 'relation': 'relation', 'settings': 'settings', 'unit': 'unit'}
+    _wireTypes = {}
     def __init__(self, application_settings=None, relation=None, settings=None, unit=None, **unknown_fields):
         '''
         application_settings : typing.Mapping[str, str]
@@ -19608,8 +20896,10 @@ class RelationUnitSettings(Type):
 
 
 class RelationUnitStatus(Type):
+    __slots__ = ('in_scope', 'relation_tag', 'suspended', 'unknown_fields')
     _toSchema = {'in_scope': 'in-scope', 'relation_tag': 'relation-tag', 'suspended': 'suspended'}
     _toPy = {'in-scope': 'in_scope', 'relation-tag': 'relation_tag', 'suspended': 'suspended'}
+    _wireTypes = {}
     def __init__(self, in_scope=None, relation_tag=None, suspended=None, **unknown_fields):
         '''
         in_scope : bool
@@ -19638,8 +20928,10 @@ class RelationUnitStatus(Type):
 
 
 class RelationUnitStatusResult(Type):
+    __slots__ = ('error', 'results', 'unknown_fields')
     _toSchema = {'error': 'error', 'results': 'results'}
     _toPy = {'error': 'error', 'results': 'results'}
+    _wireTypes = {'error': ('Error', None), 'results': ('RelationUnitStatus', 'list')}
     def __init__(self, error=None, results=None, **unknown_fields):
         '''
         error : Error
@@ -19662,8 +20954,10 @@ class RelationUnitStatusResult(Type):
 
 
 class RelationUnitStatusResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RelationUnitStatusResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RelationUnitStatusResult]
@@ -19680,8 +20974,10 @@ class RelationUnitStatusResults(Type):
 
 
 class RelationUnits(Type):
+    __slots__ = ('relation_units', 'unknown_fields')
     _toSchema = {'relation_units': 'relation-units'}
     _toPy = {'relation-units': 'relation_units'}
+    _wireTypes = {'relation_units': ('RelationUnit', 'list')}
     def __init__(self, relation_units=None, **unknown_fields):
         '''
         relation_units : typing.Sequence[~RelationUnit]
@@ -19698,8 +20994,10 @@ class RelationUnits(Type):
 
 
 class RelationUnitsChange(Type):
+    __slots__ = ('app_changed', 'changed', 'departed', 'unknown_fields')
     _toSchema = {'app_changed': 'app-changed', 'changed': 'changed', 'departed': 'departed'}
     _toPy = {'app-changed': 'app_changed', 'changed': 'changed', 'departed': 'departed'}
+    _wireTypes = {'changed': ('UnitSettings', 'dict')}
     def __init__(self, app_changed=None, changed=None, departed=None, **unknown_fields):
         '''
         app_changed : typing.Mapping[str, int]
@@ -19728,8 +21026,10 @@ class RelationUnitsChange(Type):
 
 
 class RelationUnitsWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'changes': ('RelationUnitsChange', None), 'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : RelationUnitsChange
@@ -19758,8 +21058,10 @@ class RelationUnitsWatchResult(Type):
 
 
 class RelationUnitsWatchResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RelationUnitsWatchResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RelationUnitsWatchResult]
@@ -19776,8 +21078,10 @@ class RelationUnitsWatchResults(Type):
 
 
 class RemoteApplication(Type):
+    __slots__ = ('consume_version', 'is_consumer_proxy', 'life', 'macaroon', 'model_uuid', 'name', 'offer_uuid', 'status', 'unknown_fields')
     _toSchema = {'consume_version': 'consume-version', 'is_consumer_proxy': 'is-consumer-proxy', 'life': 'life', 'macaroon': 'macaroon', 'model_uuid': 'model-uuid', 'name': 'name', 'offer_uuid': 'offer-uuid', 'status': 'status'}
     _toPy = {'consume-version': 'consume_version', 'is-consumer-proxy': 'is_consumer_proxy', 'life': 'life', 'macaroon': 'macaroon', 'model-uuid': 'model_uuid', 'name': 'name', 'offer-uuid': 'offer_uuid', 'status': 'status'}
+    _wireTypes = {'macaroon': ('Macaroon', None)}
     def __init__(self, consume_version=None, is_consumer_proxy=None, life=None, macaroon=None, model_uuid=None, name=None, offer_uuid=None, status=None, **unknown_fields):
         '''
         consume_version : int
@@ -19836,8 +21140,10 @@ class RemoteApplication(Type):
 
 
 class RemoteApplicationInfo(Type):
+    __slots__ = ('description', 'endpoints', 'icon_url_path', 'model_tag', 'name', 'offer_url', 'source_model_label', 'unknown_fields')
     _toSchema = {'description': 'description', 'endpoints': 'endpoints', 'icon_url_path': 'icon-url-path', 'model_tag': 'model-tag', 'name': 'name', 'offer_url': 'offer-url', 'source_model_label': 'source-model-label'}
     _toPy = {'description': 'description', 'endpoints': 'endpoints', 'icon-url-path': 'icon_url_path', 'model-tag': 'model_tag', 'name': 'name', 'offer-url': 'offer_url', 'source-model-label': 'source_model_label'}
+    _wireTypes = {'endpoints': ('RemoteEndpoint', 'list')}
     def __init__(self, description=None, endpoints=None, icon_url_path=None, model_tag=None, name=None, offer_url=None, source_model_label=None, **unknown_fields):
         '''
         description : str
@@ -19890,8 +21196,10 @@ class RemoteApplicationInfo(Type):
 
 
 class RemoteApplicationInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('RemoteApplicationInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -19914,8 +21222,10 @@ class RemoteApplicationInfoResult(Type):
 
 
 class RemoteApplicationInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RemoteApplicationInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoteApplicationInfoResult]
@@ -19932,8 +21242,10 @@ class RemoteApplicationInfoResults(Type):
 
 
 class RemoteApplicationResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('RemoteApplication', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -19956,8 +21268,10 @@ class RemoteApplicationResult(Type):
 
 
 class RemoteApplicationResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RemoteApplicationResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoteApplicationResult]
@@ -19974,8 +21288,10 @@ class RemoteApplicationResults(Type):
 
 
 class RemoteApplicationStatus(Type):
+    __slots__ = ('endpoints', 'err', 'life', 'offer_name', 'offer_url', 'relations', 'status', 'unknown_fields')
     _toSchema = {'endpoints': 'endpoints', 'err': 'err', 'life': 'life', 'offer_name': 'offer-name', 'offer_url': 'offer-url', 'relations': 'relations', 'status': 'status'}
     _toPy = {'endpoints': 'endpoints', 'err': 'err', 'life': 'life', 'offer-name': 'offer_name', 'offer-url': 'offer_url', 'relations': 'relations', 'status': 'status'}
+    _wireTypes = {'endpoints': ('RemoteEndpoint', 'list'), 'err': ('Error', None), 'status': ('DetailedStatus', None)}
     def __init__(self, endpoints=None, err=None, life=None, offer_name=None, offer_url=None, relations=None, status=None, **unknown_fields):
         '''
         endpoints : typing.Sequence[~RemoteEndpoint]
@@ -20028,8 +21344,10 @@ class RemoteApplicationStatus(Type):
 
 
 class RemoteEndpoint(Type):
+    __slots__ = ('interface', 'limit', 'name', 'role', 'unknown_fields')
     _toSchema = {'interface': 'interface', 'limit': 'limit', 'name': 'name', 'role': 'role'}
     _toPy = {'interface': 'interface', 'limit': 'limit', 'name': 'name', 'role': 'role'}
+    _wireTypes = {}
     def __init__(self, interface=None, limit=None, name=None, role=None, **unknown_fields):
         '''
         interface : str
@@ -20064,8 +21382,10 @@ class RemoteEndpoint(Type):
 
 
 class RemoteEntityArg(Type):
+    __slots__ = ('bakery_version', 'macaroons', 'relation_token', 'unknown_fields')
     _toSchema = {'bakery_version': 'bakery-version', 'macaroons': 'macaroons', 'relation_token': 'relation-token'}
     _toPy = {'bakery-version': 'bakery_version', 'macaroons': 'macaroons', 'relation-token': 'relation_token'}
+    _wireTypes = {'macaroons': ('Macaroon', 'list')}
     def __init__(self, bakery_version=None, macaroons=None, relation_token=None, **unknown_fields):
         '''
         bakery_version : int
@@ -20094,8 +21414,10 @@ class RemoteEntityArg(Type):
 
 
 class RemoteEntityArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('RemoteEntityArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RemoteEntityArg]
@@ -20112,8 +21434,10 @@ class RemoteEntityArgs(Type):
 
 
 class RemoteEntityTokenArg(Type):
+    __slots__ = ('tag', 'token', 'unknown_fields')
     _toSchema = {'tag': 'tag', 'token': 'token'}
     _toPy = {'tag': 'tag', 'token': 'token'}
+    _wireTypes = {}
     def __init__(self, tag=None, token=None, **unknown_fields):
         '''
         tag : str
@@ -20136,8 +21460,10 @@ class RemoteEntityTokenArg(Type):
 
 
 class RemoteEntityTokenArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'Args'}
     _toPy = {'Args': 'args'}
+    _wireTypes = {'args': ('RemoteEntityTokenArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RemoteEntityTokenArg]
@@ -20154,8 +21480,10 @@ class RemoteEntityTokenArgs(Type):
 
 
 class RemoteRelation(Type):
+    __slots__ = ('application_name', 'endpoint', 'id_', 'key', 'life', 'remote_application_name', 'remote_endpoint_name', 'source_model_uuid', 'suspended', 'unit_count', 'unknown_fields')
     _toSchema = {'application_name': 'application-name', 'endpoint': 'endpoint', 'id_': 'id', 'key': 'key', 'life': 'life', 'remote_application_name': 'remote-application-name', 'remote_endpoint_name': 'remote-endpoint-name', 'source_model_uuid': 'source-model-uuid', 'suspended': 'suspended', 'unit_count': 'unit-count'}
     _toPy = {'application-name': 'application_name', 'endpoint': 'endpoint', 'id': 'id_', 'key': 'key', 'life': 'life', 'remote-application-name': 'remote_application_name', 'remote-endpoint-name': 'remote_endpoint_name', 'source-model-uuid': 'source_model_uuid', 'suspended': 'suspended', 'unit-count': 'unit_count'}
+    _wireTypes = {'endpoint': ('RemoteEndpoint', None)}
     def __init__(self, application_name=None, endpoint=None, id_=None, key=None, life=None, remote_application_name=None, remote_endpoint_name=None, source_model_uuid=None, suspended=None, unit_count=None, **unknown_fields):
         '''
         application_name : str
@@ -20226,8 +21554,10 @@ class RemoteRelation(Type):
 
 
 class RemoteRelationChangeEvent(Type):
+    __slots__ = ('application_settings', 'application_token', 'bakery_version', 'changed_units', 'departed_units', 'force_cleanup', 'life', 'macaroons', 'relation_token', 'suspended', 'suspended_reason', 'unit_count', 'unknown_fields')
     _toSchema = {'application_settings': 'application-settings', 'application_token': 'application-token', 'bakery_version': 'bakery-version', 'changed_units': 'changed-units', 'departed_units': 'departed-units', 'force_cleanup': 'force-cleanup', 'life': 'life', 'macaroons': 'macaroons', 'relation_token': 'relation-token', 'suspended': 'suspended', 'suspended_reason': 'suspended-reason', 'unit_count': 'unit-count'}
     _toPy = {'application-settings': 'application_settings', 'application-token': 'application_token', 'bakery-version': 'bakery_version', 'changed-units': 'changed_units', 'departed-units': 'departed_units', 'force-cleanup': 'force_cleanup', 'life': 'life', 'macaroons': 'macaroons', 'relation-token': 'relation_token', 'suspended': 'suspended', 'suspended-reason': 'suspended_reason', 'unit-count': 'unit_count'}
+    _wireTypes = {'changed_units': ('RemoteRelationUnitChange', 'list'), 'macaroons': ('Macaroon', 'list')}
     def __init__(self, application_settings=None, application_token=None, bakery_version=None, changed_units=None, departed_units=None, force_cleanup=None, life=None, macaroons=None, relation_token=None, suspended=None, suspended_reason=None, unit_count=None, **unknown_fields):
         '''
         application_settings : typing.Mapping[str, typing.Any]
@@ -20310,8 +21640,10 @@ class RemoteRelationChangeEvent(Type):
 
 
 class RemoteRelationDetails(Type):
+    __slots__ = ('bakery_version', 'macaroon', 'relation_token', 'unknown_fields')
     _toSchema = {'bakery_version': 'bakery-version', 'macaroon': 'macaroon', 'relation_token': 'relation-token'}
     _toPy = {'bakery-version': 'bakery_version', 'macaroon': 'macaroon', 'relation-token': 'relation_token'}
+    _wireTypes = {'macaroon': ('Macaroon', None)}
     def __init__(self, bakery_version=None, macaroon=None, relation_token=None, **unknown_fields):
         '''
         bakery_version : int
@@ -20340,8 +21672,10 @@ class RemoteRelationDetails(Type):
 
 
 class RemoteRelationResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('RemoteRelation', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -20364,8 +21698,10 @@ class RemoteRelationResult(Type):
 
 
 class RemoteRelationResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RemoteRelationResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoteRelationResult]
@@ -20382,8 +21718,10 @@ class RemoteRelationResults(Type):
 
 
 class RemoteRelationUnitChange(Type):
+    __slots__ = ('settings', 'unit_id', 'unknown_fields')
     _toSchema = {'settings': 'settings', 'unit_id': 'unit-id'}
     _toPy = {'settings': 'settings', 'unit-id': 'unit_id'}
+    _wireTypes = {}
     def __init__(self, settings=None, unit_id=None, **unknown_fields):
         '''
         settings : typing.Mapping[str, typing.Any]
@@ -20406,8 +21744,10 @@ class RemoteRelationUnitChange(Type):
 
 
 class RemoteRelationWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'changes': ('RemoteRelationChangeEvent', None), 'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : RemoteRelationChangeEvent
@@ -20436,8 +21776,10 @@ class RemoteRelationWatchResult(Type):
 
 
 class RemoteRelationWatchResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RemoteRelationWatchResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoteRelationWatchResult]
@@ -20454,8 +21796,10 @@ class RemoteRelationWatchResults(Type):
 
 
 class RemoteRelationsChanges(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('RemoteRelationChangeEvent', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~RemoteRelationChangeEvent]
@@ -20472,8 +21816,10 @@ class RemoteRelationsChanges(Type):
 
 
 class RemoteSpace(Type):
+    __slots__ = ('cloud_type', 'name', 'provider_attributes', 'provider_id', 'subnets', 'unknown_fields')
     _toSchema = {'cloud_type': 'cloud-type', 'name': 'name', 'provider_attributes': 'provider-attributes', 'provider_id': 'provider-id', 'subnets': 'subnets'}
     _toPy = {'cloud-type': 'cloud_type', 'name': 'name', 'provider-attributes': 'provider_attributes', 'provider-id': 'provider_id', 'subnets': 'subnets'}
+    _wireTypes = {'subnets': ('Subnet', 'list')}
     def __init__(self, cloud_type=None, name=None, provider_attributes=None, provider_id=None, subnets=None, **unknown_fields):
         '''
         cloud_type : str
@@ -20514,8 +21860,10 @@ class RemoteSpace(Type):
 
 
 class RemoveBlocksArgs(Type):
+    __slots__ = ('all_', 'unknown_fields')
     _toSchema = {'all_': 'all'}
     _toPy = {'all': 'all_'}
+    _wireTypes = {}
     def __init__(self, all_=None, **unknown_fields):
         '''
         all_ : bool
@@ -20532,8 +21880,10 @@ class RemoveBlocksArgs(Type):
 
 
 class RemoveFilesystemParams(Type):
+    __slots__ = ('destroy', 'filesystem_id', 'provider', 'unknown_fields')
     _toSchema = {'destroy': 'destroy', 'filesystem_id': 'filesystem-id', 'provider': 'provider'}
     _toPy = {'destroy': 'destroy', 'filesystem-id': 'filesystem_id', 'provider': 'provider'}
+    _wireTypes = {}
     def __init__(self, destroy=None, filesystem_id=None, provider=None, **unknown_fields):
         '''
         destroy : bool
@@ -20562,8 +21912,10 @@ class RemoveFilesystemParams(Type):
 
 
 class RemoveFilesystemParamsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('RemoveFilesystemParams', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -20586,8 +21938,10 @@ class RemoveFilesystemParamsResult(Type):
 
 
 class RemoveFilesystemParamsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RemoveFilesystemParamsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoveFilesystemParamsResult]
@@ -20604,8 +21958,10 @@ class RemoveFilesystemParamsResults(Type):
 
 
 class RemoveSecretBackendArg(Type):
+    __slots__ = ('force', 'name', 'unknown_fields')
     _toSchema = {'force': 'force', 'name': 'name'}
     _toPy = {'force': 'force', 'name': 'name'}
+    _wireTypes = {}
     def __init__(self, force=None, name=None, **unknown_fields):
         '''
         force : bool
@@ -20628,8 +21984,10 @@ class RemoveSecretBackendArg(Type):
 
 
 class RemoveSecretBackendArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('RemoveSecretBackendArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~RemoveSecretBackendArg]
@@ -20646,8 +22004,10 @@ class RemoveSecretBackendArgs(Type):
 
 
 class RemoveSpaceParam(Type):
+    __slots__ = ('dry_run', 'force', 'space', 'unknown_fields')
     _toSchema = {'dry_run': 'dry-run', 'force': 'force', 'space': 'space'}
     _toPy = {'dry-run': 'dry_run', 'force': 'force', 'space': 'space'}
+    _wireTypes = {'space': ('Entity', None)}
     def __init__(self, dry_run=None, force=None, space=None, **unknown_fields):
         '''
         dry_run : bool
@@ -20676,8 +22036,10 @@ class RemoveSpaceParam(Type):
 
 
 class RemoveSpaceParams(Type):
+    __slots__ = ('space_param', 'unknown_fields')
     _toSchema = {'space_param': 'space-param'}
     _toPy = {'space-param': 'space_param'}
+    _wireTypes = {'space_param': ('RemoveSpaceParam', 'list')}
     def __init__(self, space_param=None, **unknown_fields):
         '''
         space_param : typing.Sequence[~RemoveSpaceParam]
@@ -20694,8 +22056,10 @@ class RemoveSpaceParams(Type):
 
 
 class RemoveSpaceResult(Type):
+    __slots__ = ('bindings', 'constraints', 'controller_settings', 'error', 'unknown_fields')
     _toSchema = {'bindings': 'bindings', 'constraints': 'constraints', 'controller_settings': 'controller-settings', 'error': 'error'}
     _toPy = {'bindings': 'bindings', 'constraints': 'constraints', 'controller-settings': 'controller_settings', 'error': 'error'}
+    _wireTypes = {'bindings': ('Entity', 'list'), 'constraints': ('Entity', 'list'), 'error': ('Error', None)}
     def __init__(self, bindings=None, constraints=None, controller_settings=None, error=None, **unknown_fields):
         '''
         bindings : typing.Sequence[~Entity]
@@ -20730,8 +22094,10 @@ class RemoveSpaceResult(Type):
 
 
 class RemoveSpaceResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RemoveSpaceResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoveSpaceResult]
@@ -20748,8 +22114,10 @@ class RemoveSpaceResults(Type):
 
 
 class RemoveStorage(Type):
+    __slots__ = ('storage', 'unknown_fields')
     _toSchema = {'storage': 'storage'}
     _toPy = {'storage': 'storage'}
+    _wireTypes = {'storage': ('RemoveStorageInstance', 'list')}
     def __init__(self, storage=None, **unknown_fields):
         '''
         storage : typing.Sequence[~RemoveStorageInstance]
@@ -20766,8 +22134,10 @@ class RemoveStorage(Type):
 
 
 class RemoveStorageInstance(Type):
+    __slots__ = ('destroy_attachments', 'destroy_storage', 'force', 'max_wait', 'tag', 'unknown_fields')
     _toSchema = {'destroy_attachments': 'destroy-attachments', 'destroy_storage': 'destroy-storage', 'force': 'force', 'max_wait': 'max-wait', 'tag': 'tag'}
     _toPy = {'destroy-attachments': 'destroy_attachments', 'destroy-storage': 'destroy_storage', 'force': 'force', 'max-wait': 'max_wait', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, destroy_attachments=None, destroy_storage=None, force=None, max_wait=None, tag=None, **unknown_fields):
         '''
         destroy_attachments : bool
@@ -20808,8 +22178,10 @@ class RemoveStorageInstance(Type):
 
 
 class RemoveVolumeParams(Type):
+    __slots__ = ('destroy', 'provider', 'volume_id', 'unknown_fields')
     _toSchema = {'destroy': 'destroy', 'provider': 'provider', 'volume_id': 'volume-id'}
     _toPy = {'destroy': 'destroy', 'provider': 'provider', 'volume-id': 'volume_id'}
+    _wireTypes = {}
     def __init__(self, destroy=None, provider=None, volume_id=None, **unknown_fields):
         '''
         destroy : bool
@@ -20838,8 +22210,10 @@ class RemoveVolumeParams(Type):
 
 
 class RemoveVolumeParamsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('RemoveVolumeParams', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -20862,8 +22236,10 @@ class RemoveVolumeParamsResult(Type):
 
 
 class RemoveVolumeParamsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RemoveVolumeParamsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RemoveVolumeParamsResult]
@@ -20880,8 +22256,10 @@ class RemoveVolumeParamsResults(Type):
 
 
 class RenameSpaceParams(Type):
+    __slots__ = ('from_space_tag', 'to_space_tag', 'unknown_fields')
     _toSchema = {'from_space_tag': 'from-space-tag', 'to_space_tag': 'to-space-tag'}
     _toPy = {'from-space-tag': 'from_space_tag', 'to-space-tag': 'to_space_tag'}
+    _wireTypes = {}
     def __init__(self, from_space_tag=None, to_space_tag=None, **unknown_fields):
         '''
         from_space_tag : str
@@ -20904,8 +22282,10 @@ class RenameSpaceParams(Type):
 
 
 class RenameSpacesParams(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('RenameSpaceParams', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~RenameSpaceParams]
@@ -20922,8 +22302,10 @@ class RenameSpacesParams(Type):
 
 
 class ResolveCharmWithChannel(Type):
+    __slots__ = ('charm_origin', 'reference', 'switch_charm', 'unknown_fields')
     _toSchema = {'charm_origin': 'charm-origin', 'reference': 'reference', 'switch_charm': 'switch-charm'}
     _toPy = {'charm-origin': 'charm_origin', 'reference': 'reference', 'switch-charm': 'switch_charm'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None)}
     def __init__(self, charm_origin=None, reference=None, switch_charm=None, **unknown_fields):
         '''
         charm_origin : CharmOrigin
@@ -20952,8 +22334,10 @@ class ResolveCharmWithChannel(Type):
 
 
 class ResolveCharmWithChannelResult(Type):
+    __slots__ = ('charm_origin', 'error', 'supported_bases', 'url', 'unknown_fields')
     _toSchema = {'charm_origin': 'charm-origin', 'error': 'error', 'supported_bases': 'supported-bases', 'url': 'url'}
     _toPy = {'charm-origin': 'charm_origin', 'error': 'error', 'supported-bases': 'supported_bases', 'url': 'url'}
+    _wireTypes = {'charm_origin': ('CharmOrigin', None), 'error': ('Error', None), 'supported_bases': ('Base', 'list')}
     def __init__(self, charm_origin=None, error=None, supported_bases=None, url=None, **unknown_fields):
         '''
         charm_origin : CharmOrigin
@@ -20988,8 +22372,10 @@ class ResolveCharmWithChannelResult(Type):
 
 
 class ResolveCharmWithChannelResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'Results'}
     _toPy = {'Results': 'results'}
+    _wireTypes = {'results': ('ResolveCharmWithChannelResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ResolveCharmWithChannelResult]
@@ -21006,8 +22392,10 @@ class ResolveCharmWithChannelResults(Type):
 
 
 class ResolveCharmsWithChannel(Type):
+    __slots__ = ('macaroon', 'resolve', 'unknown_fields')
     _toSchema = {'macaroon': 'macaroon', 'resolve': 'resolve'}
     _toPy = {'macaroon': 'macaroon', 'resolve': 'resolve'}
+    _wireTypes = {'macaroon': ('Macaroon', None), 'resolve': ('ResolveCharmWithChannel', 'list')}
     def __init__(self, macaroon=None, resolve=None, **unknown_fields):
         '''
         macaroon : Macaroon
@@ -21030,8 +22418,10 @@ class ResolveCharmsWithChannel(Type):
 
 
 class ResolvedModeResult(Type):
+    __slots__ = ('error', 'mode', 'unknown_fields')
     _toSchema = {'error': 'error', 'mode': 'mode'}
     _toPy = {'error': 'error', 'mode': 'mode'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, mode=None, **unknown_fields):
         '''
         error : Error
@@ -21054,8 +22444,10 @@ class ResolvedModeResult(Type):
 
 
 class ResolvedModeResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ResolvedModeResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ResolvedModeResult]
@@ -21072,8 +22464,10 @@ class ResolvedModeResults(Type):
 
 
 class Resource(Type):
+    __slots__ = ('charmresource', 'application', 'description', 'fingerprint', 'id_', 'name', 'origin', 'path', 'pending_id', 'revision', 'size', 'timestamp', 'type_', 'username', 'unknown_fields')
     _toSchema = {'application': 'application', 'charmresource': 'CharmResource', 'description': 'description', 'fingerprint': 'fingerprint', 'id_': 'id', 'name': 'name', 'origin': 'origin', 'path': 'path', 'pending_id': 'pending-id', 'revision': 'revision', 'size': 'size', 'timestamp': 'timestamp', 'type_': 'type', 'username': 'username'}
     _toPy = {'CharmResource': 'charmresource', 'application': 'application', 'description': 'description', 'fingerprint': 'fingerprint', 'id': 'id_', 'name': 'name', 'origin': 'origin', 'path': 'path', 'pending-id': 'pending_id', 'revision': 'revision', 'size': 'size', 'timestamp': 'timestamp', 'type': 'type_', 'username': 'username'}
+    _wireTypes = {'charmresource': ('CharmResource', None)}
     def __init__(self, charmresource=None, application=None, description=None, fingerprint=None, id_=None, name=None, origin=None, path=None, pending_id=None, revision=None, size=None, timestamp=None, type_=None, username=None, **unknown_fields):
         '''
         charmresource : CharmResource
@@ -21168,8 +22562,10 @@ class Resource(Type):
 
 
 class ResourcesResult(Type):
+    __slots__ = ('errorresult', 'charm_store_resources', 'error', 'resources', 'unit_resources', 'unknown_fields')
     _toSchema = {'charm_store_resources': 'charm-store-resources', 'error': 'error', 'errorresult': 'ErrorResult', 'resources': 'resources', 'unit_resources': 'unit-resources'}
     _toPy = {'ErrorResult': 'errorresult', 'charm-store-resources': 'charm_store_resources', 'error': 'error', 'resources': 'resources', 'unit-resources': 'unit_resources'}
+    _wireTypes = {'charm_store_resources': ('CharmResource', 'list'), 'error': ('Error', None), 'errorresult': ('ErrorResult', None), 'resources': ('Resource', 'list'), 'unit_resources': ('UnitResources', 'list')}
     def __init__(self, errorresult=None, charm_store_resources=None, error=None, resources=None, unit_resources=None, **unknown_fields):
         '''
         errorresult : ErrorResult
@@ -21210,8 +22606,10 @@ class ResourcesResult(Type):
 
 
 class ResourcesResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ResourcesResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ResourcesResult]
@@ -21228,8 +22626,10 @@ class ResourcesResults(Type):
 
 
 class RetryProvisioningArgs(Type):
+    __slots__ = ('all_', 'machines', 'unknown_fields')
     _toSchema = {'all_': 'all', 'machines': 'machines'}
     _toPy = {'all': 'all_', 'machines': 'machines'}
+    _wireTypes = {}
     def __init__(self, all_=None, machines=None, **unknown_fields):
         '''
         all_ : bool
@@ -21252,8 +22652,10 @@ class RetryProvisioningArgs(Type):
 
 
 class RetryStrategy(Type):
+    __slots__ = ('jitter_retry_time', 'max_retry_time', 'min_retry_time', 'retry_time_factor', 'should_retry', 'unknown_fields')
     _toSchema = {'jitter_retry_time': 'jitter-retry-time', 'max_retry_time': 'max-retry-time', 'min_retry_time': 'min-retry-time', 'retry_time_factor': 'retry-time-factor', 'should_retry': 'should-retry'}
     _toPy = {'jitter-retry-time': 'jitter_retry_time', 'max-retry-time': 'max_retry_time', 'min-retry-time': 'min_retry_time', 'retry-time-factor': 'retry_time_factor', 'should-retry': 'should_retry'}
+    _wireTypes = {}
     def __init__(self, jitter_retry_time=None, max_retry_time=None, min_retry_time=None, retry_time_factor=None, should_retry=None, **unknown_fields):
         '''
         jitter_retry_time : bool
@@ -21294,8 +22696,10 @@ class RetryStrategy(Type):
 
 
 class RetryStrategyResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('RetryStrategy', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -21318,8 +22722,10 @@ class RetryStrategyResult(Type):
 
 
 class RetryStrategyResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('RetryStrategyResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~RetryStrategyResult]
@@ -21336,8 +22742,10 @@ class RetryStrategyResults(Type):
 
 
 class RevokeCredentialArg(Type):
+    __slots__ = ('force', 'tag', 'unknown_fields')
     _toSchema = {'force': 'force', 'tag': 'tag'}
     _toPy = {'force': 'force', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, force=None, tag=None, **unknown_fields):
         '''
         force : bool
@@ -21360,8 +22768,10 @@ class RevokeCredentialArg(Type):
 
 
 class RevokeCredentialArgs(Type):
+    __slots__ = ('credentials', 'unknown_fields')
     _toSchema = {'credentials': 'credentials'}
     _toPy = {'credentials': 'credentials'}
+    _wireTypes = {'credentials': ('RevokeCredentialArg', 'list')}
     def __init__(self, credentials=None, **unknown_fields):
         '''
         credentials : typing.Sequence[~RevokeCredentialArg]
@@ -21378,8 +22788,10 @@ class RevokeCredentialArgs(Type):
 
 
 class RotateSecretBackendArgs(Type):
+    __slots__ = ('backend_ids', 'unknown_fields')
     _toSchema = {'backend_ids': 'backend-ids'}
     _toPy = {'backend-ids': 'backend_ids'}
+    _wireTypes = {}
     def __init__(self, backend_ids=None, **unknown_fields):
         '''
         backend_ids : typing.Sequence[str]
@@ -21396,8 +22808,10 @@ class RotateSecretBackendArgs(Type):
 
 
 class RunParams(Type):
+    __slots__ = ('applications', 'commands', 'execution_group', 'machines', 'parallel', 'timeout', 'units', 'workload_context', 'unknown_fields')
     _toSchema = {'applications': 'applications', 'commands': 'commands', 'execution_group': 'execution-group', 'machines': 'machines', 'parallel': 'parallel', 'timeout': 'timeout', 'units': 'units', 'workload_context': 'workload-context'}
     _toPy = {'applications': 'applications', 'commands': 'commands', 'execution-group': 'execution_group', 'machines': 'machines', 'parallel': 'parallel', 'timeout': 'timeout', 'units': 'units', 'workload-context': 'workload_context'}
+    _wireTypes = {}
     def __init__(self, applications=None, commands=None, execution_group=None, machines=None, parallel=None, timeout=None, units=None, workload_context=None, **unknown_fields):
         '''
         applications : typing.Sequence[str]
@@ -21456,8 +22870,10 @@ class RunParams(Type):
 
 
 class SSHAddressResult(Type):
+    __slots__ = ('address', 'error', 'unknown_fields')
     _toSchema = {'address': 'address', 'error': 'error'}
     _toPy = {'address': 'address', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, address=None, error=None, **unknown_fields):
         '''
         address : str
@@ -21480,8 +22896,10 @@ class SSHAddressResult(Type):
 
 
 class SSHAddressResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SSHAddressResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SSHAddressResult]
@@ -21498,8 +22916,10 @@ class SSHAddressResults(Type):
 
 
 class SSHAddressesResult(Type):
+    __slots__ = ('addresses', 'error', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'error': 'error'}
     _toPy = {'addresses': 'addresses', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, addresses=None, error=None, **unknown_fields):
         '''
         addresses : typing.Sequence[str]
@@ -21522,8 +22942,10 @@ class SSHAddressesResult(Type):
 
 
 class SSHAddressesResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SSHAddressesResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SSHAddressesResult]
@@ -21540,8 +22962,10 @@ class SSHAddressesResults(Type):
 
 
 class SSHHostKeySet(Type):
+    __slots__ = ('entity_keys', 'unknown_fields')
     _toSchema = {'entity_keys': 'entity-keys'}
     _toPy = {'entity-keys': 'entity_keys'}
+    _wireTypes = {'entity_keys': ('SSHHostKeys', 'list')}
     def __init__(self, entity_keys=None, **unknown_fields):
         '''
         entity_keys : typing.Sequence[~SSHHostKeys]
@@ -21558,8 +22982,10 @@ class SSHHostKeySet(Type):
 
 
 class SSHHostKeys(Type):
+    __slots__ = ('public_keys', 'tag', 'unknown_fields')
     _toSchema = {'public_keys': 'public-keys', 'tag': 'tag'}
     _toPy = {'public-keys': 'public_keys', 'tag': 'tag'}
+    _wireTypes = {}
     def __init__(self, public_keys=None, tag=None, **unknown_fields):
         '''
         public_keys : typing.Sequence[str]
@@ -21582,8 +23008,10 @@ class SSHHostKeys(Type):
 
 
 class SSHProxyResult(Type):
+    __slots__ = ('use_proxy', 'unknown_fields')
     _toSchema = {'use_proxy': 'use-proxy'}
     _toPy = {'use-proxy': 'use_proxy'}
+    _wireTypes = {}
     def __init__(self, use_proxy=None, **unknown_fields):
         '''
         use_proxy : bool
@@ -21600,8 +23028,10 @@ class SSHProxyResult(Type):
 
 
 class SSHPublicKeysResult(Type):
+    __slots__ = ('error', 'public_keys', 'unknown_fields')
     _toSchema = {'error': 'error', 'public_keys': 'public-keys'}
     _toPy = {'error': 'error', 'public-keys': 'public_keys'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, public_keys=None, **unknown_fields):
         '''
         error : Error
@@ -21624,8 +23054,10 @@ class SSHPublicKeysResult(Type):
 
 
 class SSHPublicKeysResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SSHPublicKeysResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SSHPublicKeysResult]
@@ -21642,8 +23074,10 @@ class SSHPublicKeysResults(Type):
 
 
 class ScaleApplicationInfo(Type):
+    __slots__ = ('num_units', 'unknown_fields')
     _toSchema = {'num_units': 'num-units'}
     _toPy = {'num-units': 'num_units'}
+    _wireTypes = {}
     def __init__(self, num_units=None, **unknown_fields):
         '''
         num_units : int
@@ -21660,8 +23094,10 @@ class ScaleApplicationInfo(Type):
 
 
 class ScaleApplicationParams(Type):
+    __slots__ = ('application_tag', 'force', 'scale', 'scale_change', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'force': 'force', 'scale': 'scale', 'scale_change': 'scale-change'}
     _toPy = {'application-tag': 'application_tag', 'force': 'force', 'scale': 'scale', 'scale-change': 'scale_change'}
+    _wireTypes = {}
     def __init__(self, application_tag=None, force=None, scale=None, scale_change=None, **unknown_fields):
         '''
         application_tag : str
@@ -21696,8 +23132,10 @@ class ScaleApplicationParams(Type):
 
 
 class ScaleApplicationResult(Type):
+    __slots__ = ('error', 'info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
+    _wireTypes = {'error': ('Error', None), 'info': ('ScaleApplicationInfo', None)}
     def __init__(self, error=None, info=None, **unknown_fields):
         '''
         error : Error
@@ -21720,8 +23158,10 @@ class ScaleApplicationResult(Type):
 
 
 class ScaleApplicationResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ScaleApplicationResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ScaleApplicationResult]
@@ -21738,8 +23178,10 @@ class ScaleApplicationResults(Type):
 
 
 class ScaleApplicationsParams(Type):
+    __slots__ = ('applications', 'unknown_fields')
     _toSchema = {'applications': 'applications'}
     _toPy = {'applications': 'applications'}
+    _wireTypes = {'applications': ('ScaleApplicationParams', 'list')}
     def __init__(self, applications=None, **unknown_fields):
         '''
         applications : typing.Sequence[~ScaleApplicationParams]
@@ -21756,8 +23198,10 @@ class ScaleApplicationsParams(Type):
 
 
 class SecretBackend(Type):
+    __slots__ = ('backend_type', 'config', 'name', 'token_rotate_interval', 'unknown_fields')
     _toSchema = {'backend_type': 'backend-type', 'config': 'config', 'name': 'name', 'token_rotate_interval': 'token-rotate-interval'}
     _toPy = {'backend-type': 'backend_type', 'config': 'config', 'name': 'name', 'token-rotate-interval': 'token_rotate_interval'}
+    _wireTypes = {}
     def __init__(self, backend_type=None, config=None, name=None, token_rotate_interval=None, **unknown_fields):
         '''
         backend_type : str
@@ -21792,8 +23236,10 @@ class SecretBackend(Type):
 
 
 class SecretBackendArgs(Type):
+    __slots__ = ('backend_ids', 'for_drain', 'unknown_fields')
     _toSchema = {'backend_ids': 'backend-ids', 'for_drain': 'for-drain'}
     _toPy = {'backend-ids': 'backend_ids', 'for-drain': 'for_drain'}
+    _wireTypes = {}
     def __init__(self, backend_ids=None, for_drain=None, **unknown_fields):
         '''
         backend_ids : typing.Sequence[str]
@@ -21816,8 +23262,10 @@ class SecretBackendArgs(Type):
 
 
 class SecretBackendConfig(Type):
+    __slots__ = ('params', 'type_', 'unknown_fields')
     _toSchema = {'params': 'params', 'type_': 'type'}
     _toPy = {'params': 'params', 'type': 'type_'}
+    _wireTypes = {}
     def __init__(self, params=None, type_=None, **unknown_fields):
         '''
         params : typing.Mapping[str, typing.Any]
@@ -21840,8 +23288,10 @@ class SecretBackendConfig(Type):
 
 
 class SecretBackendConfigResult(Type):
+    __slots__ = ('config', 'draining', 'model_controller', 'model_name', 'model_uuid', 'unknown_fields')
     _toSchema = {'config': 'config', 'draining': 'draining', 'model_controller': 'model-controller', 'model_name': 'model-name', 'model_uuid': 'model-uuid'}
     _toPy = {'config': 'config', 'draining': 'draining', 'model-controller': 'model_controller', 'model-name': 'model_name', 'model-uuid': 'model_uuid'}
+    _wireTypes = {'config': ('SecretBackendConfig', None)}
     def __init__(self, config=None, draining=None, model_controller=None, model_name=None, model_uuid=None, **unknown_fields):
         '''
         config : SecretBackendConfig
@@ -21882,8 +23332,10 @@ class SecretBackendConfigResult(Type):
 
 
 class SecretBackendConfigResults(Type):
+    __slots__ = ('active_id', 'results', 'unknown_fields')
     _toSchema = {'active_id': 'active-id', 'results': 'results'}
     _toPy = {'active-id': 'active_id', 'results': 'results'}
+    _wireTypes = {'results': ('SecretBackendConfigResult', 'dict')}
     def __init__(self, active_id=None, results=None, **unknown_fields):
         '''
         active_id : str
@@ -21906,8 +23358,10 @@ class SecretBackendConfigResults(Type):
 
 
 class SecretBackendResult(Type):
+    __slots__ = ('error', 'id_', 'message', 'num_secrets', 'result', 'status', 'unknown_fields')
     _toSchema = {'error': 'error', 'id_': 'id', 'message': 'message', 'num_secrets': 'num-secrets', 'result': 'result', 'status': 'status'}
     _toPy = {'error': 'error', 'id': 'id_', 'message': 'message', 'num-secrets': 'num_secrets', 'result': 'result', 'status': 'status'}
+    _wireTypes = {'error': ('Error', None), 'result': ('SecretBackend', None)}
     def __init__(self, error=None, id_=None, message=None, num_secrets=None, result=None, status=None, **unknown_fields):
         '''
         error : Error
@@ -21954,8 +23408,10 @@ class SecretBackendResult(Type):
 
 
 class SecretBackendRotateChange(Type):
+    __slots__ = ('backend_name', 'id_', 'next_trigger_time', 'unknown_fields')
     _toSchema = {'backend_name': 'backend-name', 'id_': 'id', 'next_trigger_time': 'next-trigger-time'}
     _toPy = {'backend-name': 'backend_name', 'id': 'id_', 'next-trigger-time': 'next_trigger_time'}
+    _wireTypes = {}
     def __init__(self, backend_name=None, id_=None, next_trigger_time=None, **unknown_fields):
         '''
         backend_name : str
@@ -21984,8 +23440,10 @@ class SecretBackendRotateChange(Type):
 
 
 class SecretBackendRotateWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'changes': ('SecretBackendRotateChange', 'list'), 'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : typing.Sequence[~SecretBackendRotateChange]
@@ -22014,8 +23472,10 @@ class SecretBackendRotateWatchResult(Type):
 
 
 class SecretConsumerInfoResult(Type):
+    __slots__ = ('error', 'label', 'revision', 'unknown_fields')
     _toSchema = {'error': 'error', 'label': 'label', 'revision': 'revision'}
     _toPy = {'error': 'error', 'label': 'label', 'revision': 'revision'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, label=None, revision=None, **unknown_fields):
         '''
         error : Error
@@ -22044,8 +23504,10 @@ class SecretConsumerInfoResult(Type):
 
 
 class SecretConsumerInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SecretConsumerInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SecretConsumerInfoResult]
@@ -22062,8 +23524,10 @@ class SecretConsumerInfoResults(Type):
 
 
 class SecretContentParams(Type):
+    __slots__ = ('data', 'value_ref', 'unknown_fields')
     _toSchema = {'data': 'data', 'value_ref': 'value-ref'}
     _toPy = {'data': 'data', 'value-ref': 'value_ref'}
+    _wireTypes = {'value_ref': ('SecretValueRef', None)}
     def __init__(self, data=None, value_ref=None, **unknown_fields):
         '''
         data : typing.Mapping[str, str]
@@ -22086,8 +23550,10 @@ class SecretContentParams(Type):
 
 
 class SecretContentResult(Type):
+    __slots__ = ('backend_config', 'content', 'error', 'latest_revision', 'unknown_fields')
     _toSchema = {'backend_config': 'backend-config', 'content': 'content', 'error': 'error', 'latest_revision': 'latest-revision'}
     _toPy = {'backend-config': 'backend_config', 'content': 'content', 'error': 'error', 'latest-revision': 'latest_revision'}
+    _wireTypes = {'backend_config': ('SecretBackendConfigResult', None), 'content': ('SecretContentParams', None), 'error': ('Error', None)}
     def __init__(self, backend_config=None, content=None, error=None, latest_revision=None, **unknown_fields):
         '''
         backend_config : SecretBackendConfigResult
@@ -22122,8 +23588,10 @@ class SecretContentResult(Type):
 
 
 class SecretContentResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SecretContentResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SecretContentResult]
@@ -22140,8 +23608,10 @@ class SecretContentResults(Type):
 
 
 class SecretRevision(Type):
+    __slots__ = ('backend_name', 'create_time', 'expire_time', 'revision', 'update_time', 'value_ref', 'unknown_fields')
     _toSchema = {'backend_name': 'backend-name', 'create_time': 'create-time', 'expire_time': 'expire-time', 'revision': 'revision', 'update_time': 'update-time', 'value_ref': 'value-ref'}
     _toPy = {'backend-name': 'backend_name', 'create-time': 'create_time', 'expire-time': 'expire_time', 'revision': 'revision', 'update-time': 'update_time', 'value-ref': 'value_ref'}
+    _wireTypes = {'value_ref': ('SecretValueRef', None)}
     def __init__(self, backend_name=None, create_time=None, expire_time=None, revision=None, update_time=None, value_ref=None, **unknown_fields):
         '''
         backend_name : str
@@ -22188,8 +23658,10 @@ class SecretRevision(Type):
 
 
 class SecretRevisionArg(Type):
+    __slots__ = ('pending_delete', 'revisions', 'uri', 'unknown_fields')
     _toSchema = {'pending_delete': 'pending-delete', 'revisions': 'revisions', 'uri': 'uri'}
     _toPy = {'pending-delete': 'pending_delete', 'revisions': 'revisions', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, pending_delete=None, revisions=None, uri=None, **unknown_fields):
         '''
         pending_delete : bool
@@ -22218,8 +23690,10 @@ class SecretRevisionArg(Type):
 
 
 class SecretRevisionChange(Type):
+    __slots__ = ('revision', 'uri', 'unknown_fields')
     _toSchema = {'revision': 'revision', 'uri': 'uri'}
     _toPy = {'revision': 'revision', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, revision=None, uri=None, **unknown_fields):
         '''
         revision : int
@@ -22242,8 +23716,10 @@ class SecretRevisionChange(Type):
 
 
 class SecretRevisionWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'changes': ('SecretRevisionChange', 'list'), 'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : typing.Sequence[~SecretRevisionChange]
@@ -22272,8 +23748,10 @@ class SecretRevisionWatchResult(Type):
 
 
 class SecretRevisionWatchResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SecretRevisionWatchResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SecretRevisionWatchResult]
@@ -22290,8 +23768,10 @@ class SecretRevisionWatchResults(Type):
 
 
 class SecretRotatedArg(Type):
+    __slots__ = ('original_revision', 'skip', 'uri', 'unknown_fields')
     _toSchema = {'original_revision': 'original-revision', 'skip': 'skip', 'uri': 'uri'}
     _toPy = {'original-revision': 'original_revision', 'skip': 'skip', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, original_revision=None, skip=None, uri=None, **unknown_fields):
         '''
         original_revision : int
@@ -22320,8 +23800,10 @@ class SecretRotatedArg(Type):
 
 
 class SecretRotatedArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('SecretRotatedArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~SecretRotatedArg]
@@ -22338,8 +23820,10 @@ class SecretRotatedArgs(Type):
 
 
 class SecretTriggerChange(Type):
+    __slots__ = ('next_trigger_time', 'revision', 'uri', 'unknown_fields')
     _toSchema = {'next_trigger_time': 'next-trigger-time', 'revision': 'revision', 'uri': 'uri'}
     _toPy = {'next-trigger-time': 'next_trigger_time', 'revision': 'revision', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, next_trigger_time=None, revision=None, uri=None, **unknown_fields):
         '''
         next_trigger_time : str
@@ -22368,8 +23852,10 @@ class SecretTriggerChange(Type):
 
 
 class SecretTriggerWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'changes': ('SecretTriggerChange', 'list'), 'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : typing.Sequence[~SecretTriggerChange]
@@ -22398,8 +23884,10 @@ class SecretTriggerWatchResult(Type):
 
 
 class SecretValueRef(Type):
+    __slots__ = ('backend_id', 'revision_id', 'unknown_fields')
     _toSchema = {'backend_id': 'backend-id', 'revision_id': 'revision-id'}
     _toPy = {'backend-id': 'backend_id', 'revision-id': 'revision_id'}
+    _wireTypes = {}
     def __init__(self, backend_id=None, revision_id=None, **unknown_fields):
         '''
         backend_id : str
@@ -22422,8 +23910,10 @@ class SecretValueRef(Type):
 
 
 class SecretValueResult(Type):
+    __slots__ = ('data', 'error', 'unknown_fields')
     _toSchema = {'data': 'data', 'error': 'error'}
     _toPy = {'data': 'data', 'error': 'error'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, data=None, error=None, **unknown_fields):
         '''
         data : typing.Mapping[str, str]
@@ -22446,8 +23936,10 @@ class SecretValueResult(Type):
 
 
 class SecretsFilter(Type):
+    __slots__ = ('label', 'owner_tag', 'revision', 'uri', 'unknown_fields')
     _toSchema = {'label': 'label', 'owner_tag': 'owner-tag', 'revision': 'revision', 'uri': 'uri'}
     _toPy = {'label': 'label', 'owner-tag': 'owner_tag', 'revision': 'revision', 'uri': 'uri'}
+    _wireTypes = {}
     def __init__(self, label=None, owner_tag=None, revision=None, uri=None, **unknown_fields):
         '''
         label : str
@@ -22482,8 +23974,10 @@ class SecretsFilter(Type):
 
 
 class SerializedModel(Type):
+    __slots__ = ('bytes_', 'charms', 'resources', 'tools', 'unknown_fields')
     _toSchema = {'bytes_': 'bytes', 'charms': 'charms', 'resources': 'resources', 'tools': 'tools'}
     _toPy = {'bytes': 'bytes_', 'charms': 'charms', 'resources': 'resources', 'tools': 'tools'}
+    _wireTypes = {'resources': ('SerializedModelResource', 'list'), 'tools': ('SerializedModelTools', 'list')}
     def __init__(self, bytes_=None, charms=None, resources=None, tools=None, **unknown_fields):
         '''
         bytes_ : typing.Sequence[int]
@@ -22518,8 +24012,10 @@ class SerializedModel(Type):
 
 
 class SerializedModelResource(Type):
+    __slots__ = ('application', 'application_revision', 'charmstore_revision', 'name', 'unit_revisions', 'unknown_fields')
     _toSchema = {'application': 'application', 'application_revision': 'application-revision', 'charmstore_revision': 'charmstore-revision', 'name': 'name', 'unit_revisions': 'unit-revisions'}
     _toPy = {'application': 'application', 'application-revision': 'application_revision', 'charmstore-revision': 'charmstore_revision', 'name': 'name', 'unit-revisions': 'unit_revisions'}
+    _wireTypes = {'application_revision': ('SerializedModelResourceRevision', None), 'charmstore_revision': ('SerializedModelResourceRevision', None), 'unit_revisions': ('SerializedModelResourceRevision', 'dict')}
     def __init__(self, application=None, application_revision=None, charmstore_revision=None, name=None, unit_revisions=None, **unknown_fields):
         '''
         application : str
@@ -22560,8 +24056,10 @@ class SerializedModelResource(Type):
 
 
 class SerializedModelResourceRevision(Type):
+    __slots__ = ('description', 'fingerprint', 'origin', 'path', 'revision', 'size', 'timestamp', 'type_', 'username', 'unknown_fields')
     _toSchema = {'description': 'description', 'fingerprint': 'fingerprint', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'timestamp': 'timestamp', 'type_': 'type', 'username': 'username'}
     _toPy = {'description': 'description', 'fingerprint': 'fingerprint', 'origin': 'origin', 'path': 'path', 'revision': 'revision', 'size': 'size', 'timestamp': 'timestamp', 'type': 'type_', 'username': 'username'}
+    _wireTypes = {}
     def __init__(self, description=None, fingerprint=None, origin=None, path=None, revision=None, size=None, timestamp=None, type_=None, username=None, **unknown_fields):
         '''
         description : str
@@ -22626,8 +24124,10 @@ class SerializedModelResourceRevision(Type):
 
 
 class SerializedModelTools(Type):
+    __slots__ = ('uri', 'version', 'unknown_fields')
     _toSchema = {'uri': 'uri', 'version': 'version'}
     _toPy = {'uri': 'uri', 'version': 'version'}
+    _wireTypes = {}
     def __init__(self, uri=None, version=None, **unknown_fields):
         '''
         uri : str
@@ -22650,8 +24150,10 @@ class SerializedModelTools(Type):
 
 
 class SetConstraints(Type):
+    __slots__ = ('application', 'constraints', 'unknown_fields')
     _toSchema = {'application': 'application', 'constraints': 'constraints'}
     _toPy = {'application': 'application', 'constraints': 'constraints'}
+    _wireTypes = {'constraints': ('Value', None)}
     def __init__(self, application=None, constraints=None, **unknown_fields):
         '''
         application : str
@@ -22674,8 +24176,10 @@ class SetConstraints(Type):
 
 
 class SetExternalControllerInfoParams(Type):
+    __slots__ = ('info', 'unknown_fields')
     _toSchema = {'info': 'info'}
     _toPy = {'info': 'info'}
+    _wireTypes = {'info': ('ExternalControllerInfo', None)}
     def __init__(self, info=None, **unknown_fields):
         '''
         info : ExternalControllerInfo
@@ -22692,8 +24196,10 @@ class SetExternalControllerInfoParams(Type):
 
 
 class SetExternalControllersInfoParams(Type):
+    __slots__ = ('controllers', 'unknown_fields')
     _toSchema = {'controllers': 'controllers'}
     _toPy = {'controllers': 'controllers'}
+    _wireTypes = {'controllers': ('SetExternalControllerInfoParams', 'list')}
     def __init__(self, controllers=None, **unknown_fields):
         '''
         controllers : typing.Sequence[~SetExternalControllerInfoParams]
@@ -22710,8 +24216,10 @@ class SetExternalControllersInfoParams(Type):
 
 
 class SetMachineBlockDevices(Type):
+    __slots__ = ('machine_block_devices', 'unknown_fields')
     _toSchema = {'machine_block_devices': 'machine-block-devices'}
     _toPy = {'machine-block-devices': 'machine_block_devices'}
+    _wireTypes = {'machine_block_devices': ('MachineBlockDevices', 'list')}
     def __init__(self, machine_block_devices=None, **unknown_fields):
         '''
         machine_block_devices : typing.Sequence[~MachineBlockDevices]
@@ -22728,8 +24236,10 @@ class SetMachineBlockDevices(Type):
 
 
 class SetMachineNetworkConfig(Type):
+    __slots__ = ('config', 'tag', 'unknown_fields')
     _toSchema = {'config': 'config', 'tag': 'tag'}
     _toPy = {'config': 'config', 'tag': 'tag'}
+    _wireTypes = {'config': ('NetworkConfig', 'list')}
     def __init__(self, config=None, tag=None, **unknown_fields):
         '''
         config : typing.Sequence[~NetworkConfig]
@@ -22752,8 +24262,10 @@ class SetMachineNetworkConfig(Type):
 
 
 class SetMachinesAddresses(Type):
+    __slots__ = ('machine_addresses', 'unknown_fields')
     _toSchema = {'machine_addresses': 'machine-addresses'}
     _toPy = {'machine-addresses': 'machine_addresses'}
+    _wireTypes = {'machine_addresses': ('MachineAddresses', 'list')}
     def __init__(self, machine_addresses=None, **unknown_fields):
         '''
         machine_addresses : typing.Sequence[~MachineAddresses]
@@ -22770,8 +24282,10 @@ class SetMachinesAddresses(Type):
 
 
 class SetMigrationPhaseArgs(Type):
+    __slots__ = ('phase', 'unknown_fields')
     _toSchema = {'phase': 'phase'}
     _toPy = {'phase': 'phase'}
+    _wireTypes = {}
     def __init__(self, phase=None, **unknown_fields):
         '''
         phase : str
@@ -22788,8 +24302,10 @@ class SetMigrationPhaseArgs(Type):
 
 
 class SetMigrationStatusMessageArgs(Type):
+    __slots__ = ('message', 'unknown_fields')
     _toSchema = {'message': 'message'}
     _toPy = {'message': 'message'}
+    _wireTypes = {}
     def __init__(self, message=None, **unknown_fields):
         '''
         message : str
@@ -22806,8 +24322,10 @@ class SetMigrationStatusMessageArgs(Type):
 
 
 class SetModelDefaults(Type):
+    __slots__ = ('config', 'unknown_fields')
     _toSchema = {'config': 'config'}
     _toPy = {'config': 'config'}
+    _wireTypes = {'config': ('ModelDefaultValues', 'list')}
     def __init__(self, config=None, **unknown_fields):
         '''
         config : typing.Sequence[~ModelDefaultValues]
@@ -22824,8 +24342,10 @@ class SetModelDefaults(Type):
 
 
 class SetModelEnvironVersion(Type):
+    __slots__ = ('model_tag', 'version', 'unknown_fields')
     _toSchema = {'model_tag': 'model-tag', 'version': 'version'}
     _toPy = {'model-tag': 'model_tag', 'version': 'version'}
+    _wireTypes = {}
     def __init__(self, model_tag=None, version=None, **unknown_fields):
         '''
         model_tag : str
@@ -22848,8 +24368,10 @@ class SetModelEnvironVersion(Type):
 
 
 class SetModelEnvironVersions(Type):
+    __slots__ = ('models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
+    _wireTypes = {'models': ('SetModelEnvironVersion', 'list')}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~SetModelEnvironVersion]
@@ -22866,8 +24388,10 @@ class SetModelEnvironVersions(Type):
 
 
 class SetPayloadStatusArg(Type):
+    __slots__ = ('entity', 'status', 'tag', 'unknown_fields')
     _toSchema = {'entity': 'Entity', 'status': 'status', 'tag': 'tag'}
     _toPy = {'Entity': 'entity', 'status': 'status', 'tag': 'tag'}
+    _wireTypes = {'entity': ('Entity', None)}
     def __init__(self, entity=None, status=None, tag=None, **unknown_fields):
         '''
         entity : Entity
@@ -22896,8 +24420,10 @@ class SetPayloadStatusArg(Type):
 
 
 class SetPayloadStatusArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('SetPayloadStatusArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~SetPayloadStatusArg]
@@ -22914,8 +24440,10 @@ class SetPayloadStatusArgs(Type):
 
 
 class SetPodSpecParams(Type):
+    __slots__ = ('specs', 'unknown_fields')
     _toSchema = {'specs': 'specs'}
     _toPy = {'specs': 'specs'}
+    _wireTypes = {'specs': ('EntityString', 'list')}
     def __init__(self, specs=None, **unknown_fields):
         '''
         specs : typing.Sequence[~EntityString]
@@ -22932,8 +24460,10 @@ class SetPodSpecParams(Type):
 
 
 class SetProfileArg(Type):
+    __slots__ = ('entity', 'profiles', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'profiles': 'profiles'}
     _toPy = {'entity': 'entity', 'profiles': 'profiles'}
+    _wireTypes = {'entity': ('Entity', None)}
     def __init__(self, entity=None, profiles=None, **unknown_fields):
         '''
         entity : Entity
@@ -22956,8 +24486,10 @@ class SetProfileArg(Type):
 
 
 class SetProfileArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('SetProfileArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~SetProfileArg]
@@ -22974,8 +24506,10 @@ class SetProfileArgs(Type):
 
 
 class SetProviderNetworkConfig(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('ProviderNetworkConfig', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~ProviderNetworkConfig]
@@ -22992,8 +24526,10 @@ class SetProviderNetworkConfig(Type):
 
 
 class SetProviderNetworkConfigResult(Type):
+    __slots__ = ('addresses', 'error', 'modified', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'error': 'error', 'modified': 'modified'}
     _toPy = {'addresses': 'addresses', 'error': 'error', 'modified': 'modified'}
+    _wireTypes = {'addresses': ('Address', 'list'), 'error': ('Error', None)}
     def __init__(self, addresses=None, error=None, modified=None, **unknown_fields):
         '''
         addresses : typing.Sequence[~Address]
@@ -23022,8 +24558,10 @@ class SetProviderNetworkConfigResult(Type):
 
 
 class SetProviderNetworkConfigResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SetProviderNetworkConfigResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SetProviderNetworkConfigResult]
@@ -23040,8 +24578,10 @@ class SetProviderNetworkConfigResults(Type):
 
 
 class SetStatus(Type):
+    __slots__ = ('entities', 'unknown_fields')
     _toSchema = {'entities': 'entities'}
     _toPy = {'entities': 'entities'}
+    _wireTypes = {'entities': ('EntityStatusArgs', 'list')}
     def __init__(self, entities=None, **unknown_fields):
         '''
         entities : typing.Sequence[~EntityStatusArgs]
@@ -23058,8 +24598,10 @@ class SetStatus(Type):
 
 
 class SetUnitStateArg(Type):
+    __slots__ = ('charm_state', 'meter_status_state', 'relation_state', 'secret_state', 'storage_state', 'tag', 'uniter_state', 'unknown_fields')
     _toSchema = {'charm_state': 'charm-state', 'meter_status_state': 'meter-status-state', 'relation_state': 'relation-state', 'secret_state': 'secret-state', 'storage_state': 'storage-state', 'tag': 'tag', 'uniter_state': 'uniter-state'}
     _toPy = {'charm-state': 'charm_state', 'meter-status-state': 'meter_status_state', 'relation-state': 'relation_state', 'secret-state': 'secret_state', 'storage-state': 'storage_state', 'tag': 'tag', 'uniter-state': 'uniter_state'}
+    _wireTypes = {}
     def __init__(self, charm_state=None, meter_status_state=None, relation_state=None, secret_state=None, storage_state=None, tag=None, uniter_state=None, **unknown_fields):
         '''
         charm_state : typing.Mapping[str, str]
@@ -23112,8 +24654,10 @@ class SetUnitStateArg(Type):
 
 
 class SetUnitStateArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('SetUnitStateArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~SetUnitStateArg]
@@ -23130,8 +24674,10 @@ class SetUnitStateArgs(Type):
 
 
 class Settings(Type):
+    __slots__ = ('autonoproxy', 'ftp', 'http', 'https', 'noproxy', 'unknown_fields')
     _toSchema = {'autonoproxy': 'AutoNoProxy', 'ftp': 'Ftp', 'http': 'Http', 'https': 'Https', 'noproxy': 'NoProxy'}
     _toPy = {'AutoNoProxy': 'autonoproxy', 'Ftp': 'ftp', 'Http': 'http', 'Https': 'https', 'NoProxy': 'noproxy'}
+    _wireTypes = {}
     def __init__(self, autonoproxy=None, ftp=None, http=None, https=None, noproxy=None, **unknown_fields):
         '''
         autonoproxy : str
@@ -23172,8 +24718,10 @@ class Settings(Type):
 
 
 class SettingsResult(Type):
+    __slots__ = ('error', 'settings', 'unknown_fields')
     _toSchema = {'error': 'error', 'settings': 'settings'}
     _toPy = {'error': 'error', 'settings': 'settings'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, settings=None, **unknown_fields):
         '''
         error : Error
@@ -23196,8 +24744,10 @@ class SettingsResult(Type):
 
 
 class SettingsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SettingsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SettingsResult]
@@ -23214,8 +24764,10 @@ class SettingsResults(Type):
 
 
 class ShowSpaceResult(Type):
+    __slots__ = ('applications', 'error', 'machine_count', 'space', 'unknown_fields')
     _toSchema = {'applications': 'applications', 'error': 'error', 'machine_count': 'machine-count', 'space': 'space'}
     _toPy = {'applications': 'applications', 'error': 'error', 'machine-count': 'machine_count', 'space': 'space'}
+    _wireTypes = {'error': ('Error', None), 'space': ('Space', None)}
     def __init__(self, applications=None, error=None, machine_count=None, space=None, **unknown_fields):
         '''
         applications : typing.Sequence[str]
@@ -23250,8 +24802,10 @@ class ShowSpaceResult(Type):
 
 
 class ShowSpaceResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ShowSpaceResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ShowSpaceResult]
@@ -23268,8 +24822,10 @@ class ShowSpaceResults(Type):
 
 
 class SingularClaim(Type):
+    __slots__ = ('claimant_tag', 'duration', 'entity_tag', 'unknown_fields')
     _toSchema = {'claimant_tag': 'claimant-tag', 'duration': 'duration', 'entity_tag': 'entity-tag'}
     _toPy = {'claimant-tag': 'claimant_tag', 'duration': 'duration', 'entity-tag': 'entity_tag'}
+    _wireTypes = {}
     def __init__(self, claimant_tag=None, duration=None, entity_tag=None, **unknown_fields):
         '''
         claimant_tag : str
@@ -23298,8 +24854,10 @@ class SingularClaim(Type):
 
 
 class SingularClaims(Type):
+    __slots__ = ('claims', 'unknown_fields')
     _toSchema = {'claims': 'claims'}
     _toPy = {'claims': 'claims'}
+    _wireTypes = {'claims': ('SingularClaim', 'list')}
     def __init__(self, claims=None, **unknown_fields):
         '''
         claims : typing.Sequence[~SingularClaim]
@@ -23316,8 +24874,10 @@ class SingularClaims(Type):
 
 
 class Space(Type):
+    __slots__ = ('error', 'id_', 'name', 'subnets', 'unknown_fields')
     _toSchema = {'error': 'error', 'id_': 'id', 'name': 'name', 'subnets': 'subnets'}
     _toPy = {'error': 'error', 'id': 'id_', 'name': 'name', 'subnets': 'subnets'}
+    _wireTypes = {'error': ('Error', None), 'subnets': ('Subnet', 'list')}
     def __init__(self, error=None, id_=None, name=None, subnets=None, **unknown_fields):
         '''
         error : Error
@@ -23352,8 +24912,10 @@ class Space(Type):
 
 
 class SpaceInfo(Type):
+    __slots__ = ('id_', 'name', 'provider_id', 'subnets', 'unknown_fields')
     _toSchema = {'id_': 'id', 'name': 'name', 'provider_id': 'provider-id', 'subnets': 'subnets'}
     _toPy = {'id': 'id_', 'name': 'name', 'provider-id': 'provider_id', 'subnets': 'subnets'}
+    _wireTypes = {'subnets': ('SubnetV3', 'list')}
     def __init__(self, id_=None, name=None, provider_id=None, subnets=None, **unknown_fields):
         '''
         id_ : str
@@ -23388,8 +24950,10 @@ class SpaceInfo(Type):
 
 
 class SpaceInfos(Type):
+    __slots__ = ('space_infos', 'unknown_fields')
     _toSchema = {'space_infos': 'space-infos'}
     _toPy = {'space-infos': 'space_infos'}
+    _wireTypes = {'space_infos': ('SpaceInfo', 'list')}
     def __init__(self, space_infos=None, **unknown_fields):
         '''
         space_infos : typing.Sequence[~SpaceInfo]
@@ -23406,8 +24970,10 @@ class SpaceInfos(Type):
 
 
 class SpaceInfosParams(Type):
+    __slots__ = ('space_ids', 'unknown_fields')
     _toSchema = {'space_ids': 'space-ids'}
     _toPy = {'space-ids': 'space_ids'}
+    _wireTypes = {}
     def __init__(self, space_ids=None, **unknown_fields):
         '''
         space_ids : typing.Sequence[str]
@@ -23424,8 +24990,10 @@ class SpaceInfosParams(Type):
 
 
 class StateServingInfo(Type):
+    __slots__ = ('api_port', 'ca_private_key', 'cert', 'controller_api_port', 'private_key', 'shared_secret', 'state_port', 'system_identity', 'unknown_fields')
     _toSchema = {'api_port': 'api-port', 'ca_private_key': 'ca-private-key', 'cert': 'cert', 'controller_api_port': 'controller-api-port', 'private_key': 'private-key', 'shared_secret': 'shared-secret', 'state_port': 'state-port', 'system_identity': 'system-identity'}
     _toPy = {'api-port': 'api_port', 'ca-private-key': 'ca_private_key', 'cert': 'cert', 'controller-api-port': 'controller_api_port', 'private-key': 'private_key', 'shared-secret': 'shared_secret', 'state-port': 'state_port', 'system-identity': 'system_identity'}
+    _wireTypes = {}
     def __init__(self, api_port=None, ca_private_key=None, cert=None, controller_api_port=None, private_key=None, shared_secret=None, state_port=None, system_identity=None, **unknown_fields):
         '''
         api_port : int
@@ -23484,8 +25052,10 @@ class StateServingInfo(Type):
 
 
 class StatusHistoryFilter(Type):
+    __slots__ = ('date', 'delta', 'exclude', 'size', 'unknown_fields')
     _toSchema = {'date': 'date', 'delta': 'delta', 'exclude': 'exclude', 'size': 'size'}
     _toPy = {'date': 'date', 'delta': 'delta', 'exclude': 'exclude', 'size': 'size'}
+    _wireTypes = {}
     def __init__(self, date=None, delta=None, exclude=None, size=None, **unknown_fields):
         '''
         date : str
@@ -23520,8 +25090,10 @@ class StatusHistoryFilter(Type):
 
 
 class StatusHistoryPruneArgs(Type):
+    __slots__ = ('max_history_mb', 'max_history_time', 'unknown_fields')
     _toSchema = {'max_history_mb': 'max-history-mb', 'max_history_time': 'max-history-time'}
     _toPy = {'max-history-mb': 'max_history_mb', 'max-history-time': 'max_history_time'}
+    _wireTypes = {}
     def __init__(self, max_history_mb=None, max_history_time=None, **unknown_fields):
         '''
         max_history_mb : int
@@ -23544,8 +25116,10 @@ class StatusHistoryPruneArgs(Type):
 
 
 class StatusHistoryRequest(Type):
+    __slots__ = ('filter_', 'historykind', 'size', 'tag', 'unknown_fields')
     _toSchema = {'filter_': 'filter', 'historykind': 'historyKind', 'size': 'size', 'tag': 'tag'}
     _toPy = {'filter': 'filter_', 'historyKind': 'historykind', 'size': 'size', 'tag': 'tag'}
+    _wireTypes = {'filter_': ('StatusHistoryFilter', None)}
     def __init__(self, filter_=None, historykind=None, size=None, tag=None, **unknown_fields):
         '''
         filter_ : StatusHistoryFilter
@@ -23580,8 +25154,10 @@ class StatusHistoryRequest(Type):
 
 
 class StatusHistoryRequests(Type):
+    __slots__ = ('requests', 'unknown_fields')
     _toSchema = {'requests': 'requests'}
     _toPy = {'requests': 'requests'}
+    _wireTypes = {'requests': ('StatusHistoryRequest', 'list')}
     def __init__(self, requests=None, **unknown_fields):
         '''
         requests : typing.Sequence[~StatusHistoryRequest]
@@ -23598,8 +25174,10 @@ class StatusHistoryRequests(Type):
 
 
 class StatusHistoryResult(Type):
+    __slots__ = ('error', 'history', 'unknown_fields')
     _toSchema = {'error': 'error', 'history': 'history'}
     _toPy = {'error': 'error', 'history': 'history'}
+    _wireTypes = {'error': ('Error', None), 'history': ('History', None)}
     def __init__(self, error=None, history=None, **unknown_fields):
         '''
         error : Error
@@ -23622,8 +25200,10 @@ class StatusHistoryResult(Type):
 
 
 class StatusHistoryResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StatusHistoryResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StatusHistoryResult]
@@ -23640,8 +25220,10 @@ class StatusHistoryResults(Type):
 
 
 class StatusParams(Type):
+    __slots__ = ('include_storage', 'patterns', 'unknown_fields')
     _toSchema = {'include_storage': 'include-storage', 'patterns': 'patterns'}
     _toPy = {'include-storage': 'include_storage', 'patterns': 'patterns'}
+    _wireTypes = {}
     def __init__(self, include_storage=None, patterns=None, **unknown_fields):
         '''
         include_storage : bool
@@ -23664,8 +25246,10 @@ class StatusParams(Type):
 
 
 class StatusResult(Type):
+    __slots__ = ('data', 'error', 'id_', 'info', 'life', 'since', 'status', 'unknown_fields')
     _toSchema = {'data': 'data', 'error': 'error', 'id_': 'id', 'info': 'info', 'life': 'life', 'since': 'since', 'status': 'status'}
     _toPy = {'data': 'data', 'error': 'error', 'id': 'id_', 'info': 'info', 'life': 'life', 'since': 'since', 'status': 'status'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, data=None, error=None, id_=None, info=None, life=None, since=None, status=None, **unknown_fields):
         '''
         data : typing.Mapping[str, typing.Any]
@@ -23718,8 +25302,10 @@ class StatusResult(Type):
 
 
 class StatusResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StatusResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StatusResult]
@@ -23736,8 +25322,10 @@ class StatusResults(Type):
 
 
 class StorageAddParams(Type):
+    __slots__ = ('name', 'storage', 'unit', 'unknown_fields')
     _toSchema = {'name': 'name', 'storage': 'storage', 'unit': 'unit'}
     _toPy = {'name': 'name', 'storage': 'storage', 'unit': 'unit'}
+    _wireTypes = {'storage': ('StorageConstraints', None)}
     def __init__(self, name=None, storage=None, unit=None, **unknown_fields):
         '''
         name : str
@@ -23766,8 +25354,10 @@ class StorageAddParams(Type):
 
 
 class StorageAttachment(Type):
+    __slots__ = ('kind', 'life', 'location', 'owner_tag', 'storage_tag', 'unit_tag', 'unknown_fields')
     _toSchema = {'kind': 'kind', 'life': 'life', 'location': 'location', 'owner_tag': 'owner-tag', 'storage_tag': 'storage-tag', 'unit_tag': 'unit-tag'}
     _toPy = {'kind': 'kind', 'life': 'life', 'location': 'location', 'owner-tag': 'owner_tag', 'storage-tag': 'storage_tag', 'unit-tag': 'unit_tag'}
+    _wireTypes = {}
     def __init__(self, kind=None, life=None, location=None, owner_tag=None, storage_tag=None, unit_tag=None, **unknown_fields):
         '''
         kind : int
@@ -23814,8 +25404,10 @@ class StorageAttachment(Type):
 
 
 class StorageAttachmentDetails(Type):
+    __slots__ = ('life', 'location', 'machine_tag', 'storage_tag', 'unit_tag', 'unknown_fields')
     _toSchema = {'life': 'life', 'location': 'location', 'machine_tag': 'machine-tag', 'storage_tag': 'storage-tag', 'unit_tag': 'unit-tag'}
     _toPy = {'life': 'life', 'location': 'location', 'machine-tag': 'machine_tag', 'storage-tag': 'storage_tag', 'unit-tag': 'unit_tag'}
+    _wireTypes = {}
     def __init__(self, life=None, location=None, machine_tag=None, storage_tag=None, unit_tag=None, **unknown_fields):
         '''
         life : str
@@ -23856,8 +25448,10 @@ class StorageAttachmentDetails(Type):
 
 
 class StorageAttachmentId(Type):
+    __slots__ = ('storage_tag', 'unit_tag', 'unknown_fields')
     _toSchema = {'storage_tag': 'storage-tag', 'unit_tag': 'unit-tag'}
     _toPy = {'storage-tag': 'storage_tag', 'unit-tag': 'unit_tag'}
+    _wireTypes = {}
     def __init__(self, storage_tag=None, unit_tag=None, **unknown_fields):
         '''
         storage_tag : str
@@ -23880,8 +25474,10 @@ class StorageAttachmentId(Type):
 
 
 class StorageAttachmentIds(Type):
+    __slots__ = ('ids', 'unknown_fields')
     _toSchema = {'ids': 'ids'}
     _toPy = {'ids': 'ids'}
+    _wireTypes = {'ids': ('StorageAttachmentId', 'list')}
     def __init__(self, ids=None, **unknown_fields):
         '''
         ids : typing.Sequence[~StorageAttachmentId]
@@ -23898,8 +25494,10 @@ class StorageAttachmentIds(Type):
 
 
 class StorageAttachmentIdsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('StorageAttachmentIds', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -23922,8 +25520,10 @@ class StorageAttachmentIdsResult(Type):
 
 
 class StorageAttachmentIdsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StorageAttachmentIdsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StorageAttachmentIdsResult]
@@ -23940,8 +25540,10 @@ class StorageAttachmentIdsResults(Type):
 
 
 class StorageAttachmentResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('StorageAttachment', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -23964,8 +25566,10 @@ class StorageAttachmentResult(Type):
 
 
 class StorageAttachmentResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StorageAttachmentResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StorageAttachmentResult]
@@ -23982,8 +25586,10 @@ class StorageAttachmentResults(Type):
 
 
 class StorageConstraints(Type):
+    __slots__ = ('count', 'pool', 'size', 'unknown_fields')
     _toSchema = {'count': 'count', 'pool': 'pool', 'size': 'size'}
     _toPy = {'count': 'count', 'pool': 'pool', 'size': 'size'}
+    _wireTypes = {}
     def __init__(self, count=None, pool=None, size=None, **unknown_fields):
         '''
         count : int
@@ -24012,8 +25618,10 @@ class StorageConstraints(Type):
 
 
 class StorageDetachmentParams(Type):
+    __slots__ = ('force', 'ids', 'max_wait', 'unknown_fields')
     _toSchema = {'force': 'force', 'ids': 'ids', 'max_wait': 'max-wait'}
     _toPy = {'force': 'force', 'ids': 'ids', 'max-wait': 'max_wait'}
+    _wireTypes = {'ids': ('StorageAttachmentIds', None)}
     def __init__(self, force=None, ids=None, max_wait=None, **unknown_fields):
         '''
         force : bool
@@ -24042,8 +25650,10 @@ class StorageDetachmentParams(Type):
 
 
 class StorageDetails(Type):
+    __slots__ = ('attachments', 'kind', 'life', 'owner_tag', 'persistent', 'status', 'storage_tag', 'unknown_fields')
     _toSchema = {'attachments': 'attachments', 'kind': 'kind', 'life': 'life', 'owner_tag': 'owner-tag', 'persistent': 'persistent', 'status': 'status', 'storage_tag': 'storage-tag'}
     _toPy = {'attachments': 'attachments', 'kind': 'kind', 'life': 'life', 'owner-tag': 'owner_tag', 'persistent': 'persistent', 'status': 'status', 'storage-tag': 'storage_tag'}
+    _wireTypes = {'attachments': ('StorageAttachmentDetails', 'dict'), 'status': ('EntityStatus', None)}
     def __init__(self, attachments=None, kind=None, life=None, owner_tag=None, persistent=None, status=None, storage_tag=None, **unknown_fields):
         '''
         attachments : typing.Mapping[str, ~StorageAttachmentDetails]
@@ -24096,8 +25706,10 @@ class StorageDetails(Type):
 
 
 class StorageDetailsListResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('StorageDetails', 'list')}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -24120,8 +25732,10 @@ class StorageDetailsListResult(Type):
 
 
 class StorageDetailsListResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StorageDetailsListResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StorageDetailsListResult]
@@ -24138,8 +25752,10 @@ class StorageDetailsListResults(Type):
 
 
 class StorageDetailsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('StorageDetails', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -24162,8 +25778,10 @@ class StorageDetailsResult(Type):
 
 
 class StorageDetailsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StorageDetailsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StorageDetailsResult]
@@ -24180,8 +25798,10 @@ class StorageDetailsResults(Type):
 
 
 class StorageFilter(Type):
+    __slots__ = ('unknown_fields',)
     _toSchema = {}
     _toPy = {}
+    _wireTypes = {}
     def __init__(self, **unknown_fields):
         '''
 
@@ -24191,8 +25811,10 @@ class StorageFilter(Type):
 
 
 class StorageFilters(Type):
+    __slots__ = ('filters', 'unknown_fields')
     _toSchema = {'filters': 'filters'}
     _toPy = {'filters': 'filters'}
+    _wireTypes = {'filters': ('StorageFilter', 'list')}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~StorageFilter]
@@ -24209,8 +25831,10 @@ class StorageFilters(Type):
 
 
 class StoragePool(Type):
+    __slots__ = ('attrs', 'name', 'provider', 'unknown_fields')
     _toSchema = {'attrs': 'attrs', 'name': 'name', 'provider': 'provider'}
     _toPy = {'attrs': 'attrs', 'name': 'name', 'provider': 'provider'}
+    _wireTypes = {}
     def __init__(self, attrs=None, name=None, provider=None, **unknown_fields):
         '''
         attrs : typing.Mapping[str, typing.Any]
@@ -24239,8 +25863,10 @@ class StoragePool(Type):
 
 
 class StoragePoolArgs(Type):
+    __slots__ = ('pools', 'unknown_fields')
     _toSchema = {'pools': 'pools'}
     _toPy = {'pools': 'pools'}
+    _wireTypes = {'pools': ('StoragePool', 'list')}
     def __init__(self, pools=None, **unknown_fields):
         '''
         pools : typing.Sequence[~StoragePool]
@@ -24257,8 +25883,10 @@ class StoragePoolArgs(Type):
 
 
 class StoragePoolDeleteArg(Type):
+    __slots__ = ('name', 'unknown_fields')
     _toSchema = {'name': 'name'}
     _toPy = {'name': 'name'}
+    _wireTypes = {}
     def __init__(self, name=None, **unknown_fields):
         '''
         name : str
@@ -24275,8 +25903,10 @@ class StoragePoolDeleteArg(Type):
 
 
 class StoragePoolDeleteArgs(Type):
+    __slots__ = ('pools', 'unknown_fields')
     _toSchema = {'pools': 'pools'}
     _toPy = {'pools': 'pools'}
+    _wireTypes = {'pools': ('StoragePoolDeleteArg', 'list')}
     def __init__(self, pools=None, **unknown_fields):
         '''
         pools : typing.Sequence[~StoragePoolDeleteArg]
@@ -24293,8 +25923,10 @@ class StoragePoolDeleteArgs(Type):
 
 
 class StoragePoolFilter(Type):
+    __slots__ = ('names', 'providers', 'unknown_fields')
     _toSchema = {'names': 'names', 'providers': 'providers'}
     _toPy = {'names': 'names', 'providers': 'providers'}
+    _wireTypes = {}
     def __init__(self, names=None, providers=None, **unknown_fields):
         '''
         names : typing.Sequence[str]
@@ -24317,8 +25949,10 @@ class StoragePoolFilter(Type):
 
 
 class StoragePoolFilters(Type):
+    __slots__ = ('filters', 'unknown_fields')
     _toSchema = {'filters': 'filters'}
     _toPy = {'filters': 'filters'}
+    _wireTypes = {'filters': ('StoragePoolFilter', 'list')}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~StoragePoolFilter]
@@ -24335,8 +25969,10 @@ class StoragePoolFilters(Type):
 
 
 class StoragePoolsResult(Type):
+    __slots__ = ('error', 'storage_pools', 'unknown_fields')
     _toSchema = {'error': 'error', 'storage_pools': 'storage-pools'}
     _toPy = {'error': 'error', 'storage-pools': 'storage_pools'}
+    _wireTypes = {'error': ('Error', None), 'storage_pools': ('StoragePool', 'list')}
     def __init__(self, error=None, storage_pools=None, **unknown_fields):
         '''
         error : Error
@@ -24359,8 +25995,10 @@ class StoragePoolsResult(Type):
 
 
 class StoragePoolsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StoragePoolsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StoragePoolsResult]
@@ -24377,8 +26015,10 @@ class StoragePoolsResults(Type):
 
 
 class StoragesAddParams(Type):
+    __slots__ = ('storages', 'unknown_fields')
     _toSchema = {'storages': 'storages'}
     _toPy = {'storages': 'storages'}
+    _wireTypes = {'storages': ('StorageAddParams', 'list')}
     def __init__(self, storages=None, **unknown_fields):
         '''
         storages : typing.Sequence[~StorageAddParams]
@@ -24395,8 +26035,10 @@ class StoragesAddParams(Type):
 
 
 class StringBoolResult(Type):
+    __slots__ = ('error', 'ok', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'ok': 'ok', 'result': 'result'}
     _toPy = {'error': 'error', 'ok': 'ok', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, ok=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -24425,8 +26067,10 @@ class StringBoolResult(Type):
 
 
 class StringBoolResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StringBoolResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StringBoolResult]
@@ -24443,8 +26087,10 @@ class StringBoolResults(Type):
 
 
 class StringResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -24467,8 +26113,10 @@ class StringResult(Type):
 
 
 class StringResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StringResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StringResult]
@@ -24485,8 +26133,10 @@ class StringResults(Type):
 
 
 class StringsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -24509,8 +26159,10 @@ class StringsResult(Type):
 
 
 class StringsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StringsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StringsResult]
@@ -24527,8 +26179,10 @@ class StringsResults(Type):
 
 
 class StringsWatchResult(Type):
+    __slots__ = ('changes', 'error', 'watcher_id', 'unknown_fields')
     _toSchema = {'changes': 'changes', 'error': 'error', 'watcher_id': 'watcher-id'}
     _toPy = {'changes': 'changes', 'error': 'error', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, changes=None, error=None, watcher_id=None, **unknown_fields):
         '''
         changes : typing.Sequence[str]
@@ -24557,8 +26211,10 @@ class StringsWatchResult(Type):
 
 
 class StringsWatchResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('StringsWatchResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~StringsWatchResult]
@@ -24575,8 +26231,10 @@ class StringsWatchResults(Type):
 
 
 class Subnet(Type):
+    __slots__ = ('cidr', 'life', 'provider_id', 'provider_network_id', 'provider_space_id', 'space_tag', 'status', 'vlan_tag', 'zones', 'unknown_fields')
     _toSchema = {'cidr': 'cidr', 'life': 'life', 'provider_id': 'provider-id', 'provider_network_id': 'provider-network-id', 'provider_space_id': 'provider-space-id', 'space_tag': 'space-tag', 'status': 'status', 'vlan_tag': 'vlan-tag', 'zones': 'zones'}
     _toPy = {'cidr': 'cidr', 'life': 'life', 'provider-id': 'provider_id', 'provider-network-id': 'provider_network_id', 'provider-space-id': 'provider_space_id', 'space-tag': 'space_tag', 'status': 'status', 'vlan-tag': 'vlan_tag', 'zones': 'zones'}
+    _wireTypes = {}
     def __init__(self, cidr=None, life=None, provider_id=None, provider_network_id=None, provider_space_id=None, space_tag=None, status=None, vlan_tag=None, zones=None, **unknown_fields):
         '''
         cidr : str
@@ -24641,8 +26299,10 @@ class Subnet(Type):
 
 
 class SubnetV2(Type):
+    __slots__ = ('subnet', 'cidr', 'id_', 'life', 'provider_id', 'provider_network_id', 'provider_space_id', 'space_tag', 'status', 'vlan_tag', 'zones', 'unknown_fields')
     _toSchema = {'cidr': 'cidr', 'id_': 'id', 'life': 'life', 'provider_id': 'provider-id', 'provider_network_id': 'provider-network-id', 'provider_space_id': 'provider-space-id', 'space_tag': 'space-tag', 'status': 'status', 'subnet': 'Subnet', 'vlan_tag': 'vlan-tag', 'zones': 'zones'}
     _toPy = {'Subnet': 'subnet', 'cidr': 'cidr', 'id': 'id_', 'life': 'life', 'provider-id': 'provider_id', 'provider-network-id': 'provider_network_id', 'provider-space-id': 'provider_space_id', 'space-tag': 'space_tag', 'status': 'status', 'vlan-tag': 'vlan_tag', 'zones': 'zones'}
+    _wireTypes = {'subnet': ('Subnet', None)}
     def __init__(self, subnet=None, cidr=None, id_=None, life=None, provider_id=None, provider_network_id=None, provider_space_id=None, space_tag=None, status=None, vlan_tag=None, zones=None, **unknown_fields):
         '''
         subnet : Subnet
@@ -24719,8 +26379,10 @@ class SubnetV2(Type):
 
 
 class SubnetV3(Type):
+    __slots__ = ('subnet', 'subnetv2', 'cidr', 'fan_info', 'id_', 'is_public', 'life', 'provider_id', 'provider_network_id', 'provider_space_id', 'space_id', 'space_tag', 'status', 'vlan_tag', 'zones', 'unknown_fields')
     _toSchema = {'cidr': 'cidr', 'fan_info': 'fan-info', 'id_': 'id', 'is_public': 'is-public', 'life': 'life', 'provider_id': 'provider-id', 'provider_network_id': 'provider-network-id', 'provider_space_id': 'provider-space-id', 'space_id': 'space-id', 'space_tag': 'space-tag', 'status': 'status', 'subnet': 'Subnet', 'subnetv2': 'SubnetV2', 'vlan_tag': 'vlan-tag', 'zones': 'zones'}
     _toPy = {'Subnet': 'subnet', 'SubnetV2': 'subnetv2', 'cidr': 'cidr', 'fan-info': 'fan_info', 'id': 'id_', 'is-public': 'is_public', 'life': 'life', 'provider-id': 'provider_id', 'provider-network-id': 'provider_network_id', 'provider-space-id': 'provider_space_id', 'space-id': 'space_id', 'space-tag': 'space_tag', 'status': 'status', 'vlan-tag': 'vlan_tag', 'zones': 'zones'}
+    _wireTypes = {'fan_info': ('FanConfigEntry', None), 'subnet': ('Subnet', None), 'subnetv2': ('SubnetV2', None)}
     def __init__(self, subnet=None, subnetv2=None, cidr=None, fan_info=None, id_=None, is_public=None, life=None, provider_id=None, provider_network_id=None, provider_space_id=None, space_id=None, space_tag=None, status=None, vlan_tag=None, zones=None, **unknown_fields):
         '''
         subnet : Subnet
@@ -24821,8 +26483,10 @@ class SubnetV3(Type):
 
 
 class SubnetsFilters(Type):
+    __slots__ = ('space_tag', 'zone', 'unknown_fields')
     _toSchema = {'space_tag': 'space-tag', 'zone': 'zone'}
     _toPy = {'space-tag': 'space_tag', 'zone': 'zone'}
+    _wireTypes = {}
     def __init__(self, space_tag=None, zone=None, **unknown_fields):
         '''
         space_tag : str
@@ -24845,8 +26509,10 @@ class SubnetsFilters(Type):
 
 
 class SubnetsResult(Type):
+    __slots__ = ('error', 'subnets', 'unknown_fields')
     _toSchema = {'error': 'error', 'subnets': 'subnets'}
     _toPy = {'error': 'error', 'subnets': 'subnets'}
+    _wireTypes = {'error': ('Error', None), 'subnets': ('SubnetV2', 'list')}
     def __init__(self, error=None, subnets=None, **unknown_fields):
         '''
         error : Error
@@ -24869,8 +26535,10 @@ class SubnetsResult(Type):
 
 
 class SubnetsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('SubnetsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~SubnetsResult]
@@ -24887,8 +26555,10 @@ class SubnetsResults(Type):
 
 
 class SummaryWatcherID(Type):
+    __slots__ = ('watcher_id', 'unknown_fields')
     _toSchema = {'watcher_id': 'watcher-id'}
     _toPy = {'watcher-id': 'watcher_id'}
+    _wireTypes = {}
     def __init__(self, watcher_id=None, **unknown_fields):
         '''
         watcher_id : str
@@ -24905,8 +26575,10 @@ class SummaryWatcherID(Type):
 
 
 class SummaryWatcherNextResults(Type):
+    __slots__ = ('models', 'unknown_fields')
     _toSchema = {'models': 'models'}
     _toPy = {'models': 'models'}
+    _wireTypes = {'models': ('ModelAbstract', 'list')}
     def __init__(self, models=None, **unknown_fields):
         '''
         models : typing.Sequence[~ModelAbstract]
@@ -24923,8 +26595,10 @@ class SummaryWatcherNextResults(Type):
 
 
 class SupportedFeature(Type):
+    __slots__ = ('description', 'name', 'version', 'unknown_fields')
     _toSchema = {'description': 'description', 'name': 'name', 'version': 'version'}
     _toPy = {'description': 'description', 'name': 'name', 'version': 'version'}
+    _wireTypes = {}
     def __init__(self, description=None, name=None, version=None, **unknown_fields):
         '''
         description : str
@@ -24953,8 +26627,10 @@ class SupportedFeature(Type):
 
 
 class TaggedCredential(Type):
+    __slots__ = ('credential', 'tag', 'unknown_fields')
     _toSchema = {'credential': 'credential', 'tag': 'tag'}
     _toPy = {'credential': 'credential', 'tag': 'tag'}
+    _wireTypes = {'credential': ('CloudCredential', None)}
     def __init__(self, credential=None, tag=None, **unknown_fields):
         '''
         credential : CloudCredential
@@ -24977,8 +26653,10 @@ class TaggedCredential(Type):
 
 
 class TaggedCredentials(Type):
+    __slots__ = ('credentials', 'unknown_fields')
     _toSchema = {'credentials': 'credentials'}
     _toPy = {'credentials': 'credentials'}
+    _wireTypes = {'credentials': ('TaggedCredential', 'list')}
     def __init__(self, credentials=None, **unknown_fields):
         '''
         credentials : typing.Sequence[~TaggedCredential]
@@ -24995,8 +26673,10 @@ class TaggedCredentials(Type):
 
 
 class TokenResult(Type):
+    __slots__ = ('error', 'token', 'unknown_fields')
     _toSchema = {'error': 'error', 'token': 'token'}
     _toPy = {'error': 'error', 'token': 'token'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, token=None, **unknown_fields):
         '''
         error : Error
@@ -25019,8 +26699,10 @@ class TokenResult(Type):
 
 
 class TokenResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('TokenResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~TokenResult]
@@ -25037,8 +26719,10 @@ class TokenResults(Type):
 
 
 class Tools(Type):
+    __slots__ = ('sha256', 'size', 'url', 'version', 'unknown_fields')
     _toSchema = {'sha256': 'sha256', 'size': 'size', 'url': 'url', 'version': 'version'}
     _toPy = {'sha256': 'sha256', 'size': 'size', 'url': 'url', 'version': 'version'}
+    _wireTypes = {'version': ('Binary', None)}
     def __init__(self, sha256=None, size=None, url=None, version=None, **unknown_fields):
         '''
         sha256 : str
@@ -25073,8 +26757,10 @@ class Tools(Type):
 
 
 class ToolsResult(Type):
+    __slots__ = ('error', 'tools', 'unknown_fields')
     _toSchema = {'error': 'error', 'tools': 'tools'}
     _toPy = {'error': 'error', 'tools': 'tools'}
+    _wireTypes = {'error': ('Error', None), 'tools': ('Tools', 'list')}
     def __init__(self, error=None, tools=None, **unknown_fields):
         '''
         error : Error
@@ -25097,8 +26783,10 @@ class ToolsResult(Type):
 
 
 class ToolsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ToolsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ToolsResult]
@@ -25115,8 +26803,10 @@ class ToolsResults(Type):
 
 
 class TrackPayloadArgs(Type):
+    __slots__ = ('payloads', 'unknown_fields')
     _toSchema = {'payloads': 'payloads'}
     _toPy = {'payloads': 'payloads'}
+    _wireTypes = {'payloads': ('Payload', 'list')}
     def __init__(self, payloads=None, **unknown_fields):
         '''
         payloads : typing.Sequence[~Payload]
@@ -25133,8 +26823,10 @@ class TrackPayloadArgs(Type):
 
 
 class UndertakerModelInfo(Type):
+    __slots__ = ('destroy_timeout', 'force_destroyed', 'global_name', 'is_system', 'life', 'name', 'uuid', 'unknown_fields')
     _toSchema = {'destroy_timeout': 'destroy-timeout', 'force_destroyed': 'force-destroyed', 'global_name': 'global-name', 'is_system': 'is-system', 'life': 'life', 'name': 'name', 'uuid': 'uuid'}
     _toPy = {'destroy-timeout': 'destroy_timeout', 'force-destroyed': 'force_destroyed', 'global-name': 'global_name', 'is-system': 'is_system', 'life': 'life', 'name': 'name', 'uuid': 'uuid'}
+    _wireTypes = {}
     def __init__(self, destroy_timeout=None, force_destroyed=None, global_name=None, is_system=None, life=None, name=None, uuid=None, **unknown_fields):
         '''
         destroy_timeout : int
@@ -25187,8 +26879,10 @@ class UndertakerModelInfo(Type):
 
 
 class UndertakerModelInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('UndertakerModelInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -25211,8 +26905,10 @@ class UndertakerModelInfoResult(Type):
 
 
 class UnitInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('UnitResult', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -25235,8 +26931,10 @@ class UnitInfoResult(Type):
 
 
 class UnitInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('UnitInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UnitInfoResult]
@@ -25253,8 +26951,10 @@ class UnitInfoResults(Type):
 
 
 class UnitRefreshResult(Type):
+    __slots__ = ('error', 'life', 'resolved', 'provider_id', 'unknown_fields')
     _toSchema = {'error': 'Error', 'life': 'Life', 'provider_id': 'provider-id', 'resolved': 'Resolved'}
     _toPy = {'Error': 'error', 'Life': 'life', 'Resolved': 'resolved', 'provider-id': 'provider_id'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, life=None, resolved=None, provider_id=None, **unknown_fields):
         '''
         error : Error
@@ -25289,8 +26989,10 @@ class UnitRefreshResult(Type):
 
 
 class UnitRefreshResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'Results'}
     _toPy = {'Results': 'results'}
+    _wireTypes = {'results': ('UnitRefreshResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UnitRefreshResult]
@@ -25307,8 +27009,10 @@ class UnitRefreshResults(Type):
 
 
 class UnitResourceResult(Type):
+    __slots__ = ('errorresult', 'error', 'resource', 'unknown_fields')
     _toSchema = {'error': 'error', 'errorresult': 'ErrorResult', 'resource': 'resource'}
     _toPy = {'ErrorResult': 'errorresult', 'error': 'error', 'resource': 'resource'}
+    _wireTypes = {'error': ('Error', None), 'errorresult': ('ErrorResult', None), 'resource': ('Resource', None)}
     def __init__(self, errorresult=None, error=None, resource=None, **unknown_fields):
         '''
         errorresult : ErrorResult
@@ -25337,8 +27041,10 @@ class UnitResourceResult(Type):
 
 
 class UnitResources(Type):
+    __slots__ = ('entity', 'download_progress', 'resources', 'tag', 'unknown_fields')
     _toSchema = {'download_progress': 'download-progress', 'entity': 'Entity', 'resources': 'resources', 'tag': 'tag'}
     _toPy = {'Entity': 'entity', 'download-progress': 'download_progress', 'resources': 'resources', 'tag': 'tag'}
+    _wireTypes = {'entity': ('Entity', None), 'resources': ('Resource', 'list')}
     def __init__(self, entity=None, download_progress=None, resources=None, tag=None, **unknown_fields):
         '''
         entity : Entity
@@ -25373,8 +27079,10 @@ class UnitResources(Type):
 
 
 class UnitResourcesResult(Type):
+    __slots__ = ('errorresult', 'error', 'resources', 'unknown_fields')
     _toSchema = {'error': 'error', 'errorresult': 'ErrorResult', 'resources': 'resources'}
     _toPy = {'ErrorResult': 'errorresult', 'error': 'error', 'resources': 'resources'}
+    _wireTypes = {'error': ('Error', None), 'errorresult': ('ErrorResult', None), 'resources': ('UnitResourceResult', 'list')}
     def __init__(self, errorresult=None, error=None, resources=None, **unknown_fields):
         '''
         errorresult : ErrorResult
@@ -25403,8 +27111,10 @@ class UnitResourcesResult(Type):
 
 
 class UnitResult(Type):
+    __slots__ = ('address', 'charm', 'leader', 'life', 'machine', 'opened_ports', 'provider_id', 'public_address', 'relation_data', 'tag', 'workload_version', 'unknown_fields')
     _toSchema = {'address': 'address', 'charm': 'charm', 'leader': 'leader', 'life': 'life', 'machine': 'machine', 'opened_ports': 'opened-ports', 'provider_id': 'provider-id', 'public_address': 'public-address', 'relation_data': 'relation-data', 'tag': 'tag', 'workload_version': 'workload-version'}
     _toPy = {'address': 'address', 'charm': 'charm', 'leader': 'leader', 'life': 'life', 'machine': 'machine', 'opened-ports': 'opened_ports', 'provider-id': 'provider_id', 'public-address': 'public_address', 'relation-data': 'relation_data', 'tag': 'tag', 'workload-version': 'workload_version'}
+    _wireTypes = {'relation_data': ('EndpointRelationData', 'list')}
     def __init__(self, address=None, charm=None, leader=None, life=None, machine=None, opened_ports=None, provider_id=None, public_address=None, relation_data=None, tag=None, workload_version=None, **unknown_fields):
         '''
         address : str
@@ -25481,8 +27191,10 @@ class UnitResult(Type):
 
 
 class UnitSettings(Type):
+    __slots__ = ('version', 'unknown_fields')
     _toSchema = {'version': 'version'}
     _toPy = {'version': 'version'}
+    _wireTypes = {}
     def __init__(self, version=None, **unknown_fields):
         '''
         version : int
@@ -25499,8 +27211,10 @@ class UnitSettings(Type):
 
 
 class UnitStateResult(Type):
+    __slots__ = ('charm_state', 'error', 'meter_status_state', 'relation_state', 'secret_state', 'storage_state', 'uniter_state', 'unknown_fields')
     _toSchema = {'charm_state': 'charm-state', 'error': 'error', 'meter_status_state': 'meter-status-state', 'relation_state': 'relation-state', 'secret_state': 'secret-state', 'storage_state': 'storage-state', 'uniter_state': 'uniter-state'}
     _toPy = {'charm-state': 'charm_state', 'error': 'error', 'meter-status-state': 'meter_status_state', 'relation-state': 'relation_state', 'secret-state': 'secret_state', 'storage-state': 'storage_state', 'uniter-state': 'uniter_state'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, charm_state=None, error=None, meter_status_state=None, relation_state=None, secret_state=None, storage_state=None, uniter_state=None, **unknown_fields):
         '''
         charm_state : typing.Mapping[str, str]
@@ -25553,8 +27267,10 @@ class UnitStateResult(Type):
 
 
 class UnitStateResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('UnitStateResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UnitStateResult]
@@ -25571,8 +27287,10 @@ class UnitStateResults(Type):
 
 
 class UnitStatus(Type):
+    __slots__ = ('address', 'agent_status', 'charm', 'leader', 'machine', 'opened_ports', 'provider_id', 'public_address', 'subordinates', 'workload_status', 'workload_version', 'unknown_fields')
     _toSchema = {'address': 'address', 'agent_status': 'agent-status', 'charm': 'charm', 'leader': 'leader', 'machine': 'machine', 'opened_ports': 'opened-ports', 'provider_id': 'provider-id', 'public_address': 'public-address', 'subordinates': 'subordinates', 'workload_status': 'workload-status', 'workload_version': 'workload-version'}
     _toPy = {'address': 'address', 'agent-status': 'agent_status', 'charm': 'charm', 'leader': 'leader', 'machine': 'machine', 'opened-ports': 'opened_ports', 'provider-id': 'provider_id', 'public-address': 'public_address', 'subordinates': 'subordinates', 'workload-status': 'workload_status', 'workload-version': 'workload_version'}
+    _wireTypes = {'agent_status': ('DetailedStatus', None), 'subordinates': ('UnitStatus', 'dict'), 'workload_status': ('DetailedStatus', None)}
     def __init__(self, address=None, agent_status=None, charm=None, leader=None, machine=None, opened_ports=None, provider_id=None, public_address=None, subordinates=None, workload_status=None, workload_version=None, **unknown_fields):
         '''
         address : str
@@ -25649,8 +27367,10 @@ class UnitStatus(Type):
 
 
 class UnitsResolved(Type):
+    __slots__ = ('all_', 'retry', 'tags', 'unknown_fields')
     _toSchema = {'all_': 'all', 'retry': 'retry', 'tags': 'tags'}
     _toPy = {'all': 'all_', 'retry': 'retry', 'tags': 'tags'}
+    _wireTypes = {'tags': ('Entities', None)}
     def __init__(self, all_=None, retry=None, tags=None, **unknown_fields):
         '''
         all_ : bool
@@ -25679,8 +27399,10 @@ class UnitsResolved(Type):
 
 
 class UnsetModelDefaults(Type):
+    __slots__ = ('keys', 'unknown_fields')
     _toSchema = {'keys': 'keys'}
     _toPy = {'keys': 'keys'}
+    _wireTypes = {'keys': ('ModelUnsetKeys', 'list')}
     def __init__(self, keys=None, **unknown_fields):
         '''
         keys : typing.Sequence[~ModelUnsetKeys]
@@ -25697,8 +27419,10 @@ class UnsetModelDefaults(Type):
 
 
 class UpdateApplicationServiceArg(Type):
+    __slots__ = ('addresses', 'application_tag', 'generation', 'provider_id', 'scale', 'unknown_fields')
     _toSchema = {'addresses': 'addresses', 'application_tag': 'application-tag', 'generation': 'generation', 'provider_id': 'provider-id', 'scale': 'scale'}
     _toPy = {'addresses': 'addresses', 'application-tag': 'application_tag', 'generation': 'generation', 'provider-id': 'provider_id', 'scale': 'scale'}
+    _wireTypes = {'addresses': ('Address', 'list')}
     def __init__(self, addresses=None, application_tag=None, generation=None, provider_id=None, scale=None, **unknown_fields):
         '''
         addresses : typing.Sequence[~Address]
@@ -25739,8 +27463,10 @@ class UpdateApplicationServiceArg(Type):
 
 
 class UpdateApplicationServiceArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('UpdateApplicationServiceArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateApplicationServiceArg]
@@ -25757,8 +27483,10 @@ class UpdateApplicationServiceArgs(Type):
 
 
 class UpdateApplicationUnitArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('UpdateApplicationUnits', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateApplicationUnits]
@@ -25775,8 +27503,10 @@ class UpdateApplicationUnitArgs(Type):
 
 
 class UpdateApplicationUnitResult(Type):
+    __slots__ = ('error', 'info', 'unknown_fields')
     _toSchema = {'error': 'error', 'info': 'info'}
     _toPy = {'error': 'error', 'info': 'info'}
+    _wireTypes = {'error': ('Error', None), 'info': ('UpdateApplicationUnitsInfo', None)}
     def __init__(self, error=None, info=None, **unknown_fields):
         '''
         error : Error
@@ -25799,8 +27529,10 @@ class UpdateApplicationUnitResult(Type):
 
 
 class UpdateApplicationUnitResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('UpdateApplicationUnitResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UpdateApplicationUnitResult]
@@ -25817,8 +27549,10 @@ class UpdateApplicationUnitResults(Type):
 
 
 class UpdateApplicationUnits(Type):
+    __slots__ = ('application_tag', 'generation', 'scale', 'status', 'units', 'unknown_fields')
     _toSchema = {'application_tag': 'application-tag', 'generation': 'generation', 'scale': 'scale', 'status': 'status', 'units': 'units'}
     _toPy = {'application-tag': 'application_tag', 'generation': 'generation', 'scale': 'scale', 'status': 'status', 'units': 'units'}
+    _wireTypes = {'status': ('EntityStatus', None), 'units': ('ApplicationUnitParams', 'list')}
     def __init__(self, application_tag=None, generation=None, scale=None, status=None, units=None, **unknown_fields):
         '''
         application_tag : str
@@ -25859,8 +27593,10 @@ class UpdateApplicationUnits(Type):
 
 
 class UpdateApplicationUnitsInfo(Type):
+    __slots__ = ('units', 'unknown_fields')
     _toSchema = {'units': 'units'}
     _toPy = {'units': 'units'}
+    _wireTypes = {'units': ('ApplicationUnitInfo', 'list')}
     def __init__(self, units=None, **unknown_fields):
         '''
         units : typing.Sequence[~ApplicationUnitInfo]
@@ -25877,8 +27613,10 @@ class UpdateApplicationUnitsInfo(Type):
 
 
 class UpdateBehavior(Type):
+    __slots__ = ('enable_os_refresh_update', 'enable_os_upgrade', 'unknown_fields')
     _toSchema = {'enable_os_refresh_update': 'enable-os-refresh-update', 'enable_os_upgrade': 'enable-os-upgrade'}
     _toPy = {'enable-os-refresh-update': 'enable_os_refresh_update', 'enable-os-upgrade': 'enable_os_upgrade'}
+    _wireTypes = {}
     def __init__(self, enable_os_refresh_update=None, enable_os_upgrade=None, **unknown_fields):
         '''
         enable_os_refresh_update : bool
@@ -25901,8 +27639,10 @@ class UpdateBehavior(Type):
 
 
 class UpdateChannelArg(Type):
+    __slots__ = ('channel', 'force', 'tag', 'unknown_fields')
     _toSchema = {'channel': 'channel', 'force': 'force', 'tag': 'tag'}
     _toPy = {'channel': 'channel', 'force': 'force', 'tag': 'tag'}
+    _wireTypes = {'tag': ('Entity', None)}
     def __init__(self, channel=None, force=None, tag=None, **unknown_fields):
         '''
         channel : str
@@ -25931,8 +27671,10 @@ class UpdateChannelArg(Type):
 
 
 class UpdateChannelArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('UpdateChannelArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateChannelArg]
@@ -25949,8 +27691,10 @@ class UpdateChannelArgs(Type):
 
 
 class UpdateCloudArgs(Type):
+    __slots__ = ('clouds', 'unknown_fields')
     _toSchema = {'clouds': 'clouds'}
     _toPy = {'clouds': 'clouds'}
+    _wireTypes = {'clouds': ('AddCloudArgs', 'list')}
     def __init__(self, clouds=None, **unknown_fields):
         '''
         clouds : typing.Sequence[~AddCloudArgs]
@@ -25967,8 +27711,10 @@ class UpdateCloudArgs(Type):
 
 
 class UpdateControllerForModel(Type):
+    __slots__ = ('info', 'model_tag', 'unknown_fields')
     _toSchema = {'info': 'info', 'model_tag': 'model-tag'}
     _toPy = {'info': 'info', 'model-tag': 'model_tag'}
+    _wireTypes = {'info': ('ExternalControllerInfo', None)}
     def __init__(self, info=None, model_tag=None, **unknown_fields):
         '''
         info : ExternalControllerInfo
@@ -25991,8 +27737,10 @@ class UpdateControllerForModel(Type):
 
 
 class UpdateControllersForModelsParams(Type):
+    __slots__ = ('changes', 'unknown_fields')
     _toSchema = {'changes': 'changes'}
     _toPy = {'changes': 'changes'}
+    _wireTypes = {'changes': ('UpdateControllerForModel', 'list')}
     def __init__(self, changes=None, **unknown_fields):
         '''
         changes : typing.Sequence[~UpdateControllerForModel]
@@ -26009,8 +27757,10 @@ class UpdateControllersForModelsParams(Type):
 
 
 class UpdateCredentialArgs(Type):
+    __slots__ = ('credentials', 'force', 'unknown_fields')
     _toSchema = {'credentials': 'credentials', 'force': 'force'}
     _toPy = {'credentials': 'credentials', 'force': 'force'}
+    _wireTypes = {'credentials': ('TaggedCredential', 'list')}
     def __init__(self, credentials=None, force=None, **unknown_fields):
         '''
         credentials : typing.Sequence[~TaggedCredential]
@@ -26033,8 +27783,10 @@ class UpdateCredentialArgs(Type):
 
 
 class UpdateCredentialModelResult(Type):
+    __slots__ = ('errors', 'name', 'uuid', 'unknown_fields')
     _toSchema = {'errors': 'errors', 'name': 'name', 'uuid': 'uuid'}
     _toPy = {'errors': 'errors', 'name': 'name', 'uuid': 'uuid'}
+    _wireTypes = {'errors': ('ErrorResult', 'list')}
     def __init__(self, errors=None, name=None, uuid=None, **unknown_fields):
         '''
         errors : typing.Sequence[~ErrorResult]
@@ -26063,8 +27815,10 @@ class UpdateCredentialModelResult(Type):
 
 
 class UpdateCredentialResult(Type):
+    __slots__ = ('error', 'models', 'tag', 'unknown_fields')
     _toSchema = {'error': 'error', 'models': 'models', 'tag': 'tag'}
     _toPy = {'error': 'error', 'models': 'models', 'tag': 'tag'}
+    _wireTypes = {'error': ('Error', None), 'models': ('UpdateCredentialModelResult', 'list')}
     def __init__(self, error=None, models=None, tag=None, **unknown_fields):
         '''
         error : Error
@@ -26093,8 +27847,10 @@ class UpdateCredentialResult(Type):
 
 
 class UpdateCredentialResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('UpdateCredentialResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UpdateCredentialResult]
@@ -26111,8 +27867,10 @@ class UpdateCredentialResults(Type):
 
 
 class UpdateSecretArg(Type):
+    __slots__ = ('upsertsecretarg', 'content', 'description', 'expire_time', 'label', 'params', 'rotate_policy', 'uri', 'unknown_fields')
     _toSchema = {'content': 'content', 'description': 'description', 'expire_time': 'expire-time', 'label': 'label', 'params': 'params', 'rotate_policy': 'rotate-policy', 'upsertsecretarg': 'UpsertSecretArg', 'uri': 'uri'}
     _toPy = {'UpsertSecretArg': 'upsertsecretarg', 'content': 'content', 'description': 'description', 'expire-time': 'expire_time', 'label': 'label', 'params': 'params', 'rotate-policy': 'rotate_policy', 'uri': 'uri'}
+    _wireTypes = {'content': ('SecretContentParams', None), 'upsertsecretarg': ('UpsertSecretArg', None)}
     def __init__(self, upsertsecretarg=None, content=None, description=None, expire_time=None, label=None, params=None, rotate_policy=None, uri=None, **unknown_fields):
         '''
         upsertsecretarg : UpsertSecretArg
@@ -26171,8 +27929,10 @@ class UpdateSecretArg(Type):
 
 
 class UpdateSecretArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('UpdateSecretArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateSecretArg]
@@ -26189,8 +27949,10 @@ class UpdateSecretArgs(Type):
 
 
 class UpdateSecretBackendArg(Type):
+    __slots__ = ('config', 'force', 'name', 'name_change', 'reset', 'token_rotate_interval', 'unknown_fields')
     _toSchema = {'config': 'config', 'force': 'force', 'name': 'name', 'name_change': 'name-change', 'reset': 'reset', 'token_rotate_interval': 'token-rotate-interval'}
     _toPy = {'config': 'config', 'force': 'force', 'name': 'name', 'name-change': 'name_change', 'reset': 'reset', 'token-rotate-interval': 'token_rotate_interval'}
+    _wireTypes = {}
     def __init__(self, config=None, force=None, name=None, name_change=None, reset=None, token_rotate_interval=None, **unknown_fields):
         '''
         config : typing.Mapping[str, typing.Any]
@@ -26237,8 +27999,10 @@ class UpdateSecretBackendArg(Type):
 
 
 class UpdateSecretBackendArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('UpdateSecretBackendArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateSecretBackendArg]
@@ -26255,8 +28019,10 @@ class UpdateSecretBackendArgs(Type):
 
 
 class UpdateUserSecretArg(Type):
+    __slots__ = ('upsertsecretarg', 'auto_prune', 'content', 'description', 'existing_label', 'expire_time', 'label', 'params', 'rotate_policy', 'uri', 'unknown_fields')
     _toSchema = {'auto_prune': 'auto-prune', 'content': 'content', 'description': 'description', 'existing_label': 'existing-label', 'expire_time': 'expire-time', 'label': 'label', 'params': 'params', 'rotate_policy': 'rotate-policy', 'upsertsecretarg': 'UpsertSecretArg', 'uri': 'uri'}
     _toPy = {'UpsertSecretArg': 'upsertsecretarg', 'auto-prune': 'auto_prune', 'content': 'content', 'description': 'description', 'existing-label': 'existing_label', 'expire-time': 'expire_time', 'label': 'label', 'params': 'params', 'rotate-policy': 'rotate_policy', 'uri': 'uri'}
+    _wireTypes = {'content': ('SecretContentParams', None), 'upsertsecretarg': ('UpsertSecretArg', None)}
     def __init__(self, upsertsecretarg=None, auto_prune=None, content=None, description=None, existing_label=None, expire_time=None, label=None, params=None, rotate_policy=None, uri=None, **unknown_fields):
         '''
         upsertsecretarg : UpsertSecretArg
@@ -26327,8 +28093,10 @@ class UpdateUserSecretArg(Type):
 
 
 class UpdateUserSecretArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('UpdateUserSecretArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~UpdateUserSecretArg]
@@ -26345,8 +28113,10 @@ class UpdateUserSecretArgs(Type):
 
 
 class UpgradeModelParams(Type):
+    __slots__ = ('agent_stream', 'dry_run', 'ignore_agent_versions', 'model_tag', 'target_version', 'unknown_fields')
     _toSchema = {'agent_stream': 'agent-stream', 'dry_run': 'dry-run', 'ignore_agent_versions': 'ignore-agent-versions', 'model_tag': 'model-tag', 'target_version': 'target-version'}
     _toPy = {'agent-stream': 'agent_stream', 'dry-run': 'dry_run', 'ignore-agent-versions': 'ignore_agent_versions', 'model-tag': 'model_tag', 'target-version': 'target_version'}
+    _wireTypes = {'target_version': ('Number', None)}
     def __init__(self, agent_stream=None, dry_run=None, ignore_agent_versions=None, model_tag=None, target_version=None, **unknown_fields):
         '''
         agent_stream : str
@@ -26387,8 +28157,10 @@ class UpgradeModelParams(Type):
 
 
 class UpgradeModelResult(Type):
+    __slots__ = ('chosen_version', 'error', 'unknown_fields')
     _toSchema = {'chosen_version': 'chosen-version', 'error': 'error'}
     _toPy = {'chosen-version': 'chosen_version', 'error': 'error'}
+    _wireTypes = {'chosen_version': ('Number', None), 'error': ('Error', None)}
     def __init__(self, chosen_version=None, error=None, **unknown_fields):
         '''
         chosen_version : Number
@@ -26411,8 +28183,10 @@ class UpgradeModelResult(Type):
 
 
 class UpgradeSeriesNotificationParam(Type):
+    __slots__ = ('entity', 'watcher_id', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'watcher_id': 'watcher-id'}
     _toPy = {'entity': 'entity', 'watcher-id': 'watcher_id'}
+    _wireTypes = {'entity': ('Entity', None)}
     def __init__(self, entity=None, watcher_id=None, **unknown_fields):
         '''
         entity : Entity
@@ -26435,8 +28209,10 @@ class UpgradeSeriesNotificationParam(Type):
 
 
 class UpgradeSeriesNotificationParams(Type):
+    __slots__ = ('params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
+    _wireTypes = {'params': ('UpgradeSeriesNotificationParam', 'list')}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~UpgradeSeriesNotificationParam]
@@ -26453,8 +28229,10 @@ class UpgradeSeriesNotificationParams(Type):
 
 
 class UpgradeSeriesStartUnitCompletionParam(Type):
+    __slots__ = ('entities', 'message', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'message': 'message'}
     _toPy = {'entities': 'entities', 'message': 'message'}
+    _wireTypes = {'entities': ('Entity', 'list')}
     def __init__(self, entities=None, message=None, **unknown_fields):
         '''
         entities : typing.Sequence[~Entity]
@@ -26477,8 +28255,10 @@ class UpgradeSeriesStartUnitCompletionParam(Type):
 
 
 class UpgradeSeriesStatusParam(Type):
+    __slots__ = ('entity', 'message', 'status', 'unknown_fields')
     _toSchema = {'entity': 'entity', 'message': 'message', 'status': 'status'}
     _toPy = {'entity': 'entity', 'message': 'message', 'status': 'status'}
+    _wireTypes = {'entity': ('Entity', None)}
     def __init__(self, entity=None, message=None, status=None, **unknown_fields):
         '''
         entity : Entity
@@ -26507,8 +28287,10 @@ class UpgradeSeriesStatusParam(Type):
 
 
 class UpgradeSeriesStatusParams(Type):
+    __slots__ = ('params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
+    _wireTypes = {'params': ('UpgradeSeriesStatusParam', 'list')}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~UpgradeSeriesStatusParam]
@@ -26525,8 +28307,10 @@ class UpgradeSeriesStatusParams(Type):
 
 
 class UpgradeSeriesStatusResult(Type):
+    __slots__ = ('error', 'status', 'target', 'unknown_fields')
     _toSchema = {'error': 'error', 'status': 'status', 'target': 'target'}
     _toPy = {'error': 'error', 'status': 'status', 'target': 'target'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, status=None, target=None, **unknown_fields):
         '''
         error : Error
@@ -26555,8 +28339,10 @@ class UpgradeSeriesStatusResult(Type):
 
 
 class UpgradeSeriesStatusResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('UpgradeSeriesStatusResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UpgradeSeriesStatusResult]
@@ -26573,8 +28359,10 @@ class UpgradeSeriesStatusResults(Type):
 
 
 class UpgradeSeriesUnitsResult(Type):
+    __slots__ = ('error', 'unit_names', 'unknown_fields')
     _toSchema = {'error': 'error', 'unit_names': 'unit-names'}
     _toPy = {'error': 'error', 'unit-names': 'unit_names'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, error=None, unit_names=None, **unknown_fields):
         '''
         error : Error
@@ -26597,8 +28385,10 @@ class UpgradeSeriesUnitsResult(Type):
 
 
 class UpgradeSeriesUnitsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'Results'}
     _toPy = {'Results': 'results'}
+    _wireTypes = {'results': ('UpgradeSeriesUnitsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UpgradeSeriesUnitsResult]
@@ -26615,8 +28405,10 @@ class UpgradeSeriesUnitsResults(Type):
 
 
 class UpsertSecretArg(Type):
+    __slots__ = ('content', 'description', 'expire_time', 'label', 'params', 'rotate_policy', 'unknown_fields')
     _toSchema = {'content': 'content', 'description': 'description', 'expire_time': 'expire-time', 'label': 'label', 'params': 'params', 'rotate_policy': 'rotate-policy'}
     _toPy = {'content': 'content', 'description': 'description', 'expire-time': 'expire_time', 'label': 'label', 'params': 'params', 'rotate-policy': 'rotate_policy'}
+    _wireTypes = {'content': ('SecretContentParams', None)}
     def __init__(self, content=None, description=None, expire_time=None, label=None, params=None, rotate_policy=None, **unknown_fields):
         '''
         content : SecretContentParams
@@ -26663,8 +28455,10 @@ class UpsertSecretArg(Type):
 
 
 class UserAccess(Type):
+    __slots__ = ('access', 'user_tag', 'unknown_fields')
     _toSchema = {'access': 'access', 'user_tag': 'user-tag'}
     _toPy = {'access': 'access', 'user-tag': 'user_tag'}
+    _wireTypes = {}
     def __init__(self, access=None, user_tag=None, **unknown_fields):
         '''
         access : str
@@ -26687,8 +28481,10 @@ class UserAccess(Type):
 
 
 class UserAccessResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('UserAccess', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -26711,8 +28507,10 @@ class UserAccessResult(Type):
 
 
 class UserAccessResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('UserAccessResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UserAccessResult]
@@ -26729,8 +28527,10 @@ class UserAccessResults(Type):
 
 
 class UserCloud(Type):
+    __slots__ = ('cloud_tag', 'user_tag', 'unknown_fields')
     _toSchema = {'cloud_tag': 'cloud-tag', 'user_tag': 'user-tag'}
     _toPy = {'cloud-tag': 'cloud_tag', 'user-tag': 'user_tag'}
+    _wireTypes = {}
     def __init__(self, cloud_tag=None, user_tag=None, **unknown_fields):
         '''
         cloud_tag : str
@@ -26753,8 +28553,10 @@ class UserCloud(Type):
 
 
 class UserClouds(Type):
+    __slots__ = ('user_clouds', 'unknown_fields')
     _toSchema = {'user_clouds': 'user-clouds'}
     _toPy = {'user-clouds': 'user_clouds'}
+    _wireTypes = {'user_clouds': ('UserCloud', 'list')}
     def __init__(self, user_clouds=None, **unknown_fields):
         '''
         user_clouds : typing.Sequence[~UserCloud]
@@ -26771,8 +28573,10 @@ class UserClouds(Type):
 
 
 class UserInfo(Type):
+    __slots__ = ('access', 'created_by', 'date_created', 'disabled', 'display_name', 'last_connection', 'username', 'unknown_fields')
     _toSchema = {'access': 'access', 'created_by': 'created-by', 'date_created': 'date-created', 'disabled': 'disabled', 'display_name': 'display-name', 'last_connection': 'last-connection', 'username': 'username'}
     _toPy = {'access': 'access', 'created-by': 'created_by', 'date-created': 'date_created', 'disabled': 'disabled', 'display-name': 'display_name', 'last-connection': 'last_connection', 'username': 'username'}
+    _wireTypes = {}
     def __init__(self, access=None, created_by=None, date_created=None, disabled=None, display_name=None, last_connection=None, username=None, **unknown_fields):
         '''
         access : str
@@ -26825,8 +28629,10 @@ class UserInfo(Type):
 
 
 class UserInfoRequest(Type):
+    __slots__ = ('entities', 'include_disabled', 'unknown_fields')
     _toSchema = {'entities': 'entities', 'include_disabled': 'include-disabled'}
     _toPy = {'entities': 'entities', 'include-disabled': 'include_disabled'}
+    _wireTypes = {'entities': ('Entity', 'list')}
     def __init__(self, entities=None, include_disabled=None, **unknown_fields):
         '''
         entities : typing.Sequence[~Entity]
@@ -26849,8 +28655,10 @@ class UserInfoRequest(Type):
 
 
 class UserInfoResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('UserInfo', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -26873,8 +28681,10 @@ class UserInfoResult(Type):
 
 
 class UserInfoResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('UserInfoResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~UserInfoResult]
@@ -26891,8 +28701,10 @@ class UserInfoResults(Type):
 
 
 class UserModel(Type):
+    __slots__ = ('last_connection', 'model', 'unknown_fields')
     _toSchema = {'last_connection': 'last-connection', 'model': 'model'}
     _toPy = {'last-connection': 'last_connection', 'model': 'model'}
+    _wireTypes = {'model': ('Model', None)}
     def __init__(self, last_connection=None, model=None, **unknown_fields):
         '''
         last_connection : str
@@ -26915,8 +28727,10 @@ class UserModel(Type):
 
 
 class UserModelList(Type):
+    __slots__ = ('user_models', 'unknown_fields')
     _toSchema = {'user_models': 'user-models'}
     _toPy = {'user-models': 'user_models'}
+    _wireTypes = {'user_models': ('UserModel', 'list')}
     def __init__(self, user_models=None, **unknown_fields):
         '''
         user_models : typing.Sequence[~UserModel]
@@ -26933,8 +28747,10 @@ class UserModelList(Type):
 
 
 class Value(Type):
+    __slots__ = ('allocate_public_ip', 'arch', 'container', 'cores', 'cpu_power', 'image_id', 'instance_role', 'instance_type', 'mem', 'root_disk', 'root_disk_source', 'spaces', 'tags', 'virt_type', 'zones', 'unknown_fields')
     _toSchema = {'allocate_public_ip': 'allocate-public-ip', 'arch': 'arch', 'container': 'container', 'cores': 'cores', 'cpu_power': 'cpu-power', 'image_id': 'image-id', 'instance_role': 'instance-role', 'instance_type': 'instance-type', 'mem': 'mem', 'root_disk': 'root-disk', 'root_disk_source': 'root-disk-source', 'spaces': 'spaces', 'tags': 'tags', 'virt_type': 'virt-type', 'zones': 'zones'}
     _toPy = {'allocate-public-ip': 'allocate_public_ip', 'arch': 'arch', 'container': 'container', 'cores': 'cores', 'cpu-power': 'cpu_power', 'image-id': 'image_id', 'instance-role': 'instance_role', 'instance-type': 'instance_type', 'mem': 'mem', 'root-disk': 'root_disk', 'root-disk-source': 'root_disk_source', 'spaces': 'spaces', 'tags': 'tags', 'virt-type': 'virt_type', 'zones': 'zones'}
+    _wireTypes = {}
     def __init__(self, allocate_public_ip=None, arch=None, container=None, cores=None, cpu_power=None, image_id=None, instance_role=None, instance_type=None, mem=None, root_disk=None, root_disk_source=None, spaces=None, tags=None, virt_type=None, zones=None, **unknown_fields):
         '''
         allocate_public_ip : bool
@@ -27035,8 +28851,10 @@ class Value(Type):
 
 
 class Version(Type):
+    __slots__ = ('version', 'unknown_fields')
     _toSchema = {'version': 'version'}
     _toPy = {'version': 'version'}
+    _wireTypes = {'version': ('Binary', None)}
     def __init__(self, version=None, **unknown_fields):
         '''
         version : Binary
@@ -27053,8 +28871,10 @@ class Version(Type):
 
 
 class VersionResult(Type):
+    __slots__ = ('error', 'version', 'unknown_fields')
     _toSchema = {'error': 'error', 'version': 'version'}
     _toPy = {'error': 'error', 'version': 'version'}
+    _wireTypes = {'error': ('Error', None), 'version': ('Number', None)}
     def __init__(self, error=None, version=None, **unknown_fields):
         '''
         error : Error
@@ -27077,8 +28897,10 @@ class VersionResult(Type):
 
 
 class VersionResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('VersionResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VersionResult]
@@ -27095,8 +28917,10 @@ class VersionResults(Type):
 
 
 class Volume(Type):
+    __slots__ = ('info', 'volume_tag', 'unknown_fields')
     _toSchema = {'info': 'info', 'volume_tag': 'volume-tag'}
     _toPy = {'info': 'info', 'volume-tag': 'volume_tag'}
+    _wireTypes = {'info': ('VolumeInfo', None)}
     def __init__(self, info=None, volume_tag=None, **unknown_fields):
         '''
         info : VolumeInfo
@@ -27119,8 +28943,10 @@ class Volume(Type):
 
 
 class VolumeAttachment(Type):
+    __slots__ = ('info', 'machine_tag', 'volume_tag', 'unknown_fields')
     _toSchema = {'info': 'info', 'machine_tag': 'machine-tag', 'volume_tag': 'volume-tag'}
     _toPy = {'info': 'info', 'machine-tag': 'machine_tag', 'volume-tag': 'volume_tag'}
+    _wireTypes = {'info': ('VolumeAttachmentInfo', None)}
     def __init__(self, info=None, machine_tag=None, volume_tag=None, **unknown_fields):
         '''
         info : VolumeAttachmentInfo
@@ -27149,8 +28975,10 @@ class VolumeAttachment(Type):
 
 
 class VolumeAttachmentDetails(Type):
+    __slots__ = ('volumeattachmentinfo', 'bus_address', 'device_link', 'device_name', 'life', 'plan_info', 'read_only', 'unknown_fields')
     _toSchema = {'bus_address': 'bus-address', 'device_link': 'device-link', 'device_name': 'device-name', 'life': 'life', 'plan_info': 'plan-info', 'read_only': 'read-only', 'volumeattachmentinfo': 'VolumeAttachmentInfo'}
     _toPy = {'VolumeAttachmentInfo': 'volumeattachmentinfo', 'bus-address': 'bus_address', 'device-link': 'device_link', 'device-name': 'device_name', 'life': 'life', 'plan-info': 'plan_info', 'read-only': 'read_only'}
+    _wireTypes = {'plan_info': ('VolumeAttachmentPlanInfo', None), 'volumeattachmentinfo': ('VolumeAttachmentInfo', None)}
     def __init__(self, volumeattachmentinfo=None, bus_address=None, device_link=None, device_name=None, life=None, plan_info=None, read_only=None, **unknown_fields):
         '''
         volumeattachmentinfo : VolumeAttachmentInfo
@@ -27203,8 +29031,10 @@ class VolumeAttachmentDetails(Type):
 
 
 class VolumeAttachmentInfo(Type):
+    __slots__ = ('bus_address', 'device_link', 'device_name', 'plan_info', 'read_only', 'unknown_fields')
     _toSchema = {'bus_address': 'bus-address', 'device_link': 'device-link', 'device_name': 'device-name', 'plan_info': 'plan-info', 'read_only': 'read-only'}
     _toPy = {'bus-address': 'bus_address', 'device-link': 'device_link', 'device-name': 'device_name', 'plan-info': 'plan_info', 'read-only': 'read_only'}
+    _wireTypes = {'plan_info': ('VolumeAttachmentPlanInfo', None)}
     def __init__(self, bus_address=None, device_link=None, device_name=None, plan_info=None, read_only=None, **unknown_fields):
         '''
         bus_address : str
@@ -27245,8 +29075,10 @@ class VolumeAttachmentInfo(Type):
 
 
 class VolumeAttachmentParams(Type):
+    __slots__ = ('instance_id', 'machine_tag', 'provider', 'read_only', 'volume_id', 'volume_tag', 'unknown_fields')
     _toSchema = {'instance_id': 'instance-id', 'machine_tag': 'machine-tag', 'provider': 'provider', 'read_only': 'read-only', 'volume_id': 'volume-id', 'volume_tag': 'volume-tag'}
     _toPy = {'instance-id': 'instance_id', 'machine-tag': 'machine_tag', 'provider': 'provider', 'read-only': 'read_only', 'volume-id': 'volume_id', 'volume-tag': 'volume_tag'}
+    _wireTypes = {}
     def __init__(self, instance_id=None, machine_tag=None, provider=None, read_only=None, volume_id=None, volume_tag=None, **unknown_fields):
         '''
         instance_id : str
@@ -27293,8 +29125,10 @@ class VolumeAttachmentParams(Type):
 
 
 class VolumeAttachmentParamsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('VolumeAttachmentParams', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -27317,8 +29151,10 @@ class VolumeAttachmentParamsResult(Type):
 
 
 class VolumeAttachmentParamsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('VolumeAttachmentParamsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeAttachmentParamsResult]
@@ -27335,8 +29171,10 @@ class VolumeAttachmentParamsResults(Type):
 
 
 class VolumeAttachmentPlan(Type):
+    __slots__ = ('block_device', 'life', 'machine_tag', 'plan_info', 'volume_tag', 'unknown_fields')
     _toSchema = {'block_device': 'block-device', 'life': 'life', 'machine_tag': 'machine-tag', 'plan_info': 'plan-info', 'volume_tag': 'volume-tag'}
     _toPy = {'block-device': 'block_device', 'life': 'life', 'machine-tag': 'machine_tag', 'plan-info': 'plan_info', 'volume-tag': 'volume_tag'}
+    _wireTypes = {'block_device': ('BlockDevice', None), 'plan_info': ('VolumeAttachmentPlanInfo', None)}
     def __init__(self, block_device=None, life=None, machine_tag=None, plan_info=None, volume_tag=None, **unknown_fields):
         '''
         block_device : BlockDevice
@@ -27377,8 +29215,10 @@ class VolumeAttachmentPlan(Type):
 
 
 class VolumeAttachmentPlanInfo(Type):
+    __slots__ = ('device_attributes', 'device_type', 'unknown_fields')
     _toSchema = {'device_attributes': 'device-attributes', 'device_type': 'device-type'}
     _toPy = {'device-attributes': 'device_attributes', 'device-type': 'device_type'}
+    _wireTypes = {}
     def __init__(self, device_attributes=None, device_type=None, **unknown_fields):
         '''
         device_attributes : typing.Mapping[str, str]
@@ -27401,8 +29241,10 @@ class VolumeAttachmentPlanInfo(Type):
 
 
 class VolumeAttachmentPlanResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('VolumeAttachmentPlan', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -27425,8 +29267,10 @@ class VolumeAttachmentPlanResult(Type):
 
 
 class VolumeAttachmentPlanResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('VolumeAttachmentPlanResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeAttachmentPlanResult]
@@ -27443,8 +29287,10 @@ class VolumeAttachmentPlanResults(Type):
 
 
 class VolumeAttachmentPlans(Type):
+    __slots__ = ('volume_plans', 'unknown_fields')
     _toSchema = {'volume_plans': 'volume-plans'}
     _toPy = {'volume-plans': 'volume_plans'}
+    _wireTypes = {'volume_plans': ('VolumeAttachmentPlan', 'list')}
     def __init__(self, volume_plans=None, **unknown_fields):
         '''
         volume_plans : typing.Sequence[~VolumeAttachmentPlan]
@@ -27461,8 +29307,10 @@ class VolumeAttachmentPlans(Type):
 
 
 class VolumeAttachmentResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('VolumeAttachment', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -27485,8 +29333,10 @@ class VolumeAttachmentResult(Type):
 
 
 class VolumeAttachmentResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('VolumeAttachmentResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeAttachmentResult]
@@ -27503,8 +29353,10 @@ class VolumeAttachmentResults(Type):
 
 
 class VolumeAttachments(Type):
+    __slots__ = ('volume_attachments', 'unknown_fields')
     _toSchema = {'volume_attachments': 'volume-attachments'}
     _toPy = {'volume-attachments': 'volume_attachments'}
+    _wireTypes = {'volume_attachments': ('VolumeAttachment', 'list')}
     def __init__(self, volume_attachments=None, **unknown_fields):
         '''
         volume_attachments : typing.Sequence[~VolumeAttachment]
@@ -27521,8 +29373,10 @@ class VolumeAttachments(Type):
 
 
 class VolumeDetails(Type):
+    __slots__ = ('info', 'life', 'machine_attachments', 'status', 'storage', 'unit_attachments', 'volume_tag', 'unknown_fields')
     _toSchema = {'info': 'info', 'life': 'life', 'machine_attachments': 'machine-attachments', 'status': 'status', 'storage': 'storage', 'unit_attachments': 'unit-attachments', 'volume_tag': 'volume-tag'}
     _toPy = {'info': 'info', 'life': 'life', 'machine-attachments': 'machine_attachments', 'status': 'status', 'storage': 'storage', 'unit-attachments': 'unit_attachments', 'volume-tag': 'volume_tag'}
+    _wireTypes = {'info': ('VolumeInfo', None), 'machine_attachments': ('VolumeAttachmentDetails', 'dict'), 'status': ('EntityStatus', None), 'storage': ('StorageDetails', None), 'unit_attachments': ('VolumeAttachmentDetails', 'dict')}
     def __init__(self, info=None, life=None, machine_attachments=None, status=None, storage=None, unit_attachments=None, volume_tag=None, **unknown_fields):
         '''
         info : VolumeInfo
@@ -27575,8 +29429,10 @@ class VolumeDetails(Type):
 
 
 class VolumeDetailsListResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('VolumeDetails', 'list')}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -27599,8 +29455,10 @@ class VolumeDetailsListResult(Type):
 
 
 class VolumeDetailsListResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('VolumeDetailsListResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeDetailsListResult]
@@ -27617,8 +29475,10 @@ class VolumeDetailsListResults(Type):
 
 
 class VolumeFilter(Type):
+    __slots__ = ('machines', 'unknown_fields')
     _toSchema = {'machines': 'machines'}
     _toPy = {'machines': 'machines'}
+    _wireTypes = {}
     def __init__(self, machines=None, **unknown_fields):
         '''
         machines : typing.Sequence[str]
@@ -27635,8 +29495,10 @@ class VolumeFilter(Type):
 
 
 class VolumeFilters(Type):
+    __slots__ = ('filters', 'unknown_fields')
     _toSchema = {'filters': 'filters'}
     _toPy = {'filters': 'filters'}
+    _wireTypes = {'filters': ('VolumeFilter', 'list')}
     def __init__(self, filters=None, **unknown_fields):
         '''
         filters : typing.Sequence[~VolumeFilter]
@@ -27653,8 +29515,10 @@ class VolumeFilters(Type):
 
 
 class VolumeInfo(Type):
+    __slots__ = ('hardware_id', 'persistent', 'pool', 'size', 'volume_id', 'wwn', 'unknown_fields')
     _toSchema = {'hardware_id': 'hardware-id', 'persistent': 'persistent', 'pool': 'pool', 'size': 'size', 'volume_id': 'volume-id', 'wwn': 'wwn'}
     _toPy = {'hardware-id': 'hardware_id', 'persistent': 'persistent', 'pool': 'pool', 'size': 'size', 'volume-id': 'volume_id', 'wwn': 'wwn'}
+    _wireTypes = {}
     def __init__(self, hardware_id=None, persistent=None, pool=None, size=None, volume_id=None, wwn=None, **unknown_fields):
         '''
         hardware_id : str
@@ -27701,8 +29565,10 @@ class VolumeInfo(Type):
 
 
 class VolumeParams(Type):
+    __slots__ = ('attachment', 'attributes', 'provider', 'size', 'tags', 'volume_tag', 'unknown_fields')
     _toSchema = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'tags': 'tags', 'volume_tag': 'volume-tag'}
     _toPy = {'attachment': 'attachment', 'attributes': 'attributes', 'provider': 'provider', 'size': 'size', 'tags': 'tags', 'volume-tag': 'volume_tag'}
+    _wireTypes = {'attachment': ('VolumeAttachmentParams', None)}
     def __init__(self, attachment=None, attributes=None, provider=None, size=None, tags=None, volume_tag=None, **unknown_fields):
         '''
         attachment : VolumeAttachmentParams
@@ -27749,8 +29615,10 @@ class VolumeParams(Type):
 
 
 class VolumeParamsResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('VolumeParams', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -27773,8 +29641,10 @@ class VolumeParamsResult(Type):
 
 
 class VolumeParamsResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('VolumeParamsResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeParamsResult]
@@ -27791,8 +29661,10 @@ class VolumeParamsResults(Type):
 
 
 class VolumeResult(Type):
+    __slots__ = ('error', 'result', 'unknown_fields')
     _toSchema = {'error': 'error', 'result': 'result'}
     _toPy = {'error': 'error', 'result': 'result'}
+    _wireTypes = {'error': ('Error', None), 'result': ('Volume', None)}
     def __init__(self, error=None, result=None, **unknown_fields):
         '''
         error : Error
@@ -27815,8 +29687,10 @@ class VolumeResult(Type):
 
 
 class VolumeResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('VolumeResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~VolumeResult]
@@ -27833,8 +29707,10 @@ class VolumeResults(Type):
 
 
 class Volumes(Type):
+    __slots__ = ('volumes', 'unknown_fields')
     _toSchema = {'volumes': 'volumes'}
     _toPy = {'volumes': 'volumes'}
+    _wireTypes = {'volumes': ('Volume', 'list')}
     def __init__(self, volumes=None, **unknown_fields):
         '''
         volumes : typing.Sequence[~Volume]
@@ -27851,8 +29727,10 @@ class Volumes(Type):
 
 
 class WatchContainer(Type):
+    __slots__ = ('container_type', 'machine_tag', 'unknown_fields')
     _toSchema = {'container_type': 'container-type', 'machine_tag': 'machine-tag'}
     _toPy = {'container-type': 'container_type', 'machine-tag': 'machine_tag'}
+    _wireTypes = {}
     def __init__(self, container_type=None, machine_tag=None, **unknown_fields):
         '''
         container_type : str
@@ -27875,8 +29753,10 @@ class WatchContainer(Type):
 
 
 class WatchContainerStartArg(Type):
+    __slots__ = ('container', 'entity', 'unknown_fields')
     _toSchema = {'container': 'container', 'entity': 'entity'}
     _toPy = {'container': 'container', 'entity': 'entity'}
+    _wireTypes = {'entity': ('Entity', None)}
     def __init__(self, container=None, entity=None, **unknown_fields):
         '''
         container : str
@@ -27899,8 +29779,10 @@ class WatchContainerStartArg(Type):
 
 
 class WatchContainerStartArgs(Type):
+    __slots__ = ('args', 'unknown_fields')
     _toSchema = {'args': 'args'}
     _toPy = {'args': 'args'}
+    _wireTypes = {'args': ('WatchContainerStartArg', 'list')}
     def __init__(self, args=None, **unknown_fields):
         '''
         args : typing.Sequence[~WatchContainerStartArg]
@@ -27917,8 +29799,10 @@ class WatchContainerStartArgs(Type):
 
 
 class WatchContainers(Type):
+    __slots__ = ('params', 'unknown_fields')
     _toSchema = {'params': 'params'}
     _toPy = {'params': 'params'}
+    _wireTypes = {'params': ('WatchContainer', 'list')}
     def __init__(self, params=None, **unknown_fields):
         '''
         params : typing.Sequence[~WatchContainer]
@@ -27935,8 +29819,10 @@ class WatchContainers(Type):
 
 
 class WatchRemoteSecretChangesArg(Type):
+    __slots__ = ('application_token', 'bakery_version', 'macaroons', 'relation_token', 'unknown_fields')
     _toSchema = {'application_token': 'application-token', 'bakery_version': 'bakery-version', 'macaroons': 'macaroons', 'relation_token': 'relation-token'}
     _toPy = {'application-token': 'application_token', 'bakery-version': 'bakery_version', 'macaroons': 'macaroons', 'relation-token': 'relation_token'}
+    _wireTypes = {'macaroons': ('Macaroon', 'list')}
     def __init__(self, application_token=None, bakery_version=None, macaroons=None, relation_token=None, **unknown_fields):
         '''
         application_token : str
@@ -27971,8 +29857,10 @@ class WatchRemoteSecretChangesArg(Type):
 
 
 class WatchRemoteSecretChangesArgs(Type):
+    __slots__ = ('relations', 'unknown_fields')
     _toSchema = {'relations': 'relations'}
     _toPy = {'relations': 'relations'}
+    _wireTypes = {'relations': ('WatchRemoteSecretChangesArg', 'list')}
     def __init__(self, relations=None, **unknown_fields):
         '''
         relations : typing.Sequence[~WatchRemoteSecretChangesArg]
@@ -27989,8 +29877,10 @@ class WatchRemoteSecretChangesArgs(Type):
 
 
 class ZoneResult(Type):
+    __slots__ = ('available', 'error', 'name', 'unknown_fields')
     _toSchema = {'available': 'available', 'error': 'error', 'name': 'name'}
     _toPy = {'available': 'available', 'error': 'error', 'name': 'name'}
+    _wireTypes = {'error': ('Error', None)}
     def __init__(self, available=None, error=None, name=None, **unknown_fields):
         '''
         available : bool
@@ -28019,8 +29909,10 @@ class ZoneResult(Type):
 
 
 class ZoneResults(Type):
+    __slots__ = ('results', 'unknown_fields')
     _toSchema = {'results': 'results'}
     _toPy = {'results': 'results'}
+    _wireTypes = {'results': ('ZoneResult', 'list')}
     def __init__(self, results=None, **unknown_fields):
         '''
         results : typing.Sequence[~ZoneResult]
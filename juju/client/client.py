@@ -19,9 +19,13 @@ for o in overrides.__all__:
             "Cannot override a versioned Facade class -- you must patch "
             "it instead.")
 
-for o in overrides.__patches__:
-    # Patch a versioned Facade.
-    for client_version in _client.CLIENTS.values():
+
+def _patch_facades(client_version):
+    """Patch the versioned Facades of a freshly imported _client<version>
+    module with the methods from overrides.__patches__.
+
+    """
+    for o in overrides.__patches__:
         try:
             c_type = getattr(client_version, o)
         except AttributeError:
@@ -33,4 +37,10 @@ for o in overrides.__patches__:
             if not a.startswith('_'):
                 setattr(c_type, a, getattr(o_type, a))
 
+
+# The _client<version> modules are only imported when a facade of that
+# version is first looked up, so they get patched as they are loaded.
+_client.CLIENTS.on_import.append(_patch_facades)
+
+from ._definitions import *  # noqa, isort:skip
 from ._client import *  # noqa, isort:skip
@@ -0,0 +1,98 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Codecs used by :class:`juju.client.connection.Connection` to encode the
+messages it sends and decode the ones it receives.
+
+The standard library json module is always available. When orjson is
+installed, it is used by default instead, as it is several times faster
+for large payloads such as FullStatus results or AllWatcher deltas.
+"""
+
+import json
+
+from .facade import Type, TypeEncoder
+
+_COMPACT = (',', ':')
+
+
+class JSONCodec:
+    """Encodes messages with the standard library json module, without any
+    insignificant whitespace.
+
+    """
+    name = 'json'
+
+    def encode(self, msg, encoder=None):
+        """Return ``msg`` encoded as a JSON str.
+
+        :param encoder: Optional json.JSONEncoder subclass to encode values
+            that are not plain JSON types with, e.g.
+            :class:`juju.client.facade.TypeEncoder`
+        """
+        return json.dumps(msg, separators=_COMPACT, cls=encoder)
+
+    def decode(self, data):
+        """Return the object encoded in the JSON str or bytes ``data``.
+
+        """
+        return json.loads(data)
+
+
+def _serialize(obj):
+    if isinstance(obj, Type):
+        return obj.serialize()
+    raise TypeError('Object of type {} is not JSON serializable'.format(
+        type(obj).__name__))
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes messages with orjson, which must be installed.
+
+    Types are serialized through their serialize hooks like with
+    TypeEncoder. Any other custom encoder falls back to the json module.
+
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def encode(self, msg, encoder=None):
+        if encoder is not None and encoder is not TypeEncoder:
+            return super().encode(msg, encoder)
+        return self._orjson.dumps(
+            msg, default=_serialize,
+            option=self._orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def decode(self, data):
+        return self._orjson.loads(data)
+
+
+codecs = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(codec=None):
+    """Return a codec instance.
+
+    :param codec: A codec instance, which is returned as is, the name of one
+        of the ``codecs``, or None for the fastest one available.
+    :raises: ValueError for an unknown codec name, ImportError if the
+        library a named codec needs is not installed
+    """
+    if codec is None:
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return JSONCodec()
+    if isinstance(codec, str):
+        try:
+            return codecs[codec]()
+        except KeyError:
+            raise ValueError('unknown codec {!r}, expected one of {}'.format(
+                codec, ', '.join(sorted(codecs)))) from None
+    return codec
@@ -5,6 +5,7 @@ import base64
 import json
 import logging
 import ssl
+import time
 import urllib.request
 import weakref
 from http.client import HTTPSConnection
@@ -15,7 +16,9 @@ import macaroonbakery.httpbakery as httpbakery
 import websockets
 from juju import errors, tag, utils, jasyncio
 from juju.client import client
-from juju.utils import IdQueue
+from juju.client.codec import get_codec
+from juju.client.tracing import RPCTracer
+from juju.utils import FutureMap
 from juju.version import CLIENT_VERSION
 
 log = logging.getLogger('juju.client.connection')
@@ -149,6 +152,16 @@ client_facades = {
     'VolumeAttachmentPlansWatcher': {'versions': [1]},
 }
 
+# Bulk facade calls that take a list of entities and reply with exactly one
+# result per entity, in the same order. Concurrent calls to these are
+# coalesced into a single request by RequestBatcher.
+batchable_requests = {
+    ('Action', 'Actions'): 'entities',
+    ('Annotations', 'Get'): 'entities',
+    ('Application', 'ApplicationsInfo'): 'entities',
+    ('Application', 'UnitsInfo'): 'entities',
+}
+
 
 def facade_versions(name, versions):
     """
@@ -228,6 +241,101 @@ class Monitor:
         return self.CONNECTED
 
 
+class RequestBatcher:
+    """
+    Coalesces bulk facade calls made within the same event loop iteration.
+
+    Calls to the same facade method (see ``batchable_requests``) are
+    collected until the loop gets to run its callbacks, then sent as one
+    request whose entity list is the concatenation of all of theirs. The
+    results are split back so that each caller gets a reply holding only
+    the results for the entities it asked for.
+    """
+
+    def __init__(self, connection, max_batch_size):
+        self.connection = weakref.ref(connection)
+        self.max_batch_size = max_batch_size
+        self._pending = {}
+
+    async def call(self, msg, list_key, encoder=None):
+        params = msg.get('params') or {}
+        others = {k: v for k, v in params.items() if k != list_key}
+        key = (msg.get('type'), msg.get('request'), msg.get('version'),
+               list_key, encoder, json.dumps(others, sort_keys=True, cls=encoder))
+        loop = jasyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_soon(self._flush, key)
+        batch.append((msg, future))
+        return await future
+
+    def _flush(self, key):
+        batch = self._pending.pop(key)
+        _, _, _, list_key, encoder, _ = key
+        chunk, size = [], 0
+        for msg, future in batch:
+            count = len(msg['params'][list_key])
+            if chunk and size + count > self.max_batch_size:
+                jasyncio.ensure_future(self._send(chunk, list_key, encoder))
+                chunk, size = [], 0
+            chunk.append((msg, future))
+            size += count
+        if chunk:
+            jasyncio.ensure_future(self._send(chunk, list_key, encoder))
+
+    async def _send(self, batch, list_key, encoder):
+        batch = [(msg, future) for msg, future in batch if not future.done()]
+        if len(batch) <= 1:
+            await jasyncio.gather(*(self._send_one(msg, future, encoder)
+                                    for msg, future in batch))
+            return
+
+        first = batch[0][0]
+        entities = [entity for msg, _ in batch for entity in msg['params'][list_key]]
+        merged = dict(first, params=dict(first['params'], **{list_key: entities}))
+        try:
+            result = await self.connection()._rpc(merged, encoder=encoder)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        results = (result.get('response') or {}).get('results')
+        if 'error' in result or results is None:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(result)
+            return
+        if len(results) != len(entities):
+            # We can't tell which result belongs to whom; ask separately.
+            log.warning('RPC: %s.%s returned %d results for %d entities, '
+                        'retrying the calls one by one',
+                        first['type'], first['request'], len(results), len(entities))
+            await jasyncio.gather(*(self._send_one(msg, future, encoder)
+                                    for msg, future in batch))
+            return
+        start = 0
+        for msg, future in batch:
+            end = start + len(msg['params'][list_key])
+            if not future.done():
+                future.set_result(dict(result, response=dict(
+                    result['response'], results=results[start:end])))
+            start = end
+
+    async def _send_one(self, msg, future, encoder):
+        try:
+            result = await self.connection()._rpc(msg, encoder=encoder)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+
 class Connection:
     """
     Usage::
@@ -241,6 +349,10 @@ class Connection:
     MAX_FRAME_SIZE = 2**22
     "Maximum size for a single frame.  Defaults to 4MB."
 
+    MAX_BATCH_SIZE = 1000
+    """Maximum number of entities that concurrent bulk facade calls are
+    coalesced into (see ``batchable_requests``). 0 disables coalescing."""
+
     @classmethod
     async def connect(
             cls,
@@ -256,7 +368,11 @@ class Connection:
             specified_facades=None,
             proxy=None,
             debug_log_conn=None,
-            debug_log_params={}
+            debug_log_params={},
+            codec=None,
+            tracer=None,
+            metrics=None,
+            lazy_responses=False,
     ):
         """Connect to the websocket.
 
@@ -285,6 +401,18 @@ class Connection:
             to prevent using the conservative client pinning with in the client.
         :param TextIOWrapper debug_log_conn: target if this is a debug log connection
         :param dict debug_log_params: filtering parameters for the debug-log output
+        :param codec: The codec used to encode and decode messages, or the
+            name of one. See :func:`juju.client.codec.get_codec`; by default
+            the fastest one available.
+        :param RPCTracer tracer: Decides which requests and replies are
+            traced and how. By default, they are logged at DEBUG level. See
+            :mod:`juju.client.tracing`.
+        :param RPCMetrics metrics: Where to record per facade call metrics,
+            or None to not record any. See :mod:`juju.client.metrics`.
+        :param bool lazy_responses: Decode the replies of facade calls into
+            Types whose fields, and the Types nested in them, are only built
+            when first read. This saves time and memory when large replies,
+            e.g. FullStatus, are only partly read.
         """
         self = cls()
         if endpoint is None:
@@ -306,6 +434,11 @@ class Connection:
         self.password = password
 
         self.__request_id__ = 0
+        self.codec = get_codec(codec)
+        self.tracer = tracer if tracer is not None else RPCTracer()
+        self.metrics = metrics
+        self.lazy_responses = lazy_responses
+        self._reply_sizes = {}
 
         # The following instance variables are initialized by the
         # _connect_with_redirect method, but create them here
@@ -333,7 +466,8 @@ class Connection:
         self.facades = {}
         self.specified_facades = specified_facades or {}
 
-        self.messages = IdQueue()
+        self.messages = FutureMap()
+        self.batcher = RequestBatcher(self, self.MAX_BATCH_SIZE)
         self.monitor = Monitor(connection=self)
         if max_frame_size is None:
             max_frame_size = self.MAX_FRAME_SIZE
@@ -468,13 +602,13 @@ class Connection:
         if self.proxy is not None:
             self.proxy.close()
 
-    async def _recv(self, request_id):
+    async def _recv(self, request_id, timeout=None):
         if not self.is_open:
             raise websockets.exceptions.ConnectionClosed(
                 websockets.frames.Close(websockets.frames.CloseCode.NORMAL_CLOSURE,
                                         'websocket closed'))
         try:
-            return await self.messages.get(request_id)
+            return await self.messages.get(request_id, timeout=timeout)
         except GeneratorExit:
             return {}
 
@@ -569,14 +703,17 @@ class Connection:
                 if self.monitor.close_called.is_set():
                     break
                 if result is not None:
-                    result = json.loads(result)
-                    await self.messages.put(result['request-id'], result)
+                    size = len(result)
+                    result = self.codec.decode(result)
+                    if self.metrics is not None and result['request-id'] in self.messages:
+                        self._reply_sizes[result['request-id']] = size
+                    self.messages.resolve(result['request-id'], result)
         except jasyncio.CancelledError:
             log.debug('Receiver: Cancelled')
             pass
         except websockets.exceptions.ConnectionClosed as e:
             log.warning('Receiver: Connection closed, reconnecting')
-            await self.messages.put_all(e)
+            self.messages.fail_all(e)
             # the reconnect has to be done as a task because the receiver will
             # be cancelled by the reconnect and we don't want the reconnect
             # to be aborted half-way through
@@ -585,7 +722,7 @@ class Connection:
         except Exception as e:
             log.exception("Error in receiver")
             # make pending listeners aware of the error
-            await self.messages.put_all(e)
+            self.messages.fail_all(e)
             raise
 
     async def _pinger(self):
@@ -622,47 +759,24 @@ class Connection:
             log.debug('ping failed because of closed connection')
             pass
 
-    async def rpc(self, msg, encoder=None):
+    async def rpc(self, msg, encoder=None, timeout=None):
         '''Make an RPC to the API. The message is encoded as JSON
         using the given encoder if any.
         :param msg: Parameters for the call (will be encoded as JSON).
         :param encoder: Encoder to be used when encoding the message.
+        :param float timeout: How long, in seconds, to wait for the reply
+            before giving up on the call. If None, wait forever.
         :return: The result of the call.
         :raises JujuAPIError: When there's an error returned.
         :raises JujuError:
+        :raises asyncio.TimeoutError: When no reply came within timeout.
         '''
-        self.__request_id__ += 1
-        msg['request-id'] = self.__request_id__
-        if 'params' not in msg:
-            msg['params'] = {}
-        if "version" not in msg:
-            msg['version'] = self.facades[msg['type']]
-        outgoing = json.dumps(msg, indent=2, cls=encoder)
-        log.debug('connection id: {} ---> {}'.format(id(self), outgoing))
-        for attempt in range(3):
-            if self.monitor.status == Monitor.DISCONNECTED:
-                # closed cleanly; shouldn't try to reconnect
-                raise websockets.exceptions.ConnectionClosed(
-                    websockets.frames.Close(websockets.frames.CloseCode.NORMAL_CLOSURE,
-                                            'websocket closed'))
-            try:
-                await self._ws.send(outgoing)
-                break
-            except websockets.ConnectionClosed:
-                if attempt == 2:
-                    raise
-                log.warning('RPC: Connection closed, reconnecting')
-                # the reconnect has to be done in a separate task because,
-                # if it is triggered by the pinger, then this RPC call will
-                # be cancelled when the pinger is cancelled by the reconnect,
-                # and we don't want the reconnect to be aborted halfway through
-                await jasyncio.wait([self.reconnect()])
-                if self.monitor.status != Monitor.CONNECTED:
-                    # reconnect failed; abort and shutdown
-                    log.error('RPC: Automatic reconnect failed')
-                    raise
-        result = await self._recv(msg['request-id'])
-        log.debug('connection id : {} <--- {}'.format(id(self), result))
+        list_key = batchable_requests.get((msg.get('type'), msg.get('request')))
+        if (list_key is not None and timeout is None and self.batcher.max_batch_size and
+                isinstance((msg.get('params') or {}).get(list_key), list)):
+            result = await self.batcher.call(msg, list_key, encoder=encoder)
+        else:
+            result = await self._rpc(msg, encoder=encoder, timeout=timeout)
 
         if not result:
             return result
@@ -693,6 +807,67 @@ class Connection:
 
         return result
 
+    async def _rpc(self, msg, encoder=None, timeout=None):
+        '''Send msg and return the raw reply, without checking it for
+        errors.
+        '''
+        self.__request_id__ += 1
+        msg['request-id'] = self.__request_id__
+        if 'params' not in msg:
+            msg['params'] = {}
+        if "version" not in msg:
+            msg['version'] = self.facades[msg['type']]
+        outgoing = self.codec.encode(msg, encoder)
+        traced = self.tracer.sample(msg)
+        if traced:
+            self.tracer.request(self, msg, outgoing)
+        if traced or self.metrics is not None:
+            sent = time.monotonic()
+        attempt = 0
+        result = None
+        try:
+            for attempt in range(3):
+                if self.monitor.status == Monitor.DISCONNECTED:
+                    # closed cleanly; shouldn't try to reconnect
+                    raise websockets.exceptions.ConnectionClosed(
+                        websockets.frames.Close(websockets.frames.CloseCode.NORMAL_CLOSURE,
+                                                'websocket closed'))
+                # Register before each send, so that the reply always finds
+                # its future, and a future failed along with the previous
+                # connection is replaced.
+                self.messages.register(msg['request-id'])
+                try:
+                    await self._ws.send(outgoing)
+                    break
+                except websockets.ConnectionClosed:
+                    if attempt == 2:
+                        raise
+                    log.warning('RPC: Connection closed, reconnecting')
+                    # the reconnect has to be done in a separate task because,
+                    # if it is triggered by the pinger, then this RPC call will
+                    # be cancelled when the pinger is cancelled by the reconnect,
+                    # and we don't want the reconnect to be aborted halfway through
+                    await jasyncio.wait([jasyncio.ensure_future(self.reconnect())])
+                    if self.monitor.status != Monitor.CONNECTED:
+                        # reconnect failed; abort and shutdown
+                        log.error('RPC: Automatic reconnect failed')
+                        raise
+            result = await self._recv(msg['request-id'], timeout=timeout)
+        finally:
+            # No-op once the reply was collected; otherwise a late reply
+            # is dropped instead of lingering.
+            self.messages.discard(msg['request-id'])
+            if self.metrics is not None:
+                self.metrics.record(
+                    msg.get('type'), msg.get('request'), msg['version'],
+                    time.monotonic() - sent, sent=len(outgoing),
+                    received=self._reply_sizes.pop(msg['request-id'], 0),
+                    retries=attempt,
+                    error=result is None or 'error' in result)
+        if traced:
+            self.tracer.reply(self, msg, result, time.monotonic() - sent)
+        return result
+
     def _http_headers(self):
         """Return dictionary of http headers necessary for making an http
         connection to the endpoint of this Connection.
@@ -762,6 +937,10 @@ class Connection:
             'bakery_client': self.bakery_client,
             'max_frame_size': self.max_frame_size,
             'proxy': self.proxy,
+            'codec': self.codec,
+            'tracer': self.tracer,
+            'metrics': self.metrics,
+            'lazy_responses': self.lazy_responses,
         }
 
     async def controller(self):
@@ -774,6 +953,10 @@ class Connection:
             cacert=self.cacert,
             bakery_client=self.bakery_client,
             max_frame_size=self.max_frame_size,
+            codec=self.codec,
+            tracer=self.tracer,
+            metrics=self.metrics,
+            lazy_responses=self.lazy_responses,
         )
 
     async def reconnect(self):
@@ -783,6 +966,8 @@ class Connection:
         if monitor.reconnecting.locked() or monitor.close_called.is_set():
             return
         async with monitor.reconnecting:
+            if self.metrics is not None:
+                self.metrics.record_reconnect()
             await self.close(to_reconnect=True)
             connector = self._connect if self.is_debug_log_connection else self._connect_with_login
             res = await connector(
@@ -8,6 +8,7 @@ import json
 import keyword
 import pprint
 import re
+import sys
 import textwrap
 import typing
 from collections import defaultdict
@@ -110,9 +111,38 @@ class TypeFactory:
 '''
 
 CLIENT_TABLE = '''
-CLIENTS = {{
+class ClientModules(Mapping):
+    """
+    Maps facade versions to their _client<version> module, importing each
+    module the first time it is looked up.
+
+    Callables in ``on_import`` are called with every newly imported module.
+
+    """
+    def __init__(self, names):
+        self._names = names
+        self._modules = {{}}
+        self.on_import = []
+
+    def __getitem__(self, version):
+        module = self._modules.get(version)
+        if module is None:
+            module = importlib.import_module(self._names[version])
+            for hook in self.on_import:
+                hook(module)
+            self._modules[version] = module
+        return module
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+CLIENTS = ClientModules({{
     {clients}
-}}
+}})
 
 '''
 
@@ -345,6 +375,47 @@ def buildValidation(name, instance_type, instance_sub_type, ident=None):
     return source
 
 
+def nested_type(arg_type):
+    """Return the name of the Type an argument of type ``arg_type`` holds,
+    and how: None if it is that Type, 'list' or 'dict' if it is a list or
+    dict of them. Return None if it holds no Type.
+
+    """
+    if arg_type in basic_types or arg_type is typing.Any:
+        return None
+    elif type(arg_type) is typing.TypeVar:
+        return strcast(arg_type), None
+    for origin, container in ((Sequence, 'list'), (Mapping, 'dict')):
+        if typing_inspect.is_generic_type(arg_type) and issubclass(typing_inspect.get_origin(arg_type), origin):
+            parameters = typing_inspect.get_parameters(arg_type)
+            value_type = (
+                parameters[0]
+                if len(parameters)
+                else None
+            )
+            if type(value_type) is typing.TypeVar:
+                return strcast(value_type), container
+            return None
+    return None
+
+
+def decode_expr(arg_type, value):
+    """Return the expression converting ``value``, an argument of type
+    ``arg_type`` as found in JSON, to its Python type.
+
+    """
+    nested = nested_type(arg_type)
+    if nested is None:
+        return value
+    name, container = nested
+    if container is None:
+        return "{}.from_json({}) if {} else None".format(name, value, value)
+    elif container == 'list':
+        return "[{}.from_json(o) for o in {} or []]".format(name, value)
+    return "{{k: {}.from_json(v) for k, v in ({} or dict()).items()}}".format(
+        name, value)
+
+
 def buildTypes(schema, capture):
     INDENT = "    "
     for kind in sorted((k for k in schema.types if not isinstance(k, str)),
@@ -355,19 +426,33 @@ def buildTypes(schema, capture):
         args = Args(schema, kind)
         # Write Factory class for _client.py
         make_factory(name)
+        # Instances only hold their fields, so they don't need a __dict__.
+        slots = [name_to_py(arg[0]) for arg in args]
+        slots.append('unknown_fields')
+        # The nested Types of the fields that hold any, for Type.from_wire
+        # and from_wire_lazy.
+        wire_types = {}
+        for arg in args:
+            nested = nested_type(arg[1])
+            if nested is not None:
+                wire_types[name_to_py(arg[0])] = nested
         # Write actual class
         source = ["""
 class {}(Type):
+    __slots__ = {}
     _toSchema = {}
     _toPy = {}
+    _wireTypes = {}
     def __init__(self{}{}, **unknown_fields):
         '''
 {}
         '''""".format(
             name,
+            pprint.pformat(tuple(dict.fromkeys(slots)), width=999),
             # pprint these to get stable ordering across regens
             pprint.pformat(args.PyToSchemaMapping(), width=999),
             pprint.pformat(args.SchemaToPyMapping(), width=999),
+            pprint.pformat(wire_types, width=999),
             ", " if args else "",
             args.as_kwargs(),
             textwrap.indent(args.get_doc(), INDENT * 2))]
@@ -378,60 +463,8 @@ class {}(Type):
             # do the validation first, before setting the variables
             for arg in args:
                 arg_name = name_to_py(arg[0])
-                arg_type = arg[1]
-                arg_type_name = strcast(arg_type)
-                if arg_type in basic_types or arg_type is typing.Any:
-                    source.append("{}{}_ = {}".format(INDENT * 2,
-                                                      arg_name,
-                                                      arg_name))
-                elif type(arg_type) is typing.TypeVar:
-                    source.append("{}{}_ = {}.from_json({}) "
-                                  "if {} else None".format(INDENT * 2,
-                                                           arg_name,
-                                                           arg_type_name,
-                                                           arg_name,
-                                                           arg_name))
-                elif typing_inspect.is_generic_type(arg_type) and issubclass(typing_inspect.get_origin(arg_type), Sequence):
-                    parameters = typing_inspect.get_parameters(arg_type)
-                    value_type = (
-                        parameters[0]
-                        if len(parameters)
-                        else None
-                    )
-                    if type(value_type) is typing.TypeVar:
-                        source.append(
-                            "{}{}_ = [{}.from_json(o) "
-                            "for o in {} or []]".format(INDENT * 2,
-                                                        arg_name,
-                                                        strcast(value_type),
-                                                        arg_name))
-                    else:
-                        source.append("{}{}_ = {}".format(INDENT * 2,
-                                                          arg_name,
-                                                          arg_name))
-                elif typing_inspect.is_generic_type(arg_type) and issubclass(typing_inspect.get_origin(arg_type), Mapping):
-                    parameters = typing_inspect.get_parameters(arg_type)
-                    value_type = (
-                        parameters[0]
-                        if len(parameters)
-                        else None
-                    )
-                    if type(value_type) is typing.TypeVar:
-                        source.append(
-                            "{}{}_ = {{k: {}.from_json(v) "
-                            "for k, v in ({} or dict()).items()}}".format(
-                                INDENT * 2,
-                                arg_name,
-                                strcast(value_type),
-                                arg_name))
-                    else:
-                        source.append("{}{}_ = {}".format(INDENT * 2,
-                                                          arg_name,
-                                                          arg_name))
-                else:
-                    source.append("{}{}_ = {}".format(INDENT * 2,
-                                                      arg_name,
-                                                      arg_name))
+                source.append("{}{}_ = {}".format(
+                    INDENT * 2, arg_name, decode_expr(arg[1], arg_name)))
             if len(args) > 0:
                 source.append('\n{}# Validate arguments against known Juju API types.'.format(INDENT * 2))
             for arg in args:
@@ -488,12 +521,15 @@ def ReturnMapping(cls):
                 return reply
             if 'error' in reply:
                 cls = CLASSES['Error']
+            # Connections opt in to materializing replies lazily.
+            lazy = getattr(args[0].connection, 'lazy_responses', False) is True
             if typing_inspect.is_generic_type(cls) and issubclass(typing_inspect.get_origin(cls), Sequence):
                 parameters = typing_inspect.get_parameters(cls)
                 result = []
                 item_cls = parameters[0]
                 for item in reply:
-                    result.append(item_cls.from_json(item))
+                    result.append(item_cls.from_wire_lazy(item) if lazy
+                                  else item_cls.from_wire(item))
                     """
                     if 'error' in item:
                         cls = CLASSES['Error']
@@ -501,8 +537,10 @@ def ReturnMapping(cls):
                         cls = item_cls
                     result.append(cls.from_json(item))
                     """
+            elif lazy:
+                result = cls.from_wire_lazy(reply['response'])
             else:
-                result = cls.from_json(reply['response'])
+                result = cls.from_wire(reply['response'])
 
             return result
         return wrapper
@@ -642,18 +680,161 @@ class TypeEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+class _LazyField:
+    """A field of a lazily decoded Type, decoded from the wire data when
+    first read and then kept in the field's slot.
+
+    """
+    __slots__ = ('slot', 'decode')
+
+    def __init__(self, slot, decode):
+        self.slot = slot
+        self.decode = decode
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, owner)
+        except AttributeError:
+            value = self.decode(obj._wire)
+            self.slot.__set__(obj, value)
+            return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+def _generated_module(cls):
+    """Return the module the generated Type ``cls`` (or its generated
+    base) was defined in, where the overrides are patched in.
+
+    """
+    return sys.modules[next(klass for klass in cls.__mro__
+                            if '_wireTypes' in vars(klass)).__module__]
+
+
+# generated Type -> tuple of (field name, JSON key, nested Type or None,
+# container of the nested Types) for Type.from_wire
+_wire_plans = {}
+
+
+def _wire_plan(cls):
+    plan = _wire_plans.get(cls)
+    if plan is None:
+        module = _generated_module(cls)
+        plan = []
+        for py_name, key in cls._toSchema.items():
+            nested = cls._wireTypes.get(py_name)
+            if nested is None:
+                plan.append((py_name, key, None, None))
+            else:
+                name, container = nested
+                plan.append((py_name, key, getattr(module, name), container))
+        plan = _wire_plans[cls] = tuple(plan)
+    return plan
+
+
+def _lazy_decoder(owner, key, nested):
+    if nested is None:
+        return lambda wire: wire.get(key)
+    name, container = nested
+    # Looked up when used, in the module the Type was generated in, so
+    # that the overrides patched into it apply.
+    module = _generated_module(owner)
+
+    def decode(wire):
+        value = wire.get(key)
+        cls = getattr(module, name)
+        if container is None:
+            return cls.from_wire_lazy(value) if value else None
+        elif container == 'list':
+            return [cls.from_wire_lazy(o) for o in value or []]
+        return {k: cls.from_wire_lazy(v) for k, v in (value or {}).items()}
+    return decode
+
+
+_lazy_classes = {}
+
+
+def _lazy_class(cls):
+    """Return the subclass of ``cls`` whose instances decode their fields
+    from the wire data they wrap only when they are read.
+
+    """
+    lazy = _lazy_classes.get(cls)
+    if lazy is not None:
+        return lazy
+
+    def slot(name):
+        return next(vars(klass)[name] for klass in cls.__mro__
+                    if name in vars(klass))
+
+    namespace = {
+        '__slots__': ('_wire',),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+    }
+    for py_name, key in cls._toSchema.items():
+        namespace[py_name] = _LazyField(slot(py_name), _lazy_decoder(
+            cls, key, cls._wireTypes.get(py_name)))
+    namespace['unknown_fields'] = _LazyField(slot('unknown_fields'), lambda wire: {
+        k: v for k, v in wire.items() if k not in cls._toPy})
+    lazy = _lazy_classes[cls] = type(cls)(cls.__name__, (cls,), namespace)
+    return lazy
+
+
+# The slots of Type instances that don't hold schema fields.
+_NOT_FIELDS = frozenset(('_wire', 'connection', '__weakref__'))
+
+
 class Type:
+    # Generated types declare their fields as __slots__; subclasses that
+    # don't, like the facades and the overrides, get a __dict__ as usual.
+    # Every Type can still be connected and weakly referenced.
+    __slots__ = ('connection', '__weakref__')
+
+    # The nested Types of the fields of generated types, by field name;
+    # None where fields can't be decoded from the wire data directly.
+    _wireTypes = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass changing how instances are built from JSON (e.g. the
+        # overrides) must not inherit the from_wire of a generated type,
+        # which bypasses it.
+        if '_wireTypes' not in vars(cls) and (
+                '__init__' in vars(cls) or 'from_json' in vars(cls)):
+            cls._wireTypes = None
+
     def connect(self, connection):
         self.connection = connection
 
+    def _fields(self):
+        """Return the attributes of this instance by name, whether they are
+        slots or in its __dict__.
+
+        """
+        fields = {}
+        for klass in reversed(type(self).__mro__):
+            for name in vars(klass).get('__slots__', ()):
+                if name in _NOT_FIELDS:
+                    continue
+                try:
+                    fields[name] = getattr(self, name)
+                except AttributeError:
+                    pass
+        fields.update(getattr(self, '__dict__', {}))
+        return fields
+
     def __repr__(self):
-        return "{}({})".format(self.__class__, self.__dict__)
+        return "{}({})".format(self.__class__, self._fields())
 
     def __eq__(self, other):
         if not isinstance(other, Type):
             return NotImplemented
 
-        return self.__dict__ == other.__dict__
+        return self._fields() == other._fields()
 
     async def rpc(self, msg):
         result = await self.connection.rpc(msg, encoder=TypeEncoder)
@@ -704,6 +885,45 @@ class Type:
             return cls(**d)
         return None
 
+    @classmethod
+    def from_wire(cls, data):
+        """Build an instance from JSON decoded from a server reply.
+
+        Generated types skip the argument validation of ``from_json`` here,
+        since the data comes from the controller rather than the user: the
+        fields are set from ``_toSchema`` and the nested Types of
+        ``_wireTypes`` are built with their own ``from_wire``.
+        """
+        if cls._wireTypes is None or type(data) is not dict:
+            return cls.from_json(data)
+        self = cls.__new__(cls)
+        for py_name, key, nested, container in _wire_plan(cls):
+            value = data.get(key)
+            if nested is not None:
+                if container is None:
+                    value = nested.from_wire(value) if value else None
+                elif container == 'list':
+                    value = [nested.from_wire(o) for o in value or []]
+                else:
+                    value = {k: nested.from_wire(v) for k, v in (value or {}).items()}
+            setattr(self, py_name, value)
+        self.unknown_fields = {} if data.keys() <= cls._toPy.keys() else {
+            k: v for k, v in data.items() if k not in cls._toPy}
+        return self
+
+    @classmethod
+    def from_wire_lazy(cls, data):
+        """Like :meth:`from_wire`, but only decode the fields of generated
+        types, and the Types nested in them, when they are first read.
+
+        The instance keeps a reference to ``data``, which must not change.
+        """
+        if cls._wireTypes is None or type(data) is not dict:
+            return cls.from_wire(data)
+        self = object.__new__(_lazy_class(cls))
+        self._wire = data
+        return self
+
     def serialize(self):
         d = {}
         for attr, tgt in self._toSchema.items():
@@ -883,17 +1103,18 @@ def write_client(captures, options):
     Write the TypeFactory classes to _client.py, along with some
     imports and tables so that we can look up versioned Facades.
 
+    The versioned modules are only imported on first use. _definitions
+    is star-imported as before: overrides patch it at import time anyway.
+
     """
     with open("{}/_client.py".format(options.output_dir), "w") as f:
         f.write(HEADER)
         f.write("from juju.client._definitions import *\n\n")
-        clients = ", ".join("_client{}".format(v) for v in captures)
-
-        # from juju.client import _client2, _client1, _client3 ...
-        f.write("\nfrom juju.client import " + clients + "\n\n")
-        # CLIENTS = { ....
+        f.write("import importlib\n")
+        f.write("from collections.abc import Mapping\n\n")
+        # CLIENTS = ClientModules({ ....
         f.write(CLIENT_TABLE.format(clients=",\n    ".join(
-            ['"{}": _client{}'.format(v, v) for v in captures])))
+            ['"{}": "juju.client._client{}"'.format(v, v) for v in captures])))
 
         f.write(LOOKUP_FACADE)
         f.write(TYPE_FACTORY)
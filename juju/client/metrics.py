@@ -0,0 +1,170 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Per facade call instrumentation of the RPC requests a
+:class:`juju.client.connection.Connection` makes.
+
+Metrics are disabled unless a :class:`RPCMetrics` instance is passed to
+the connection::
+
+    metrics = RPCMetrics()
+    model = Model()
+    await model.connect(metrics=metrics)
+    ...
+    for call in metrics.snapshot()['calls']:
+        print(call['facade'], call['request'], call['count'])
+    print(metrics.prometheus())
+
+The connections made from that connection, e.g. to the controller, share
+the instance.
+"""
+
+import bisect
+import math
+
+#: Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0, 30.0, 60.0)
+
+
+class _CallStats:
+    __slots__ = ('count', 'errors', 'retries', 'sent', 'received',
+                 'latency_sum', 'latency_max', 'buckets')
+
+    def __init__(self, size):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.sent = 0
+        self.received = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        # The last bucket counts everything above the largest bound.
+        self.buckets = [0] * (size + 1)
+
+
+def _label(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _bound(value):
+    return '+Inf' if math.isinf(value) else repr(float(value))
+
+
+class RPCMetrics:
+    """Records call counts, errors, retries, latencies and payload sizes per
+    ``(facade, request, version)``, and the number of reconnections.
+
+    Sizes are the lengths of the text frames sent and received, which are
+    their sizes in bytes as long as the payloads are ASCII.
+
+    :param buckets: Sorted upper bounds, in seconds, of the latency
+        histogram buckets.
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        if list(buckets) != sorted(buckets):
+            raise ValueError('buckets must be sorted')
+        self.buckets = tuple(buckets)
+        self.reconnects = 0
+        self._calls = {}
+
+    def _stats(self, facade, request, version):
+        key = (facade, request, version)
+        stats = self._calls.get(key)
+        if stats is None:
+            stats = self._calls[key] = _CallStats(len(self.buckets))
+        return stats
+
+    def record(self, facade, request, version, elapsed, sent=0, received=0,
+               retries=0, error=False):
+        """Record a call that took ``elapsed`` seconds."""
+        stats = self._stats(facade, request, version)
+        stats.count += 1
+        stats.errors += bool(error)
+        stats.retries += retries
+        stats.sent += sent
+        stats.received += received
+        stats.latency_sum += elapsed
+        if elapsed > stats.latency_max:
+            stats.latency_max = elapsed
+        stats.buckets[bisect.bisect_left(self.buckets, elapsed)] += 1
+
+    def record_reconnect(self):
+        self.reconnects += 1
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        self.reconnects = 0
+        self._calls.clear()
+
+    def snapshot(self):
+        """Return the metrics recorded so far as plain data.
+
+        Calls are sorted by the total time spent in them, slowest first.
+        Histogram buckets are cumulative and keyed by their upper bound.
+        """
+        calls = []
+        for (facade, request, version), stats in self._calls.items():
+            cumulative, total = {}, 0
+            for bound, count in zip(self.buckets + (math.inf,), stats.buckets):
+                total += count
+                cumulative[bound] = total
+            calls.append({
+                'facade': facade,
+                'request': request,
+                'version': version,
+                'count': stats.count,
+                'errors': stats.errors,
+                'retries': stats.retries,
+                'bytes_sent': stats.sent,
+                'bytes_received': stats.received,
+                'latency_sum': stats.latency_sum,
+                'latency_max': stats.latency_max,
+                'latency_mean': stats.latency_sum / stats.count,
+                'latency_buckets': cumulative,
+            })
+        calls.sort(key=lambda call: call['latency_sum'], reverse=True)
+        return {'calls': calls, 'reconnects': self.reconnects}
+
+    def prometheus(self, prefix='juju_rpc'):
+        """Return the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        calls = sorted(snapshot['calls'], key=lambda call: (
+            call['facade'], call['request'], call['version']))
+        lines = []
+
+        def family(name, kind, help):
+            lines.append('# HELP {}_{} {}'.format(prefix, name, help))
+            lines.append('# TYPE {}_{} {}'.format(prefix, name, kind))
+
+        def labels(call, **extra):
+            pairs = [('facade', call['facade']), ('request', call['request']),
+                     ('version', call['version'])] + list(extra.items())
+            return ','.join('{}="{}"'.format(k, _label(v)) for k, v in pairs)
+
+        counters = [
+            ('requests_total', 'count', 'RPC requests made.'),
+            ('errors_total', 'errors', 'RPC requests that failed or returned an error.'),
+            ('retries_total', 'retries', 'RPC request sends retried after a reconnection.'),
+            ('request_bytes_total', 'bytes_sent', 'Size of the RPC requests sent.'),
+            ('response_bytes_total', 'bytes_received', 'Size of the RPC replies received.'),
+        ]
+        for name, field, help in counters:
+            family(name, 'counter', help)
+            for call in calls:
+                lines.append('{}_{}{{{}}} {}'.format(
+                    prefix, name, labels(call), call[field]))
+
+        family('latency_seconds', 'histogram', 'RPC request latency.')
+        for call in calls:
+            for bound, count in call['latency_buckets'].items():
+                lines.append('{}_latency_seconds_bucket{{{}}} {}'.format(
+                    prefix, labels(call, le=_bound(bound)), count))
+            lines.append('{}_latency_seconds_sum{{{}}} {!r}'.format(
+                prefix, labels(call), call['latency_sum']))
+            lines.append('{}_latency_seconds_count{{{}}} {}'.format(
+                prefix, labels(call), call['count']))
+
+        family('reconnects_total', 'counter', 'Reconnections to the controller.')
+        lines.append('{}_reconnects_total {}'.format(prefix, snapshot['reconnects']))
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,123 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""Tracing of the RPC requests a :class:`juju.client.connection.Connection`
+sends and the replies it receives.
+
+A connection asks its tracer whether to trace each request before doing any
+work for it, so nothing is formatted for requests that are not traced. By
+default, requests and replies are logged to ``juju.client.connection`` at
+DEBUG level, and only while that level is enabled.
+
+Subclass :class:`RPCTracer` and override :meth:`RPCTracer.emit` to send the
+trace events elsewhere, e.g. to a metrics or tracing system::
+
+    class Recorder(RPCTracer):
+        def emit(self, event):
+            events.append(event)
+
+    model = Model()
+    await model.connect(tracer=Recorder(sample_rate=0.1))
+"""
+
+import logging
+import random
+from collections import namedtuple
+
+log = logging.getLogger('juju.client.connection')
+
+REQUEST = '--->'
+REPLY = '<---'
+
+#: A traced request or reply. ``payload`` is the encoded request or the
+#: decoded reply as is; use :meth:`RPCTracer.format` to render it.
+RPCEvent = namedtuple('RPCEvent', [
+    'connection_id', 'direction', 'request_id', 'facade', 'version',
+    'request', 'payload', 'elapsed',
+])
+
+
+class _Payload:
+    """Renders a payload when converted to a str, so that log records only
+    format it if they are actually emitted.
+
+    """
+    __slots__ = ('tracer', 'payload')
+
+    def __init__(self, tracer, payload):
+        self.tracer = tracer
+        self.payload = payload
+
+    def __str__(self):
+        return self.tracer.format(self.payload)
+
+
+class RPCTracer:
+    """Decides which requests are traced and emits their trace events.
+
+    :param int max_length: Truncate the payloads longer than this many
+        characters when formatting them; None to never truncate.
+    :param float sample_rate: The fraction of requests, between 0 and 1,
+        to trace.
+    :param facades: Only trace requests to these facade names; None for
+        all of them.
+    :param logging.Logger logger: The logger :meth:`emit` writes to.
+    :param int level: The level :meth:`emit` logs at. Nothing is traced
+        while the logger is not enabled for it.
+    """
+    def __init__(self, max_length=None, sample_rate=1.0, facades=None,
+                 logger=None, level=logging.DEBUG):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('sample_rate must be between 0 and 1')
+        self.max_length = max_length
+        self.sample_rate = sample_rate
+        self.facades = frozenset(facades) if facades is not None else None
+        self.logger = logger or log
+        self.level = level
+
+    def enabled(self):
+        """Return whether anything would be emitted at all."""
+        return self.logger.isEnabledFor(self.level)
+
+    def sample(self, msg):
+        """Return whether to trace the request ``msg`` and its reply.
+
+        This is called for every request, so it must be cheap.
+        """
+        if not self.enabled():
+            return False
+        if self.facades is not None and msg.get('type') not in self.facades:
+            return False
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def request(self, connection, msg, outgoing):
+        """Trace the request ``msg``, sent encoded as ``outgoing``."""
+        self.emit(RPCEvent(
+            id(connection), REQUEST, msg['request-id'], msg.get('type'),
+            msg.get('version'), msg.get('request'), outgoing, None))
+
+    def reply(self, connection, msg, result, elapsed):
+        """Trace the ``result`` received ``elapsed`` seconds after sending
+        the request ``msg``.
+
+        """
+        self.emit(RPCEvent(
+            id(connection), REPLY, msg['request-id'], msg.get('type'),
+            msg.get('version'), msg.get('request'), result, elapsed))
+
+    def format(self, payload):
+        """Return ``payload`` as a str, truncated to ``max_length``."""
+        text = payload if isinstance(payload, str) else str(payload)
+        if self.max_length is not None and len(text) > self.max_length:
+            return '{}... ({} more characters)'.format(
+                text[:self.max_length], len(text) - self.max_length)
+        return text
+
+    def emit(self, event):
+        """Log ``event``; the payload is only formatted if the record is
+        emitted.
+
+        """
+        self.logger.log(
+            self.level, 'connection id: %s %s %s',
+            event.connection_id, event.direction, _Payload(self, event.payload))
@@ -291,6 +291,13 @@ class Machine(model.ModelEntity):
         """
         return self.safe_data['series']
 
+    @property
+    def units(self):
+        """Returns the units placed on this machine.
+
+        """
+        return self.model.state.machine_units(self.id)
+
     @property
     def tag(self):
         return tag.machine(self.id)
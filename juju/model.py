@@ -4,6 +4,8 @@
 import base64
 import collections
 import hashlib
+import io
+import itertools
 import json
 import logging
 import os
@@ -11,17 +13,25 @@ import sys
 import re
 import stat
 import tempfile
+import time
+import types
 import warnings
 import weakref
 import zipfile
 from concurrent.futures import CancelledError
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import timedelta
 from functools import partial
 from pathlib import Path
 
 import yaml
 import websockets
 
+try:
+    import fcntl
+except ImportError:  # not on Windows
+    fcntl = None
+
 from . import provisioner, tag, utils, jasyncio
 from .annotationhelper import _get_annotations, _set_annotations
 from .bundle import BundleHandler, get_charm_series, is_local_charm
@@ -32,13 +42,14 @@ from .constraints import parse as parse_constraints
 from .constraints import parse_storage_constraint
 from .controller import Controller, ConnectedController
 from .delta import get_entity_class, get_entity_delta
-from .errors import JujuAPIError, JujuError, JujuModelConfigError, JujuBackupError
+from .errors import JujuAPIError, JujuConnectionError, JujuError, JujuModelConfigError, JujuBackupError
 from .errors import JujuModelError, JujuAppError, JujuUnitError, JujuAgentError, JujuMachineError, PylibjujuError, JujuNotSupportedError
 from .exceptions import DeadEntityException
 from .names import is_valid_application
 from .offerendpoints import ParseError as OfferParseError
 from .offerendpoints import parse_local_endpoint, parse_offer_url
 from .origin import Channel, Source
+from .status import StatusCache
 from .placement import parse as parse_placement
 from .secrets import create_secret_data, read_secret_data
 from .tag import application as application_tag
@@ -48,25 +59,51 @@ from .version import DEFAULT_ARCHITECTURE
 log = logging.getLogger(__name__)
 
 
+# Characters that make an observer's entity id a regular expression rather
+# than a plain id.
+_REGEX_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+
 class _Observer:
     """Wrapper around an observer callable.
 
     This wrapper allows filter criteria to be associated with the
     callable so that it's only called for changes that meet the criteria.
 
+    An ``inline`` observer wraps a plain function rather than a coroutine
+    function, and is called right away by the model rather than on the
+    observer worker pool. The model uses them to wake up its own waiters,
+    which must not queue behind user callbacks: those may well be waiting
+    on them.
+
     """
-    def __init__(self, callable_, entity_type, action, entity_id, predicate):
+    def __init__(self, callable_, entity_type, action, entity_id, predicate,
+                 inline=False):
         self.callable_ = callable_
+        self.inline = inline
         self.entity_type = entity_type
         self.action = action
         self.entity_id = entity_id
         self.predicate = predicate
+        # The id itself when it is not a regular expression, so that it can
+        # be compared (and indexed) without running the regex.
+        self.exact_id = None
+        self._id_regex = None
         if self.entity_id:
             self.entity_id = str(self.entity_id)
+            bare_id = self.entity_id
+            if bare_id.startswith('^'):
+                bare_id = bare_id[1:]
+            if bare_id.endswith('$'):
+                bare_id = bare_id[:-1]
             if not self.entity_id.startswith('^'):
                 self.entity_id = '^' + self.entity_id
             if not self.entity_id.endswith('$'):
                 self.entity_id += '$'
+            if _REGEX_CHARS.isdisjoint(bare_id):
+                self.exact_id = bare_id
+            else:
+                self._id_regex = re.compile(self.entity_id)
 
     async def __call__(self, delta, old, new, model):
         await self.callable_(delta, old, new, model)
@@ -76,9 +113,12 @@ class _Observer:
         called) for a this delta.
 
         """
-        if (self.entity_id and delta.get_id() and
-                not re.match(self.entity_id, str(delta.get_id()))):
-            return False
+        if self.entity_id and delta.get_id():
+            if self.exact_id is not None:
+                if self.exact_id != str(delta.get_id()):
+                    return False
+            elif not self._id_regex.match(str(delta.get_id())):
+                return False
 
         if self.entity_type and self.entity_type != delta.entity:
             return False
@@ -92,6 +132,338 @@ class _Observer:
         return True
 
 
+class _ObserverRegistry:
+    """Holds the observers of a model, indexed by entity type, action and
+    exact entity id, so that a delta is only checked against the observers
+    that may care about it. Observers filtering on a regular expression are
+    kept in a separate, slower bucket per entity type and action.
+
+    """
+    def __init__(self):
+        self._observers = weakref.WeakValueDictionary()
+        # (entity_type, action, exact_id) -> observers
+        self._exact = {}
+        # (entity_type, action) -> observers with a regex entity id
+        self._patterns = {}
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._observers)
+
+    def __iter__(self):
+        return iter(list(self._observers.keys()))
+
+    def _bucket(self, observer):
+        entity_type = observer.entity_type or None
+        action = observer.action or None
+        if observer.entity_id and observer.exact_id is None:
+            return self._patterns, (entity_type, action)
+        return self._exact, (entity_type, action, observer.exact_id)
+
+    def add(self, observer):
+        observer.seq = next(self._seq)
+        self._observers[observer] = observer.callable_
+        buckets, key = self._bucket(observer)
+        buckets.setdefault(key, set()).add(observer)
+
+    def remove(self, observer):
+        self._observers.pop(observer, None)
+        buckets, key = self._bucket(observer)
+        bucket = buckets.get(key)
+        if bucket is not None:
+            bucket.discard(observer)
+            # most buckets are for a single entity id, e.g. a unit waited
+            # on once, so don't keep them around once empty
+            if not bucket:
+                del buckets[key]
+
+    def matching(self, delta):
+        """Return the observers that care about `delta`, in the order they
+        were added.
+
+        """
+        entity_id = delta.get_id()
+        if not entity_id:
+            # id filters don't apply to deltas without an id
+            candidates = list(self._observers.keys())
+        else:
+            entity_id = str(entity_id)
+            candidates = []
+            for entity_type in (delta.entity, None):
+                for action in (delta.type, None):
+                    for id_ in (entity_id, None):
+                        candidates.extend(
+                            self._exact.get((entity_type, action, id_), ()))
+                    candidates.extend(
+                        self._patterns.get((entity_type, action), ()))
+        matches = [o for o in candidates if o.cares_about(delta)]
+        matches.sort(key=lambda o: o.seq)
+        return matches
+
+
+class _ObserverDispatcher:
+    """Runs observer callbacks on a bounded pool of worker tasks.
+
+    Callbacks for the same entity are run one at a time, in the order of
+    the deltas, while callbacks for different entities run concurrently on
+    up to ``max_workers`` tasks. Workers are started on demand and exit once
+    there is nothing left to run.
+
+    """
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        # (entity_type, entity_id) -> deque of (queued_at, observer, args),
+        # kept while a callback of the entity is queued or running
+        self._pending = {}
+        # entities with callbacks to run, and none running
+        self._ready = collections.deque()
+        self._workers = set()
+        self._queued = 0
+        self._metrics = {
+            'max_queued': 0,
+            'dispatched': 0,
+            'failed': 0,
+            'queue_wait_max': 0.0,
+            'callback_time_total': 0.0,
+            'callback_time_max': 0.0,
+        }
+
+    def submit(self, key, observer, *args):
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = collections.deque()
+            self._ready.append(key)
+            if len(self._workers) < self.max_workers:
+                self._workers.add(jasyncio.ensure_future(self._work()))
+        pending.append((time.monotonic(), observer, args))
+        self._queued += 1
+        if self._queued > self._metrics['max_queued']:
+            self._metrics['max_queued'] = self._queued
+
+    async def _work(self):
+        task = jasyncio.current_task()
+        try:
+            while self._ready:
+                key = self._ready.popleft()
+                pending = self._pending[key]
+                queued_at, observer, args = pending.popleft()
+                self._queued -= 1
+                started = time.monotonic()
+                try:
+                    await observer(*args)
+                except Exception:
+                    self._metrics['failed'] += 1
+                    log.exception('Error in model observer %r',
+                                  observer.callable_)
+                finally:
+                    if pending:
+                        self._ready.append(key)
+                    else:
+                        del self._pending[key]
+                self._record(started - queued_at, time.monotonic() - started)
+        finally:
+            self._workers.discard(task)
+
+    def _record(self, queue_wait, callback_time):
+        metrics = self._metrics
+        metrics['dispatched'] += 1
+        metrics['callback_time_total'] += callback_time
+        metrics['queue_wait_max'] = max(metrics['queue_wait_max'], queue_wait)
+        metrics['callback_time_max'] = max(
+            metrics['callback_time_max'], callback_time)
+
+    def metrics(self):
+        """Return a snapshot of the dispatch metrics.
+
+        """
+        return dict(
+            self._metrics,
+            workers=len(self._workers),
+            queued=self._queued,
+        )
+
+
+class _ActionTracker:
+    """Tracks the completion of actions from the action deltas of the
+    model's all watcher, and fetches their results.
+
+    Any number of actions can be waited on at once. The results of the
+    actions that finish together are fetched with a single Actions call,
+    or one call per ``max_batch`` of them when their waiters set one,
+    and the actions still running are only polled as a fallback, in case
+    their deltas are missed, with one call for all of them at an interval
+    growing from ``POLL_MIN`` to ``POLL_MAX`` seconds.
+
+    """
+    FINAL_STATUSES = frozenset(
+        ('completed', 'failed', 'cancelled', 'aborted', 'error'))
+    POLL_MIN = 2.0
+    POLL_MAX = 30.0
+
+    def __init__(self, model):
+        self.model = model
+        # action id -> future of the ActionResult of the action
+        self._waiters = {}
+        # action id -> number of callers waiting on the action
+        self._callers = collections.Counter()
+        # action id -> most results to fetch with it in one request
+        self._max_batch = {}
+        # ids of the finished actions whose results are still to be fetched
+        self._finished = set()
+        self._fetcher = None
+        self._poller = None
+
+    def on_deltas(self, deltas):
+        """Fetch the results of the waited on actions that ``deltas``
+        finish.
+
+        """
+        if not self._waiters:
+            return
+        for delta in deltas:
+            if (delta.entity == 'action' and
+                    delta.data.get('status') in self.FINAL_STATUSES and
+                    delta.data.get('id') in self._waiters):
+                self._finished.add(delta.data['id'])
+        self._fetch_finished()
+
+    async def result(self, action_id, max_batch=None):
+        """Wait for the action ``action_id`` to finish and return its
+        ActionResult.
+
+        :param int max_batch: At most how many results to fetch in the
+            same request as this one; no limit if None
+        :raises: :class:`JujuError` if the action cannot be fetched
+
+        """
+        future = self._waiters.get(action_id)
+        if future is None:
+            future = jasyncio.get_running_loop().create_future()
+            self._waiters[action_id] = future
+            action = self.model.state._live_entity_map('action').get(action_id)
+            if action is not None and action.data['status'] in self.FINAL_STATUSES:
+                self._finished.add(action_id)
+                self._fetch_finished()
+            if self._poller is None:
+                self._poller = jasyncio.ensure_future(self._poll())
+        if max_batch is not None:
+            self._max_batch[action_id] = min(
+                max_batch, self._max_batch.get(action_id, max_batch))
+        self._callers[action_id] += 1
+        try:
+            # Several callers may wait on the same action; cancelling one
+            # of them must not cancel the others.
+            return await jasyncio.shield(future)
+        finally:
+            self._callers[action_id] -= 1
+            if not self._callers[action_id]:
+                del self._callers[action_id]
+                self._max_batch.pop(action_id, None)
+                if self._waiters.get(action_id) is future:
+                    del self._waiters[action_id]
+                    self._finished.discard(action_id)
+
+    def _fetch_finished(self):
+        if self._finished and self._fetcher is None:
+            self._fetcher = jasyncio.ensure_future(self._fetch())
+
+    async def _fetch(self):
+        try:
+            while self._finished:
+                # Actions finishing while a wave is fetched make the next one
+                action_ids, self._finished = list(self._finished), set()
+                for wave in self._waves(action_ids):
+                    try:
+                        await self._resolve(wave)
+                    except Exception as e:
+                        for action_id in wave:
+                            self._fail(action_id, e)
+        finally:
+            self._fetcher = None
+
+    async def _poll(self):
+        interval = self.POLL_MIN
+        try:
+            while self._waiters:
+                await jasyncio.sleep(interval)
+                interval = min(interval * 2, self.POLL_MAX)
+                action_ids = [action_id for action_id in self._waiters
+                              if action_id not in self._finished]
+                for wave in self._waves(action_ids):
+                    try:
+                        await self._resolve(wave)
+                    except Exception:
+                        log.debug('Failed to poll actions %s', wave,
+                                  exc_info=True)
+        finally:
+            self._poller = None
+
+    def _waves(self, action_ids):
+        """Split ``action_ids`` in batches that respect the ``max_batch`` of
+        each of their actions.
+
+        """
+        unlimited = len(action_ids)
+        action_ids = sorted(
+            action_ids, key=lambda i: self._max_batch.get(i, unlimited))
+        wave, limit = [], unlimited
+        for action_id in action_ids:
+            if not wave:
+                limit = max(self._max_batch.get(action_id, unlimited), 1)
+            wave.append(action_id)
+            if len(wave) >= limit:
+                yield wave
+                wave = []
+        if wave:
+            yield wave
+
+    async def _resolve(self, action_ids):
+        """Fetch the actions ``action_ids`` with one Actions call, and
+        resolve the waiters of the finished ones.
+
+        """
+        action_facade = client.ActionFacade.from_connection(
+            self.model.connection())
+        try:
+            response = await action_facade.Actions(
+                entities=[{'tag': tag.action(action_id)} for action_id in action_ids])
+        except (JujuAPIError, JujuConnectionError):
+            raise
+        except JujuError as e:
+            # The whole call fails if any of the actions does, e.g. an
+            # unknown one: split the batch in halves until the failing
+            # actions are told apart.
+            if len(action_ids) == 1:
+                self._fail(action_ids[0], e)
+                return
+            half = len(action_ids) // 2
+            await self._resolve(action_ids[:half])
+            await self._resolve(action_ids[half:])
+            return
+        for action_id, result in zip(action_ids, response.results):
+            if result.error:
+                self._fail(action_id, JujuError(result.error.message))
+            elif result.status in self.FINAL_STATUSES:
+                future = self._waiters.pop(action_id, None)
+                if future is not None and not future.done():
+                    future.set_result(result)
+
+    def _fail(self, action_id, error):
+        future = self._waiters.pop(action_id, None)
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def cancel(self):
+        """Fail all the waiters, e.g. once the watcher stops."""
+        for task in (self._fetcher, self._poller):
+            if task is not None:
+                task.cancel()
+        self._finished.clear()
+        for action_id in list(self._waiters):
+            self._fail(action_id, JujuError(
+                'Model disconnected while waiting for action {}'.format(action_id)))
+
+
 class ModelObserver:
     """
     Base class for creating observers that react to changes in a model.
@@ -115,25 +487,129 @@ class ModelObserver:
         pass
 
 
+def _estimated_size(data):
+    """Roughly estimate how many bytes the data of a delta holds on to, by
+    adding up the length of its strings and a fixed cost for every other
+    value. It is only meant to be cheap and proportional, not exact.
+
+    """
+    size = 0
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            size += 49 + len(value)
+        elif isinstance(value, dict):
+            size += 64 + 8 * len(value)
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            size += 56 + 8 * len(value)
+            stack.extend(value)
+        else:
+            size += 32
+    return size
+
+
+class _History(collections.deque):
+    """The history deque of a single entity.
+
+    ``offset`` counts the entries dropped from the left of the deque, so the
+    absolute history indexes held by ModelEntity objects stay valid when old
+    history is trimmed. ``sizes`` holds the estimated size of every entry
+    when a byte budget is in use.
+
+    """
+    def __init__(self):
+        super().__init__()
+        self.offset = 0
+        self.sizes = collections.deque()
+
+
 class ModelState:
     """Holds the state of the model, including the delta history of all
     entities in the model.
 
+    By default the whole history is kept. The retained history can be bounded
+    with:
+
+    :param int max_history: The maximum number of entries kept per entity.
+        Must be at least 2, so that the previous state of an entity is still
+        there when observers are called.
+    :param int max_history_bytes: A budget for the estimated size of all the
+        history. When it is exceeded, the past states of the least recently
+        updated entities are evicted first. The current state of an entity is
+        never evicted.
+    :param float dead_entity_ttl: Seconds after which the history of a
+        removed entity is purged altogether.
+
     """
-    def __init__(self, model):
+    def __init__(self, model, max_history=None, max_history_bytes=None,
+                 dead_entity_ttl=None):
+        if max_history is not None and max_history < 2:
+            raise ValueError('max_history must be at least 2')
         self.model = model
         self.state = dict()
+        self.max_history = max_history
+        self.max_history_bytes = max_history_bytes
+        self.dead_entity_ttl = dead_entity_ttl
+        self._history_bytes = 0
+        # (entity_type, entity_id) of the entities that have past states to
+        # evict, least recently updated first
+        self._lru = collections.OrderedDict()
+        # (entity_type, entity_id) -> monotonic time to purge it at
+        self._dead = collections.OrderedDict()
+        # entity_type -> {entity_id: current, connected entity} for all the
+        # living entities, maintained by apply_delta
+        self._live = {}
+        # entities at past states, shared while anything refers to them
+        self._past_entities = weakref.WeakValueDictionary()
+        self._delta_listeners = []
+        # Secondary indexes, maintained by apply_delta. Each one maps a key
+        # to an (insertion ordered) dict whose keys are the related ids.
+        self._indexes = {
+            'application_units': collections.defaultdict(dict),
+            'machine_units': collections.defaultdict(dict),
+            'application_relations': collections.defaultdict(dict),
+            'principal_subordinates': collections.defaultdict(dict),
+        }
+
+    def add_delta_listener(self, callable_):
+        """Register a synchronous callable that is called with every delta
+        right after it has been applied to the state.
+
+        """
+        self._delta_listeners.append(callable_)
+
+    def remove_delta_listener(self, callable_):
+        """Unregister a callable added with :meth:`add_delta_listener`.
+
+        """
+        try:
+            self._delta_listeners.remove(callable_)
+        except ValueError:
+            pass
+
+    def _live_entities(self, entity_type):
+        return self._live.setdefault(entity_type, {})
 
     def _live_entity_map(self, entity_type):
-        """Return an id:Entity map of all the living entities of
+        """Return a read-only id:Entity map of all the living entities of
         type ``entity_type``.
 
+        The map is a live view kept up to date by apply_delta, rather than
+        a copy, so it should be copied before iterating over it across
+        awaits.
+
         """
-        return {
-            entity_id: self.get_entity(entity_type, entity_id)
-            for entity_id, history in self.state.get(entity_type, {}).items()
-            if history[-1] is not None
-        }
+        return types.MappingProxyType(self._live_entities(entity_type))
+
+    def _entity_map(self, entity_type):
+        """Return an id:Entity map of the entities of type ``entity_type``
+        living now, which later deltas don't change.
+
+        """
+        return dict(self._live_entities(entity_type))
 
     @property
     def applications(self):
@@ -141,7 +617,7 @@ class ModelState:
         currently in the model.
 
         """
-        return self._live_entity_map('application')
+        return self._entity_map('application')
 
     @property
     def remote_applications(self):
@@ -149,14 +625,14 @@ class ModelState:
         applications currently in the model.
 
         """
-        return self._live_entity_map('remoteApplication')
+        return self._entity_map('remoteApplication')
 
     @property
     def application_offers(self):
         """Return a map of application-name:Application for all applications
         offers currently in the model.
         """
-        return self._live_entity_map('applicationOffer')
+        return self._entity_map('applicationOffer')
 
     @property
     def machines(self):
@@ -164,7 +640,7 @@ class ModelState:
         the model.
 
         """
-        return self._live_entity_map('machine')
+        return self._entity_map('machine')
 
     @property
     def units(self):
@@ -172,12 +648,16 @@ class ModelState:
         the model.
 
         """
-        return self._live_entity_map('unit')
+        return self._entity_map('unit')
 
     @property
     def subordinate_units(self):
         """Return a map of unit-id:Unit for all subordinate units"""
-        return {u_name: u for u_name, u in self.units.items() if u.is_subordinate}
+        return {
+            unit_id: self.get_entity('unit', unit_id)
+            for unit_ids in self._indexes['principal_subordinates'].values()
+            for unit_id in unit_ids
+        }
 
     @property
     def relations(self):
@@ -185,7 +665,75 @@ class ModelState:
         the model.
 
         """
-        return self._live_entity_map('relation')
+        return self._entity_map('relation')
+
+    def _indexed_entities(self, index, key, entity_type):
+        return [
+            self.get_entity(entity_type, entity_id)
+            for entity_id in self._indexes[index].get(key, ())
+        ]
+
+    def application_units(self, application_name):
+        """Return a list of the living units of an application.
+
+        """
+        return self._indexed_entities(
+            'application_units', application_name, 'unit')
+
+    def machine_units(self, machine_id):
+        """Return a list of the living units placed on a machine.
+
+        """
+        return self._indexed_entities('machine_units', machine_id, 'unit')
+
+    def application_relations(self, application_name):
+        """Return a list of the living relations that have an endpoint on
+        an application.
+
+        """
+        return self._indexed_entities(
+            'application_relations', application_name, 'relation')
+
+    def unit_subordinates(self, unit_name):
+        """Return a list of the living subordinate units of a principal unit.
+
+        """
+        return self._indexed_entities(
+            'principal_subordinates', unit_name, 'unit')
+
+    @staticmethod
+    def _index_keys(entity_type, data):
+        """Return (index, key) pairs under which an entity with the given
+        data is indexed.
+
+        """
+        if data is None:
+            return ()
+        if entity_type == 'unit':
+            keys = [('application_units', data.get('application'))]
+            if data.get('machine-id'):
+                keys.append(('machine_units', data['machine-id']))
+            if data.get('subordinate') and data.get('principal'):
+                keys.append(('principal_subordinates', data['principal']))
+            return keys
+        if entity_type == 'relation':
+            return [('application_relations', endpoint['application-name'])
+                    for endpoint in data.get('endpoints') or ()]
+        return ()
+
+    def _update_indexes(self, entity_type, entity_id, old_data, new_data):
+        old_keys = self._index_keys(entity_type, old_data)
+        new_keys = self._index_keys(entity_type, new_data)
+        if old_keys == new_keys:
+            return
+        for index, key in old_keys:
+            ids = self._indexes[index].get(key)
+            if ids is not None:
+                ids.pop(entity_id, None)
+                if not ids:
+                    del self._indexes[index][key]
+        for index, key in new_keys:
+            self._indexes[index][key][entity_id] = None
 
     def entity_history(self, entity_type, entity_id):
         """Return the history deque for an entity.
@@ -193,12 +741,84 @@ class ModelState:
         """
         return self.state[entity_type][entity_id]
 
+    def history_length(self, entity_type, entity_id):
+        """Return the number of states an entity went through, including
+        the ones that were trimmed from its history.
+
+        """
+        history = self.entity_history(entity_type, entity_id)
+        return history.offset + len(history)
+
     def entity_data(self, entity_type, entity_id, history_index):
         """Return the data dict for an entity at a specific index of its
         history.
 
+        Raises IndexError if that state is no longer retained.
+
         """
-        return self.entity_history(entity_type, entity_id)[history_index]
+        history = self.entity_history(entity_type, entity_id)
+        if history_index >= 0:
+            history_index -= history.offset
+            if history_index < 0:
+                raise IndexError('history entry no longer retained')
+        return history[history_index]
+
+    def _append(self, history, data):
+        history.append(data)
+        if self.max_history_bytes is not None:
+            size = _estimated_size(data)
+            history.sizes.append(size)
+            self._history_bytes += size
+
+    def _popleft(self, history):
+        history.popleft()
+        history.offset += 1
+        if history.sizes:
+            self._history_bytes -= history.sizes.popleft()
+
+    def _trim(self, key, history):
+        """Apply the history policy after `key` has been updated.
+
+        """
+        if self.max_history is not None:
+            while len(history) > self.max_history:
+                self._popleft(history)
+
+        if self.max_history_bytes is not None:
+            self._lru.pop(key, None)
+            if len(history) > 1:
+                self._lru[key] = None
+            while self._history_bytes > self.max_history_bytes and self._lru:
+                lru_key = next(iter(self._lru))
+                # The previous state of the entity being updated is still
+                # needed by the observers of this delta.
+                keep = 2 if lru_key == key else 1
+                lru_history = self.entity_history(*lru_key)
+                while len(lru_history) > keep and \
+                        self._history_bytes > self.max_history_bytes:
+                    self._popleft(lru_history)
+                if lru_key == key:
+                    break
+                if len(lru_history) <= 1:
+                    del self._lru[lru_key]
+
+        if self.dead_entity_ttl is not None:
+            self._dead.pop(key, None)
+            if history[-1] is None:
+                self._dead[key] = time.monotonic() + self.dead_entity_ttl
+            self._purge_dead()
+
+    def _purge_dead(self):
+        now = time.monotonic()
+        while self._dead:
+            key, deadline = next(iter(self._dead.items()))
+            if deadline > now:
+                break
+            del self._dead[key]
+            entity_type, entity_id = key
+            history = self.state[entity_type].pop(entity_id)
+            self._history_bytes -= sum(history.sizes)
+            self._lru.pop(key, None)
 
     def apply_delta(self, delta):
         """Apply delta to our state and return a copy of the
@@ -213,15 +833,28 @@ class ModelState:
         if the object was deleted as a result of the delta being applied.
 
         """
-        history = (
-            self.state
-            .setdefault(delta.entity, {})
-            .setdefault(delta.get_id(), collections.deque())
-        )
-
-        history.append(delta.data)
+        entity_id = delta.get_id()
+        entities = self.state.setdefault(delta.entity, {})
+        history = entities.get(entity_id)
+        if history is None:
+            history = entities[entity_id] = _History()
+
+        old_data = history[-1] if history else None
+        self._append(history, delta.data)
         if delta.type == 'remove':
-            history.append(None)
+            self._append(history, None)
+        self._update_indexes(delta.entity, entity_id, old_data, history[-1])
+        self._trim((delta.entity, entity_id), history)
+
+        live = self._live_entities(delta.entity)
+        if history[-1] is None:
+            live.pop(entity_id, None)
+        elif entity_id not in live:
+            live[entity_id] = get_entity_class(delta.entity)(
+                entity_id, self.model)
+
+        for listener in list(self._delta_listeners):
+            listener(delta)
 
         entity = self.get_entity(delta.entity, delta.get_id())
         return entity.previous(), entity
@@ -234,10 +867,17 @@ class ModelState:
         Juju. To get an instance of the object in an older state, pass
         history_index, an index into the history deque for the entity.
 
+        The same object is returned for the same entity and state for as
+        long as it is in use.
+
         """
+        if history_index == -1 and connected:
+            entity = self._live.get(entity_type, {}).get(entity_id)
+            if entity is not None:
+                return entity
 
         if history_index < 0 and history_index != -1:
-            history_index += len(self.entity_history(entity_type, entity_id))
+            history_index += self.history_length(entity_type, entity_id)
             if history_index < 0:
                 return None
 
@@ -246,10 +886,16 @@ class ModelState:
         except IndexError:
             return None
 
-        entity_class = get_entity_class(entity_type)
-        return entity_class(
-            entity_id, self.model, history_index=history_index,
-            connected=connected)
+        key = (entity_type, entity_id, history_index, connected)
+        entity = self._past_entities.get(key)
+        if entity is None:
+            entity_class = get_entity_class(entity_type)
+            entity = entity_class(
+                entity_id, self.model, history_index=history_index,
+                connected=connected)
+            if history_index != -1:
+                self._past_entities[key] = entity
+        return entity
 
 
 class ModelEntity:
@@ -271,7 +917,6 @@ class ModelEntity:
         self.model = model
         self._history_index = history_index
         self.connected = connected
-        self.connection = model.connection()
         self._status = 'unknown'
 
     def __repr__(self):
@@ -295,6 +940,14 @@ class ModelEntity:
     def __bool__(self):
         return bool(self.data)
 
+    @property
+    def connection(self):
+        """The current connection of the model, so that entities kept
+        across a reconnect don't hold on to a closed one.
+
+        """
+        return self.model.connection()
+
     def on_change(self, callable_):
         """Add a change observer to this entity.
 
@@ -346,11 +999,14 @@ class ModelEntity:
         model.
 
         """
-        return (
-            self.data is None or
-            self.model.state.entity_data(
+        if self.data is None:
+            return True
+        try:
+            return self.model.state.entity_data(
                 self.entity_type, self.entity_id, -1) is None
-        )
+        except KeyError:
+            # removed, and purged from the history since
+            return True
 
     @property
     def alive(self):
@@ -364,9 +1020,15 @@ class ModelEntity:
     def data(self):
         """The data dictionary for this entity.
 
+        None if the entity is dead, or if this object refers to a state that
+        is no longer retained in the model's history.
+
         """
-        return self.model.state.entity_data(
-            self.entity_type, self.entity_id, self._history_index)
+        try:
+            return self.model.state.entity_data(
+                self.entity_type, self.entity_id, self._history_index)
+        except (KeyError, IndexError):
+            return None
 
     @property
     def safe_data(self):
@@ -388,15 +1050,20 @@ class ModelEntity:
         """Return a copy of this object as was at its previous state in
         history.
 
-        Returns None if this object is new (and therefore has no history).
+        Returns None if this object is new (and therefore has no history),
+        or if its previous state is no longer retained in the history.
 
         The returned object is always "disconnected", i.e. does not receive
         live updates.
 
         """
-        return self.model.state.get_entity(
-            self.entity_type, self.entity_id, self._history_index - 1,
-            connected=False)
+        try:
+            return self.model.state.get_entity(
+                self.entity_type, self.entity_id, self._history_index - 1,
+                connected=False)
+        except KeyError:
+            # the entity was removed, and purged from the history since
+            return None
 
     def next(self):
         """Return a copy of this object at its next state in
@@ -412,13 +1079,16 @@ class ModelEntity:
             return None
 
         new_index = self._history_index + 1
-        connected = (
-            new_index == len(self.model.state.entity_history(
-                self.entity_type, self.entity_id)) - 1
-        )
+        try:
+            connected = (
+                new_index == self.model.state.history_length(
+                    self.entity_type, self.entity_id) - 1
+            )
+        except KeyError:
+            return None
         return self.model.state.get_entity(
-            self.entity_type, self.entity_id, self._history_index - 1,
-            connected=connected)
+            self.entity_type, self.entity_id,
+            -1 if connected else new_index, connected=connected)
 
     def latest(self):
         """Return a copy of this object at its current state in the model.
@@ -548,11 +1218,19 @@ class Model:
     """
     The main API for interacting with a Juju model.
     """
+    # How many resources add_local_resources uploads at once.
+    MAX_CONCURRENT_UPLOADS = 4
+
     def __init__(
         self,
         max_frame_size=None,
         bakery_client=None,
         jujudata=None,
+        max_history=None,
+        max_history_bytes=None,
+        dead_entity_ttl=None,
+        max_observer_workers=64,
+        status_ttl=0,
     ):
         """Instantiate a new Model.
 
@@ -566,14 +1244,32 @@ class Model:
         :param bakery_client httpbakery.Client: The bakery client to use
             for macaroon authorization.
         :param jujudata JujuData: The source for current controller information
+        :param max_history int: See `ModelState`
+        :param max_history_bytes int: See `ModelState`
+        :param dead_entity_ttl float: See `ModelState`
+        :param max_observer_workers int: How many observer callbacks may run
+            concurrently. Callbacks for the same entity always run one after
+            the other, in order.
+        :param status_ttl float: How long, in seconds, `get_status` reuses
+            a FullStatus result for, unless the model changes in the
+            meantime. Defaults to 0, to only share concurrent calls. See
+            `juju.status.StatusCache`.
         """
         self._connector = connector.Connector(
             max_frame_size=max_frame_size,
             bakery_client=bakery_client,
             jujudata=jujudata,
         )
-        self._observers = weakref.WeakValueDictionary()
-        self.state = ModelState(self)
+        self._observers = _ObserverRegistry()
+        self._observer_dispatcher = _ObserverDispatcher(max_observer_workers)
+        self._status_cache = StatusCache(self, status_ttl)
+        self._action_tracker = _ActionTracker(self)
+        self.state = ModelState(
+            self,
+            max_history=max_history,
+            max_history_bytes=max_history_bytes,
+            dead_entity_ttl=dead_entity_ttl,
+        )
         self._info = None
         self._mode = None
         self._watch_stopping = jasyncio.Event()
@@ -771,7 +1467,7 @@ class Model:
             # is known)
             async with ConnectedController(self.connection()) as contr:
                 self._info = await contr.get_model_info(model_name, model_uuid)
-                log.debug('Got ModelInfo: %s', vars(self.info))
+                log.debug('Got ModelInfo: %s', self.info._fields())
 
         self.uuid = self.info.uuid
 
@@ -794,8 +1490,9 @@ class Model:
         if self.is_connected():
             await self._connector.disconnect(entity='model')
             self._info = None
+        self._status_cache.invalidate()
 
-    async def add_local_charm_dir(self, charm_dir, series):
+    async def add_local_charm_dir(self, charm_dir, series, progress=None):
         """Upload a local charm to the model.
 
         This will automatically generate an archive from
@@ -803,23 +1500,57 @@ class Model:
 
         :param charm_dir: Path to the charm directory
         :param series: Charm series
+        :param progress: Optional ``callback(sent, total)``, called on the
+            event loop as the archive is uploaded
 
         """
         charm_dir = Path(charm_dir)
+        loop = jasyncio.get_running_loop()
+        cache = await loop.run_in_executor(None, CharmArchiveCache)
         if charm_dir.suffix == '.charm':
             fn = charm_dir
+            content_hash = await loop.run_in_executor(
+                None, cache.file_hash, fn)
         else:
-            fn = tempfile.NamedTemporaryFile().name
-            CharmArchiveGenerator(str(charm_dir)).make_archive(fn)
+            content_hash, fn = await loop.run_in_executor(
+                None, cache.archive, charm_dir)
+
+        model_uuid = self.connection().uuid
+        charm_url = await loop.run_in_executor(
+            None, cache.uploaded_url, model_uuid, series, content_hash)
+        if charm_url is not None:
+            if await self._has_charm(charm_url):
+                log.debug('Local charm %s unchanged, already uploaded as %s',
+                          charm_dir, charm_url)
+                return charm_url
+            await loop.run_in_executor(
+                None, cache.record_upload, model_uuid, series, content_hash, None)
+
+        if progress is not None:
+            progress = partial(loop.call_soon_threadsafe, progress)
         with open(str(fn), 'rb') as fh:
-            func = partial(
-                self.add_local_charm, fh, series, os.stat(str(fn)).st_size)
-            loop = jasyncio.get_running_loop()
+            size = os.stat(str(fn)).st_size
+            if progress is not None:
+                fh = utils.ProgressReader(fh, size, progress)
+            func = partial(self.add_local_charm, fh, series, size)
             charm_url = await loop.run_in_executor(None, func)
+        await loop.run_in_executor(
+            None, cache.record_upload, model_uuid, series, content_hash, charm_url)
 
         log.debug('Uploaded local charm: %s -> %s', charm_dir, charm_url)
         return charm_url
 
+    async def _has_charm(self, charm_url):
+        """Return True if the model holds the charm with the given url.
+
+        """
+        charms_facade = client.CharmsFacade.from_connection(self.connection())
+        try:
+            await charms_facade.CharmInfo(charm_url)
+        except JujuError:
+            return False
+        return True
+
     def add_local_charm(self, charm_file, series="", size=None):
         """Upload a local charm archive to the model.
 
@@ -841,6 +1572,7 @@ class Model:
 
         """
         conn, headers, path_prefix = self.connection().https_connection()
+        conn.blocksize = utils.UPLOAD_CHUNK_SIZE
         path = "%s/charms?series=%s" % (path_prefix, series)
         headers['Content-Type'] = 'application/zip'
         if size:
@@ -1174,7 +1906,7 @@ class Model:
         """
         observer = _Observer(
             callable_, entity_type, action, entity_id, predicate)
-        self._observers[observer] = callable_
+        self._observers.add(observer)
 
     def _watch(self):
         """Start an asynchronous watch against this model.
@@ -1260,6 +1992,8 @@ class Model:
                         # Post step ensure that we can handle any settings
                         # that need to be correctly set as a post step.
                         _post_step(new_obj)
+                    self._status_cache.invalidate_for(results.deltas)
+                    self._action_tracker.on_deltas(results.deltas)
                     self._watch_received.set()
             except CancelledError:
                 pass
@@ -1267,6 +2001,7 @@ class Model:
                 log.exception('Error in watcher')
                 raise
             finally:
+                self._action_tracker.cancel()
                 self._watch_stopped.set()
 
         log.debug('Starting watcher task')
@@ -1293,9 +2028,29 @@ class Model:
             'Model changed: %s %s %s',
             delta.entity, delta.type, delta.get_id())
 
-        for o in self._observers:
-            if o.cares_about(delta):
-                jasyncio.ensure_future(o(delta, old_obj, new_obj, self))
+        key = (delta.entity, delta.get_id())
+        for o in self._observers.matching(delta):
+            if o.inline:
+                o.callable_(delta, old_obj, new_obj, self)
+            else:
+                self._observer_dispatcher.submit(
+                    key, o, delta, old_obj, new_obj, self)
+
+    @property
+    def observer_metrics(self):
+        """Return a dict of metrics about the dispatching of observer
+        callbacks:
+
+            workers - worker tasks currently running callbacks
+            queued, max_queued - callbacks waiting to run, now and at most
+            dispatched, failed - callbacks run, and how many of them raised
+            queue_wait_max - longest wait of a callback before running
+            callback_time_total, callback_time_max - time spent in callbacks
+
+        Times are in seconds.
+
+        """
+        return self._observer_dispatcher.metrics()
 
     async def _wait(self, entity_type, entity_id, action, predicate=None):
         """
@@ -1314,11 +2069,19 @@ class Model:
         """
         q = jasyncio.Queue()
 
-        async def callback(delta, old, new, model):
-            await q.put(delta.get_id())
+        def callback(delta, old, new, model):
+            q.put_nowait(delta.get_id())
 
-        self.add_observer(callback, entity_type, action, entity_id, predicate)
-        entity_id = await q.get()
+        # Called inline rather than on the observer workers, so that an
+        # observer callback can itself wait on the model (e.g. deploy or add
+        # units) without deadlocking the workers.
+        observer = _Observer(
+            callback, entity_type, action, entity_id, predicate, inline=True)
+        self._observers.add(observer)
+        try:
+            entity_id = await q.get()
+        finally:
+            self._observers.remove(observer)
         # object might not be in the entity_map if we were waiting for a
         # 'remove' action
         return self.state._live_entity_map(entity_type).get(entity_id)
@@ -1455,7 +2218,9 @@ class Model:
                 client.Constraints.from_json(o) for o in disks]
 
         if series:
-            params.series = series
+            # AddMachineParams has no series, only a base.
+            params.base = client.Base(channel=utils.get_series_version(series),
+                                      name=utils.get_os_from_series(series))
 
         # Submit the request.
         client_facade = client.MachineManagerFacade.from_connection(self.connection())
@@ -1890,45 +2655,75 @@ class Model:
 
         :returns url.URL, client.CharmOrigin, [str]
         """
-        charms_cls = client.CharmsFacade
-        if charms_cls.best_facade_version(self.connection()) < 3:
-            raise JujuError("resolve charm")
-
-        charms_facade = charms_cls.from_connection(self.connection())
-
-        # TODO (cderici): following part can be refactored out, since the
-        #  origin should be set (including the base) before calling this,
-        #  though all tests need to run (in earlier versions too) before
-        #  committing to make sure there's no regression
-        source = Source.CHARM_HUB.value
+        [resolved] = await self._resolve_charms(
+            [(url, origin)], force=force, series=series, model_config=model_config)
+        return resolved
 
-        resolve_origin = {'source': source, 'architecture': origin.architecture,
-                          'track': origin.track, 'risk': origin.risk,
-                          'base': origin.base, 'revision': origin.revision,
-                          }
+    async def _resolve_charms(self, charms, force=False, series=None, model_config=None):
+        """Resolve many charms like _resolve_charm, with a single call to
+        Charms.ResolveCharms for all those not in charm_resolution_cache.
 
-        resp = await charms_facade.ResolveCharms(resolve=[{
-            'reference': str(url),
-            'charm-origin': resolve_origin
-        }])
-        if len(resp.results) != 1:
-            raise JujuError("expected one result, received {}".format(resp.results))
-
-        result = resp.results[0]
-        if result.error:
-            raise JujuError(f'resolving {url} : {result.error.message}')
+        :param charms: A list of (url, client.CharmOrigin) to resolve
 
-        # TODO (cderici) : supported_bases
-        supported_series = result.get('supported_series', result.unknown_fields['supported-series'])
-        resolved_origin = result.charm_origin
-        charm_url = URL.parse(result.url)
+        :returns [(url.URL, client.CharmOrigin)] in the order of ``charms``
+        """
+        charms_cls = client.CharmsFacade
+        if charms_cls.best_facade_version(self.connection()) < 3:
+            raise JujuError("resolve charm")
 
-        # run the series selector to get a series for the base
-        selected_series = utils.series_selector(series, charm_url, model_config, supported_series, force)
-        result.charm_origin.base = utils.get_base_from_origin_or_channel(resolved_origin, selected_series)
-        charm_url.series = selected_series
+        connection = self.connection()
+        # what a charm resolves to depends on the controller
+        controller = (connection.info or {}).get('controller-tag') or connection.endpoint
+        keys = [CharmResolutionCache.key(controller, url, origin)
+                for url, origin in charms]
+        resolutions = [charm_resolution_cache.get(key) for key in keys]
+        missing = [i for i, resolution in enumerate(resolutions) if resolution is None]
+        if missing:
+            charms_facade = charms_cls.from_connection(self.connection())
 
-        return charm_url, resolved_origin
+            # TODO (cderici): following part can be refactored out, since the
+            #  origin should be set (including the base) before calling this,
+            #  though all tests need to run (in earlier versions too) before
+            #  committing to make sure there's no regression
+            source = Source.CHARM_HUB.value
+
+            resolve = []
+            for i in missing:
+                url, origin = charms[i]
+                resolve.append({
+                    'reference': str(url),
+                    'charm-origin': {'source': source, 'architecture': origin.architecture,
+                                     'track': origin.track, 'risk': origin.risk,
+                                     'base': origin.base, 'revision': origin.revision,
+                                     },
+                })
+            resp = await charms_facade.ResolveCharms(resolve=resolve)
+            if len(resp.results) != len(missing):
+                raise JujuError("expected {} results, received {}".format(
+                    len(missing), resp.results))
+
+            for i, result in zip(missing, resp.results):
+                if result.error:
+                    raise JujuError(f'resolving {charms[i][0]} : {result.error.message}')
+                # TODO (cderici) : supported_bases
+                supported_series = result.get('supported_series', result.unknown_fields['supported-series'])
+                resolutions[i] = (result.url, result.charm_origin.to_json(),
+                                  tuple(supported_series or ()))
+                charm_resolution_cache.put(keys[i], resolutions[i])
+
+        resolved = []
+        for url, origin, supported_series in resolutions:
+            # Cached resolutions are shared, build new objects from them
+            charm_url = URL.parse(url)
+            resolved_origin = client.CharmOrigin.from_json(origin)
+
+            # run the series selector to get a series for the base
+            selected_series = utils.series_selector(
+                series, charm_url, model_config, list(supported_series), force)
+            resolved_origin.base = utils.get_base_from_origin_or_channel(resolved_origin, selected_series)
+            charm_url.series = selected_series
+            resolved.append((charm_url, resolved_origin))
+        return resolved
 
     async def _resolve_architecture(self, url=None):
         """_resolve_architecture returns the architecture for a given charm url.
@@ -2004,7 +2799,8 @@ class Model:
 
         return resource_map
 
-    async def add_local_resources(self, application, entity_url, metadata, resources):
+    async def add_local_resources(self, application, entity_url, metadata, resources,
+                                  progress=None):
         """_add_local_resources is called by the deploy to add pending local  resources requested by
         the charm being deployed. It calls the ResourcesFacade.AddPendingResources. After getting
         the pending IDs from the controller it sends an HTTP PUT request to actually upload local
@@ -2015,6 +2811,11 @@ class Model:
         :param [string]string metadata: metadata for the charm that we add resources for
         :param [string] resources: the paths for the local files (or oci-images) to be added as
         local resources
+        :param progress: optional ``callback(resource_name, sent, total)`` called as
+        the resources are uploaded
+
+        The resources are streamed from disk, and several of them are uploaded
+        concurrently.
 
         :returns [string]string resource_map that is a map of resources to their assigned
         pendingIDs.
@@ -2022,32 +2823,37 @@ class Model:
         if not resources:
             return None
 
-        resource_map = dict()
-
+        pending = []
         for name, path in resources.items():
             resource_type = metadata["resources"][name]["type"]
             if resource_type not in {"oci-image", "file"}:
                 log.info("Resource {} of type {} is not supported".format(name, resource_type))
                 continue
 
-            charmresource = {
-                'description': '',
-                'fingerprint': '',
-                'name': name,
-                'path': Path(path).name,
-                'revision': 0,
-                'size': 0,
-                'type_': resource_type,
-                'origin': 'upload',
-            }
+            pending.append((name, path, resource_type, client.CharmResource(
+                description='',
+                fingerprint='',
+                name=name,
+                path=Path(path).name,
+                revision=0,
+                size=0,
+                type_=resource_type,
+                origin='upload',
+            )))
+        if not pending:
+            return dict()
 
-            resources_facade = client.ResourcesFacade.from_connection(
-                self.connection())
-            response = await resources_facade.AddPendingResources(
-                application_tag=tag.application(application),
-                charm_url=entity_url,
-                resources=[client.CharmResource(**charmresource)])
-            pending_id = response.pending_ids[0]
+        resources_facade = client.ResourcesFacade.from_connection(
+            self.connection())
+        response = await resources_facade.AddPendingResources(
+            application_tag=tag.application(application),
+            charm_url=entity_url,
+            resources=[charmresource for _, _, _, charmresource in pending])
+
+        resource_map = dict()
+        uploads = []
+        for (name, path, resource_type, _), pending_id in zip(
+                pending, response.pending_ids):
             resource_map[name] = pending_id
 
             if resource_type == "oci-image":
@@ -2060,13 +2866,40 @@ class Model:
                 data = yaml.dump(docker_image_details)
             else:
                 p = Path(path)
-                data = p.read_text() if p.exists() else ''
+                data = p if p.exists() else ''
+
+            uploads.append(self._upload(
+                data, path, application, name, resource_type, pending_id,
+                progress=partial(progress, name) if progress else None))
 
-            self._upload(data, path, application, name, resource_type, pending_id)
+        # upload the resources concurrently, a few at a time
+        semaphore = jasyncio.Semaphore(self.MAX_CONCURRENT_UPLOADS)
 
+        async def upload(coro):
+            async with semaphore:
+                await coro
+
+        await jasyncio.gather(*[upload(coro) for coro in uploads])
         return resource_map
 
-    def _upload(self, data, path, app_name, res_name, res_type, pending_id):
+    async def _upload(self, data, path, app_name, res_name, res_type,
+                      pending_id, progress=None):
+        """Upload the content of a pending resource.
+
+        :param data: The content, as str or bytes, or a Path to the file to
+            stream it from
+        :param progress: Optional ``callback(sent, total)``, called on the
+            event loop as the content is sent
+        """
+        loop = jasyncio.get_running_loop()
+        if progress is not None:
+            progress = partial(loop.call_soon_threadsafe, progress)
+        await loop.run_in_executor(None, partial(
+            self._put_resource, data, path, app_name, res_name, res_type,
+            pending_id, progress))
+
+    def _put_resource(self, data, path, app_name, res_name, res_type,
+                      pending_id, progress):
         conn, headers, path_prefix = self.connection().https_connection()
 
         query = "?pendingid={}".format(pending_id)
@@ -2077,16 +2910,15 @@ class Model:
             disp = "form-data; filename=\"{}\"".format(path)
 
         headers['Content-Type'] = 'application/octet-stream'
-        headers['Content-Length'] = len(data)
-        headers['Content-Sha384'] = hashlib.sha384(bytes(data, 'utf-8')).hexdigest()
         headers['Content-Disposition'] = disp
 
-        conn.request('PUT', url, data, headers)
-
-        response = conn.getresponse()
-        result = response.read().decode()
-        if not response.status == 200:
-            raise JujuError(result)
+        if isinstance(data, Path):
+            fileobj = open(str(data), 'rb')
+        else:
+            fileobj = io.BytesIO(
+                data if isinstance(data, bytes) else data.encode('utf-8'))
+        with fileobj:
+            utils.upload_file(conn, 'PUT', url, fileobj, headers, progress)
 
     async def _deploy(self, charm_url, application, series, config,
                       constraints, endpoint_bindings, resources, storage,
@@ -2137,8 +2969,8 @@ class Model:
                 for pending_upload_resource in getattr(_result, 'pendingresourceuploads', []):
                     _path = pending_upload_resource.filename
                     p = Path(_path)
-                    data = p.read_text() if p.exists() else ''
-                    self._upload(data, _path, application, pending_upload_resource.name, 'file', '')
+                    data = p if p.exists() else ''
+                    await self._upload(data, _path, application, pending_upload_resource.name, 'file', '')
         else:
             app = client.ApplicationDeploy(
                 charm_url=charm_url,
@@ -2386,6 +3218,79 @@ class Model:
             application='',
             constraints=constraints)
 
+    async def run_on(self, command, units=None, machines=None,
+                     applications=None, timeout=None, max_concurrency=16):
+        """Run a command on many units and machines at once.
+
+        The command is submitted in a single request, and the action of
+        every unit and machine it runs on is yielded as soon as it
+        finishes, with its results fetched. The results of the actions
+        finishing together are fetched together, ``max_concurrency`` at a
+        time::
+
+            async for action in model.run_on('hostname', applications=['ubuntu']):
+                print(action.data['receiver'], action.results.get('stdout'))
+
+        :param str command: The command to run
+        :param [str] units: Names of the units to run the command on
+        :param [str] machines: Ids of the machines to run the command on
+        :param [str] applications: Names of the applications to run the
+            command on every unit of
+        :param int timeout: Time, in seconds, to wait before the command is
+            considered failed
+        :param int max_concurrency: At most how many action results are
+            fetched with each request
+        :returns: An async iterator of :class:`juju.action.Action`
+            instances, in the order they finish.
+        :raises: :class:`JujuError` if the command could not be queued on
+            some of the receivers, before yielding any action. It still runs
+            on the others.
+
+        """
+        action_facade = client.ActionFacade.from_connection(self.connection())
+
+        log.debug('Running `%s` on units %s, machines %s and applications %s',
+                  command, units, machines, applications)
+
+        if timeout:
+            # Convert seconds to nanoseconds
+            timeout = int(timeout * 1000000000)
+
+        # See Unit.run: ActionFacade v6 and older answer with results
+        # rather than actions.
+        old_facade = client.ActionFacade.best_facade_version(self.connection()) <= 6
+
+        res = await action_facade.Run(
+            applications=list(applications or []),
+            commands=command,
+            machines=list(machines or []),
+            timeout=timeout,
+            units=list(units or []),
+        )
+        action_results = res.results if old_facade else res.actions
+
+        errors = ["Action error - {} : {}".format(r.error.code, r.error.message)
+                  for r in action_results if r.error]
+        if errors:
+            raise JujuError(errors)
+
+        async def _finished(action_id):
+            result = await self._action_tracker.result(
+                action_id, max_batch=max_concurrency)
+            action = await self._wait_for_new('action', action_id)
+            action._set_result(result)
+            return action
+
+        tasks = [jasyncio.ensure_future(_finished(tag.untag('action-', r.action.tag)))
+                 for r in action_results]
+        try:
+            for task in jasyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # Stop waiting if the caller stops iterating early
+            for task in tasks:
+                task.cancel()
+
     async def get_action_output(self, action_uuid, wait=None):
         """ Get the results of an action by ID.
 
@@ -2401,32 +3306,18 @@ class Model:
     async def _get_completed_action(self, action_uuid, wait=None):
         """Get the completed internal _definitions.Action object.
 
+        Completion is tracked from the watcher deltas, see _ActionTracker.
+
         :param str action_uuid: Id of the action
         :param int wait: Time in seconds to wait for action to complete.
         :return dict: Output from action
         :raises: :class:`JujuError` if invalid action_uuid
         """
-        action_facade = client.ActionFacade.from_connection(
-            self.connection()
-        )
-        entity = [{'tag': tag.action(action_uuid)}]
-        # Cannot use self.wait_for_action as the action event has probably
-        # already happened and self.wait_for_action works by processing
-        # model deltas and checking if they match our type. If the action
-        # has already occured then the delta has gone.
-
-        async def _wait_for_action_status():
-            while True:
-                action_output = await action_facade.Actions(entities=entity)
-                if action_output.results[0].status in ('completed', 'failed'):
-                    return
-                else:
-                    await jasyncio.sleep(1)
-        await jasyncio.wait_for(
-            _wait_for_action_status(),
+        # The action may well have finished already, and its delta gone,
+        # which the tracker checks for in the model state.
+        return await jasyncio.wait_for(
+            self._action_tracker.result(tag.untag('action-', action_uuid)),
             timeout=wait)
-        action_results = await action_facade.Actions(entities=entity)
-        return action_results.results[0]
 
     async def get_action_status(self, uuid_or_prefix=None, name=None):
         """Get the status of all actions, filtered by ID, ID prefix, or name.
@@ -2464,9 +3355,12 @@ class Model:
             to include, which can use wildcards ('*').
         :param bool utc: Display time as UTC in RFC3339 format
 
+        Concurrent calls share a single request, and with a ``status_ttl``
+        results are reused for that long unless the model changes; see
+        `juju.status.StatusCache`. The result must not be modified.
+
         """
-        client_facade = client.ClientFacade.from_connection(self.connection())
-        return await client_facade.FullStatus(patterns=filters)
+        return await self._status_cache.get(filters)
 
     async def get_metrics(self, *tags):
         """Retrieve metrics.
@@ -2496,7 +3390,7 @@ class Model:
                     raise Exception(error.message)
 
             for metric in entity_metrics.metrics:
-                metrics[metric.unit].append(vars(metric))
+                metrics[metric.unit].append(metric._fields())
 
         return metrics
 
@@ -2586,11 +3480,11 @@ class Model:
         offer_url.source = offer.source
 
         consume_details.offer.offer_url = offer_url.string()
-        consume_details.offer.application_alias = application_alias
 
         arg = _create_consume_args(consume_details.offer,
                                    consume_details.macaroon,
-                                   consume_details.external_controller)
+                                   consume_details.external_controller,
+                                   application_alias)
 
         facade = client.ApplicationFacade.from_connection(self.connection())
         results = await facade.Consume(args=[arg])
@@ -2821,8 +3715,11 @@ class Model:
             any pending hooks have a chance to start to avoid false positives.
             The default is 15 seconds.
 
-        :param float check_freq: How frequently, in seconds, to check the model.
-            The default is every half-second.
+        :param float check_freq: The shortest interval, in seconds, between two
+            checks of the model. Checks are triggered by watcher deltas for the
+            given apps (or by idle periods running out) rather than by polling,
+            and at most one FullStatus call is made per check.
+            The default is half a second.
 
         :param str status: The status to wait for. If None, not waiting.
             The default is None (not waiting for any status).
@@ -2844,18 +3741,39 @@ class Model:
 
         timeout = timedelta(seconds=timeout) if timeout is not None else None
         idle_period = timedelta(seconds=idle_period)
-        start_time = datetime.now()
+        start_time = time.monotonic()
         # Type check against the common error of passing a str for apps
         if apps is not None and (not isinstance(apps, list) or
                                  any(not isinstance(o, str)
                                      for o in apps)):
             raise JujuError(f'Expected a List[str] for apps, given {apps}')
 
-        apps = apps or self.applications
+        apps = list(apps or self.applications)
         idle_times = {}
         units_ready = set()  # The units that are in the desired state
         last_log_time = None
-        log_interval = timedelta(seconds=30)
+        log_interval = 30
+        # The application status is only worth a FullStatus call if it can
+        # make us raise or keep waiting.
+        need_app_status = raise_on_error or raise_on_blocked or bool(status)
+
+        # Results of the last evaluation of each application, re-used until
+        # a delta touches the application or one of its idle timers expires.
+        app_statuses = {}
+        unit_checks = {}
+        stale = set(apps)
+        changed = jasyncio.Event()
+
+        def _on_delta(delta):
+            if delta.entity == 'application':
+                stale.add(delta.get_id())
+            elif delta.entity == 'unit':
+                stale.add(delta.data.get('application'))
+            elif delta.entity == 'machine':
+                stale.update(apps)
+            else:
+                return
+            changed.set()
 
         def _raise_for_status(entities, status):
             if not entities:
@@ -2874,107 +3792,169 @@ class Model:
                     ", ".join(errored),
                 ))
 
-        if wait_for_exact_units is not None:
-            assert isinstance(wait_for_exact_units, int) and wait_for_exact_units >= 0, \
-                'Invalid value for wait_for_exact_units : %s' % wait_for_exact_units
-
-        while True:
-            # The list 'busy' is what keeps this loop going,
-            # i.e. it'll stop when busy is empty after all the
-            # units are scanned
-            busy = []
+        def _check_units(app, app_status, now):
             errors = {}
             blocks = {}
-            for app_name in apps:
-                if app_name not in self.applications:
-                    busy.append(app_name + " (missing)")
+            busy = []
+            # When the next idle period of one of the units runs out
+            deadline = None
+            for unit in app.units:
+                if raise_on_error and unit.machine is not None and unit.machine.status == "error":
+                    errors.setdefault("Machine", []).append(unit.machine.id)
                     continue
-                app = self.applications[app_name]
-                app_status = await app.get_status()
-                if raise_on_error and app_status == "error":
-                    errors.setdefault("App", []).append(app.name)
-                if raise_on_blocked and app_status == "blocked":
-                    blocks.setdefault("App", []).append(app.name)
-
-                # Check if wait_for_exact_units flag is used
-                if wait_for_exact_units is not None:
-                    if len(app.units) != wait_for_exact_units:
-                        busy.append(app.name + " (waiting for exactly %s units, current : %s)" %
-                                    (wait_for_exact_units, len(app.units)))
-                        continue
-                # If we have less # of units then required, then wait a bit more
-                elif len(app.units) < _wait_for_units:
-                    busy.append(app.name + " (not enough units yet - %s/%s)" %
-                                (len(app.units), _wait_for_units))
+                if raise_on_error and unit.agent_status == "error":
+                    errors.setdefault("Agent", []).append(unit.name)
                     continue
-                # User is waiting for at least a certain # of units, and we have enough
-                elif wait_for_at_least_units and len(units_ready) >= _wait_for_units:
-                    # So no need to keep looking, we have the desired number of units ready to go,
-                    # exit the loop. Don't just return here, though, we might still have some
-                    # errors to raise at the end
-                    break
-                for unit in app.units:
-                    if raise_on_error and unit.machine is not None and unit.machine.status == "error":
-                        errors.setdefault("Machine", []).append(unit.machine.id)
-                        continue
-                    if raise_on_error and unit.agent_status == "error":
-                        errors.setdefault("Agent", []).append(unit.name)
-                        continue
-                    if raise_on_error and unit.workload_status == "error":
-                        errors.setdefault("Unit", []).append(unit.name)
-                        continue
-                    if raise_on_blocked and unit.workload_status == "blocked":
-                        blocks.setdefault("Unit", []).append(unit.name)
-                        continue
-                    # TODO (cderici): we need two versions of wait_for_idle, one for waiting on
-                    #  individual units, another one for waiting for an application.
-                    #  The convoluted logic below is the result of trying to do both at the same
-                    #  time
-                    need_to_wait_more_for_a_particular_status = status and (unit.workload_status != status)
-                    app_is_in_desired_status = (not status) or (app_status == status)
-                    if not need_to_wait_more_for_a_particular_status and \
-                            unit.agent_status == "idle" and \
-                            (wait_for_at_least_units or app_is_in_desired_status):
-                        # A unit is ready if either:
-                        # 1) Don't need to wait more for a particular status and the agent is "idle"
-                        # 2) We're looking for a particular status and the unit's workload,
-                        # as well as the application, is in that status. If the user wants to
-                        # see only a particular number of units in that state -- i.e. a subset of
-                        # the units is needed, then we don't care about the application status
-                        # (because e.g. app can be in 'waiting' while unit.0 is 'active' and unit.1
-                        # is 'waiting')
-
-                        # Either way, the unit is ready, start measuring the time period that
-                        # it needs to stay in that state (i.e. idle_period)
-                        units_ready.add(unit.name)
-                        now = datetime.now()
-                        idle_start = idle_times.setdefault(unit.name, now)
-
-                        if now - idle_start < idle_period:
-                            busy.append("{} [{}] {}: {}".format(unit.name,
-                                                                unit.agent_status,
-                                                                unit.workload_status,
-                                                                unit.workload_status_message))
-                    else:
-                        idle_times.pop(unit.name, None)
+                if raise_on_error and unit.workload_status == "error":
+                    errors.setdefault("Unit", []).append(unit.name)
+                    continue
+                if raise_on_blocked and unit.workload_status == "blocked":
+                    blocks.setdefault("Unit", []).append(unit.name)
+                    continue
+                # TODO (cderici): we need two versions of wait_for_idle, one for waiting on
+                #  individual units, another one for waiting for an application.
+                #  The convoluted logic below is the result of trying to do both at the same
+                #  time
+                need_to_wait_more_for_a_particular_status = status and (unit.workload_status != status)
+                app_is_in_desired_status = (not status) or (app_status == status)
+                if not need_to_wait_more_for_a_particular_status and \
+                        unit.agent_status == "idle" and \
+                        (wait_for_at_least_units or app_is_in_desired_status):
+                    # A unit is ready if either:
+                    # 1) Don't need to wait more for a particular status and the agent is "idle"
+                    # 2) We're looking for a particular status and the unit's workload,
+                    # as well as the application, is in that status. If the user wants to
+                    # see only a particular number of units in that state -- i.e. a subset of
+                    # the units is needed, then we don't care about the application status
+                    # (because e.g. app can be in 'waiting' while unit.0 is 'active' and unit.1
+                    # is 'waiting')
+
+                    # Either way, the unit is ready, start measuring the time period that
+                    # it needs to stay in that state (i.e. idle_period)
+                    units_ready.add(unit.name)
+                    idle_start = idle_times.setdefault(unit.name, now)
+                    idle_end = idle_start + idle_period.total_seconds()
+
+                    if now < idle_end:
+                        deadline = idle_end if deadline is None else min(deadline, idle_end)
                         busy.append("{} [{}] {}: {}".format(unit.name,
                                                             unit.agent_status,
                                                             unit.workload_status,
                                                             unit.workload_status_message))
-            _raise_for_status(errors, "error")
-            _raise_for_status(blocks, "blocked")
-            if not busy:
-                break
-            busy = "\n  ".join(busy)
-            if timeout is not None and datetime.now() - start_time > timeout:
-                raise jasyncio.TimeoutError("Timed out waiting for model:\n" + busy)
-            if last_log_time is None or datetime.now() - last_log_time > log_interval:
-                log.info("Waiting for model:\n  " + busy)
-                last_log_time = datetime.now()
-            await jasyncio.sleep(check_freq)
+                else:
+                    idle_times.pop(unit.name, None)
+                    busy.append("{} [{}] {}: {}".format(unit.name,
+                                                        unit.agent_status,
+                                                        unit.workload_status,
+                                                        unit.workload_status_message))
+            return errors, blocks, busy, deadline
 
+        if wait_for_exact_units is not None:
+            assert isinstance(wait_for_exact_units, int) and wait_for_exact_units >= 0, \
+                'Invalid value for wait_for_exact_units : %s' % wait_for_exact_units
 
-def _create_consume_args(offer, macaroon, controller_info):
+        self.state.add_delta_listener(_on_delta)
+        try:
+            while True:
+                now = time.monotonic()
+                rescan = stale | {name for name, (_, _, _, deadline) in unit_checks.items()
+                                  if deadline is not None and deadline <= now}
+                stale.clear()
+                changed.clear()
+                # At most one FullStatus per pass, shared by every application
+                # that needs to be re-evaluated.
+                full_status = None
+                num_ready = len(units_ready)
+
+                # The list 'busy' is what keeps this loop going,
+                # i.e. it'll stop when busy is empty after all the
+                # units are scanned
+                busy = []
+                errors = {}
+                blocks = {}
+                applications = self.applications
+                for app_name in apps:
+                    if app_name not in applications:
+                        busy.append(app_name + " (missing)")
+                        continue
+                    app = applications[app_name]
+                    if app_name in rescan or app_name not in app_statuses:
+                        unit_checks.pop(app_name, None)
+                        if need_app_status:
+                            if full_status is None:
+                                full_status = await self.get_status()
+                            app_statuses[app_name] = await app.get_status(full_status=full_status)
+                        else:
+                            app_statuses[app_name] = None
+                    app_status = app_statuses[app_name]
+                    if raise_on_error and app_status == "error":
+                        errors.setdefault("App", []).append(app.name)
+                    if raise_on_blocked and app_status == "blocked":
+                        blocks.setdefault("App", []).append(app.name)
+
+                    num_units = len(app.units)
+                    # Check if wait_for_exact_units flag is used
+                    if wait_for_exact_units is not None:
+                        if num_units != wait_for_exact_units:
+                            busy.append(app.name + " (waiting for exactly %s units, current : %s)" %
+                                        (wait_for_exact_units, num_units))
+                            continue
+                    # If we have less # of units then required, then wait a bit more
+                    elif num_units < _wait_for_units:
+                        busy.append(app.name + " (not enough units yet - %s/%s)" %
+                                    (num_units, _wait_for_units))
+                        continue
+                    # User is waiting for at least a certain # of units, and we have enough
+                    elif wait_for_at_least_units and len(units_ready) >= _wait_for_units:
+                        # So no need to keep looking, we have the desired number of units ready to go,
+                        # exit the loop. Don't just return here, though, we might still have some
+                        # errors to raise at the end
+                        break
+                    if app_name not in unit_checks:
+                        unit_checks[app_name] = _check_units(app, app_status, now)
+                    unit_errors, unit_blocks, unit_busy, _ = unit_checks[app_name]
+                    for kind, names in unit_errors.items():
+                        errors.setdefault(kind, []).extend(names)
+                    for kind, names in unit_blocks.items():
+                        blocks.setdefault(kind, []).extend(names)
+                    busy.extend(unit_busy)
+                _raise_for_status(errors, "error")
+                _raise_for_status(blocks, "blocked")
+                if not busy:
+                    break
+                busy = "\n  ".join(busy)
+                now = time.monotonic()
+                if timeout is not None and now - start_time > timeout.total_seconds():
+                    raise jasyncio.TimeoutError("Timed out waiting for model:\n" + busy)
+                if last_log_time is None or now - last_log_time > log_interval:
+                    log.info("Waiting for model:\n  " + busy)
+                    last_log_time = now
+                if wait_for_at_least_units and len(units_ready) != num_ready:
+                    # More units became ready, which can be enough on its own
+                    # on the next pass.
+                    changed.set()
+
+                # Let deltas accumulate for at least check_freq, then sleep
+                # until one touches an application we wait on, an idle period
+                # runs out, the timeout expires or it is time to log again.
+                await jasyncio.sleep(check_freq)
+                if changed.is_set():
+                    continue
+                wake_ups = [last_log_time + log_interval]
+                wake_ups.extend(deadline for _, _, _, deadline in unit_checks.values()
+                                if deadline is not None)
+                if timeout is not None:
+                    wake_ups.append(start_time + timeout.total_seconds())
+                try:
+                    await jasyncio.wait_for(changed.wait(),
+                                            max(0, min(wake_ups) - time.monotonic()))
+                except jasyncio.TimeoutError:
+                    pass
+        finally:
+            self.state.remove_delta_listener(_on_delta)
+
+
+def _create_consume_args(offer, macaroon, controller_info, application_alias=""):
     """
     Convert a typed object that has been normalised to a overrided typed
     definition.
@@ -2983,6 +3963,7 @@ def _create_consume_args(offer, macaroon, controller_info):
     @param macaroon: takes a macaroon and serialises it into a valid type
     @param controller_info: takes a controller information and serialises it into
     a valid type.
+    @param application_alias: the name to consume the offer as, if any.
     """
     endpoints = []
     for ep in offer.endpoints:
@@ -3015,7 +3996,7 @@ def _create_consume_args(offer, macaroon, controller_info):
     arg.offer_uuid = offer.offer_uuid
     arg.source_model_tag = offer.source_model_tag
     arg.users = users
-    arg.application_alias = offer.application_alias
+    arg.application_alias = application_alias
     arg.external_controller = external_controller
     arg.macaroon = macaroon
 
@@ -3047,16 +4028,30 @@ class CharmArchiveGenerator:
 
         """
         zf = zipfile.ZipFile(str(path), 'w', zipfile.ZIP_DEFLATED)
+        for real_path, archive_name, kind in self.entries():
+            if kind == 'link':
+                self._write_symlink(zf, os.readlink(real_path), archive_name)
+            else:
+                zf.write(real_path, archive_name)
+        zf.close()
+        return path
+
+    def entries(self):
+        """Yield a (real_path, archive_name, kind) tuple for every entry
+        that goes into the archive, where kind is one of 'dir', 'link' or
+        'file'. The ignore rules of :meth:`make_archive` apply.
+
+        """
         for dirpath, dirnames, filenames in os.walk(self.path):
             relative_path = dirpath[len(self.path) + 1:]
             if relative_path and not self._ignore(relative_path):
-                zf.write(dirpath, relative_path)
+                yield dirpath, relative_path, 'dir'
             for dirname in dirnames:
                 archive_name = os.path.join(relative_path, dirname)
                 real_path = os.path.join(dirpath, dirname)
                 if os.path.islink(real_path):
                     self._check_link(real_path)
-                    self._write_symlink(zf, os.readlink(real_path), archive_name)
+                    yield real_path, archive_name, 'link'
             for name in filenames:
                 archive_name = os.path.join(relative_path, name)
                 if not self._ignore(archive_name):
@@ -3064,12 +4059,9 @@ class CharmArchiveGenerator:
                     self._check_type(real_path)
                     if os.path.islink(real_path):
                         self._check_link(real_path)
-                        self._write_symlink(
-                            zf, os.readlink(real_path), archive_name)
+                        yield real_path, archive_name, 'link'
                     else:
-                        zf.write(real_path, archive_name)
-        zf.close()
-        return path
+                        yield real_path, archive_name, 'file'
 
     def _check_type(self, path):
         """Check the path
@@ -3110,6 +4102,261 @@ class CharmArchiveGenerator:
             return True
 
 
+class CharmResolutionCache:
+    """
+    Process-wide cache of the charms resolved with Charms.ResolveCharms,
+    keyed by the controller, and the url, channel, base, architecture and
+    revision they were resolved for.
+
+    Resolutions are kept for ``ttl`` seconds, so that deploying the same
+    charms again, e.g. redeploying a bundle, skips resolving them. This is
+    used by ``Model._resolve_charms``, through ``charm_resolution_cache``,
+    which is disabled by default: a charm released meanwhile would not be
+    seen until its resolution expires. Set its ``ttl`` to enable it.
+    """
+    def __init__(self, ttl=0.0, max_entries=1024):
+        """
+        :param float ttl: Seconds a resolution is kept for, 0 to keep none
+        :param int max_entries: How many resolutions to keep, the least
+            recently added ones are removed first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key -> (expiry time, (url, origin json, supported series))
+        self._entries = collections.OrderedDict()
+
+    @staticmethod
+    def key(controller, url, origin):
+        """Return the cache key of resolving ``url`` for ``origin`` on
+        ``controller``.
+
+        """
+        base = origin.base
+        if isinstance(base, dict):
+            base = client.Base.from_json(base)
+        return (controller, str(url), origin.track, origin.risk,
+                (base.name, base.channel) if base is not None else None,
+                origin.architecture, origin.revision)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, resolution = entry
+        if time.monotonic() >= expiry:
+            del self._entries[key]
+            return None
+        return resolution
+
+    def put(self, key, resolution):
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, resolution)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+charm_resolution_cache = CharmResolutionCache()
+
+
+class CharmArchiveCache:
+    """
+    Cache of the archives built from local charm directories, keyed by a
+    hash of the charm content, along with the charm urls they were uploaded
+    as to each model.
+
+    The content hash of a charm directory is only recomputed when the name,
+    size or mtime of one of its files changed since the last time.
+
+    This is used automatically by
+    `Model.add_local_charm_dir <#juju.model.Model.add_local_charm_dir>`_.
+    """
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path=None, max_archives=10):
+        """
+        :param path: Cache folder, defaults to a ``charms`` folder in
+            :func:`juju.utils.libjuju_cache_dir`
+        :param max_archives: How many archives to keep, the least recently
+            used ones are removed first
+
+        The cache folder is created if needed, so this is blocking, like
+        the other methods.
+        """
+        self.path = Path(path or utils.libjuju_cache_dir('charms'))
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_archives = max_archives
+
+    @property
+    def _index_path(self):
+        return self.path / 'index.json'
+
+    def _load_index(self):
+        try:
+            with open(str(self._index_path)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault('trees', {})
+        index.setdefault('uploads', {})
+        return index
+
+    def _save_index(self, index):
+        fd, tmp = tempfile.mkstemp(dir=str(self.path), suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(index, f)
+            os.replace(tmp, str(self._index_path))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @contextmanager
+    def _index_lock(self):
+        """Hold an exclusive lock on the index across processes, where
+        the platform supports it.
+
+        """
+        with open(str(self.path / 'index.lock'), 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def _update_index(self, section, key, value):
+        # Other processes may update the index meanwhile, so it is read,
+        # changed and replaced under the lock.
+        with self._index_lock():
+            index = self._load_index()
+            if value is None:
+                index[section].pop(key, None)
+            else:
+                index[section][key] = value
+            self._save_index(index)
+
+    def file_hash(self, path):
+        """Return the sha256 hex digest of the file at ``path``.
+
+        """
+        return utils.file_digest(path, 'sha256', self.CHUNK_SIZE)
+
+    def tree_hash(self, charm_dir):
+        """Return a hash of the content of a charm directory, covering
+        exactly what would go into its archive.
+
+        """
+        charm_dir = os.path.abspath(os.path.expanduser(str(charm_dir)))
+        entries = sorted(
+            CharmArchiveGenerator(charm_dir).entries(), key=lambda e: e[1])
+
+        stats = hashlib.sha256()
+        for real_path, archive_name, kind in entries:
+            st = os.lstat(real_path)
+            stats.update('{}\0{}\0{}\0{}\0{}\n'.format(
+                archive_name, kind, st.st_mode, st.st_size,
+                st.st_mtime_ns).encode())
+        stats = stats.hexdigest()
+
+        index = self._load_index()
+        known = index['trees'].get(charm_dir)
+        if known and known['stats'] == stats:
+            return known['hash']
+
+        digest = hashlib.sha256()
+        for real_path, archive_name, kind in entries:
+            digest.update('{}\0{}\0'.format(archive_name, kind).encode())
+            if kind == 'link':
+                digest.update(os.readlink(real_path).encode())
+            elif kind == 'file':
+                digest.update(oct(os.stat(real_path).st_mode & 0o777).encode())
+                with open(real_path, 'rb') as f:
+                    for chunk in iter(partial(f.read, self.CHUNK_SIZE), b''):
+                        digest.update(chunk)
+            digest.update(b'\n')
+        content_hash = digest.hexdigest()
+        self._update_index(
+            'trees', charm_dir, {'stats': stats, 'hash': content_hash})
+        return content_hash
+
+    def archive(self, charm_dir):
+        """Return a (content_hash, archive_path) tuple for a charm directory,
+        building the archive only if the cache doesn't hold it yet.
+
+        """
+        content_hash = self.tree_hash(charm_dir)
+        archive_path = self.path / '{}.charm'.format(content_hash)
+        if archive_path.exists():
+            # mark it as recently used
+            os.utime(str(archive_path))
+            return content_hash, archive_path
+
+        fd, tmp = tempfile.mkstemp(dir=str(self.path), suffix='.tmp')
+        os.close(fd)
+        try:
+            CharmArchiveGenerator(str(charm_dir)).make_archive(tmp)
+            os.replace(tmp, str(archive_path))
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        self._prune()
+        return content_hash, archive_path
+
+    def _prune(self):
+        archives = []
+        for archive_path in self.path.glob('*.charm'):
+            try:
+                archives.append((archive_path.stat().st_mtime, archive_path))
+            except OSError:
+                # removed by another process meanwhile
+                pass
+        archives.sort(reverse=True)
+        evicted = set()
+        for _, stale in archives[self.max_archives:]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+            evicted.add(stale.stem)
+        if not evicted:
+            return
+
+        # Forget the directories and uploads of the evicted archives too,
+        # so that the index doesn't grow with every charm ever built.
+        with self._index_lock():
+            index = self._load_index()
+            index['trees'] = {
+                charm_dir: tree for charm_dir, tree in index['trees'].items()
+                if tree['hash'] not in evicted}
+            index['uploads'] = {
+                key: charm_url for key, charm_url in index['uploads'].items()
+                if key.rpartition('/')[2] not in evicted}
+            self._save_index(index)
+
+    @staticmethod
+    def _upload_key(model_uuid, series, content_hash):
+        return '{}/{}/{}'.format(model_uuid, series or '', content_hash)
+
+    def uploaded_url(self, model_uuid, series, content_hash):
+        """Return the charm url an archive was uploaded as to a model, or
+        None if it wasn't.
+
+        """
+        return self._load_index()['uploads'].get(
+            self._upload_key(model_uuid, series, content_hash))
+
+    def record_upload(self, model_uuid, series, content_hash, charm_url):
+        """Remember the charm url an archive was uploaded as to a model, or
+        forget it if charm_url is None.
+
+        """
+        self._update_index(
+            'uploads', self._upload_key(model_uuid, series, content_hash),
+            charm_url)
+
+
 class ModelInfo(ModelEntity):
 
     @property
@@ -10,7 +10,9 @@ from subprocess import CalledProcessError
 
 import paramiko
 
+from . import utils
 from .client import client
+from .errors import JujuError
 
 arches = [
     [re.compile(r"amd64|x86_64"), "amd64"],
@@ -30,6 +32,21 @@ def normalize_arch(rawArch):
             return arch[1]
 
 
+def series_base(series):
+    """Return the client.Base of a series reported by DETECTION_SCRIPT,
+    e.g. jammy or centos7.
+
+    :raises: :class:`juju.errors.JujuError` if the series is unknown
+    """
+    if series in utils.UBUNTU_SERIES:
+        return client.Base(
+            channel=utils.get_series_version(series), name='ubuntu')
+    match = re.fullmatch(r'centos(\d+)', series)
+    if match:
+        return client.Base(channel=match.group(1), name='centos')
+    raise JujuError('Unsupported series of the machine: {}'.format(series))
+
+
 DETECTION_SCRIPT = """#!/bin/bash
 set -e
 os_id=$(grep '^ID=' /etc/os-release | tr -d '"' | cut -d= -f2)
@@ -256,6 +273,8 @@ class SSHProvisioner:
         :return: bool: The client.AddMachineParams
         :raises: :class:`paramiko.ssh_exception.AuthenticationException`
             if the upload fails
+        :raises: :class:`juju.errors.JujuError` if the OS of the machine
+            is not supported
         """
         params = client.AddMachineParams()
 
@@ -269,7 +288,7 @@ class SSHProvisioner:
                 )
 
                 hw = self._detect_hardware_and_os(ssh)
-                params.series = hw['series']
+                params.base = series_base(hw['series'])
                 params.instance_id = "manual:{}".format(self.host)
                 params.nonce = "manual:{}:{}".format(
                     self.host,
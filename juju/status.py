@@ -2,8 +2,11 @@
 # Licensed under the Apache V2, see LICENCE file for details.
 
 import logging
+import time
 
+from . import jasyncio
 from .client import client
+from .names import is_valid_application
 
 log = logging.getLogger(__name__)
 
@@ -53,8 +56,7 @@ async def formatted_status(model, target=None, raw=False, filters=None):
     :param str fileters: Optional list of applications, units, or machines
         to include, which can use wildcards ('*').
     """
-    client_facade = client.ClientFacade.from_connection(model.connection())
-    result_status = await client_facade.FullStatus(patterns=filters)
+    result_status = await model.get_status(filters)
 
     if raw:
         result_str = str(result_status)
@@ -207,3 +209,144 @@ def _print_status_machines(result_status):
     result_str += summary
     result_str += '\n'
     return result_str
+
+
+# The kinds of AllWatcher delta that can change what FullStatus returns.
+STATUS_DELTA_TYPES = frozenset({
+    'application', 'applicationOffer', 'machine', 'model', 'relation',
+    'remoteApplication', 'unit',
+})
+
+
+def _cache_key(patterns):
+    if not patterns:
+        return None
+    if isinstance(patterns, str):
+        return patterns
+    return tuple(sorted(patterns))
+
+
+def _application_names(patterns):
+    """Return the application names if all of ``patterns`` are exact
+    application names, without wildcards; else None.
+
+    """
+    if not patterns or isinstance(patterns, str):
+        return None
+    if all(isinstance(p, str) and is_valid_application(p) for p in patterns):
+        return set(patterns)
+    return None
+
+
+def filter_status(status, names):
+    """Return the part of the FullStatus ``status`` about the applications
+    in ``names``: the applications with all their units, the machines
+    hosting those units, the relations and remote applications involving
+    them, and their offers. The model, branches and storage are kept
+    whole.
+
+    """
+    applications = {name: app for name, app in (status.applications or {}).items()
+                    if name in names}
+    machine_ids = {unit.machine.split('/')[0]
+                   for app in applications.values()
+                   for unit in (app.units or {}).values() if unit.machine}
+    relations = [relation for relation in status.relations or []
+                 if any(ep.application in names for ep in relation.endpoints or [])]
+    related = {ep.application for relation in relations
+               for ep in relation.endpoints or []}
+    return client.FullStatus(
+        applications=applications,
+        branches=status.branches,
+        controller_timestamp=status.controller_timestamp,
+        filesystems=status.filesystems,
+        machines={id_: machine for id_, machine in (status.machines or {}).items()
+                  if id_ in machine_ids},
+        model=status.model,
+        offers={name: offer for name, offer in (status.offers or {}).items()
+                if offer.application_name in names},
+        relations=relations,
+        remote_applications={
+            name: app for name, app in (status.remote_applications or {}).items()
+            if name in related},
+        storage=status.storage,
+        volumes=status.volumes,
+    )
+
+
+class StatusCache:
+    """Coalesces and caches the FullStatus calls made for a model.
+
+    Concurrent calls with the same patterns share a single request. With a
+    ``ttl``, results are reused for that many seconds, or until the model's
+    watcher sees a change that could affect them (see :meth:`invalidate_for`),
+    and patterns that are all exact application names are answered by
+    filtering the full status (see :func:`filter_status`).
+
+    Results are shared between callers, and must not be modified.
+
+    :param Model model: The model to get the status of.
+    :param float ttl: How long, in seconds, to reuse results for; 0, the
+        default, to only share concurrent requests.
+    """
+    def __init__(self, model, ttl=0):
+        self.model = model
+        self.ttl = ttl
+        self._results = {}
+        self._requests = {}
+        self._generation = 0
+
+    def invalidate(self):
+        """Forget all the results fetched so far. Requests in flight are
+        left to the callers already waiting on them: their results may
+        predate the change, so later callers make a new request.
+
+        """
+        self._generation += 1
+        self._results.clear()
+        self._requests.clear()
+
+    def invalidate_for(self, deltas):
+        """Invalidate the cache if any of the AllWatcher ``deltas`` may
+        change the status.
+
+        """
+        if (self._results or self._requests) and \
+                any(d.entity in STATUS_DELTA_TYPES for d in deltas):
+            self.invalidate()
+
+    async def get(self, patterns=None):
+        """Return the FullStatus of the model, limited to ``patterns`` if
+        any.
+
+        """
+        if self.ttl > 0:
+            names = _application_names(patterns)
+            if names is not None:
+                return filter_status(await self.get(), names)
+        key = _cache_key(patterns)
+        cached = self._results.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        request = self._requests.get(key)
+        if request is None:
+            request = self._requests[key] = jasyncio.ensure_future(
+                self._fetch(key, patterns))
+            request.add_done_callback(lambda f: self._done(key, f))
+        # A caller giving up must not cancel the request for the others.
+        return await jasyncio.shield(request)
+
+    async def _fetch(self, key, patterns):
+        generation = self._generation
+        started = time.monotonic()
+        client_facade = client.ClientFacade.from_connection(self.model.connection())
+        status = await client_facade.FullStatus(patterns=patterns)
+        if self.ttl > 0 and generation == self._generation:
+            self._results[key] = (started, status)
+        return status
+
+    def _done(self, key, request):
+        if self._requests.get(key) is request:
+            del self._requests[key]
+        if not request.cancelled():
+            request.exception()  # retrieved by the callers, if any are left
@@ -99,8 +99,7 @@ class Unit(model.ModelEntity):
 
         :return [Unit]
         """
-        return [u for u_name, u in self.model.units.items() if u.is_subordinate and
-                u.principal_unit == self.name]
+        return self.model.state.unit_subordinates(self.name)
 
     async def destroy(self, destroy_storage=False, dry_run=False, force=False, max_wait=None):
         """Destroy this unit.
@@ -366,9 +365,7 @@ class Unit(model.ModelEntity):
         unit_parts = self.name.split("/")
         app = unit_parts[0]
 
-        client_facade = client.ClientFacade.from_connection(self.connection)
-
-        status = await client_facade.FullStatus(patterns=None)
+        status = await self.model.get_status()
         # FullStatus may be more up to date than our model, and the
         # unit may have gone away, or we may be doing something silly,
         # like trying to fetch leadership for a subordinate, which
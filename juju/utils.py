@@ -1,6 +1,7 @@
 # Copyright 2023 Canonical Ltd.
 # Licensed under the Apache V2, see LICENCE file for details.
 
+import hashlib
 import os
 import textwrap
 from collections import defaultdict
@@ -60,6 +61,22 @@ def juju_config_dir():
     return str(config_dir.expanduser().resolve())
 
 
+def libjuju_cache_dir(*parts):
+    """Resolves, creates and returns the path string to a folder for
+    python-libjuju's own caches:
+
+    * $XDG_CACHE_HOME/python-libjuju
+    * ~/.cache/python-libjuju
+
+    :param parts: sub folders to append to the cache folder
+
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or '~/.cache'
+    cache_dir = Path(cache_home, 'python-libjuju', *parts).expanduser()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return str(cache_dir)
+
+
 def juju_ssh_key_paths():
     """Resolves and returns the path strings for public and private ssh
     keys for juju CLI.
@@ -95,6 +112,78 @@ async def read_ssh_key():
     return await loop.run_in_executor(None, _read_ssh_key)
 
 
+# Size of the chunks files are hashed and uploaded in.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(fileobj, algorithm='sha256', chunk_size=UPLOAD_CHUNK_SIZE):
+    """Return the hex digest of a binary file object, or of the file at the
+    given path, reading it in chunks so that memory use stays constant.
+
+    :param fileobj: A binary file object, read from its current position,
+        or a path
+    :param str algorithm: Any algorithm supported by hashlib
+    """
+    if isinstance(fileobj, (str, Path)):
+        with open(str(fileobj), 'rb') as f:
+            return file_digest(f, algorithm, chunk_size)
+    digest = hashlib.new(algorithm)
+    for chunk in iter(partial(fileobj.read, chunk_size), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ProgressReader:
+    """Wraps a binary file object to call ``callback(sent, total)`` each time
+    a chunk is read from it, e.g. while it is being uploaded.
+
+    """
+    def __init__(self, fileobj, total, callback):
+        self._fileobj = fileobj
+        self.total = total
+        self.sent = 0
+        self._callback = callback
+
+    def read(self, size=-1):
+        chunk = self._fileobj.read(size)
+        if chunk:
+            self.sent += len(chunk)
+            self._callback(self.sent, self.total)
+        return chunk
+
+
+def upload_file(conn, method, url, fileobj, headers, progress=None):
+    """Send the rest of a binary, seekable file object as the body of an
+    HTTP request, along with its size and SHA-384 checksum as the Juju API
+    expects them, and return the decoded response body.
+
+    The file is read twice in chunks, first to hash it and then to send it,
+    so memory use stays constant whatever its size. This blocks, so from a
+    coroutine it should be run in an executor.
+
+    :param conn: An :class:`http.client.HTTPSConnection`, as returned by
+        :meth:`juju.client.connection.Connection.https_connection`
+    :param progress: Optional ``callback(sent, total)``
+    :raises: :class:`JujuError` if the response status is not 200
+    """
+    start = fileobj.tell()
+    size = fileobj.seek(0, os.SEEK_END) - start
+    fileobj.seek(start)
+    headers['Content-Sha384'] = file_digest(fileobj, 'sha384')
+    headers['Content-Length'] = size
+    fileobj.seek(start)
+
+    conn.blocksize = UPLOAD_CHUNK_SIZE
+    body = fileobj if progress is None else \
+        ProgressReader(fileobj, size, progress)
+    conn.request(method, url, body, headers)
+    response = conn.getresponse()
+    result = response.read().decode()
+    if not response.status == 200:
+        raise JujuError(result)
+    return result
+
+
 class IdQueue:
     """
     Wrapper around asyncio.Queue that maintains a separate queue for each ID.
@@ -118,6 +207,91 @@ class IdQueue:
             await queue.put(value)
 
 
+class FutureMap:
+    """
+    Maps request IDs to the futures that their replies resolve.
+
+    Any number of requests can be in flight at the same time, each costing
+    a single future. A request is registered before it is sent, so that a
+    reply arriving before anybody waits for it is kept until it is
+    collected. A reply for a request that is not registered, e.g. one that
+    was cancelled or timed out, is dropped.
+    """
+
+    def __init__(self):
+        self._futures = {}
+
+    def __len__(self):
+        return len(self._futures)
+
+    def __contains__(self, id):
+        return id in self._futures
+
+    def register(self, id):
+        """Create the future for ``id`` ahead of its reply.
+
+        A future already failed, e.g. by :meth:`fail_all` when the
+        connection dropped, is replaced, so that the request can be sent
+        again.
+        """
+        future = self._futures.get(id)
+        if future is not None and future.done() and (
+                future.cancelled() or future.exception() is not None):
+            future = None
+        if future is None:
+            self._futures[id] = jasyncio.get_running_loop().create_future()
+
+    async def get(self, id, timeout=None):
+        """Wait for the reply to the registered request ``id``.
+
+        If the reply is an exception, it is raised. If ``timeout`` seconds
+        pass first, asyncio.TimeoutError is raised and the request is
+        forgotten; the same happens if the caller is cancelled.
+        """
+        future = self._futures.get(id)
+        if future is None:
+            raise KeyError(id)
+        try:
+            return await jasyncio.wait_for(future, timeout)
+        finally:
+            self.discard(id)
+
+    def discard(self, id):
+        """Forget about ``id``, dropping its reply if it hasn't arrived."""
+        future = self._futures.pop(id, None)
+        if future is None:
+            return
+        if not future.done():
+            future.cancel()
+        elif not future.cancelled():
+            # mark a reply nobody waited for as retrieved, so that asyncio
+            # doesn't log it
+            future.exception()
+
+    def resolve(self, id, value):
+        """Hand ``value`` to whoever waits (or will wait) for ``id``.
+
+        Nothing happens if ``id`` is not registered.
+        """
+        future = self._futures.get(id)
+        if future is None or future.done():
+            return
+        if isinstance(value, Exception):
+            future.set_exception(value)
+        else:
+            future.set_result(value)
+
+    def fail_all(self, exception):
+        """Raise ``exception`` in every request that is still waiting.
+
+        The requests stay registered until collected or discarded, so that
+        those yet to wait for their reply get the exception too.
+        """
+        for future in self._futures.values():
+            if not future.done():
+                future.set_exception(exception)
+
+
 async def block_until(*conditions, timeout=None, wait_period=0.5):
     """Return only after all conditions are true.
     If a timeout occurs, it cancels the task and raises
@@ -0,0 +1,1015 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+"""A local stand-in for a Juju controller, to run load and performance
+tests without a live one.
+
+:class:`FakeController` serves the Juju API over a TLS websocket on
+127.0.0.1. It advertises the client facade versions found in
+``juju/client/schemas-juju-*.json`` and answers requests for one
+:class:`SyntheticModel`::
+
+    async with FakeController(SyntheticModel(applications=500, units=40)) as controller:
+        model = Model()
+        await model.connect(**controller.connect_params())
+        await model.wait_for_idle(idle_period=0)
+
+Login, the AllWatcher, FullStatus, model info and config, and the usual
+Application, Charms and Action calls are implemented against the synthetic
+model, and change it the way a controller would: deploying an application
+adds its units and machines, actions complete after ``action_duration``,
+and every change is sent to the AllWatchers as a delta. Any other request
+that the schemas know about gets an empty reply shaped like its result, and
+the rest get the "not implemented" error a controller would return. Tests
+can replace or add handlers in :attr:`FakeController.handlers`.
+
+Latency and bandwidth can be injected, so that what is measured looks
+like talking to a remote controller. Charmhub itself is not faked: code
+paths that query it over HTTP, such as :meth:`juju.model.Model.deploy` of a
+Charmhub charm, need to go through the facades directly.
+"""
+
+import datetime
+import glob
+import inspect
+import itertools
+import json
+import logging
+import os
+import re
+import ssl
+import tempfile
+import uuid
+from collections import Counter, defaultdict
+
+import websockets
+import yaml
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from juju import jasyncio, tag
+
+log = logging.getLogger(__name__)
+
+SCHEMAS = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                       'juju', 'client', 'schemas-juju-*.json')
+SINCE = '2023-06-01T10:00:00Z'
+SERIES = 'jammy'
+BASE = {'name': 'ubuntu', 'channel': '22.04'}
+
+_MODEL_PATH = re.compile(r'^/model/([^/]+)/api$')
+
+
+def self_signed_cert():
+    """Return a (cert_pem, key_pem) pair valid for 127.0.0.1."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'juju-apiserver')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_pem = cert.public_bytes(serialization.Encoding.PEM).decode()
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    return cert_pem, key_pem
+
+
+def server_ssl_context(cert_pem, key_pem):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    with tempfile.NamedTemporaryFile('w') as cert_file, \
+            tempfile.NamedTemporaryFile('w') as key_file:
+        cert_file.write(cert_pem)
+        cert_file.flush()
+        key_file.write(key_pem)
+        key_file.flush()
+        context.load_cert_chain(cert_file.name, key_file.name)
+    return context
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _status(current, message='', version=''):
+    return {'current': current, 'message': message, 'since': SINCE, 'version': version}
+
+
+def _detailed_status(status):
+    return {
+        'status': status['current'], 'info': status['message'],
+        'since': status['since'], 'version': status['version'],
+        'kind': '', 'life': '', 'data': {}, 'err': None,
+    }
+
+
+def _charm_name(url):
+    name = url.split(':', 1)[-1].rsplit('/', 1)[-1]
+    base, _, revision = name.rpartition('-')
+    return base if base and revision.isdigit() else name
+
+
+def _unit_name(unit_tag):
+    name = tag.untag('unit-', unit_tag)
+    app, _, number = name.rpartition('-')
+    return '{}/{}'.format(app, number)
+
+
+class FakeError(Exception):
+    """Raised by handlers to reply with an error."""
+    def __init__(self, message, code=''):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+class Schemas:
+    """The facades described by the schema files, keyed by name and
+    version.
+
+    Only the facades available to users are kept.
+    """
+    def __init__(self, pattern=SCHEMAS):
+        self.facades = {}
+        for path in sorted(glob.glob(pattern)):
+            with open(path) as f:
+                for facade in json.load(f):
+                    available = set(facade['AvailableTo'])
+                    if available & {'model-user', 'controller-user'}:
+                        self.facades[facade['Name'], facade['Version']] = facade['Schema']
+        if not self.facades:
+            raise FileNotFoundError('no facade schemas match {}'.format(pattern))
+
+    def versions(self):
+        """Return the facades to advertise on login."""
+        versions = defaultdict(list)
+        for name, version in sorted(self.facades):
+            if name != 'Admin':
+                versions[name].append(version)
+        return [{'name': name, 'versions': v} for name, v in versions.items()]
+
+    def method(self, facade, version, request):
+        """Return the schema of a method, or raise the FakeError a
+        controller would reply with for an unknown one.
+
+        """
+        schema = self.facades.get((facade, version))
+        if schema is None:
+            if not any(name == facade for name, _ in self.facades):
+                raise FakeError('unknown object type "{}"'.format(facade),
+                                'not implemented')
+            raise FakeError('unknown version {} of interface "{}"'.format(
+                version, facade), 'not implemented')
+        method = schema['properties'].get(request)
+        if method is None:
+            raise FakeError('no such request - method {}({}).{} is not '
+                            'implemented'.format(facade, version, request),
+                            'not implemented')
+        return schema, method
+
+    def empty_result(self, schema, method):
+        """Return the smallest reply that is valid for ``method``."""
+        result = method['properties'].get('Result')
+        if result is None:
+            return {}
+        return self._empty(schema['definitions'], result, 0)
+
+    def _empty(self, definitions, spec, depth):
+        if '$ref' in spec:
+            spec = definitions[spec['$ref'].split('/')[-1]]
+        kind = spec.get('type')
+        if kind == 'object':
+            if depth > 4 or 'properties' not in spec:
+                return {}
+            return {
+                name: self._empty(definitions, spec['properties'][name], depth + 1)
+                for name in spec.get('required', [])
+            }
+        return {'array': [], 'string': '', 'integer': 0, 'number': 0,
+                'boolean': False}.get(kind)
+
+
+class _Watcher:
+    def __init__(self):
+        self.started = False
+        self.stopped = False
+        self.deltas = []
+        self.changed = jasyncio.Event()
+
+    def push(self, delta):
+        self.deltas.append(delta)
+        self.changed.set()
+
+    def stop(self):
+        self.stopped = True
+        self.changed.set()
+
+
+class SyntheticModel:
+    """The state of a model served by :class:`FakeController`.
+
+    :param int applications: How many applications to create, named app-0,
+        app-1, ...
+    :param int units: How many units each application starts with. Each
+        unit gets a machine of its own.
+    :param str name: The model name.
+    :param dict config: Extra model config.
+    """
+    def __init__(self, applications=0, units=1, name='fake', config=None):
+        self.name = name
+        self.uuid = str(uuid.uuid4())
+        self.controller_uuid = None
+        self.config = {
+            'name': name,
+            'uuid': self.uuid,
+            'type': 'fake',
+            'default-series': SERIES,
+            'default-base': 'ubuntu@22.04',
+            'charmhub-url': 'https://api.charmhub.io',
+        }
+        self.config.update(config or {})
+        self.applications = {}
+        self.units = {}
+        self.machines = {}
+        self.actions = {}
+        self._app_config = {}
+        self._watchers = []
+        self._machine_ids = itertools.count()
+        self._action_ids = itertools.count(1)
+        self._operation_ids = itertools.count(1)
+        for a in range(applications):
+            self.add_application('app-{}'.format(a), num_units=units)
+
+    # Changes
+
+    def _emit(self, entity, type_, data):
+        delta = [entity, type_, data]
+        for watcher in self._watchers:
+            watcher.push(delta)
+
+    def _put(self, entity, collection, key, data):
+        collection[key] = data
+        self._emit(entity, 'change', data)
+
+    def add_application(self, name, charm=None, num_units=1, config=None,
+                        subordinate=False):
+        """Add an application with ``num_units`` units."""
+        if name in self.applications:
+            raise FakeError('application already exists', 'already exists')
+        self._app_config[name] = dict(config or {})
+        self._put('application', self.applications, name, {
+            'model-uuid': self.uuid,
+            'name': name,
+            'exposed': False,
+            'charm-url': 'ch:amd64/{}/{}-1'.format(SERIES, charm or name),
+            'owner-tag': '',
+            'life': 'alive',
+            'min-units': 0,
+            'constraints': {},
+            'config': {},
+            'subordinate': subordinate,
+            'status': _status('active'),
+            'workload-version': '1.0',
+        })
+        return self.add_units(name, num_units)
+
+    def add_units(self, application, count=1):
+        """Add ``count`` units, each on a new machine, and return their
+        names.
+
+        """
+        app = self.applications.get(application)
+        if app is None:
+            raise FakeError('application "{}" not found'.format(application),
+                            'not found')
+        numbers = [int(n.rsplit('/', 1)[1]) for n in self.units
+                   if n.startswith(application + '/')]
+        first = max(numbers) + 1 if numbers else 0
+        names = []
+        for number in range(first, first + count):
+            machine_id = str(next(self._machine_ids))
+            address = '10.{}.{}.{}'.format(
+                int(machine_id) >> 16 & 255, int(machine_id) >> 8 & 255,
+                int(machine_id) & 255)
+            self._put('machine', self.machines, machine_id, {
+                'model-uuid': self.uuid,
+                'id': machine_id,
+                'instance-id': 'juju-{}-{}'.format(self.uuid[:6], machine_id),
+                'display-name': '',
+                'hostname': 'juju-{}'.format(machine_id),
+                'agent-status': _status('started', version='3.3.0'),
+                'instance-status': _status('running', 'Running'),
+                'life': 'alive',
+                'base': 'ubuntu@22.04',
+                'series': SERIES,
+                'container-type': '',
+                'jobs': ['JobHostUnits'],
+                'addresses': [{'value': address, 'type': 'ipv4',
+                               'scope': 'local-cloud'}],
+                'has-vote': False,
+                'wants-vote': False,
+                'hardware-characteristics': {'arch': 'amd64'},
+                'supported-containers': [],
+                'supported-containers-known': True,
+            })
+            name = '{}/{}'.format(application, number)
+            self._put('unit', self.units, name, {
+                'model-uuid': self.uuid,
+                'name': name,
+                'application': application,
+                'series': SERIES,
+                'charm-url': app['charm-url'],
+                'life': 'alive',
+                'public-address': address,
+                'private-address': address,
+                'machine-id': machine_id,
+                'ports': [],
+                'port-ranges': [],
+                'principal': '',
+                'subordinate': False,
+                'workload-status': _status('active', 'ready'),
+                'agent-status': _status('idle', version='3.3.0'),
+            })
+            names.append(name)
+        return names
+
+    def remove_unit(self, name):
+        """Remove a unit and its machine."""
+        unit = self.units.pop(name, None)
+        if unit is None:
+            raise FakeError('unit "{}" not found'.format(name), 'not found')
+        self._emit('unit', 'remove', unit)
+        machine = self.machines.pop(unit['machine-id'], None)
+        if machine is not None:
+            self._emit('machine', 'remove', machine)
+
+    def remove_application(self, name):
+        """Remove an application with all its units."""
+        if name not in self.applications:
+            raise FakeError('application "{}" not found'.format(name), 'not found')
+        for unit in [u for u, data in self.units.items()
+                     if data['application'] == name]:
+            self.remove_unit(unit)
+        self._app_config.pop(name, None)
+        self._emit('application', 'remove', self.applications.pop(name))
+
+    def set_unit_status(self, name, workload=None, agent=None, message=None):
+        """Change the workload and/or agent status of a unit."""
+        unit = dict(self.units[name])
+        if workload is not None or message is not None:
+            current = unit['workload-status']
+            unit['workload-status'] = dict(
+                current, since=_now(),
+                current=workload if workload is not None else current['current'],
+                message=message if message is not None else current['message'])
+        if agent is not None:
+            unit['agent-status'] = dict(unit['agent-status'], current=agent, since=_now())
+        self._put('unit', self.units, name, unit)
+
+    def set_application_config(self, name, config):
+        if name not in self.applications:
+            raise FakeError('application "{}" not found'.format(name), 'not found')
+        self._app_config[name].update(config)
+        self._put('application', self.applications, name,
+                  dict(self.applications[name]))
+
+    def enqueue_action(self, receiver, name, parameters=None):
+        """Queue an action on the unit ``receiver`` and return its id."""
+        if receiver not in self.units:
+            raise FakeError('unit "{}" not found'.format(receiver), 'not found')
+        action_id = str(next(self._action_ids))
+        self._put('action', self.actions, action_id, {
+            'model-uuid': self.uuid,
+            'id': action_id,
+            'receiver': receiver,
+            'name': name,
+            'parameters': parameters or {},
+            'status': 'pending',
+            'message': '',
+            'results': {},
+            'enqueued': _now(),
+            'started': '0001-01-01T00:00:00Z',
+            'completed': '0001-01-01T00:00:00Z',
+        })
+        return action_id
+
+    def finish_action(self, action_id, status='completed', results=None):
+        action = dict(self.actions[action_id], status=status,
+                      results=results or {'return-code': 0},
+                      started=_now(), completed=_now())
+        self._put('action', self.actions, action_id, action)
+
+    # Views
+
+    def watch(self):
+        watcher = _Watcher()
+        self._watchers.append(watcher)
+        return watcher
+
+    def unwatch(self, watcher):
+        watcher.stop()
+        if watcher in self._watchers:
+            self._watchers.remove(watcher)
+
+    def model_data(self):
+        return {
+            'model-uuid': self.uuid,
+            'name': self.name,
+            'life': 'alive',
+            'owner': 'admin',
+            'controller-uuid': self.controller_uuid or '',
+            'is-controller': False,
+            'config': dict(self.config),
+            'status': _status('available'),
+            'constraints': {},
+            'sla': {'level': 'unsupported', 'owner': ''},
+            'type': 'iaas',
+            'cloud': 'fake',
+            'cloud-region': 'fake-region',
+            'cloud-credential': '',
+        }
+
+    def snapshot(self):
+        """Return every entity as a change delta, like the first
+        AllWatcher.Next.
+
+        """
+        deltas = [['model', 'change', self.model_data()]]
+        deltas.extend(['application', 'change', d] for d in self.applications.values())
+        deltas.extend(['machine', 'change', d] for d in self.machines.values())
+        deltas.extend(['unit', 'change', d] for d in self.units.values())
+        deltas.extend(['action', 'change', d] for d in self.actions.values())
+        return deltas
+
+    def application_config(self, name):
+        return dict(self._app_config[name])
+
+    def full_status(self):
+        """Return the reply to Client.FullStatus."""
+        machines = {}
+        for machine_id, m in self.machines.items():
+            machines[machine_id] = {
+                'id': machine_id,
+                'agent-status': _detailed_status(m['agent-status']),
+                'instance-status': _detailed_status(m['instance-status']),
+                'modification-status': _detailed_status(_status('idle')),
+                'hostname': m['hostname'],
+                'dns-name': m['addresses'][0]['value'],
+                'ip-addresses': [m['addresses'][0]['value']],
+                'instance-id': m['instance-id'],
+                'display-name': '',
+                'base': BASE,
+                'containers': {},
+                'constraints': '',
+                'hardware': 'arch=amd64',
+                'jobs': m['jobs'],
+                'has-vote': False,
+                'wants-vote': False,
+                'network-interfaces': {},
+                'lxd-profiles': {},
+                'primary-controller-machine': False,
+            }
+        units = defaultdict(dict)
+        for name, u in self.units.items():
+            units[u['application']][name] = {
+                'agent-status': _detailed_status(u['agent-status']),
+                'workload-status': _detailed_status(u['workload-status']),
+                'workload-version': '1.0',
+                'machine': u['machine-id'],
+                'opened-ports': [],
+                'public-address': u['public-address'],
+                'address': u['private-address'],
+                'charm': '',
+                'subordinates': {},
+                'leader': name.endswith('/0'),
+                'provider-id': '',
+            }
+        applications = {}
+        for name, a in self.applications.items():
+            applications[name] = {
+                'charm': a['charm-url'],
+                'charm-channel': 'latest/stable',
+                'charm-version': '',
+                'charm-profile': '',
+                'charm-rev': 1,
+                'can-upgrade-to': '',
+                'base': BASE,
+                'exposed': a['exposed'],
+                'exposed-endpoints': {},
+                'life': '',
+                'relations': {},
+                'subordinate-to': [],
+                'units': units.get(name, {}),
+                'status': _detailed_status(a['status']),
+                'workload-version': a['workload-version'],
+                'endpoint-bindings': {},
+                'meter-statuses': {},
+                'int': 0,
+                'provider-id': '',
+                'public-address': '',
+                'err': None,
+            }
+        return {
+            'model': {
+                'name': self.name,
+                'type': 'iaas',
+                'cloud-tag': 'cloud-fake',
+                'region': 'fake-region',
+                'version': '3.3.0',
+                'available-version': '',
+                'model-status': _detailed_status(_status('available')),
+                'meter-status': {'color': '', 'message': ''},
+                'sla': 'unsupported',
+            },
+            'machines': machines,
+            'applications': applications,
+            'remote-applications': {},
+            'offers': {},
+            'relations': [],
+            'controller-timestamp': _now(),
+            'branches': {},
+        }
+
+    def model_info(self):
+        """Return the reply to ModelManager.ModelInfo for this model."""
+        return {
+            'name': self.name,
+            'uuid': self.uuid,
+            'type': 'iaas',
+            'controller-uuid': self.controller_uuid or '',
+            'is-controller': False,
+            'provider-type': 'fake',
+            'default-series': SERIES,
+            'default-base': 'ubuntu@22.04',
+            'cloud-tag': 'cloud-fake',
+            'cloud-region': 'fake-region',
+            'cloud-credential-tag': '',
+            'owner-tag': 'user-admin',
+            'life': 'alive',
+            'status': _detailed_status(_status('available')),
+            'users': [{'user': 'admin', 'display-name': '', 'access': 'admin'}],
+            'machines': [],
+            'secret-backends': [],
+            'sla': {'level': 'unsupported', 'owner': ''},
+            'agent-version': '3.3.0',
+        }
+
+
+class _Session:
+    """One websocket connection to the fake controller."""
+    def __init__(self, controller, ws, model_uuid):
+        self.controller = controller
+        self.ws = ws
+        self.model_uuid = model_uuid
+        self.logged_in = False
+        self.watchers = {}
+        self._send_lock = jasyncio.Lock()
+
+    async def send(self, text):
+        bandwidth = self.controller.bandwidth
+        if bandwidth:
+            # One frame at a time, like over a single link.
+            async with self._send_lock:
+                await jasyncio.sleep(len(text) / bandwidth)
+                await self.ws.send(text)
+        else:
+            await self.ws.send(text)
+
+    def close(self):
+        for watcher in self.watchers.values():
+            self.controller.model.unwatch(watcher)
+        self.watchers.clear()
+
+
+_handlers = {}
+
+
+def _handles(facade, request):
+    def register(method):
+        _handlers[facade, request] = method
+        return method
+    return register
+
+
+class FakeController:
+    """Serves a :class:`SyntheticModel` over the Juju API.
+
+    :param SyntheticModel model: The model to serve; an empty one by
+        default.
+    :param latency: Seconds to wait before replying to each request, or a
+        callable that returns them given the request.
+    :param bandwidth: How many bytes per second each connection can
+        receive, or None for no limit.
+    :param float action_duration: Seconds until an enqueued action
+        completes.
+    :param str username: The user to accept logins of.
+    :param str password: Its password.
+    """
+    def __init__(self, model=None, latency=0.0, bandwidth=None,
+                 action_duration=0.0, username='admin', password='secret',
+                 schemas=None):
+        self.model = model if model is not None else SyntheticModel()
+        self.uuid = str(uuid.uuid4())
+        self.model.controller_uuid = self.uuid
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.action_duration = action_duration
+        self.username = username
+        self.password = password
+        self.schemas = schemas or Schemas()
+        self.server_version = '3.3.0'
+        #: How many times each (facade, request) was called.
+        self.calls = Counter()
+        #: Request handlers, keyed by (facade, request). They are called
+        #: with the session and the request, and return the response.
+        self.handlers = {key: method.__get__(self)
+                         for key, method in _handlers.items()}
+        self.cacert = None
+        self.endpoint = None
+        self._server = None
+        self._sessions = set()
+        self._tasks = set()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def start(self):
+        cert_pem, key_pem = self_signed_cert()
+        self.cacert = cert_pem
+        self._server = await websockets.serve(
+            self._serve, '127.0.0.1', 0,
+            ssl=server_ssl_context(cert_pem, key_pem),
+            max_size=None)
+        port = self._server.sockets[0].getsockname()[1]
+        self.endpoint = '127.0.0.1:{}'.format(port)
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        for session in list(self._sessions):
+            session.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def connect_params(self, model=True):
+        """Return the keyword arguments for Model.connect, or with
+        ``model=False``, for Controller.connect.
+
+        """
+        params = {
+            'endpoint': self.endpoint,
+            'username': self.username,
+            'password': self.password,
+            'cacert': self.cacert,
+        }
+        if model:
+            params['uuid'] = self.model.uuid
+        return params
+
+    async def _serve(self, ws, path=None):
+        if path is None:
+            path = getattr(ws, 'path', None) or ws.request.path
+        match = _MODEL_PATH.match(path)
+        session = _Session(self, ws, match.group(1) if match else None)
+        self._sessions.add(session)
+        try:
+            async for message in ws:
+                task = jasyncio.ensure_future(self._reply(session, json.loads(message)))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            session.close()
+            self._sessions.discard(session)
+
+    async def _reply(self, session, msg):
+        latency = self.latency(msg) if callable(self.latency) else self.latency
+        if latency:
+            await jasyncio.sleep(latency)
+        reply = {'request-id': msg['request-id']}
+        try:
+            reply['response'] = await self._dispatch(session, msg)
+        except FakeError as e:
+            reply.update({'error': e.message, 'error-code': e.code, 'response': {}})
+        except Exception as e:
+            # A request the fake can't handle should fail, not hang.
+            log.exception('Fake controller: error handling %s.%s',
+                          msg.get('type'), msg.get('request'))
+            reply.update({'error': repr(e), 'error-code': '', 'response': {}})
+        try:
+            await session.send(json.dumps(reply))
+        except websockets.ConnectionClosed:
+            pass
+
+    async def _dispatch(self, session, msg):
+        facade, request = msg.get('type'), msg.get('request')
+        self.calls[facade, request] += 1
+        if facade != 'Admin' and not session.logged_in:
+            raise FakeError('not logged in', 'unauthorized access')
+        handler = self.handlers.get((facade, request))
+        if facade != 'Admin':
+            schema, method = self.schemas.method(facade, msg.get('version'), request)
+        if handler is None:
+            if facade == 'Admin':
+                raise FakeError('no such request - method Admin.{} is not '
+                                'implemented'.format(request), 'not implemented')
+            return self.schemas.empty_result(schema, method)
+        result = handler(session, msg)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    # Handlers
+
+    @_handles('Admin', 'Login')
+    def _login(self, session, msg):
+        params = msg.get('params') or {}
+        if params.get('auth-tag') != tag.user(self.username) or \
+                params.get('credentials') != self.password:
+            raise FakeError('invalid entity name or password', 'unauthorized access')
+        if session.model_uuid is not None and session.model_uuid != self.model.uuid:
+            raise FakeError('model "{}" not found'.format(session.model_uuid),
+                            'model not found')
+        session.logged_in = True
+        host, port = self.endpoint.rsplit(':', 1)
+        response = {
+            'server-version': self.server_version,
+            'facades': self.schemas.versions(),
+            'controller-tag': tag.controller(self.uuid),
+            'user-info': {
+                'display-name': '',
+                'identity': tag.user(self.username),
+                'controller-access': 'superuser',
+                'model-access': 'admin' if session.model_uuid else '',
+            },
+            'servers': [[{'value': host, 'port': int(port), 'type': 'ipv4',
+                          'scope': 'public'}]],
+            'public-dns-name': '',
+        }
+        if session.model_uuid is not None:
+            response['model-tag'] = tag.model(self.model.uuid)
+        return response
+
+    @_handles('Pinger', 'Ping')
+    def _ping(self, session, msg):
+        return {}
+
+    @_handles('Client', 'WatchAll')
+    def _watch_all(self, session, msg):
+        watcher_id = str(len(session.watchers) + 1)
+        session.watchers[watcher_id] = self.model.watch()
+        return {'watcher-id': watcher_id}
+
+    @_handles('AllWatcher', 'Next')
+    async def _all_watcher_next(self, session, msg):
+        watcher = session.watchers.get(msg.get('Id'))
+        if watcher is None or watcher.stopped:
+            raise FakeError('watcher was stopped', '')
+        if not watcher.started:
+            watcher.started = True
+            watcher.deltas.clear()
+            watcher.changed.clear()
+            return {'deltas': self.model.snapshot()}
+        await watcher.changed.wait()
+        if watcher.stopped:
+            raise FakeError('watcher was stopped', '')
+        deltas, watcher.deltas = watcher.deltas, []
+        watcher.changed.clear()
+        return {'deltas': deltas}
+
+    @_handles('AllWatcher', 'Stop')
+    def _all_watcher_stop(self, session, msg):
+        watcher = session.watchers.pop(msg.get('Id'), None)
+        if watcher is not None:
+            self.model.unwatch(watcher)
+        return {}
+
+    @_handles('Client', 'FullStatus')
+    def _full_status(self, session, msg):
+        return self.model.full_status()
+
+    @_handles('ModelConfig', 'ModelGet')
+    def _model_get(self, session, msg):
+        return {'config': {k: {'value': v, 'source': 'model'}
+                           for k, v in self.model.config.items()}}
+
+    @_handles('ModelConfig', 'GetModelConstraints')
+    def _model_constraints(self, session, msg):
+        return {'constraints': {}}
+
+    @_handles('ModelManager', 'ModelInfo')
+    def _model_info(self, session, msg):
+        results = []
+        for entity in msg['params'].get('entities') or []:
+            if entity['tag'] == tag.model(self.model.uuid):
+                results.append({'result': self.model.model_info()})
+            else:
+                results.append({'error': {'message': 'model not found',
+                                          'code': 'not found'}})
+        return {'results': results}
+
+    @_handles('ModelManager', 'ListModelSummaries')
+    def _list_model_summaries(self, session, msg):
+        info = self.model.model_info()
+        return {'results': [{'result': dict(
+            info, **{'user-access': 'admin', 'last-connection': None,
+                     'counts': [{'entity': 'machines', 'count': len(self.model.machines)},
+                                {'entity': 'units', 'count': len(self.model.units)}]})}]}
+
+    @_handles('Charms', 'ResolveCharms')
+    def _resolve_charms(self, session, msg):
+        results = []
+        for item in msg['params']['resolve']:
+            name = _charm_name(item['reference'])
+            origin = dict(item.get('charm-origin') or {}, source='charm-hub',
+                          id='fake-' + name, hash='', revision=1,
+                          risk='stable', architecture='amd64',
+                          base=BASE)
+            results.append({
+                'url': 'ch:amd64/{}/{}-1'.format(SERIES, name),
+                'charm-origin': origin,
+                'supported-bases': [BASE],
+            })
+        return {'Results': results}
+
+    @_handles('Charms', 'AddCharm')
+    def _add_charm(self, session, msg):
+        return {'charm-origin': msg['params']['charm-origin']}
+
+    def _deploy_one(self, name, charm, num_units, config_yaml):
+        config = (yaml.safe_load(config_yaml) or {}).get(name, {}) if config_yaml else {}
+        self.model.add_application(name, charm=_charm_name(charm), num_units=num_units,
+                                   config=config)
+
+    @_handles('Application', 'Deploy')
+    def _app_deploy(self, session, msg):
+        results = []
+        for app in msg['params']['applications']:
+            try:
+                self._deploy_one(app['application'], app['charm-url'],
+                                 app.get('num-units') or 0, app.get('config-yaml'))
+                results.append({})
+            except FakeError as e:
+                results.append({'error': {'message': e.message, 'code': e.code}})
+        return {'results': results}
+
+    @_handles('Application', 'DeployFromRepository')
+    def _app_deploy_from_repository(self, session, msg):
+        results = []
+        for app in msg['params']['Args']:
+            name = app['ApplicationName'] or app['CharmName']
+            errors = []
+            try:
+                self._deploy_one(name, app['CharmName'],
+                                 app.get('num-units') or 0, app.get('ConfigYAML'))
+            except FakeError as e:
+                errors.append({'message': e.message, 'code': e.code})
+            results.append({
+                'Errors': errors,
+                'Info': {'architecture': 'amd64', 'base': BASE,
+                         'channel': 'stable', 'name': name, 'revision': 1},
+                'PendingResourceUploads': [],
+            })
+        return {'Results': results}
+
+    @_handles('Application', 'AddUnits')
+    def _app_add_units(self, session, msg):
+        params = msg['params']
+        return {'units': self.model.add_units(params['application'],
+                                              params['num-units'])}
+
+    @_handles('Application', 'DestroyUnit')
+    def _app_destroy_unit(self, session, msg):
+        results = []
+        for unit in msg['params']['units']:
+            try:
+                self.model.remove_unit(_unit_name(unit['unit-tag']))
+                results.append({'info': {}})
+            except FakeError as e:
+                results.append({'error': {'message': e.message, 'code': e.code}})
+        return {'results': results}
+
+    @_handles('Application', 'DestroyApplication')
+    def _app_destroy(self, session, msg):
+        results = []
+        for app in msg['params']['applications']:
+            try:
+                self.model.remove_application(
+                    tag.untag('application-', app['application-tag']))
+                results.append({'info': {}})
+            except FakeError as e:
+                results.append({'error': {'message': e.message, 'code': e.code}})
+        return {'results': results}
+
+    @_handles('Application', 'Get')
+    def _app_get(self, session, msg):
+        name = msg['params']['application']
+        if name not in self.model.applications:
+            raise FakeError('application "{}" not found'.format(name), 'not found')
+        app = self.model.applications[name]
+        return {
+            'application': name,
+            'charm': _charm_name(app['charm-url']),
+            'config': {k: {'value': v, 'source': 'user'}
+                       for k, v in self.model.application_config(name).items()},
+            'application-config': {},
+            'constraints': {},
+            'base': BASE,
+            'channel': 'latest/stable',
+            'endpoint-bindings': {},
+        }
+
+    @_handles('Application', 'SetConfigs')
+    def _app_set_configs(self, session, msg):
+        results = []
+        for arg in msg['params']['Args']:
+            try:
+                self.model.set_application_config(arg['application'],
+                                                  arg.get('config') or {})
+                results.append({})
+            except FakeError as e:
+                results.append({'error': {'message': e.message, 'code': e.code}})
+        return {'results': results}
+
+    def _enqueue(self, actions):
+        """Queue ``actions``, a list of (unit name, action name,
+        parameters), and return them as EnqueuedActions.
+
+        """
+        operation = 'operation-{}'.format(next(self.model._operation_ids))
+        results = []
+        loop = jasyncio.get_running_loop()
+        for receiver, name, parameters in actions:
+            try:
+                action_id = self.model.enqueue_action(receiver, name, parameters)
+            except FakeError as e:
+                results.append({'error': {'message': e.message, 'code': e.code}})
+                continue
+            loop.call_later(self.action_duration, self.model.finish_action, action_id)
+            results.append({
+                'action': {'tag': tag.action(action_id),
+                           'receiver': tag.unit(receiver),
+                           'name': name,
+                           'parameters': parameters or {}},
+                'status': 'pending',
+                'enqueued': self.model.actions[action_id]['enqueued'],
+            })
+        return {'operation': operation, 'actions': results}
+
+    @_handles('Action', 'EnqueueOperation')
+    def _enqueue_operation(self, session, msg):
+        return self._enqueue([
+            (_unit_name(action['receiver']), action['name'], action.get('parameters'))
+            for action in msg['params'].get('actions') or []])
+
+    @_handles('Action', 'Run')
+    def _run(self, session, msg):
+        params = msg['params']
+        units = list(params.get('units') or [])
+        for application in params.get('applications') or []:
+            units.extend(sorted(name for name, unit in self.model.units.items()
+                                if unit['application'] == application))
+        parameters = {'command': params['commands'], 'timeout': params.get('timeout') or 0}
+        return self._enqueue([(unit, 'juju-exec', parameters) for unit in units])
+
+    @_handles('Action', 'Actions')
+    def _actions(self, session, msg):
+        results = []
+        for entity in msg['params'].get('entities') or []:
+            action = self.model.actions.get(tag.untag('action-', entity['tag']))
+            if action is None:
+                results.append({'error': {'message': 'action not found',
+                                          'code': 'not found'}})
+                continue
+            results.append({
+                'action': {'tag': tag.action(action['id']),
+                           'receiver': tag.unit(action['receiver']),
+                           'name': action['name'],
+                           'parameters': action['parameters']},
+                'status': action['status'],
+                'message': action['message'],
+                'output': action['results'],
+                'enqueued': action['enqueued'],
+                'started': action['started'],
+                'completed': action['completed'],
+            })
+        return {'results': results}
@@ -56,39 +56,36 @@ async def test_info_not_found():
 
 
 @base.bootstrapped
-@pytest.mark.skip('CharmHub facade no longer exists')
 async def test_find():
     async with base.CleanModel() as model:
         result = await model.charmhub.find("kube")
 
-        assert len(result.result) > 0
-        for resp in result.result:
-            assert resp.name != ""
-            assert resp.type_ in ["charm", "bundle"]
+        assert len(result['results']) > 0
+        for resp in result['results']:
+            assert resp['name'] != ""
+            assert resp['type'] in ["charm", "bundle"]
 
 
 @base.bootstrapped
-@pytest.mark.skip('CharmHub facade no longer exists')
 async def test_find_bundles():
     async with base.CleanModel() as model:
         result = await model.charmhub.find("kube", charm_type="bundle")
 
-        assert len(result.result) > 0
-        for resp in result.result:
-            assert resp.name != ""
-            assert resp.type_ in ["bundle"]
+        assert len(result['results']) > 0
+        for resp in result['results']:
+            assert resp['name'] != ""
+            assert resp['type'] in ["bundle"]
 
 
 @base.bootstrapped
-@pytest.mark.skip('CharmHub facade no longer exists')
 async def test_find_all():
     async with base.CleanModel() as model:
         result = await model.charmhub.find("")
 
-        assert len(result.result) > 0
-        for resp in result.result:
-            assert resp.name != ""
-            assert resp.type_ in ["charm", "bundle"]
+        assert len(result['results']) > 0
+        for resp in result['results']:
+            assert resp['name'] != ""
+            assert resp['type'] in ["charm", "bundle"]
 
 
 @base.bootstrapped
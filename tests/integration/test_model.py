@@ -761,10 +761,10 @@ async def test_attach_resource():
         assert app.units[0].agent_status == 'idle'
 
         with open(str(charm_path / 'test.file')) as f:
-            app.attach_resource('file-res', 'test.file', f)
+            await app.attach_resource('file-res', 'test.file', f)
 
         with open(str(charm_path / 'test.file'), 'rb') as f:
-            app.attach_resource('file-res', 'test.file', f)
+            await app.attach_resource('file-res', 'test.file', f)
 
 
 @base.bootstrapped
@@ -0,0 +1,160 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+import pytest
+
+from juju import jasyncio
+from juju.errors import JujuError
+from juju.model import Model
+
+from ..fake_controller import FakeController, SyntheticModel
+
+
+@pytest.fixture
+async def controller():
+    async with FakeController(SyntheticModel(applications=3, units=4)) as controller:
+        yield controller
+
+
+@pytest.fixture
+async def model(controller):
+    model = Model()
+    await model.connect(**controller.connect_params())
+    try:
+        yield model
+    finally:
+        await model.disconnect()
+
+
+async def test_run_on(controller, model):
+    actions = [action async for action in model.run_on(
+        'hostname', units=['app-0/0'], applications=['app-1', 'app-2'])]
+    assert sorted(a.data['receiver'] for a in actions) == \
+        ['app-0/0'] + ['app-{}/{}'.format(a, u) for a in (1, 2) for u in range(4)]
+    assert all(a.status == 'completed' for a in actions)
+    assert all(a.results == {'return-code': 0} for a in actions)
+    assert controller.calls['Action', 'Run'] == 1
+
+
+async def test_run_on_yields_in_completion_order(controller, model):
+    controller.action_duration = 3600  # finished by the test instead
+    actions = model.run_on('hostname', units=['app-0/0', 'app-0/1'])
+    first = jasyncio.ensure_future(actions.__anext__())
+    await jasyncio.sleep(0.1)
+    assert not first.done()
+    second_id = next(i for i, a in controller.model.actions.items()
+                     if a['receiver'] == 'app-0/1')
+    controller.model.finish_action(second_id, 'failed', {'return-code': 1})
+    action = await jasyncio.wait_for(first, 5)
+    assert action.id == second_id
+    assert action.status == 'failed'
+    assert action.results == {'return-code': 1}
+    await actions.aclose()
+
+
+async def test_run_on_max_concurrency(controller, model, monkeypatch):
+    controller.action_duration = 3600  # finished by the test instead
+    waves = []
+    resolve = model._action_tracker._resolve
+
+    async def _resolve(action_ids):
+        waves.append(len(action_ids))
+        await resolve(action_ids)
+
+    monkeypatch.setattr(model._action_tracker, '_resolve', _resolve)
+    run = model.run_on('hostname', applications=['app-1', 'app-2'], max_concurrency=3)
+    first = jasyncio.ensure_future(run.__anext__())
+    await model.block_until(lambda: len(model._action_tracker._waiters) == 8)
+    for action_id in list(controller.model.actions):
+        controller.model.finish_action(action_id)
+    actions = [await first] + [a async for a in run]
+    assert len(actions) == 8
+    assert waves and max(waves) <= 3
+
+
+async def test_run_on_errors(controller, model):
+    with pytest.raises(JujuError, match='not found'):
+        async for action in model.run_on('hostname', units=['app-0/0', 'nope/0']):
+            pass
+
+
+async def test_action_tracker_already_finished(controller, model):
+    action_id = controller.model.enqueue_action('app-0/0', 'backup')
+    controller.model.finish_action(action_id)
+    await model.block_until(
+        lambda: action_id in model.state._live_entity_map('action') and
+        model.state._live_entity_map('action')[action_id].data['status'] == 'completed')
+    result = await model._action_tracker.result(action_id)
+    assert result.status == 'completed'
+    assert result.output == {'return-code': 0}
+
+
+async def test_action_tracker_disconnect(controller, model):
+    action_id = controller.model.enqueue_action('app-0/0', 'backup')
+    waiter = jasyncio.ensure_future(model._action_tracker.result(action_id))
+    await jasyncio.sleep(0)
+    await model.disconnect()
+    with pytest.raises(JujuError, match='disconnected'):
+        await waiter
+
+
+async def test_action_wait(controller, model):
+    units = list(model.units.values())
+    actions = await jasyncio.gather(*(u.run_action('backup') for u in units))
+    controller.calls.clear()
+    await jasyncio.gather(*(a.wait() for a in actions))
+    assert all(a.status == 'completed' for a in actions)
+    assert all(a.results == {'return-code': 0} for a in actions)
+    # The watcher reports the actions finishing: no polling, and their
+    # results are fetched in waves rather than one by one
+    assert 1 <= controller.calls['Action', 'Actions'] < len(actions)
+
+
+async def test_action_wait_timeout(controller, model):
+    controller.action_duration = 3600
+    action = await model.units['app-0/0'].run_action('backup')
+    with pytest.raises(jasyncio.TimeoutError):
+        await model.get_action_output(action.id, wait=0.1)
+    assert not model._action_tracker._waiters
+    controller.model.finish_action(action.id)
+    assert await model.get_action_output(action.id, wait=5) == {'return-code': 0}
+
+
+async def test_action_tracker_polls_without_deltas(controller, model, monkeypatch):
+    monkeypatch.setattr(model._action_tracker, 'on_deltas', lambda deltas: None)
+    monkeypatch.setattr(model._action_tracker, 'POLL_MIN', 0.01)
+    action_id = controller.model.enqueue_action('app-0/0', 'backup')
+    result = jasyncio.ensure_future(model._action_tracker.result(action_id))
+    await jasyncio.sleep(0.05)
+    assert not result.done()
+    controller.model.finish_action(action_id)
+    assert (await jasyncio.wait_for(result, 5)).status == 'completed'
+
+
+async def test_action_tracker_unknown_action(controller, model, monkeypatch):
+    monkeypatch.setattr(model._action_tracker, 'POLL_MIN', 0.01)
+    controller.action_duration = 3600
+    action_id = controller.model.enqueue_action('app-0/0', 'backup')
+    known = jasyncio.ensure_future(model._action_tracker.result(action_id))
+    with pytest.raises(JujuError, match='not found'):
+        await jasyncio.wait_for(model._action_tracker.result('12345'), 5)
+    assert not known.done()
+    controller.model.finish_action(action_id)
+    assert (await jasyncio.wait_for(known, 5)).status == 'completed'
+
+
+async def test_action_tracker_bisects_failed_batch(controller, model):
+    action_ids = [controller.model.enqueue_action('app-0/0', 'backup') for _ in range(31)]
+    for action_id in action_ids:
+        controller.model.finish_action(action_id)
+    waiters = [jasyncio.ensure_future(model._action_tracker.result(i))
+               for i in action_ids + ['12345']]
+    await jasyncio.sleep(0)
+    controller.calls.clear()
+    await model._action_tracker._resolve(action_ids + ['12345'])
+    # one failing action costs a request per halving, not one per action
+    assert controller.calls['Action', 'Actions'] < len(action_ids)
+    results = await jasyncio.gather(*waiters[:-1])
+    assert all(r.status == 'completed' for r in results)
+    with pytest.raises(JujuError, match='not found'):
+        await waiters[-1]
@@ -1,6 +1,8 @@
 # Copyright 2023 Canonical Ltd.
 # Licensed under the Apache V2, see LICENCE file for details.
 
+import io
+import threading
 import unittest
 import mock
 import asyncio
@@ -180,6 +182,30 @@ class TestRefreshApplication(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(ValueError):
             await app.refresh(switch="charm1", path="/path/to/charm2")
 
+    @mock.patch("juju.model.Model.connection")
+    async def test_local_refresh_unchanged(self, mock_conn):
+        model = Model()
+        model.add_local_charm_dir = mock.AsyncMock(return_value='local:focal/app-3')
+        app = Application(entity_id="app", model=model)
+        app.name = "app"
+        app._facade = mock.MagicMock()
+        app._facade().SetCharm = mock.AsyncMock()
+        app.get_config = mock.AsyncMock(return_value={})
+        app.get_series = mock.AsyncMock(return_value='focal')
+        data = {'charm-url': 'local:focal/app-3'}
+        with mock.patch.object(Application, 'data', data):
+            await app.local_refresh(client.CharmOrigin(), path='/path/to/app')
+            app._facade().SetCharm.assert_not_called()
+
+            # a changed charm is uploaded as a new revision
+            model.add_local_charm_dir.return_value = 'local:focal/app-4'
+            model.block_until = mock.AsyncMock()
+            with mock.patch('juju.utils.get_local_charm_metadata', return_value={}):
+                await app.local_refresh(client.CharmOrigin(), path='/path/to/app')
+            app._facade().SetCharm.assert_called_once()
+            self.assertEqual(
+                app._facade().SetCharm.call_args.kwargs['charm_url'], 'local:focal/app-4')
+
     def test_refresh_origin(self):
         current_origin = client.CharmOrigin(
             source=str(Source.CHARM_HUB),
@@ -230,3 +256,23 @@ class TestRefreshApplication(unittest.IsolatedAsyncioTestCase):
         origin = _refresh_origin(current_origin, None, None)
         self.assertIsNone(origin.id_)
         self.assertIsNone(origin.hash_)
+
+
+class TestAttachResource(unittest.IsolatedAsyncioTestCase):
+    @mock.patch("juju.model.Model.connection")
+    async def test_attach_resource_in_executor(self, mock_conn):
+        mock_conn.return_value.https_connection.return_value = (
+            mock.Mock(), {}, '/model/uuid')
+        app = Application(entity_id="app-id", model=Model())
+        app.name = "panther"
+
+        threads = []
+
+        def upload_file(conn, method, url, fileobj, headers):
+            threads.append(threading.current_thread())
+            self.assertEqual(fileobj.read(), b'data')
+
+        with mock.patch('juju.utils.upload_file', upload_file):
+            await app.attach_resource('res', 'res.txt', io.StringIO('data'))
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
@@ -1,8 +1,12 @@
 # Copyright 2023 Canonical Ltd.
 # Licensed under the Apache V2, see LICENCE file for details.
 
+import hashlib
+import io
 from pathlib import Path
+import tempfile
 import unittest
+import zipfile
 from unittest import mock
 from mock import patch, Mock, ANY
 
@@ -14,6 +18,7 @@ from juju.bundle import (
     AddMachineChange,
     AddRelationChange,
     AddUnitChange,
+    BundleArchiveCache,
     BundleHandler,
     ChangeSet,
     ConsumeOfferChange,
@@ -22,8 +27,10 @@ from juju.bundle import (
     ScaleChange,
     SetAnnotationsChange,
 )
-from juju import charmhub
+from juju import charmhub, jasyncio
 from juju.client import client
+from juju.errors import JujuError
+from juju.url import URL
 from toposort import CircularDependencyError
 
 
@@ -67,6 +74,90 @@ class TestChangeSet(unittest.TestCase):
         self.assertRaises(CircularDependencyError, changeset.sorted)
 
 
+class TestChangeSetRun(unittest.IsolatedAsyncioTestCase):
+
+    def _changes(self):
+        return [
+            client.BundleChange(id_="addCharm-0", requires=[]),
+            client.BundleChange(id_="addCharm-1", requires=[]),
+            client.BundleChange(id_="addMachine-2", requires=[]),
+            client.BundleChange(id_="deploy-3", requires=["addCharm-0"]),
+            client.BundleChange(id_="deploy-4", requires=["addCharm-1"]),
+            client.BundleChange(id_="addUnit-5", requires=["deploy-3", "addMachine-2"]),
+            client.BundleChange(id_="addRelation-6", requires=["deploy-3", "deploy-4"]),
+        ]
+
+    async def test_runs_independent_changes_concurrently(self):
+        changes = self._changes()
+        done = []
+        running = 0
+        max_running = 0
+
+        async def apply(change):
+            nonlocal running, max_running
+            for required in change.requires:
+                assert required in done, (change.id_, required)
+            running += 1
+            max_running = max(max_running, running)
+            await jasyncio.sleep(0.01)
+            running -= 1
+            done.append(change.id_)
+
+        await ChangeSet(changes).run(apply, max_concurrency=2)
+        self.assertEqual(sorted(done), sorted(c.id_ for c in changes))
+        self.assertEqual(max_running, 2)
+
+    async def test_limit_of_one_keeps_sorted_order(self):
+        changeset = ChangeSet(self._changes())
+        done = []
+
+        async def apply(change):
+            await jasyncio.sleep(0)
+            done.append(change)
+
+        await changeset.run(apply, max_concurrency=1)
+        self.assertEqual(done, changeset.sorted())
+
+    async def test_failure_stops_scheduling(self):
+        done = []
+
+        async def apply(change):
+            if change.id_ == "deploy-3":
+                raise JujuError("boom")
+            await jasyncio.sleep(0)
+            done.append(change.id_)
+
+        with self.assertRaises(JujuError):
+            await ChangeSet(self._changes()).run(apply, max_concurrency=1)
+        self.assertEqual(done, ["addCharm-0", "addCharm-1", "addMachine-2"])
+
+    async def test_execute_plan_resolves_references(self):
+        handler = BundleHandler.__new__(BundleHandler)
+        handler.references = {}
+        handler.timings = {}
+        handler.max_concurrent_changes = 4
+        handler._resolve_charms = mock.AsyncMock()
+
+        class Change:
+            def __init__(self, change_id, requires, params):
+                self.change_id = change_id
+                self.params = params
+
+            async def run(self, context):
+                await jasyncio.sleep(0)
+                return [context.resolve(p) for p in self.params]
+
+        handler.change_types = {"step": Change}
+        handler.plan = mock.Mock(changes=[
+            client.BundleChange(id_="a", method="step", requires=[], args=["x"]),
+            client.BundleChange(id_="b", method="step", requires=["a"], args=["$a"]),
+            client.BundleChange(id_="c", method="step", requires=["a", "b"], args=["$a", "$b"]),
+        ])
+        await handler.execute_plan()
+        self.assertEqual(handler.references["c"], [["x"], [["x"]]])
+        self.assertEqual(set(handler.timings), {"a", "b", "c"})
+
+
 class TestAddApplicationChange(unittest.TestCase):
 
     def test_method(self):
@@ -346,11 +437,11 @@ class TestAddCharmChangeRun:
 
         model = mock.Mock()
         model._add_charm = mock.AsyncMock(return_value=None)
-        model._resolve_architecture = mock.AsyncMock(return_value=None)
         model._resolve_charm = mock.AsyncMock(return_value=("entity_id",
                                                             None))
 
         context = mock.Mock()
+        context.resolve_architecture = mock.AsyncMock(return_value=None)
 
         context.charms_facade = charms_facade
         context.origins = {}
@@ -893,3 +984,131 @@ class TestBundleHandler:
             mc_3 in m_add_local_charm_dir_calls
 
         assert bundle["applications"]["oci-image-charm"]["resources"]["oci-image"] == "id"
+
+    async def test_resolve_charms_batched(self):
+        connection_mock = mock.Mock()
+        connection_mock.facades = {
+            "Bundle": 17,
+            "Client": 17,
+            "Application": 17,
+            "Annotations": 17,
+            "MachineManager": 17,
+            "Charms": 7,
+        }
+        deployed = mock.Mock(charm_url="ch:amd64/focal/db-1")
+        deployed.get_constraints = mock.AsyncMock(return_value={"arch": "arm64"})
+        model = mock.Mock()
+        model.units = {}
+        model.applications = {"db": deployed}
+        model.connection.return_value = connection_mock
+        model._resolve_architecture = mock.AsyncMock(return_value="amd64")
+
+        async def resolve_charms(charms):
+            return [(URL.parse("ch:{}/jammy/{}-3".format(origin.architecture, url.name)), origin)
+                    for url, origin in charms]
+        model._resolve_charms = mock.AsyncMock(side_effect=resolve_charms)
+
+        handler = BundleHandler(model)
+        handler.bundle = {"applications": {
+            "web": {"charm": "ch:web", "channel": "edge"},
+            "cache": {"charm": "ch:cache"},
+            "db": {"charm": "ch:db"},
+            "local": {"charm": "./local"},
+        }}
+        await handler._resolve_charms()
+
+        model._resolve_charms.assert_awaited_once()
+        model._resolve_architecture.assert_awaited_once_with()
+        specs = handler.applications_specs
+        assert specs["web"]["charm"] == "ch:amd64/jammy/web-3"
+        assert specs["cache"]["charm"] == "ch:amd64/jammy/cache-3"
+        assert specs["db"]["charm"] == "ch:arm64/jammy/db-3"
+        assert specs["local"]["charm"] == "./local"
+        assert handler.origins["ch:amd64/jammy/web-3"]["edge"].risk == "edge"
+
+
+class TestDownloadBundle(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_dir = Path(self.tmp.name)
+        patcher = patch('juju.bundle.BundleArchiveCache',
+                        side_effect=lambda: BundleArchiveCache(self.cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('bundle.yaml', 'applications: {}\n')
+        self.archive = archive.getvalue()
+        self.session = mock.Mock()
+        self.session.get.return_value = mock.Mock(
+            iter_content=mock.Mock(side_effect=lambda size: iter([self.archive])))
+        patcher = patch('juju.charmhub.default_client',
+                        return_value=mock.Mock(session=self.session))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.handler = BundleHandler.__new__(BundleHandler)
+        self.handler.model = mock.Mock()
+        self.handler.model.connection().is_using_old_client = False
+        self.handler.charms_facade = mock.Mock()
+        self.handler.charms_facade.GetDownloadInfos = mock.AsyncMock(side_effect=self._download_infos)
+
+    async def _download_infos(self, entities):
+        origin = entities[0]['charm-origin']
+        return mock.Mock(results=[mock.Mock(
+            url='https://api.charmhub.io/api/v1/bundles/download/x.bundle',
+            charm_origin=client.CharmOrigin(source='charm-hub', id_=origin['id'] or None,
+                                            revision=origin['revision'],
+                                            hash_=hashlib.sha256(self.archive).hexdigest()))])
+
+    def _origin(self, **kwargs):
+        return client.CharmOrigin(source='charm-hub', type_='bundle', risk='stable', **kwargs)
+
+    async def test_same_revision_is_not_downloaded_again(self):
+        url = URL.parse('ch:kubeflow')
+        origin = self._origin(id_='abc', revision=3)
+        self.assertEqual(await self.handler._download_bundle(url, origin), b'applications: {}\n')
+        self.session.get.assert_called_once_with(ANY, stream=True, timeout=60)
+
+        self.assertEqual(await self.handler._download_bundle(url, origin), b'applications: {}\n')
+        self.handler.charms_facade.GetDownloadInfos.assert_awaited_once()
+        self.session.get.assert_called_once()
+
+        # another revision
+        await self.handler._download_bundle(url, self._origin(id_='abc', revision=4))
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(len(list(self.cache_dir.glob('*.bundle'))), 2)
+
+    async def test_invalid_archive_is_downloaded_again(self):
+        url, origin = URL.parse('ch:kubeflow'), self._origin(id_='abc', revision=3)
+        await self.handler._download_bundle(url, origin)
+        [archive] = self.cache_dir.glob('*.bundle')
+        archive.write_bytes(b'truncated')
+        self.assertEqual(await self.handler._download_bundle(url, origin), b'applications: {}\n')
+        self.assertEqual(self.session.get.call_count, 2)
+
+    async def test_unidentified_origin_is_not_cached(self):
+        url, origin = URL.parse('ch:kubeflow'), self._origin()
+        await self.handler._download_bundle(url, origin)
+        await self.handler._download_bundle(url, origin)
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    async def test_unidentified_origin_invalid_archive(self):
+        self.archive = b'truncated'
+        with self.assertRaisesRegex(JujuError, 'invalid bundle archive'):
+            await self.handler._download_bundle(URL.parse('ch:kubeflow'), self._origin())
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    async def test_archive_not_matching_hash_is_downloaded_again(self):
+        url = URL.parse('ch:kubeflow')
+        origin = self._origin(id_='abc', revision=3,
+                              hash_=hashlib.sha256(self.archive).hexdigest())
+        await self.handler._download_bundle(url, origin)
+        [archive] = self.cache_dir.glob('*.bundle')
+        with zipfile.ZipFile(str(archive), 'w') as zf:
+            zf.writestr('bundle.yaml', 'applications: {stale: {}}\n')
+        self.assertEqual(await self.handler._download_bundle(url, origin), b'applications: {}\n')
+        self.assertEqual(self.session.get.call_count, 2)
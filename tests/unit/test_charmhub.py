@@ -0,0 +1,208 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from juju.charmhub import CharmHub, CharmHubClient
+from juju.client import client
+from juju.errors import JujuError
+
+
+def _response(status_code, body=None, headers=None):
+    return mock.Mock(status_code=status_code, headers=headers or {},
+                     text=json.dumps(body) if body is not None else '')
+
+
+class TestCharmHubClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.http = CharmHubClient(cache_dir=self.tmp.name, ttl=60, backoff=0.001)
+        self.http.session = mock.Mock()
+        self.url = 'https://api.charmhub.io/v2/charms/info/ubuntu'
+
+    async def test_cached_within_ttl(self):
+        self.http.session.get.return_value = _response(200, {'name': 'ubuntu'})
+        self.assertEqual(await self.http.get(self.url), {'name': 'ubuntu'})
+        self.assertEqual(await self.http.get(self.url), {'name': 'ubuntu'})
+        self.http.session.get.assert_called_once()
+
+    async def test_revalidated_after_ttl(self):
+        self.http.ttl = 0
+        self.http.session.get.return_value = _response(
+            200, {'name': 'ubuntu'},
+            {'ETag': '"v1"', 'Last-Modified': 'Mon, 02 Oct 2023 10:00:00 GMT'})
+        await self.http.get(self.url)
+        self.assertEqual(self.http.session.get.call_args.kwargs['headers'], {})
+
+        self.http.session.get.return_value = _response(304)
+        self.assertEqual(await self.http.get(self.url), {'name': 'ubuntu'})
+        self.assertEqual(self.http.session.get.call_args.kwargs['headers'], {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 02 Oct 2023 10:00:00 GMT',
+        })
+
+        # a new client on the same cache folder, e.g. another process
+        other = CharmHubClient(cache_dir=self.tmp.name, ttl=60)
+        other.session = mock.Mock()
+        self.assertEqual(await other.get(self.url), {'name': 'ubuntu'})
+        other.session.get.assert_not_called()
+
+    async def test_retries_with_backoff(self):
+        self.http.session.get.side_effect = [
+            _response(503), requests.ConnectionError('reset'), _response(200, {})]
+        with mock.patch('juju.jasyncio.sleep') as sleep:
+            self.assertEqual(await self.http.get(self.url), {})
+        self.assertEqual(sleep.call_count, 2)
+        self.assertTrue(all(0 <= c.args[0] <= 0.002 for c in sleep.call_args_list))
+
+    async def test_client_errors_are_not_retried(self):
+        self.http.session.get.return_value = _response(404)
+        with self.assertRaisesRegex(JujuError, 'Got 404'):
+            await self.http.get(self.url)
+        self.http.session.get.assert_called_once()
+
+    async def test_gives_up(self):
+        self.http.session.get.side_effect = requests.ConnectionError('down')
+        with self.assertRaisesRegex(JujuError, 'down'):
+            await self.http.get(self.url)
+        self.assertEqual(self.http.session.get.call_count, self.http.retries)
+
+
+class TestCharmHub(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.model = mock.Mock()
+        self.model.get_config = mock.AsyncMock(return_value={
+            'charmhub-url': mock.Mock(value='https://api.charmhub.io')})
+        self.model.connection().is_using_old_client = False
+        self.http = mock.Mock()
+        self.http.get = mock.AsyncMock()
+        self.charmhub = CharmHub(self.model, http=self.http)
+
+    async def test_charmhub_url_is_cached(self):
+        self.http.get.return_value = {'default-release': {'revision': {'subordinate': True},
+                                                          'resources': []}}
+        self.assertTrue(await self.charmhub.is_subordinate('rsyslog'))
+        self.assertEqual(await self.charmhub.list_resources('rsyslog'), [])
+        self.model.get_config.assert_awaited_once()
+        self.assertEqual(self.http.get.call_args.args[0],
+                         'https://api.charmhub.io/v2/charms/info/rsyslog'
+                         '?fields=default-release.resources')
+
+    async def test_info(self):
+        self.http.get.return_value = {'name': 'ubuntu', 'channel-map': [
+            {'channel': {'track': 'latest', 'risk': 'stable'}, 'revision': 1}]}
+        info = await self.charmhub.info('ubuntu')
+        self.assertEqual(list(info['channel-map']), ['latest/stable'])
+
+        self.http.get.side_effect = JujuError('Got 404 from https://api.charmhub.io')
+        with self.assertRaisesRegex(JujuError, 'nope not found'):
+            await self.charmhub.info('nope')
+
+    async def test_find(self):
+        self.http.get.return_value = {'results': []}
+        self.assertEqual(await self.charmhub.find('kube', charm_type='bundle'), {'results': []})
+        self.assertEqual(self.http.get.call_args.args[0],
+                         'https://api.charmhub.io/v2/charms/find?q=kube&type=bundle')
+
+    async def test_request_charmhub_with_retry(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        http = CharmHubClient(cache_dir=tmp.name, backoff=0.001)
+        http.session = mock.Mock()
+        charmhub = CharmHub(self.model, http=http)
+        url = 'https://api.charmhub.io/v2/charms/info/ubuntu'
+
+        http.session.get.side_effect = [requests.ConnectionError('reset'), _response(200, {})]
+        with mock.patch('juju.jasyncio.sleep') as sleep:
+            self.assertEqual((await charmhub.request_charmhub_with_retry(url, 3)).status_code, 200)
+        sleep.assert_called_once()
+
+        # always tried once, and no sleep after the last attempt
+        http.session.get.side_effect = None
+        http.session.get.return_value = _response(503)
+        with mock.patch('juju.jasyncio.sleep') as sleep:
+            for retries in (0, 1):
+                with self.assertRaisesRegex(JujuError, 'Got 503'):
+                    await charmhub.request_charmhub_with_retry(url, retries)
+        sleep.assert_not_called()
+        self.assertEqual(http.session.get.call_count, 4)
+
+    async def test_bulk_refresh_info(self):
+        def app(name, charm_url):
+            app = mock.Mock(charm_url=charm_url)
+            app.name = name
+            return app
+
+        apps = [app('web', 'ch:amd64/jammy/nginx-21'),
+                app('db', 'ch:arm64/jammy/postgresql-3'),
+                app('mine', 'local:jammy/mine-0')]
+        self.model.applications = {a.name: a for a in apps}
+        self.model.get_status = mock.AsyncMock(return_value=mock.Mock(applications={
+            'web': mock.Mock(charm_channel='stable', base=client.Base(name='ubuntu', channel='22.04')),
+            'db': mock.Mock(charm_channel='14/edge', base=client.Base(name='ubuntu', channel='22.04')),
+            'mine': mock.Mock(charm_channel=None, base=None),
+        }))
+        self.http.post = mock.AsyncMock(return_value={'results': [
+            {'instance-key': 'web/latest/stable', 'charm': {'revision': 24, 'version': '1.25'}},
+            {'instance-key': 'web/latest/candidate', 'charm': {'revision': 25, 'version': '1.26'}},
+            {'instance-key': 'db/14/edge', 'charm': {'revision': 5, 'version': '14.9'}},
+            {'instance-key': 'db/14/candidate', 'result': 'error',
+             'error': {'code': 'revision-not-found', 'message': 'no revision'}},
+        ]})
+
+        results = await self.charmhub.bulk_refresh_info(channels=['candidate', 'stable'])
+
+        self.http.post.assert_awaited_once()
+        url, body = self.http.post.call_args.args
+        self.assertEqual(url, 'https://api.charmhub.io/v2/charms/refresh')
+        self.assertEqual([a['instance-key'] for a in body['actions']], [
+            'web/latest/stable', 'web/latest/candidate',
+            'db/14/edge', 'db/14/candidate', 'db/14/stable'])
+        self.assertEqual(body['actions'][2]['base'],
+                         {'name': 'ubuntu', 'channel': '22.04', 'architecture': 'arm64'})
+        self.assertEqual(results, {
+            'web': {'charm': 'nginx', 'revision': 21, 'channels': {
+                'latest/stable': {'revision': 24, 'version': '1.25'},
+                'latest/candidate': {'revision': 25, 'version': '1.26'}}},
+            'db': {'charm': 'postgresql', 'revision': 3, 'channels': {
+                '14/edge': {'revision': 5, 'version': '14.9'},
+                '14/candidate': {'error': 'no revision'},
+                '14/stable': None}},
+        })
+
+    async def test_bulk_refresh_info_without_base(self):
+        def app(name, charm_url):
+            app = mock.Mock(charm_url=charm_url)
+            app.name = name
+            return app
+
+        apps = [app('old', 'ch:amd64/focal/redis-1'), app('odd', 'ch:amd64/redis-1')]
+        self.model.get_status = mock.AsyncMock(return_value=mock.Mock(applications={
+            'old': mock.Mock(charm_channel='stable', base=None),
+            'odd': mock.Mock(charm_channel='stable', base=client.Base(name='ubuntu')),
+        }))
+        self.http.post = mock.AsyncMock(return_value={'results': [
+            {'instance-key': 'old/latest/stable', 'charm': {'revision': 2}},
+        ]})
+
+        results = await self.charmhub.bulk_refresh_info(apps)
+
+        _, body = self.http.post.call_args.args
+        self.assertEqual([a['base'] for a in body['actions']], [
+            {'name': 'ubuntu', 'channel': '20.04', 'architecture': 'amd64'}])
+        self.assertEqual(results, {
+            'old': {'charm': 'redis', 'revision': 1, 'channels': {
+                'latest/stable': {'revision': 2, 'version': None}}},
+            'odd': {'charm': 'redis', 'revision': 1, 'error': 'unknown base'},
+        })
+
+        self.http.post.return_value = {'error-list': [
+            {'code': 'invalid-request', 'message': 'bad base'}]}
+        with self.assertRaisesRegex(JujuError, 'bad base'):
+            await self.charmhub.bulk_refresh_info(apps)
@@ -6,6 +6,10 @@ Tests for generated client code
 
 """
 
+import subprocess
+import sys
+import textwrap
+
 import mock
 
 from juju.client import client
@@ -29,3 +33,26 @@ def test_to_json():
     uml = client.UserModelList([client.UserModel()])
     assert uml.to_json() == ('{"user-models": [{"last-connection": null, '
                              '"model": null}]}')
+
+
+def test_versioned_clients_are_imported_lazily():
+    code = textwrap.dedent('''
+        import sys
+        from unittest import mock
+        from juju.client import client
+
+        def loaded():
+            return sorted(m for m in sys.modules
+                          if m.startswith("juju.client._client")
+                          and m != "juju.client._client")
+
+        assert loaded() == [], loaded()
+        connection = mock.Mock()
+        connection.facades = {"Action": 7}
+        connection.info = {"server-version": "3.0"}
+        facade = client.ActionFacade.from_connection(connection)
+        assert loaded() == ["juju.client._client7"], loaded()
+        # the overrides get patched onto lazily imported facades too
+        assert hasattr(facade, "FindActionTagsByPrefix")
+    ''')
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -0,0 +1,70 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+import json
+import unittest
+
+from juju.client import client
+from juju.client.codec import JSONCodec, OrjsonCodec, get_codec
+from juju.client.facade import TypeEncoder
+
+try:
+    import orjson  # noqa
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class CodecTests:
+    def msg(self):
+        return {
+            'type': 'Client',
+            'request': 'FullStatus',
+            'version': 6,
+            'request-id': 1,
+            'params': {'entities': [client.Entity(tag='unit-ubuntu-0')],
+                       'values': [1, 2.5, None, True, 'ünïcode']},
+        }
+
+    def test_round_trip(self):
+        encoded = self.codec.encode(self.msg(), TypeEncoder)
+        self.assertIsInstance(encoded, str)
+        self.assertEqual(self.codec.decode(encoded),
+                         json.loads(json.dumps(self.msg(), cls=TypeEncoder)))
+        self.assertEqual(self.codec.decode(encoded.encode('utf-8')),
+                         self.codec.decode(encoded))
+
+    def test_compact(self):
+        encoded = self.codec.encode({'a': [1, 2], 'b': {'c': 'd'}})
+        self.assertNotIn(' ', encoded)
+        self.assertNotIn('\n', encoded)
+
+
+class TestJSONCodec(CodecTests, unittest.TestCase):
+    codec = JSONCodec()
+
+
+@unittest.skipUnless(HAS_ORJSON, 'orjson is not installed')
+class TestOrjsonCodec(CodecTests, unittest.TestCase):
+    def setUp(self):
+        self.codec = OrjsonCodec()
+
+    def test_custom_encoder_falls_back_to_json(self):
+        class Encoder(json.JSONEncoder):
+            def default(self, obj):
+                return 'custom'
+        self.assertEqual(self.codec.encode({'a': object()}, Encoder),
+                         '{"a":"custom"}')
+
+
+class TestGetCodec(unittest.TestCase):
+    def test_names(self):
+        self.assertIsInstance(get_codec('json'), JSONCodec)
+        codec = JSONCodec()
+        self.assertIs(get_codec(codec), codec)
+        with self.assertRaises(ValueError):
+            get_codec('yaml')
+
+    def test_default(self):
+        expected = OrjsonCodec if HAS_ORJSON else JSONCodec
+        self.assertIs(type(get_codec()), expected)
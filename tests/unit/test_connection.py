@@ -8,6 +8,8 @@ from collections import deque
 import mock
 from juju.errors import JujuRedirectException
 from juju.client.connection import Connection
+from juju.client.metrics import RPCMetrics
+from juju.client.tracing import RPCTracer
 from websockets.exceptions import ConnectionClosed
 
 import pytest
@@ -34,8 +36,26 @@ class WebsocketMock:
         self.closed = True
 
 
+class ServerWebsocketMock(WebsocketMock):
+    """Only replies to the requests that were sent, like a controller."""
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.sent = set()
+        self.sending = asyncio.Event()
+
+    async def send(self, message):
+        self.sent.add(json.loads(message)['request-id'])
+        self.sending.set()
+
+    async def recv(self):
+        while self.responses and self.responses[0]['request-id'] not in self.sent:
+            self.sending.clear()
+            await self.sending.wait()
+        return await super().recv()
+
+
 async def test_out_of_order():
-    ws = WebsocketMock([
+    ws = ServerWebsocketMock([
         {'request-id': 1},
         {'request-id': 3},
         {'request-id': 2},
@@ -60,15 +80,58 @@ async def test_out_of_order():
                 mock.patch('juju.client.connection.Connection._get_ssl'), \
                 mock.patch('juju.client.connection.Connection._pinger', mock.AsyncMock()):
             con = await Connection.connect('0.1.2.3:999')
-        actual_responses = []
-        for i in range(3):
-            actual_responses.append(await con.rpc({'version': 1}))
+        actual_responses = await asyncio.gather(
+            *(con.rpc({'version': 1}) for i in range(3)))
         assert actual_responses == expected_responses
     finally:
         if con:
             await con.close()
 
 
+class DroppingWebsocketMock(ServerWebsocketMock):
+    """Drops the connection on the first send."""
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.dropped = False
+
+    async def send(self, message):
+        if not self.dropped:
+            self.dropped = True
+            raise ConnectionClosed(None, None)
+        await super().send(message)
+
+
+async def test_rpc_resent_after_reconnect():
+    ws = DroppingWebsocketMock([{'request-id': 1, 'response': {}}])
+    minimal_facades = [{'name': 'Pinger', 'versions': [1]}]
+    con = None
+    try:
+        with \
+                mock.patch('websockets.connect', mock.AsyncMock(return_value=ws)), \
+                mock.patch(
+                    'juju.client.connection.Connection.login',
+                    mock.AsyncMock(return_value={'response': {
+                        'facades': minimal_facades,
+                        'server-version': '3.0',
+                    }}),
+                ), \
+                mock.patch('juju.client.connection.Connection._get_ssl'), \
+                mock.patch('juju.client.connection.Connection._pinger', mock.AsyncMock()):
+            con = await Connection.connect('0.1.2.3:999')
+
+        async def reconnect():
+            # the receiver fails the pending requests as the socket drops
+            con.messages.fail_all(ConnectionClosed(None, None))
+
+        with mock.patch.object(con, 'reconnect', reconnect):
+            assert await asyncio.wait_for(con.rpc({'version': 1}), 5) == \
+                {'request-id': 1, 'response': {}}
+        assert len(con.messages) == 0
+    finally:
+        if con:
+            await con.close()
+
+
 async def test_bubble_redirect_exception():
     ca_cert = """
 -----BEGIN CERTIFICATE-----
@@ -198,3 +261,168 @@ async def test_rpc_none_results():
     finally:
         if con:
             await con.close()
+
+
+async def test_rpc_timeout():
+    ws = WebsocketMock([])
+    minimal_facades = [{'name': 'Pinger', 'versions': [1]}]
+    con = None
+    try:
+        with \
+                mock.patch('websockets.connect', mock.AsyncMock(return_value=ws)), \
+                mock.patch(
+                    'juju.client.connection.Connection.login',
+                    mock.AsyncMock(return_value={'response': {
+                        'facades': minimal_facades,
+                        'server-version': '3.0',
+                    }}),
+                ), \
+                mock.patch('juju.client.connection.Connection._get_ssl'), \
+                mock.patch('juju.client.connection.Connection._pinger', mock.AsyncMock()):
+            con = await Connection.connect('0.1.2.3:999')
+        with pytest.raises(asyncio.TimeoutError):
+            await con.rpc({'version': 1}, timeout=0.01)
+        assert len(con.messages) == 0
+    finally:
+        if con:
+            await con.close()
+
+
+class BulkWebsocketMock(WebsocketMock):
+    """Replies to every bulk call with one result per entity."""
+
+    def __init__(self):
+        super().__init__([])
+        self.sent = []
+        self.replies = asyncio.Queue()
+
+    async def send(self, message):
+        msg = json.loads(message)
+        self.sent.append(msg)
+        entities = msg['params'].get('entities') or []
+        await self.replies.put({
+            'request-id': msg['request-id'],
+            'response': {'results': [
+                {'annotations': {'tag': e['tag']}} for e in entities
+            ]},
+        })
+
+    async def recv(self):
+        return json.dumps(await self.replies.get())
+
+
+async def test_bulk_calls_are_coalesced():
+    from juju.client import client
+
+    ws = BulkWebsocketMock()
+    minimal_facades = [{'name': 'Annotations', 'versions': [2]}]
+    con = None
+    try:
+        with \
+                mock.patch('websockets.connect', mock.AsyncMock(return_value=ws)), \
+                mock.patch(
+                    'juju.client.connection.Connection.login',
+                    mock.AsyncMock(return_value={'response': {
+                        'facades': minimal_facades,
+                        'server-version': '3.0',
+                    }}),
+                ), \
+                mock.patch('juju.client.connection.Connection._get_ssl'), \
+                mock.patch('juju.client.connection.Connection._pinger', mock.AsyncMock()):
+            con = await Connection.connect('0.1.2.3:999')
+        con.batcher.max_batch_size = 40
+        facade = client.AnnotationsFacade.from_connection(con)
+        tags = ['unit-app-{}'.format(i) for i in range(100)]
+        results = await asyncio.gather(*(
+            facade.Get(entities=[client.Entity(tag)]) for tag in tags))
+        assert [r.results[0].annotations['tag'] for r in results] == tags
+        assert [len(msg['params']['entities']) for msg in ws.sent] == [40, 40, 20]
+    finally:
+        if con:
+            await con.close()
+
+
+class RecordingTracer(RPCTracer):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.events = []
+
+    def enabled(self):
+        return True
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+async def test_rpc_tracer():
+    ws = WebsocketMock([
+        {'request-id': 1, 'response': {}},
+        {'request-id': 2, 'response': {}},
+    ])
+    minimal_facades = [{'name': 'Pinger', 'versions': [1]}]
+    tracer = RecordingTracer(facades=['Pinger'])
+    con = None
+    try:
+        with \
+                mock.patch('websockets.connect', mock.AsyncMock(return_value=ws)), \
+                mock.patch(
+                    'juju.client.connection.Connection.login',
+                    mock.AsyncMock(return_value={'response': {
+                        'facades': minimal_facades,
+                        'server-version': '3.0',
+                    }}),
+                ), \
+                mock.patch('juju.client.connection.Connection._get_ssl'), \
+                mock.patch('juju.client.connection.Connection._pinger', mock.AsyncMock()):
+            con = await Connection.connect('0.1.2.3:999', tracer=tracer)
+        await con.rpc({'type': 'Pinger', 'request': 'Ping', 'version': 1})
+        await con.rpc({'type': 'Client', 'request': 'FullStatus', 'version': 1})
+        assert [(e.direction, e.request_id, e.facade, e.request)
+                for e in tracer.events] == [
+            ('--->', 1, 'Pinger', 'Ping'),
+            ('<---', 1, 'Pinger', 'Ping'),
+        ]
+        assert json.loads(tracer.events[0].payload)['request'] == 'Ping'
+        assert tracer.events[1].payload == {'request-id': 1, 'response': {}}
+        assert tracer.events[1].elapsed >= 0
+        assert con.connect_params()['tracer'] is tracer
+    finally:
+        if con:
+            await con.close()
+
+
+async def test_rpc_metrics():
+    ws = WebsocketMock([
+        {'request-id': 1, 'response': {}},
+        {'request-id': 2, 'error': 'boom'},
+    ])
+    minimal_facades = [{'name': 'Pinger', 'versions': [1]}]
+    metrics = RPCMetrics()
+    con = None
+    try:
+        with \
+                mock.patch('websockets.connect', mock.AsyncMock(return_value=ws)), \
+                mock.patch(
+                    'juju.client.connection.Connection.login',
+                    mock.AsyncMock(return_value={'response': {
+                        'facades': minimal_facades,
+                        'server-version': '3.0',
+                    }}),
+                ), \
+                mock.patch('juju.client.connection.Connection._get_ssl'), \
+                mock.patch('juju.client.connection.Connection._pinger', mock.AsyncMock()):
+            con = await Connection.connect('0.1.2.3:999', metrics=metrics)
+        await con._rpc({'type': 'Pinger', 'request': 'Ping', 'version': 1})
+        await con._rpc({'type': 'Pinger', 'request': 'Ping', 'version': 1})
+        call, = metrics.snapshot()['calls']
+        assert (call['facade'], call['request'], call['version']) == ('Pinger', 'Ping', 1)
+        assert call['count'] == 2
+        assert call['errors'] == 1
+        assert call['bytes_sent'] > 0
+        assert call['bytes_received'] == len(json.dumps({'request-id': 1, 'response': {}})) + \
+            len(json.dumps({'request-id': 2, 'error': 'boom'}))
+        assert con._reply_sizes == {}
+        assert con.connect_params()['metrics'] is metrics
+    finally:
+        if con:
+            await con.close()
@@ -2,10 +2,36 @@
 # Licensed under the Apache V2, see LICENCE file for details.
 
 import unittest
+import weakref
 
+import mock
+
+from juju import jasyncio
 from juju.client import client
 
 
+STATUS = {
+    'model': {'name': 'm', 'type': 'iaas', 'version': '3.1.0'},
+    'applications': {
+        'app': {
+            'charm': 'ch:app',
+            'exposed': False,
+            'status': {'status': 'active', 'info': '', 'data': {}},
+            'units': {
+                'app/0': {
+                    'machine': '0',
+                    'workload-status': {'status': 'active', 'info': 'ready'},
+                    'agent-status': {'status': 'idle'},
+                    'future-field': 1,
+                }
+            },
+        }
+    },
+    'machines': {'0': {'id': '0', 'instance-id': 'i-0', 'series': 'jammy'}},
+    'relations': [],
+}
+
+
 class TestDefinitions(unittest.TestCase):
 
     def test_dict_legacy(self):
@@ -97,3 +123,82 @@ class TestDefinitions(unittest.TestCase):
             raise Exception('status relation endpoint is not a EndpointStatus')
         if not isinstance(status.applications['app'], client.ApplicationStatus):
             raise Exception('status application is not a ApplicationStatus')
+
+    def test_from_wire(self):
+        status = client.FullStatus.from_wire(STATUS)
+        self.assertEqual(status, client.FullStatus.from_json(STATUS))
+        unit = status.applications['app'].units['app/0']
+        self.assertIsInstance(unit, client.UnitStatus)
+        self.assertIsInstance(unit.workload_status, client.DetailedStatus)
+        self.assertEqual(unit.workload_status.info, 'ready')
+        self.assertEqual(unit.unknown_fields, {'future-field': 1})
+        self.assertEqual(status.relations, [])
+        self.assertIsNone(client.FullStatus.from_wire(None))
+
+    def test_slots(self):
+        status = client.FullStatus.from_wire(STATUS)
+        self.assertFalse(hasattr(status, '__dict__'))
+        self.assertIn("'model':", repr(status))
+        with self.assertRaises(AttributeError):
+            status.not_a_field = 1
+
+    def test_slots_connect(self):
+        connection = mock.Mock()
+        for status in (client.FullStatus.from_wire(STATUS),
+                       client.FullStatus.from_wire_lazy(STATUS)):
+            status.connect(connection)
+            self.assertIs(status.connection, connection)
+            self.assertIs(weakref.ref(status)(), status)
+            self.assertEqual(status, client.FullStatus.from_json(STATUS))
+
+    def test_from_wire_skips_validation(self):
+        with self.assertRaises(Exception):
+            client.ModelStatusInfo(name=1)
+        self.assertEqual(client.ModelStatusInfo.from_wire({'name': 1}).name, 1)
+
+    def test_from_wire_overrides(self):
+        info = client.ModelStatusInfo.from_wire(STATUS['model'])
+        self.assertIsInstance(client.Number.from_wire('3.1.0'), client.Number)
+        self.assertEqual(info.version, '3.1.0')
+        tools = client.Tools.from_wire({'version': '3.1.0-jammy-amd64', 'url': ''})
+        self.assertIsInstance(tools.version, client.Binary)
+        self.assertEqual(str(tools.version), '3.1.0-jammy-amd64')
+
+    def test_from_wire_lazy(self):
+        status = client.FullStatus.from_wire_lazy(STATUS)
+        self.assertIsInstance(status, client.FullStatus)
+        self.assertEqual(status, client.FullStatus.from_wire(STATUS))
+        self.assertIsNone(client.FullStatus.from_wire_lazy(None))
+
+    def test_from_wire_lazy_materializes_on_access(self):
+        status = client.FullStatus.from_wire_lazy(STATUS)
+        slot = vars(client.FullStatus)['applications']
+        with self.assertRaises(AttributeError):
+            slot.__get__(status)
+        app = status.applications['app']
+        self.assertIs(slot.__get__(status)['app'], app)
+        self.assertIs(status.applications['app'], app)
+        self.assertIsInstance(app, client.ApplicationStatus)
+        unit = app.units['app/0']
+        self.assertEqual(unit.workload_status.info, 'ready')
+        self.assertEqual(unit.unknown_fields, {'future-field': 1})
+        unit.machine = '1'
+        self.assertEqual(unit.machine, '1')
+        self.assertEqual(unit.serialize()['machine'], '1')
+
+    def test_from_wire_lazy_overrides(self):
+        tools = client.Tools.from_wire_lazy({'version': '3.1.0-jammy-amd64', 'url': ''})
+        self.assertIsInstance(tools.version, client.Binary)
+        self.assertIsInstance(client.Number.from_wire_lazy('3.1.0'), client.Number)
+
+    def test_lazy_responses(self):
+        async def rpc(msg, encoder=None):
+            return {'request-id': 1, 'response': STATUS}
+
+        for lazy in (False, True):
+            facade = client.ClientFacade.from_connection(mock.Mock(
+                facades={'Client': 6}, lazy_responses=lazy, rpc=rpc))
+            status = jasyncio.run(facade.FullStatus(patterns=None))
+            self.assertIsInstance(status, client.FullStatus)
+            self.assertEqual(type(status) is not client.FullStatus, lazy)
+            self.assertEqual(status, client.FullStatus.from_wire(STATUS))
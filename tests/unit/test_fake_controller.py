@@ -0,0 +1,152 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+import pytest
+
+from juju import jasyncio
+from juju.client import client
+from juju.controller import Controller
+from juju.errors import JujuAPIError
+from juju.model import Model
+
+from ..fake_controller import FakeController, SyntheticModel
+
+
+@pytest.fixture
+async def controller():
+    async with FakeController(SyntheticModel(applications=3, units=2)) as controller:
+        yield controller
+
+
+@pytest.fixture
+async def model(controller):
+    model = Model()
+    await model.connect(**controller.connect_params())
+    try:
+        yield model
+    finally:
+        await model.disconnect()
+
+
+async def test_connect(controller, model):
+    assert model.info.uuid == controller.model.uuid
+    assert sorted(model.applications) == ['app-0', 'app-1', 'app-2']
+    assert len(model.units) == 6
+    assert len(model.machines) == 6
+    assert model.units['app-1/1'].machine.id in model.machines
+    assert controller.calls['Admin', 'Login'] == 2  # the model and the controller
+
+
+async def test_wrong_password(controller):
+    params = dict(controller.connect_params(), password='nope')
+    with pytest.raises(JujuAPIError, match='invalid entity name or password'):
+        await Model().connect(**params)
+
+
+async def test_controller_connection(controller):
+    ctrl = Controller()
+    await ctrl.connect(**controller.connect_params(model=False))
+    try:
+        assert await ctrl.model_uuids() == {'fake': controller.model.uuid}
+    finally:
+        await ctrl.disconnect()
+
+
+async def test_full_status(model):
+    status = await model.get_status()
+    assert sorted(status.applications) == ['app-0', 'app-1', 'app-2']
+    assert status.applications['app-0'].status.status == 'active'
+    assert status.applications['app-0'].units['app-0/0'].workload_status.status == 'active'
+
+
+async def test_wait_for_idle(controller, model):
+    controller.model.set_unit_status('app-0/0', workload='maintenance', agent='executing')
+    waiter = jasyncio.ensure_future(
+        model.wait_for_idle(status='active', idle_period=0, check_freq=0.01, timeout=5))
+    await jasyncio.sleep(0.1)
+    assert not waiter.done()
+    controller.model.set_unit_status('app-0/0', workload='active', agent='idle')
+    await waiter
+
+
+async def test_deploy_and_scale(controller, model):
+    await model._deploy(
+        charm_url='ch:amd64/jammy/postgresql-1', application='db', series='jammy',
+        config={'port': 5432}, constraints=None, endpoint_bindings=None,
+        resources=None, storage=None, num_units=2,
+        charm_origin=client.CharmOrigin(source='charm-hub', revision=1))
+    app = model.applications['db']
+    await model.block_until(lambda: len(app.units) == 2, timeout=5)
+    assert await app.get_config() == {'port': {'value': '5432', 'source': 'user'}}
+
+    await app.add_unit(count=2)
+    await model.block_until(lambda: len(app.units) == 4, timeout=5)
+    await model.destroy_unit('db/0')
+    await model.block_until(lambda: 'db/0' not in model.units, timeout=5)
+    assert controller.calls['Application', 'Deploy'] == 1
+
+
+async def test_entities_follow_reconnect(controller, model):
+    unit = model.units['app-0/0']
+    await model.disconnect()
+    await model.connect(**controller.connect_params())
+    assert model.units['app-0/0'] is unit
+    assert unit.connection is model.connection()
+    action = await unit.run_action('backup')
+    assert (await action.wait()).status == 'completed'
+
+
+async def test_observer_waiting_on_model(controller):
+    # The observer holds the only worker while it waits for the new units,
+    # whose deltas must still get through
+    model = Model(max_observer_workers=1)
+    await model.connect(**controller.connect_params())
+    try:
+        added = jasyncio.get_running_loop().create_future()
+
+        async def on_change(delta, old, new, model):
+            if not added.done():
+                added.set_result(await new.add_unit(count=2))
+
+        model.add_observer(on_change, 'application', 'change', 'app-0')
+        controller.model.set_application_config('app-0', {'scale': 'up'})
+        units = await jasyncio.wait_for(added, 5)
+        assert [u.name for u in units] == ['app-0/2', 'app-0/3']
+    finally:
+        await model.disconnect()
+
+
+async def test_run_action(controller, model):
+    action = await model.units['app-0/0'].run_action('backup', mode='full')
+    await action.wait()
+    assert action.status == 'completed'
+    assert action.results == {'return-code': 0}
+    assert controller.model.actions[action.id]['parameters'] == {'mode': 'full'}
+
+
+async def test_default_and_unknown_requests(model):
+    # Known to the schemas but not handled: an empty, valid reply.
+    facade = client.SpacesFacade.from_connection(model.connection())
+    assert (await facade.ListSpaces()).results == []
+    with pytest.raises(JujuAPIError, match='not implemented'):
+        await model.connection().rpc({'type': 'Spaces', 'request': 'Teleport',
+                                      'version': model.connection().facades['Spaces']})
+
+
+async def test_latency():
+    async with FakeController(latency=0.05) as controller:
+        model = Model()
+        await model.connect(**controller.connect_params())
+        try:
+            start = jasyncio.get_running_loop().time()
+            await model.get_status()
+            assert jasyncio.get_running_loop().time() - start >= 0.05
+        finally:
+            await model.disconnect()
+
+
+def test_synthetic_model_size():
+    model = SyntheticModel(applications=50, units=40)
+    assert len(model.units) == len(model.machines) == 2000
+    assert len(model.snapshot()) == 1 + 50 + 2000 + 2000
+    assert len(model.full_status()['applications']['app-7']['units']) == 40
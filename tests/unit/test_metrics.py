@@ -0,0 +1,57 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+import unittest
+
+from juju.client.metrics import RPCMetrics
+
+
+class TestRPCMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = RPCMetrics(buckets=(0.1, 1.0))
+        self.metrics.record('Client', 'FullStatus', 6, 0.05, sent=10, received=1000)
+        self.metrics.record('Client', 'FullStatus', 6, 2.0, sent=10, received=2000,
+                            retries=1, error=True)
+        self.metrics.record('Pinger', 'Ping', 1, 0.5)
+        self.metrics.record_reconnect()
+
+    def test_snapshot(self):
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['reconnects'], 1)
+        status, ping = snapshot['calls']
+        self.assertEqual((status['facade'], status['request'], status['version']),
+                         ('Client', 'FullStatus', 6))
+        self.assertEqual(status['count'], 2)
+        self.assertEqual(status['errors'], 1)
+        self.assertEqual(status['retries'], 1)
+        self.assertEqual(status['bytes_sent'], 20)
+        self.assertEqual(status['bytes_received'], 3000)
+        self.assertEqual(status['latency_max'], 2.0)
+        self.assertAlmostEqual(status['latency_mean'], 1.025)
+        self.assertEqual(list(status['latency_buckets'].values()), [1, 1, 2])
+        self.assertEqual(ping['count'], 1)
+
+    def test_prometheus(self):
+        text = self.metrics.prometheus()
+        labels = 'facade="Client",request="FullStatus",version="6"'
+        self.assertIn('# TYPE juju_rpc_requests_total counter\n', text)
+        self.assertIn('juju_rpc_requests_total{%s} 2\n' % labels, text)
+        self.assertIn('juju_rpc_errors_total{%s} 1\n' % labels, text)
+        self.assertIn('juju_rpc_response_bytes_total{%s} 3000\n' % labels, text)
+        self.assertIn('juju_rpc_latency_seconds_bucket{%s,le="0.1"} 1\n' % labels, text)
+        self.assertIn('juju_rpc_latency_seconds_bucket{%s,le="+Inf"} 2\n' % labels, text)
+        self.assertIn('juju_rpc_latency_seconds_count{%s} 2\n' % labels, text)
+        self.assertIn('juju_rpc_reconnects_total 1\n', text)
+
+    def test_label_escaping(self):
+        metrics = RPCMetrics()
+        metrics.record('Odd"Facade', 'Re\\quest', 1, 0.1)
+        self.assertIn(r'facade="Odd\"Facade",request="Re\\quest"', metrics.prometheus())
+
+    def test_reset(self):
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot(), {'calls': [], 'reconnects': 0})
+
+    def test_unsorted_buckets(self):
+        with self.assertRaises(ValueError):
+            RPCMetrics(buckets=(1, 0.1))
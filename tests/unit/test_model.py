@@ -1,7 +1,12 @@
 # Copyright 2023 Canonical Ltd.
 # Licensed under the Apache V2, see LICENCE file for details.
 
+import os
+import tempfile
+import time
 import unittest
+import zipfile
+from pathlib import Path
 from unittest.mock import patch, PropertyMock
 
 import mock
@@ -9,11 +14,13 @@ import mock
 import pytest
 import datetime
 
+from juju.client import client
 from juju.client.jujudata import FileJujuData
 from juju.model import Model
 from juju.application import Application
 from juju import jasyncio
 from juju.errors import JujuConnectionError, JujuError
+from juju.url import URL
 
 
 def _make_delta(entity, type_, data=None):
@@ -75,6 +82,100 @@ class TestObserver(unittest.TestCase):
         self.assertTrue(o.cares_about(delta))
 
 
+class TestObserverRegistry(unittest.TestCase):
+    def test_matching(self):
+        from juju.model import _Observer, _ObserverRegistry
+
+        async def callback(*args):
+            pass
+
+        registry = _ObserverRegistry()
+        observers = [
+            _Observer(callback, 'unit', 'change', 'ubuntu/0', None),
+            _Observer(callback, 'unit', None, 'ubuntu/.*', None),
+            _Observer(callback, None, None, None, None),
+            _Observer(callback, 'application', None, None, None),
+            _Observer(callback, 'unit', 'change', 'ubuntu/1', None),
+            _Observer(callback, 'unit', None, None,
+                      lambda delta: delta.data.get('fizz') == 'bang'),
+        ]
+        for o in observers:
+            registry.add(o)
+
+        delta = _make_delta('unit', 'change', dict(name='ubuntu/0'))
+        self.assertEqual(registry.matching(delta), observers[:3])
+        delta = _make_delta('unit', 'change', dict(name='ubuntu/1', fizz='bang'))
+        self.assertEqual(registry.matching(delta),
+                         [observers[1], observers[2], observers[4], observers[5]])
+        delta = _make_delta('application', 'add', dict(name='ubuntu'))
+        self.assertEqual(registry.matching(delta), observers[2:4])
+
+    def test_remove_drops_empty_buckets(self):
+        from juju.model import _Observer, _ObserverRegistry
+
+        async def callback(*args):
+            pass
+
+        registry = _ObserverRegistry()
+        observers = [_Observer(callback, 'unit', 'change', 'ubuntu/0', None),
+                     _Observer(callback, 'unit', None, 'ubuntu/.*', None)]
+        for o in observers:
+            registry.add(o)
+        self.assertEqual(len(registry._exact), 1)
+        self.assertEqual(len(registry._patterns), 1)
+
+        for o in observers:
+            registry.remove(o)
+        self.assertEqual(len(registry), 0)
+        self.assertEqual(registry._exact, {})
+        self.assertEqual(registry._patterns, {})
+
+
+class TestObserverDispatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_bounded_and_ordered_per_entity(self):
+        from juju.model import _Observer, _ObserverDispatcher
+
+        calls = []
+        running = set()
+        max_running = 0
+
+        async def callback(delta, old, new, model):
+            nonlocal max_running
+            entity = delta.get_id()
+            # callbacks of one entity never overlap
+            assert entity not in running
+            running.add(entity)
+            max_running = max(max_running, len(running))
+            await jasyncio.sleep(0.001)
+            calls.append((entity, delta.data['n']))
+            running.discard(entity)
+            if delta.data['n'] == 1:
+                raise ValueError('boom')
+
+        observer = _Observer(callback, None, None, None, None)
+        dispatcher = _ObserverDispatcher(max_workers=2)
+        for n in range(3):
+            for name in ('a', 'b', 'c', 'd'):
+                delta = _make_delta('application', 'change',
+                                    dict(name=name, n=n))
+                dispatcher.submit(('application', name), observer,
+                                  delta, None, None, None)
+
+        self.assertEqual(dispatcher.metrics()['queued'], 12)
+        while dispatcher.metrics()['workers']:
+            await jasyncio.sleep(0.01)
+
+        self.assertEqual(max_running, 2)
+        for name in ('a', 'b', 'c', 'd'):
+            self.assertEqual([n for e, n in calls if e == name], [0, 1, 2])
+        metrics = dispatcher.metrics()
+        self.assertEqual(metrics['queued'], 0)
+        self.assertEqual(metrics['max_queued'], 12)
+        self.assertEqual(metrics['dispatched'], 12)
+        self.assertEqual(metrics['failed'], 4)
+        self.assertGreater(metrics['callback_time_max'], 0)
+
+
 class TestModelState(unittest.TestCase):
     def test_apply_delta(self):
 
@@ -104,6 +205,147 @@ class TestModelState(unittest.TestCase):
         self.assertIsInstance(prev, Application)
         self.assertTrue(prev)
 
+    def test_secondary_indexes(self):
+        model = Model()
+        model._connector = mock.MagicMock()
+
+        def unit(name, machine, principal=''):
+            return dict(name=name, application=name.split('/')[0],
+                        subordinate=bool(principal), principal=principal,
+                        **{'machine-id': machine})
+
+        def relation(id_, *apps):
+            return {'id': id_, 'endpoints': [
+                {'application-name': app} for app in apps]}
+
+        for delta in [
+            _make_delta('unit', 'add', unit('mysql/0', '0')),
+            _make_delta('unit', 'add', unit('mysql/1', '1')),
+            _make_delta('unit', 'add', unit('wordpress/0', '1')),
+            _make_delta('unit', 'add', unit('ntp/0', '', 'mysql/0')),
+            _make_delta('relation', 'add', relation(1, 'mysql', 'wordpress')),
+            _make_delta('relation', 'add', relation(2, 'mysql', 'ntp')),
+        ]:
+            model.state.apply_delta(delta)
+
+        def names(entities):
+            return [e.entity_id for e in entities]
+
+        state = model.state
+        self.assertEqual(names(state.application_units('mysql')),
+                         ['mysql/0', 'mysql/1'])
+        self.assertEqual(names(state.machine_units('1')),
+                         ['mysql/1', 'wordpress/0'])
+        self.assertEqual(names(state.application_relations('mysql')), [1, 2])
+        self.assertEqual(names(state.unit_subordinates('mysql/0')), ['ntp/0'])
+        self.assertEqual(list(state.subordinate_units), ['ntp/0'])
+
+        # units move between machines, and removals are dropped
+        state.apply_delta(_make_delta('unit', 'change', unit('mysql/1', '2')))
+        state.apply_delta(_make_delta('unit', 'remove', unit('mysql/0', '0')))
+        state.apply_delta(_make_delta('relation', 'remove',
+                                      relation(2, 'mysql', 'ntp')))
+        self.assertEqual(names(state.machine_units('1')), ['wordpress/0'])
+        self.assertEqual(names(state.machine_units('2')), ['mysql/1'])
+        self.assertEqual(names(state.application_units('mysql')), ['mysql/1'])
+        self.assertEqual(names(state.application_relations('ntp')), [])
+        self.assertEqual(names(state.machine_units('0')), [])
+
+    def test_live_entity_views(self):
+        model = Model()
+        model._connector = mock.MagicMock()
+        apps = model.applications
+        live = model.state._live_entity_map('application')
+        self.assertEqual(len(apps), 0)
+
+        model.state.apply_delta(
+            _make_delta('application', 'add', dict(name='foo')))
+        # the public map is a snapshot, the internal one a live view
+        self.assertNotIn('foo', apps)
+        self.assertIn('foo', live)
+        with self.assertRaises(TypeError):
+            live['bar'] = None
+        apps = model.applications
+        apps['bar'] = None
+        self.assertNotIn('bar', model.applications)
+
+        # entities are shared rather than rebuilt on every access
+        foo = apps['foo']
+        _, new = model.state.apply_delta(
+            _make_delta('application', 'change', dict(name='foo', n=1)))
+        self.assertIs(new, foo)
+        self.assertIs(model.applications['foo'], foo)
+        self.assertEqual(foo.n, 1)
+        self.assertIs(foo.previous(), foo.previous())
+
+        model.state.apply_delta(
+            _make_delta('application', 'remove', dict(name='foo')))
+        self.assertNotIn('foo', live)
+        self.assertNotIn('foo', model.applications)
+        self.assertTrue(foo.dead)
+
+    def _apply_changes(self, model, name, count):
+        for i in range(count):
+            model.state.apply_delta(
+                _make_delta('application', 'change', dict(name=name, n=i)))
+
+    def test_max_history(self):
+        model = Model(max_history=3)
+        model._connector = mock.MagicMock()
+        self._apply_changes(model, 'foo', 10)
+
+        self.assertEqual(len(model.state.state['application']['foo']), 3)
+        app = model.applications['foo']
+        self.assertEqual(app.n, 9)
+        prev = app.previous()
+        self.assertEqual(prev.n, 8)
+        self.assertEqual(prev.previous().n, 7)
+        # the older states were dropped
+        self.assertIsNone(prev.previous().previous())
+        # next() walks back to the current state
+        self.assertEqual(prev.previous().next().n, 8)
+        self.assertTrue(prev.next().current)
+
+        # objects pointing at states that get trimmed later become empty
+        self._apply_changes(model, 'foo', 3)
+        self.assertIsNone(prev.data)
+
+        with self.assertRaises(ValueError):
+            Model(max_history=1)
+
+    def test_max_history_bytes(self):
+        model = Model(max_history_bytes=2000)
+        model._connector = mock.MagicMock()
+        self._apply_changes(model, 'old', 20)
+        self._apply_changes(model, 'new', 20)
+
+        state = model.state
+        self.assertLessEqual(state._history_bytes, 2000)
+        # the least recently updated entity is trimmed first, but never
+        # below its current state
+        self.assertEqual(len(state.state['application']['old']), 1)
+        self.assertGreater(len(state.state['application']['new']), 1)
+        self.assertEqual(model.applications['old'].n, 19)
+        self.assertEqual(model.applications['new'].previous().n, 18)
+
+    def test_dead_entity_ttl(self):
+        model = Model(dead_entity_ttl=30)
+        model._connector = mock.MagicMock()
+        state = model.state
+        state.apply_delta(_make_delta('application', 'add', dict(name='foo')))
+        _, removed = state.apply_delta(
+            _make_delta('application', 'remove', dict(name='foo')))
+        self.assertIn('foo', state.state['application'])
+        self.assertTrue(removed.dead)
+
+        with patch('juju.model.time.monotonic',
+                   return_value=time.monotonic() + 31):
+            state.apply_delta(
+                _make_delta('application', 'add', dict(name='bar')))
+        self.assertNotIn('foo', state.state['application'])
+        self.assertTrue(removed.dead)
+        self.assertIsNone(removed.previous())
+
 
 class TestContextManager(unittest.IsolatedAsyncioTestCase):
     @mock.patch('juju.model.Model.disconnect')
@@ -298,7 +540,8 @@ class TestModelWaitForIdle(unittest.IsolatedAsyncioTestCase):
         app.get_status = mock.AsyncMock(return_value=app_status)
         apps = {"dummy_app": app}
 
-        with patch.object(Model, 'applications', new_callable=PropertyMock) as mock_apps:
+        with patch.object(Model, 'applications', new_callable=PropertyMock) as mock_apps, \
+                patch.object(Model, 'get_status', new_callable=mock.AsyncMock):
             mock_apps.return_value = apps
             m = Model()
 
@@ -340,7 +583,8 @@ class TestModelWaitForIdle(unittest.IsolatedAsyncioTestCase):
         app.get_status = mock.AsyncMock(return_value=app_status)
         apps = {"dummy_app": app}
 
-        with patch.object(Model, 'applications', new_callable=PropertyMock) as mock_apps:
+        with patch.object(Model, 'applications', new_callable=PropertyMock) as mock_apps, \
+                patch.object(Model, 'get_status', new_callable=mock.AsyncMock):
             mock_apps.return_value = apps
             m = Model()
 
@@ -377,7 +621,8 @@ class TestModelWaitForIdle(unittest.IsolatedAsyncioTestCase):
         app.get_status = mock.AsyncMock(return_value=app_status)
         apps = {"dummy_app": app}
 
-        with patch.object(Model, 'applications', new_callable=PropertyMock) as mock_apps:
+        with patch.object(Model, 'applications', new_callable=PropertyMock) as mock_apps, \
+                patch.object(Model, 'get_status', new_callable=mock.AsyncMock):
             mock_apps.return_value = apps
             m = Model()
 
@@ -385,3 +630,290 @@ class TestModelWaitForIdle(unittest.IsolatedAsyncioTestCase):
                                   timeout=None)
 
         mock_apps.assert_called_with()
+
+    @pytest.mark.wait_for_idle
+    async def test_single_full_status_per_check(self):
+        from types import SimpleNamespace
+
+        def _app():
+            app = SimpleNamespace(
+                status='active',
+                units=[SimpleNamespace(
+                    name="mockunit/0",
+                    workload_status='active',
+                    workload_status_message="workload_status_message",
+                    machine=None,
+                    agent_status="idle",
+                )],
+            )
+            app.get_status = mock.AsyncMock(return_value='active')
+            return app
+
+        apps = {"app{}".format(i): _app() for i in range(5)}
+
+        with patch.object(Model, 'applications', new_callable=PropertyMock) as mock_apps, \
+                patch.object(Model, 'get_status', new_callable=mock.AsyncMock) as mock_status:
+            mock_apps.return_value = apps
+            m = Model()
+            await m.wait_for_idle(apps=list(apps), status="active")
+
+        mock_status.assert_awaited_once_with()
+        for app in apps.values():
+            app.get_status.assert_awaited_once_with(full_status=mock_status.return_value)
+
+
+class TestModelWaitForIdleDeltas(unittest.IsolatedAsyncioTestCase):
+    async def test_wakes_up_on_delta(self):
+        m = Model()
+        m._connector = mock.MagicMock()
+        m.state.apply_delta(_make_delta('application', 'add', dict(
+            name='app', status=dict(current='active', message=''))))
+        m.state.apply_delta(_make_delta('unit', 'add', dict(
+            name='app/0', application='app', machine_id='',
+            subordinate=False, principal='',
+            **{'agent-status': dict(current='executing', message=''),
+               'workload-status': dict(current='active', message=''),
+               'machine-id': ''})))
+
+        waiter = jasyncio.ensure_future(
+            m.wait_for_idle(apps=['app'], raise_on_error=False,
+                            idle_period=0, check_freq=0.01, timeout=5))
+        await jasyncio.sleep(0.1)
+        self.assertFalse(waiter.done())
+        self.assertEqual(len(m.state._delta_listeners), 1)
+
+        m.state.apply_delta(_make_delta('unit', 'change', dict(
+            name='app/0', application='app', machine_id='',
+            subordinate=False, principal='',
+            **{'agent-status': dict(current='idle', message=''),
+               'workload-status': dict(current='active', message=''),
+               'machine-id': ''})))
+        await jasyncio.wait_for(waiter, 1)
+        self.assertEqual(m.state._delta_listeners, [])
+
+
+class TestCharmArchiveCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        from juju.model import CharmArchiveCache
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.charm_dir = Path(self.tmp.name, 'charm')
+        (self.charm_dir / 'src').mkdir(parents=True)
+        (self.charm_dir / 'metadata.yaml').write_text('name: test\n')
+        (self.charm_dir / 'src' / 'charm.py').write_bytes(b'\x00\xff binary')
+        (self.charm_dir / 'build').mkdir()
+        self.cache = CharmArchiveCache(Path(self.tmp.name, 'cache'))
+
+    def test_archive_is_reused_until_content_changes(self):
+        content_hash, archive = self.cache.archive(self.charm_dir)
+        self.assertTrue(archive.exists())
+        with zipfile.ZipFile(str(archive)) as zf:
+            self.assertEqual(zf.read('src/charm.py'), b'\x00\xff binary')
+
+        # ignored files don't count
+        (self.charm_dir / 'build' / 'junk').write_text('junk')
+        with patch('juju.model.CharmArchiveGenerator.make_archive') as make:
+            self.assertEqual(self.cache.archive(self.charm_dir),
+                             (content_hash, archive))
+            make.assert_not_called()
+
+        # a touched but unchanged file keeps the hash
+        os.utime(str(self.charm_dir / 'metadata.yaml'), (0, 0))
+        self.assertEqual(self.cache.tree_hash(self.charm_dir), content_hash)
+
+        (self.charm_dir / 'metadata.yaml').write_text('name: changed\n')
+        new_hash, new_archive = self.cache.archive(self.charm_dir)
+        self.assertNotEqual(new_hash, content_hash)
+        self.assertNotEqual(new_archive, archive)
+
+    def test_prune_forgets_evicted_uploads(self):
+        self.cache.max_archives = 1
+        old_hash, old_archive = self.cache.archive(self.charm_dir)
+        os.utime(str(old_archive), (0, 0))
+        self.cache.record_upload('uuid', 'focal', old_hash, 'local:focal/test-0')
+        self.cache.record_upload('uuid', 'focal', 'other', 'local:focal/other-0')
+
+        (self.charm_dir / 'metadata.yaml').write_text('name: changed\n')
+        new_hash, new_archive = self.cache.archive(self.charm_dir)
+        self.assertFalse(old_archive.exists())
+        self.assertTrue(new_archive.exists())
+        self.assertIsNone(self.cache.uploaded_url('uuid', 'focal', old_hash))
+        self.assertEqual(self.cache.uploaded_url('uuid', 'focal', 'other'),
+                         'local:focal/other-0')
+        self.assertEqual(self.cache.tree_hash(self.charm_dir), new_hash)
+
+    def test_concurrent_index_updates(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from juju.model import CharmArchiveCache
+
+        # e.g. two processes sharing the cache folder
+        caches = [self.cache, CharmArchiveCache(self.cache.path)]
+
+        def record(n):
+            caches[n % 2].record_upload('uuid', 'focal', str(n), 'local:focal/test-{}'.format(n))
+
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(record, range(40)))
+        for n in range(40):
+            self.assertEqual(self.cache.uploaded_url('uuid', 'focal', str(n)),
+                             'local:focal/test-{}'.format(n))
+        self.assertEqual(list(self.cache.path.glob('*.json')), [self.cache.path / 'index.json'])
+
+    async def test_add_local_charm_dir_skips_known_uploads(self):
+        model = Model()
+        model._connector = mock.MagicMock()
+        model.connection().uuid = 'model-uuid'
+        model.add_local_charm = mock.Mock(return_value='local:focal/test-0')
+        model._has_charm = mock.AsyncMock(return_value=True)
+
+        with patch('juju.model.CharmArchiveCache', return_value=self.cache):
+            url = await model.add_local_charm_dir(self.charm_dir, 'focal')
+            self.assertEqual(url, 'local:focal/test-0')
+            model._has_charm.assert_not_called()
+
+            # unchanged: the controller still has it, so nothing is uploaded
+            url = await model.add_local_charm_dir(self.charm_dir, 'focal')
+            self.assertEqual(url, 'local:focal/test-0')
+            model._has_charm.assert_called_once_with('local:focal/test-0')
+            self.assertEqual(model.add_local_charm.call_count, 1)
+
+            # the controller lost it, so upload it again
+            model._has_charm.return_value = False
+            model.add_local_charm.return_value = 'local:focal/test-1'
+            url = await model.add_local_charm_dir(self.charm_dir, 'focal')
+            self.assertEqual(url, 'local:focal/test-1')
+            self.assertEqual(model.add_local_charm.call_count, 2)
+
+
+class TestCharmResolutionCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        from juju.model import CharmResolutionCache
+        self.cache = CharmResolutionCache(ttl=60)
+        patcher = patch('juju.model.charm_resolution_cache', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.model = Model()
+        self.model._connector = mock.MagicMock()
+        self.facade = mock.Mock()
+        self.facade.ResolveCharms = mock.AsyncMock(side_effect=self._resolve)
+        for name, value in (('best_facade_version', mock.Mock(return_value=7)),
+                            ('from_connection', mock.Mock(return_value=self.facade))):
+            patcher = patch.object(client.CharmsFacade, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def _resolve(self, resolve):
+        return client.ResolveCharmWithChannelResults.from_json({'Results': [{
+            'url': 'ch:amd64/jammy/{}-{}'.format(r['reference'][3:], n),
+            'charm-origin': {'source': 'charm-hub', 'type': 'charm', 'id': 'id',
+                             'revision': n, 'risk': 'stable',
+                             'architecture': r['charm-origin']['architecture']},
+            'supported-series': ['jammy'],
+        } for n, r in enumerate(resolve)]})
+
+    def _origin(self, arch='amd64'):
+        return client.CharmOrigin(source='charm-hub', architecture=arch,
+                                  risk='stable', track='latest')
+
+    async def test_resolve_charms_once(self):
+        charms = [(URL.parse('ch:ubuntu'), self._origin()),
+                  (URL.parse('ch:mysql'), self._origin())]
+        resolved = await self.model._resolve_charms(charms)
+        self.assertEqual([str(url) for url, _ in resolved],
+                         ['ch:amd64/jammy/ubuntu-0', 'ch:amd64/jammy/mysql-1'])
+        self.assertEqual(resolved[0][1].base.name, 'ubuntu')
+        self.facade.ResolveCharms.assert_called_once()
+
+        # cached, but not shared with the callers
+        resolved[0][1].revision = 42
+        again = await self.model._resolve_charms(charms)
+        self.assertEqual([str(url) for url, _ in again],
+                         [str(url) for url, _ in resolved])
+        self.assertEqual(again[0][1].revision, 0)
+        self.facade.ResolveCharms.assert_called_once()
+
+        # only the charms not resolved yet are requested
+        url, origin = await self.model._resolve_charm(
+            URL.parse('ch:ubuntu'), self._origin('arm64'))
+        self.assertEqual(self.facade.ResolveCharms.call_count, 2)
+        self.assertEqual(len(self.facade.ResolveCharms.call_args.kwargs['resolve']), 1)
+        self.assertEqual(origin.architecture, 'arm64')
+
+    async def test_ttl(self):
+        charm = [(URL.parse('ch:ubuntu'), self._origin())]
+        with patch('time.monotonic', return_value=1000):
+            await self.model._resolve_charms(charm)
+        with patch('time.monotonic', return_value=1059):
+            await self.model._resolve_charms(charm)
+        self.assertEqual(self.facade.ResolveCharms.call_count, 1)
+        with patch('time.monotonic', return_value=1060):
+            await self.model._resolve_charms(charm)
+        self.assertEqual(self.facade.ResolveCharms.call_count, 2)
+
+        self.cache.ttl = 0
+        self.cache.clear()
+        await self.model._resolve_charms(charm)
+        await self.model._resolve_charms(charm)
+        self.assertEqual(self.facade.ResolveCharms.call_count, 4)
+
+    async def test_keyed_by_controller(self):
+        charm = [(URL.parse('ch:ubuntu'), self._origin())]
+        self.model.connection().info = {'controller-tag': 'controller-one'}
+        await self.model._resolve_charms(charm)
+        await self.model._resolve_charms(charm)
+        self.assertEqual(self.facade.ResolveCharms.call_count, 1)
+        self.model.connection().info = {'controller-tag': 'controller-two'}
+        await self.model._resolve_charms(charm)
+        self.assertEqual(self.facade.ResolveCharms.call_count, 2)
+
+    def test_disabled_by_default(self):
+        from juju.model import CharmResolutionCache
+        cache = CharmResolutionCache()
+        cache.put('key', 'resolution')
+        self.assertIsNone(cache.get('key'))
+
+
+class TestAddLocalResources(unittest.IsolatedAsyncioTestCase):
+    async def test_uploads_binary_files_concurrently(self):
+        from tests.unit.test_utils import FakeHTTPSConnection
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        files = {}
+        for name in ('one', 'two', 'three'):
+            path = Path(tmp.name, name + '.bin')
+            path.write_bytes(b'\x00\xff' + name.encode() * 1000)
+            files[name] = str(path)
+
+        model = Model()
+        model._connector = mock.MagicMock()
+        conns = []
+
+        def https_connection():
+            conns.append(FakeHTTPSConnection())
+            return conns[-1], {}, '/model/uuid'
+        model.connection().https_connection = https_connection
+
+        facade = mock.Mock()
+        facade.AddPendingResources = mock.AsyncMock(return_value=mock.Mock(
+            pending_ids=['id-one', 'id-two', 'id-three']))
+        metadata = {'resources': {name: {'type': 'file'} for name in files}}
+        progress = []
+
+        with patch('juju.model.client.ResourcesFacade.from_connection',
+                   return_value=facade):
+            resource_map = await model.add_local_resources(
+                'app', 'local:app-0', metadata, files,
+                progress=lambda *args: progress.append(args))
+
+        self.assertEqual(resource_map,
+                         {'one': 'id-one', 'two': 'id-two', 'three': 'id-three'})
+        # a single call for all the pending resources
+        facade.AddPendingResources.assert_called_once()
+        uploaded = {conn.url.split('?')[1]: b''.join(conn.chunks)
+                    for conn in conns}
+        for name, path in files.items():
+            self.assertEqual(uploaded['pendingid=id-' + name],
+                             Path(path).read_bytes())
+        self.assertEqual({name for name, _, _ in progress}, set(files))
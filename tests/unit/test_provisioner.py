@@ -0,0 +1,31 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+import mock
+import pytest
+
+from juju.errors import JujuError
+from juju.provisioner import SSHProvisioner, series_base
+
+
+def test_series_base():
+    base = series_base('jammy')
+    assert (base.name, base.channel) == ('ubuntu', '22.04')
+    base = series_base('centos7')
+    assert (base.name, base.channel) == ('centos', '7')
+    with pytest.raises(JujuError):
+        series_base('windows')
+
+
+@pytest.mark.parametrize('series, name, channel', [
+    ('focal', 'ubuntu', '20.04'),
+    ('centos9', 'centos', '9'),
+])
+def test_provision_machine_base(series, name, channel):
+    provisioner = SSHProvisioner('ubuntu', '10.0.0.1', '/dev/null')
+    hw = {'series': series, 'arch': 'amd64', 'mem': '2048', 'cpu-cores': '2'}
+    with mock.patch.object(provisioner, '_init_ubuntu_user', return_value=True), \
+            mock.patch.object(provisioner, '_get_ssh_client'), \
+            mock.patch.object(provisioner, '_detect_hardware_and_os', return_value=hw):
+        params = provisioner.provision_machine()
+    assert (params.base.name, params.base.channel) == (name, channel)
@@ -3,10 +3,16 @@
 
 import unittest
 
+import pytest
 
-from juju.status import derive_status
+from juju import jasyncio
+from juju.client import client
+from juju.model import Model
+from juju.status import derive_status, filter_status
 from random import sample
 
+from ..fake_controller import FakeController, SyntheticModel
+
 
 class TestStatus(unittest.TestCase):
     def test_derive_status_with_empty_list(self):
@@ -24,3 +30,116 @@ class TestStatus(unittest.TestCase):
     def test_derive_status_with_highest_value(self):
         result = derive_status(sample(['error', 'active', 'terminated'], 3))
         self.assertEqual(result, 'error')
+
+    def test_filter_status(self):
+        status = client.FullStatus.from_json({
+            'applications': {
+                'db': {'units': {'db/0': {'machine': '0'}}},
+                'web': {'units': {'web/0': {'machine': '1/lxd/0'}}},
+                'other': {'units': {'other/0': {'machine': '2'}}},
+            },
+            'machines': {'0': {'id': '0'}, '1': {'id': '1'}, '2': {'id': '2'}},
+            'relations': [
+                {'id': 1, 'endpoints': [{'application': 'web'}, {'application': 'db'}]},
+                {'id': 2, 'endpoints': [{'application': 'web'}, {'application': 'cache'}]},
+                {'id': 3, 'endpoints': [{'application': 'other'}]},
+            ],
+            'remote-applications': {'cache': {}, 'unrelated': {}},
+            'offers': {'web-offer': {'application-name': 'web'},
+                       'other-offer': {'application-name': 'other'}},
+        })
+        web = filter_status(status, {'web'})
+        self.assertEqual(list(web.applications), ['web'])
+        self.assertEqual(list(web.machines), ['1'])
+        self.assertEqual([r.id_ for r in web.relations], [1, 2])
+        self.assertEqual(list(web.remote_applications), ['cache'])
+        self.assertEqual(list(web.offers), ['web-offer'])
+
+
+@pytest.fixture
+async def controller():
+    async with FakeController(SyntheticModel(applications=3, units=2)) as controller:
+        yield controller
+
+
+async def connected(controller, **kwargs):
+    model = Model(**kwargs)
+    await model.connect(**controller.connect_params())
+    return model
+
+
+async def test_status_cache_single_flight(controller):
+    model = await connected(controller)
+    try:
+        units = list(model.units.values())
+        leaders = await jasyncio.gather(*(u.is_leader_from_status() for u in units))
+        assert leaders == [u.name.endswith('/0') for u in units]
+        assert controller.calls['Client', 'FullStatus'] == 1
+    finally:
+        await model.disconnect()
+
+
+async def test_status_cache_invalidated_by_deltas(controller):
+    model = await connected(controller, status_ttl=60)
+    try:
+        await model.get_status()
+        await model.applications['app-0'].get_status()
+        assert controller.calls['Client', 'FullStatus'] == 1
+
+        # Changes to actions don't affect the status.
+        model._status_cache.invalidate_for([client.Delta(deltas=['action', 'change', {}])])
+        await model.get_status()
+        assert controller.calls['Client', 'FullStatus'] == 1
+
+        controller.model.set_unit_status('app-0/0', workload='blocked')
+        await model.block_until(
+            lambda: model.units['app-0/0'].workload_status == 'blocked')
+        status = await model.get_status()
+        assert controller.calls['Client', 'FullStatus'] == 2
+        assert status.applications['app-0'].units['app-0/0'].workload_status.status == 'blocked'
+    finally:
+        await model.disconnect()
+
+
+async def test_status_cache_change_during_request(controller):
+    model = await connected(controller, status_ttl=60)
+    try:
+        before = jasyncio.ensure_future(model.get_status())
+        await jasyncio.sleep(0)
+        # the request in flight may predate the change: don't join it
+        model._status_cache.invalidate_for([client.Delta(deltas=['unit', 'change', {}])])
+        await jasyncio.gather(before, model.get_status())
+        assert controller.calls['Client', 'FullStatus'] == 2
+    finally:
+        await model.disconnect()
+
+
+async def test_status_cache_patterns(controller):
+    controller.model.add_application('web', num_units=2)
+    model = await connected(controller, status_ttl=60)
+    try:
+        status = await model.get_status(['web'])
+        assert list(status.applications) == ['web']
+        assert sorted(status.machines) == sorted(
+            u.machine.id for u in model.applications['web'].units)
+        await model.get_status()
+        assert controller.calls['Client', 'FullStatus'] == 1
+
+        # Wildcards are left to the controller.
+        await model.get_status(['app-*'])
+        await model.get_status(['app-*'])
+        assert controller.calls['Client', 'FullStatus'] == 2
+    finally:
+        await model.disconnect()
+
+
+async def test_status_cache_without_ttl(controller):
+    model = await connected(controller)
+    try:
+        await model.get_status()
+        await model.get_status()
+        assert controller.calls['Client', 'FullStatus'] == 2
+        await jasyncio.gather(model.get_status(), model.get_status())
+        assert controller.calls['Client', 'FullStatus'] == 3
+    finally:
+        await model.disconnect()
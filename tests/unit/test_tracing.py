@@ -0,0 +1,60 @@
+# Copyright 2023 Canonical Ltd.
+# Licensed under the Apache V2, see LICENCE file for details.
+
+import logging
+import unittest
+from unittest import mock
+
+from juju.client.tracing import REPLY, RPCEvent, RPCTracer
+
+
+class ExplodingPayload:
+    def __str__(self):
+        raise AssertionError('payload formatted')
+
+
+class TestRPCTracer(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger('tests.unit.test_tracing')
+        self.logger.setLevel(logging.DEBUG)
+
+    def event(self, payload):
+        return RPCEvent(1, REPLY, 1, 'Client', 6, 'FullStatus', payload, 0.1)
+
+    def test_not_sampled_while_logging_disabled(self):
+        self.logger.setLevel(logging.INFO)
+        tracer = RPCTracer(logger=self.logger)
+        self.assertFalse(tracer.sample({'type': 'Client'}))
+
+    def test_facade_filter(self):
+        tracer = RPCTracer(logger=self.logger, facades=['Client'])
+        self.assertTrue(tracer.sample({'type': 'Client'}))
+        self.assertFalse(tracer.sample({'type': 'Pinger'}))
+
+    def test_sample_rate(self):
+        tracer = RPCTracer(logger=self.logger, sample_rate=0.25)
+        with mock.patch('random.random', side_effect=[0.1, 0.5]):
+            self.assertTrue(tracer.sample({'type': 'Client'}))
+            self.assertFalse(tracer.sample({'type': 'Client'}))
+        self.assertFalse(RPCTracer(logger=self.logger, sample_rate=0).sample({}))
+        with self.assertRaises(ValueError):
+            RPCTracer(sample_rate=2)
+
+    def test_truncation(self):
+        tracer = RPCTracer(max_length=5)
+        self.assertEqual(tracer.format('abcdefgh'), 'abcde... (3 more characters)')
+        self.assertEqual(tracer.format({'a': 1}), "{'a':... (3 more characters)")
+        self.assertEqual(tracer.format('abc'), 'abc')
+        self.assertEqual(RPCTracer().format('abcdefgh'), 'abcdefgh')
+
+    def test_emit_formats_lazily(self):
+        tracer = RPCTracer(logger=self.logger, level=logging.DEBUG)
+        self.logger.setLevel(logging.INFO)
+        tracer.emit(self.event(ExplodingPayload()))
+
+    def test_emit_logs(self):
+        tracer = RPCTracer(logger=self.logger, max_length=10)
+        with self.assertLogs(self.logger, logging.DEBUG) as logs:
+            tracer.emit(self.event('x' * 20))
+        self.assertEqual(logs.records[0].getMessage(),
+                         'connection id: 1 <--- xxxxxxxxxx... (10 more characters)')
@@ -1,7 +1,11 @@
 # Copyright 2023 Canonical Ltd.
 # Licensed under the Apache V2, see LICENCE file for details.
 
+import hashlib
+import io
 import unittest
+from unittest import mock
+
 import pytest
 
 from juju.utils import series_selector, get_base_from_origin_or_channel, \
@@ -10,7 +14,7 @@ from juju.utils import series_selector, get_base_from_origin_or_channel, \
     base_channel_from_series, get_os_from_series
 from juju.errors import JujuError
 from juju.url import URL
-from juju import utils
+from juju import jasyncio, utils
 from juju.client import client
 
 
@@ -146,3 +150,116 @@ class TestShouldUpgradeResource(unittest.TestCase):
                                 revision=0, fingerprint='OLBgp1GsljhM2TJ+sbHjaiH9txEUvgdDTAzHv2P24donTt6/529l+9Ua0vFImLlb',
                                 size=0)}
         assert utils.should_upgrade_resource(res, existing)
+
+
+class TestFutureMap(unittest.IsolatedAsyncioTestCase):
+    async def test_reply_after_get(self):
+        futures = utils.FutureMap()
+        futures.register(1)
+        getter = jasyncio.ensure_future(futures.get(1))
+        await jasyncio.sleep(0)
+        futures.resolve(1, {'request-id': 1})
+        assert await getter == {'request-id': 1}
+        assert len(futures) == 0
+
+    async def test_reply_before_get(self):
+        futures = utils.FutureMap()
+        futures.register(2)
+        futures.resolve(2, {'request-id': 2})
+        assert await futures.get(2) == {'request-id': 2}
+        assert len(futures) == 0
+
+    async def test_unregistered_reply_is_dropped(self):
+        futures = utils.FutureMap()
+        futures.resolve(3, {'request-id': 3})
+        assert len(futures) == 0
+        with pytest.raises(KeyError):
+            await futures.get(3)
+
+    async def test_exception(self):
+        futures = utils.FutureMap()
+        futures.register(1)
+        futures.register(2)
+        getters = [jasyncio.ensure_future(futures.get(i)) for i in (1, 2)]
+        await jasyncio.sleep(0)
+        futures.register(3)
+        futures.fail_all(JujuError('boom'))
+        for getter in getters:
+            with pytest.raises(JujuError):
+                await getter
+        with pytest.raises(JujuError):
+            await futures.get(3)
+        assert len(futures) == 0
+
+    async def test_register_replaces_failed_future(self):
+        futures = utils.FutureMap()
+        futures.register(1)
+        futures.fail_all(JujuError('connection lost'))
+        futures.register(1)
+        futures.resolve(1, {'request-id': 1})
+        assert await futures.get(1) == {'request-id': 1}
+
+    async def test_timeout_drops_late_reply(self):
+        futures = utils.FutureMap()
+        futures.register(1)
+        with pytest.raises(jasyncio.TimeoutError):
+            await futures.get(1, timeout=0.01)
+        assert 1 not in futures
+        futures.resolve(1, {'request-id': 1})
+        assert 1 not in futures
+
+    async def test_cancel_drops_entry(self):
+        futures = utils.FutureMap()
+        futures.register(1)
+        getter = jasyncio.ensure_future(futures.get(1))
+        await jasyncio.sleep(0)
+        getter.cancel()
+        with pytest.raises(jasyncio.CancelledError):
+            await getter
+        assert len(futures) == 0
+        futures.resolve(1, {'request-id': 1})
+        assert len(futures) == 0
+
+
+class FakeHTTPSConnection:
+    """Records what a request sends, reading file bodies the way
+    http.client does."""
+    def __init__(self, status=200):
+        self.blocksize = 8192
+        self.status = status
+        self.chunks = []
+
+    def request(self, method, url, body, headers):
+        self.method, self.url, self.headers = method, url, headers
+        for chunk in iter(lambda: body.read(self.blocksize), b''):
+            self.chunks.append(chunk)
+
+    def getresponse(self):
+        response = mock.Mock(status=self.status)
+        response.read.return_value = b'{"ok": true}'
+        return response
+
+
+class TestUploadFile(unittest.TestCase):
+    def test_streams_in_chunks(self):
+        data = bytes(range(256)) * 20000  # ~5MB of binary data
+        conn = FakeHTTPSConnection()
+        progress = []
+        fileobj = io.BytesIO(data)
+        headers = {}
+
+        result = utils.upload_file(conn, 'PUT', '/url', fileobj, headers,
+                                   lambda sent, total: progress.append((sent, total)))
+
+        self.assertEqual(result, '{"ok": true}')
+        self.assertEqual(b''.join(conn.chunks), data)
+        self.assertEqual(max(len(c) for c in conn.chunks), utils.UPLOAD_CHUNK_SIZE)
+        self.assertEqual(headers['Content-Length'], len(data))
+        self.assertEqual(headers['Content-Sha384'], hashlib.sha384(data).hexdigest())
+        self.assertEqual(progress[-1], (len(data), len(data)))
+        self.assertEqual(len(progress), len(conn.chunks))
+
+    def test_error_status(self):
+        conn = FakeHTTPSConnection(status=400)
+        with self.assertRaises(JujuError):
+            utils.upload_file(conn, 'PUT', '/url', io.BytesIO(b'x'), {})